@@ -0,0 +1,84 @@
+"""compare csv, gzip'd csv, parquet and arrow ipc uploads for space creation.
+
+offline (default): builds a synthetic frame with text, numeric, date and vector columns and
+reports encode time and payload size per format.
+
+    python benchmarks/upload_formats.py --rows 200000 --dim 256
+
+live (--live): also runs client.spaces.create(..., wait=True) once per format against the
+configured backend (MANTIS_HOST / MANTIS_COOKIE or MANTIS_INTERNAL_USER_ID) and reports the
+end-to-end create latency. formats the backend doesn't advertise fall back to csv — the
+"sent" column shows what actually went out. needs pyarrow: pip install "mantis_sdk[columnar]"."""
+import argparse
+import gzip
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from mantis_sdk import ConfigurationManager, DataType, MantisClient, columnar
+
+
+def synthetic_frame(rows: int, dim: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "title": [f"item {i}" for i in range(rows)],
+        "score": rng.normal(size=rows),
+        "count": rng.integers(0, 10_000, size=rows),
+        "when": pd.date_range("2020-01-01", periods=rows, freq="min"),
+        "embedding": list(rng.normal(size=(rows, dim)).astype(np.float32)),
+    })
+
+
+DATA_TYPES = {
+    "title": DataType.Title,
+    "score": DataType.Numeric,
+    "count": DataType.Numeric,
+    "when": DataType.Date,
+    "embedding": DataType.Vector,
+}
+
+
+def encode(df: pd.DataFrame, fmt: str) -> bytes:
+    if fmt == "csv":
+        return df.to_csv(index=False).encode()
+    if fmt == "csv.gz":
+        return gzip.compress(df.to_csv(index=False).encode(), compresslevel=6, mtime=0)
+    sink, _ = columnar.encode(df, fmt)
+    return sink.read()
+
+
+def offline(df: pd.DataFrame) -> None:
+    print(f"{'format':<8} {'encode s':>9} {'bytes':>14} {'vs csv':>7}")
+    baseline = None
+    for fmt in ("csv", "csv.gz", "parquet", "arrow"):
+        started = time.perf_counter()
+        payload = encode(df, fmt)
+        elapsed = time.perf_counter() - started
+        baseline = baseline or len(payload)
+        print(f"{fmt:<8} {elapsed:>9.2f} {len(payload):>14,} {baseline / len(payload):>6.1f}x")
+
+
+def live(df: pd.DataFrame) -> None:
+    client = MantisClient("/api/proxy/", cookie=os.getenv("MANTIS_COOKIE"), config=ConfigurationManager())
+    print(f"\n{'format':<8} {'sent':<8} {'create s':>9}")
+    for fmt in ("csv", "parquet", "arrow"):
+        sent = client.spaces._upload_format(fmt, df)
+        started = time.perf_counter()
+        handle = client.spaces.create(f"upload-bench-{fmt}", df, DATA_TYPES, upload_format=fmt)
+        print(f"{fmt:<8} {sent:<8} {time.perf_counter() - started:>9.1f}")
+        handle.delete()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=128, help="embedding width of the vector column")
+    parser.add_argument("--live", action="store_true", help="also time end-to-end creates against the backend")
+    args = parser.parse_args()
+
+    frame = synthetic_frame(args.rows, args.dim)
+    offline(frame)
+    if args.live:
+        live(frame)
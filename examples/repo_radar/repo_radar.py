@@ -90,7 +90,7 @@ def build_maps(client: MantisClient) -> tuple[str, dict[str, str]]:
         "issues": lambda: sources.github_issues(),
         "authors": lambda: sources.github_authors(),
         "notes": lambda: sources.meeting_notes(),
-        "code": lambda: sources.github_code(),  # largest — run last so others don't queue behind it
+        "code": lambda: sources.github_code(),  # largest — queued last so the others start first
     }
     # friendly per-map titles (without this the backend names every map "Untitled Map").
     map_titles = {
@@ -98,31 +98,49 @@ def build_maps(client: MantisClient) -> tuple[str, dict[str, str]]:
         "authors": "Contributors (all-time)", "code": "Codebase",
         "notes": "Meeting Notes",
     }
+    # row identity per map, so weekly re-runs upload only the rows that changed (a delta
+    # refresh). meeting notes have no stable id, so that map is always re-uploaded in full.
+    delta_keys = {
+        "prs": "url", "issues": "url", "authors": "author",
+        "code": ["repo", "title"],  # the same path can exist in several repos
+    }
     maps: dict[str, str] = {}
     cap = int(os.getenv("REPO_RADAR_CAP", "0"))  # optional row cap for bounded/demo runs
+    names: list[str] = []
+    specs: list[dict] = []
     for name, build in builders.items():
         try:
             df, data_types = build()
-            if cap:
-                df = df.head(cap)
-            if df.empty:
-                print(f"  [skip] {name}: no rows")
-                continue
-            map_id = _stable_map_id(space_id, name)
-            print(f"  [upsert] {name}: {len(df)} points → map {map_id[:8]}…")
-            handle = client.spaces.create(
-                f"Mantis Radar — {name}", df, data_types,
-                space_id=space_id, map_id=map_id,  # same space + stable map id ⇒ idempotent refresh
-                map_name=map_titles[name],  # so the map isn't named "Untitled Map"
-                privacy_level=SpacePrivacy.PUBLIC,
-                show_progress=False,
-                stall_timeout=1800.0,  # code map can take a while for large file sets
-                on_progress=lambda p, m, t, n=name: print(f"    {n}: {p:3d}% {m or ''}", end="\r"),
-            )
-            maps[name] = handle.map_id
-            print(f"\n  [done] {name}: map {handle.map_id}")
         except Exception as exc:  # noqa: BLE001 — one bad source must not abort the whole run
             print(f"  [fail] {name}: {exc}")
+            continue
+        if cap:
+            df = df.head(cap)
+        if df.empty:
+            print(f"  [skip] {name}: no rows")
+            continue
+        map_id = _stable_map_id(space_id, name)
+        print(f"  [upsert] {name}: {len(df)} points → map {map_id[:8]}…")
+        names.append(name)
+        specs.append({
+            "space_name": f"Mantis Radar — {name}", "data": df, "data_types": data_types,
+            "space_id": space_id, "map_id": map_id,  # same space + stable map id ⇒ idempotent refresh
+            "delta_key": delta_keys.get(name),
+            "map_name": map_titles[name],  # so the map isn't named "Untitled Map"
+            "privacy_level": SpacePrivacy.PUBLIC,
+            "show_progress": False,
+            "stall_timeout": 1800.0,  # code map can take a while for large file sets
+            "on_progress": lambda p, m, t, n=name: print(f"    {n}: {p:3d}% {m or ''}"),
+        })
+
+    # upload the maps side by side and follow them with one poller; a failed map is reported
+    # in its result without stopping the others.
+    for name, result in zip(names, client.spaces.create_many(specs, max_concurrent_uploads=2)):
+        if result.ok:
+            maps[name] = result.handle.map_id
+            print(f"  [done] {name}: map {result.handle.map_id}")
+        else:
+            print(f"  [fail] {name}: {result.error}")
 
     # alias the space ONCE (on first creation). the backend fix makes re-set idempotent, but we
     # only need it on the first run; resolve_or_create told us whether this is that run.
@@ -10,6 +10,7 @@ from .exceptions import (
     APIConnectionError,
     APIStatusError,
     AuthenticationError,
+    CircuitOpenError,
     ConfigurationError,
     ExecutionError,
     FeatureUnavailableError,
@@ -20,8 +21,10 @@ from .exceptions import (
     SpaceCreationError,
 )
 from .notebook import Cell, Notebook
+from .progress import ProgressEvent
 from .render_args import RenderArgs
-from .resources import SpaceHandle
+from .resources import CreateResult, SpaceHandle
+from .sources import Rows
 
 __version__ = "0.12.0"
 
@@ -33,14 +36,23 @@ def __getattr__(name: str):
         from .space import Space
 
         return Space
+    # likewise the async client needs httpx (the optional [async] extra).
+    if name == "AsyncMantisClient":
+        from .aio import AsyncMantisClient
+
+        return AsyncMantisClient
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "MantisClient",
+    "AsyncMantisClient",
     "ConfigurationManager",
     "RenderArgs",
     "Space",
     "SpaceHandle",
+    "CreateResult",
+    "Rows",
+    "ProgressEvent",
     "Notebook",
     "Cell",
     # agents
@@ -58,6 +70,7 @@ __all__ = [
     "ConfigurationError",
     "APIStatusError",
     "APIConnectionError",
+    "CircuitOpenError",
     "AuthenticationError",
     "NotFoundError",
     "RateLimitError",
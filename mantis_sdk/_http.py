@@ -3,21 +3,80 @@ resource groups and the rich handles all route their rest calls through here."""
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from collections.abc import Callable, Hashable, Iterator
 from typing import Any
 
+from .cache import ResponseCache
+from .circuit import CircuitBreakers
+from .codec import JsonCodec, get_codec
 from .config import ConfigurationManager
+from .instrumentation import MetricsRecorder
+from .ratelimit import RateLimiter
 from .transport import Transport
 
 logger = logging.getLogger("mantis_sdk")
 
 
+class _Flight:
+    """one in-flight call that followers wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class _SingleFlight:
+    """collapse concurrent identical calls onto one leader; followers block until it finishes
+    and share its result or its exception. nothing is cached once the leader returns."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+        self.shared = 0  # calls answered by another thread's request
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.shared += 1
+        assert flight is not None
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+
 class HttpClient:
     """builds fully-qualified urls, attaches auth headers, and delegates to Transport.
 
     auth resolution (either or both may apply):
       - cookie: a browser session cookie string (canonical for user auth).
       - config.internal_user_id: enables X-Internal-Service backend-to-backend auth.
+
+    thread-safety: safe to share across threads. request() never mutates shared state (the
+    caller's params/headers are copied), and the Transport underneath is thread-safe.
+
+    with config.coalesce_gets, identical GETs already in flight (same url + params, ignoring
+    the _ts cache-buster) share one network call instead of each sending their own.
     """
 
     def __init__(
@@ -30,7 +89,38 @@ class HttpClient:
         self.base_url = base_url.strip("/")
         self.cookie = cookie
         self.config = config
-        self.transport = transport or Transport(default_timeout=config.request_timeout)
+        # one codec for everything json this client touches (bodies, form fields, ws frames).
+        self.codec = get_codec(config.json_codec)
+        self.transport = transport or Transport(
+            default_timeout=config.request_timeout,
+            pool_maxsize=config.pool_maxsize or 10,
+            pool_block=config.pool_block,
+            cache=self._build_cache(config, self.codec),
+            codec=self.codec,
+            limiter=self._build_limiter(config),
+            breakers=self._build_breakers(config),
+        )
+        self._flights = _SingleFlight() if config.coalesce_gets else None
+        self.metrics = MetricsRecorder().attach(self.transport) if config.record_metrics else None
+
+    @staticmethod
+    def _build_cache(config: ConfigurationManager, codec: JsonCodec) -> ResponseCache | None:
+        if config.cache_ttl is None:
+            return None
+        return ResponseCache(
+            ttl=config.cache_ttl, max_entries=config.cache_max_entries, max_bytes=config.cache_max_bytes,
+            codec=codec,
+        )
+
+    @staticmethod
+    def _build_limiter(config: ConfigurationManager) -> RateLimiter | None:
+        return RateLimiter(config.rate_limits) if config.rate_limits else None
+
+    @staticmethod
+    def _build_breakers(config: ConfigurationManager) -> CircuitBreakers | None:
+        if not config.circuit_failures:
+            return None
+        return CircuitBreakers(failure_threshold=config.circuit_failures, reset_timeout=config.circuit_reset_timeout)
 
     @staticmethod
     def _trim(segment: str) -> str:
@@ -59,31 +149,84 @@ class HttpClient:
             headers["X-Internal-User-Id"] = str(self.config.internal_user_id)
         return headers
 
-    def request(
+    def _prepare(
         self,
         method: str,
         endpoint: str,
         *,
         rm_slash: bool = False,
         headers: dict[str, str] | None = None,
-        timeout: float | None = None,
         **kwargs: Any,
-    ) -> Any:
-        """make an authenticated request to a backend endpoint and return parsed json."""
+    ) -> tuple[str, dict[str, str], dict[str, Any]]:
+        """resolve the url, merge auth headers, and apply the GET cache-buster.
+        shared by the sync and async clients so both send byte-identical requests."""
         url = self.build_url(endpoint, rm_slash=rm_slash)
 
         merged = self.auth_headers()
         if headers:
             merged.update(headers)
 
-        if method.upper() == "GET":
-            # prevent any intermediary caching of GET reads.
+        cache = getattr(self.transport, "cache", None)
+        if method.upper() == "GET" and not (cache is not None and cache.caches(url)):
+            # prevent any intermediary caching of GET reads. reads the response cache owns
+            # skip this: they revalidate with etags instead of busting every cache on the way.
             merged.setdefault("Cache-Control", "no-cache")
-            params = kwargs.get("params", {}) or {}
+            # copy: the caller's dict may be shared with other threads.
+            params = dict(kwargs.get("params") or {})
             params["_ts"] = str(time.time())
             kwargs["params"] = params
 
+        return url, merged, kwargs
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        rm_slash: bool = False,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """make an authenticated request to a backend endpoint and return parsed json."""
+        url, merged, kwargs = self._prepare(method, endpoint, rm_slash=rm_slash, headers=headers, **kwargs)
+        if self._flights is not None and method.upper() == "GET":
+            return self._flights.do(
+                self._flight_key(method, url, kwargs.get("params")),
+                lambda: self.transport.request(method, url, headers=merged, timeout=timeout, **kwargs),
+            )
         return self.transport.request(method, url, headers=merged, timeout=timeout, **kwargs)
 
+    def stream(
+        self,
+        method: str,
+        endpoint: str,
+        *keys: str,
+        rm_slash: bool = False,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        decoder: Any = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """like request(), but yield the items of the json list in the response (a bare list,
+        or the list under the first of `keys`) as they are decoded, instead of building the
+        whole body in memory. a decoder replaces the json list decoding (e.g. an
+        EventStreamDecoder for server-sent events). never coalesced or cached: each caller
+        gets its own stream."""
+        url, merged, kwargs = self._prepare(method, endpoint, rm_slash=rm_slash, headers=headers, **kwargs)
+        return self.transport.stream(
+            method, url, *keys, headers=merged, timeout=timeout, decoder=decoder, **kwargs
+        )
+
+    @staticmethod
+    def _flight_key(method: str, url: str, params: Any) -> Hashable:
+        """identity of a read for coalescing: method + url + params, minus the _ts buster."""
+        items = tuple(sorted((str(k), str(v)) for k, v in dict(params or {}).items() if k != "_ts"))
+        return method.upper(), url, items
+
+    def warm_up(self, connections: int = 1) -> int:
+        """pre-open keep-alive connections to the configured host; see Transport.warm_up."""
+        return self.transport.warm_up(self.config.host, connections)
+
     def close(self) -> None:
         self.transport.close()
@@ -0,0 +1,37 @@
+"""files the sdk keeps under config.state_dir (delta manifests, the create cache, ...)."""
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def state_path(directory: str | Path, *parts: str) -> Path:
+    """a path under the state directory; the last part is made filename-safe."""
+    *dirs, name = parts
+    return Path(directory).expanduser().joinpath(*dirs, re.sub(r"[^\w.-]", "_", name))
+
+
+def read_json(path: Path) -> Any:
+    """the decoded file, or None when it is missing or unreadable."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(path: Path, payload: Any) -> None:
+    """write atomically (temp file + rename), so readers and an interrupted run never see a
+    partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
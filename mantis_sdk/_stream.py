@@ -0,0 +1,194 @@
+"""incremental decoding of large json list responses and of server-sent event streams.
+
+JsonArrayDecoder is fed raw body chunks and hands back the items of the response's list as
+soon as each one is complete, so a listIdeas page of 500k ids is never held as one python
+object. EventStreamDecoder does the same for a text/event-stream body, one item per event.
+both are push-based (feed/close) so the sync and async transports share them."""
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .codec import JsonCodec, get_codec
+from .exceptions import MantisError
+
+_WS = " \t\n\r"
+# a value is only known to be complete once one of these follows it (`12` may become `12.5`).
+_DELIMS = _WS + ",:]}"
+
+# parser states
+_START, _KEY, _COLON, _VALUE, _ITEMS, _DONE = range(6)
+
+
+class JsonArrayDecoder:
+    """yield the items of a top-level json array, or of the array under one of `keys` in a
+    top-level object ({"ideas": [...]}). other values in the envelope are skipped.
+
+    keys are in priority order, whatever order the body has them in. the first key's list is
+    streamed as it arrives; a later key's list is collected and only yielded once the envelope
+    closes without a better one. an empty body yields nothing; any other value that isn't a
+    list or an object holding one of the keys' lists raises MantisError."""
+
+    def __init__(self, *keys: str):
+        self.keys = keys
+        self._rank = {key: rank for rank, key in reversed(list(enumerate(keys)))}
+        self._best = len(keys)  # rank of the list found so far (len(keys): none yet)
+        self._held: list[Any] | None = None  # items of a lower-priority list, until "}"
+        # stays on the stdlib whatever config.json_codec says: incremental decoding needs
+        # raw_decode's "value plus where it ended", which orjson has no counterpart for.
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buf = ""
+        self._pos = 0
+        self._state = _START
+        self._key: str | None = None
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """consume one body chunk; returns the items it completed (possibly none)."""
+        self._buf = self._buf[self._pos:] + self._utf8.decode(chunk)
+        self._pos = 0
+        return self._drain(final=False)
+
+    def close(self) -> list[Any]:
+        """flush at end of body; returns any trailing items. raises on a truncated list."""
+        self._buf = self._buf[self._pos:] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        items = self._drain(final=True)
+        if self._state == _ITEMS:
+            raise MantisError("response body ended in the middle of a json list")
+        if self._state != _START and self._state != _DONE:
+            raise MantisError("response body ended in the middle of a json object")
+        return items
+
+    # --- internals ---
+    def _skip_ws(self) -> str | None:
+        """advance past whitespace; returns the next char without consuming it."""
+        buf, pos = self._buf, self._pos
+        while pos < len(buf) and buf[pos] in _WS:
+            pos += 1
+        self._pos = pos
+        return buf[pos] if pos < len(buf) else None
+
+    def _value(self, final: bool) -> tuple[bool, Any]:
+        """decode one complete json value at the cursor. (False, None) means wait for more.
+        unless final, a value is held back until a delimiter follows it: `12` at the buffer
+        edge may be the first half of `123` or `12.5`."""
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError as exc:
+            if final:
+                raise MantisError(f"invalid json in list response: {exc}") from exc
+            return False, None
+        if not final and (end == len(self._buf) or self._buf[end] not in _DELIMS):
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _drain(self, final: bool) -> list[Any]:
+        items: list[Any] = []
+        while self._state != _DONE:
+            ch = self._skip_ws()
+            if ch is None:
+                break
+            if self._state == _START:
+                if ch != "[" and (ch != "{" or not self.keys):
+                    raise MantisError(f"expected a json list{self._wanted()} in the response")
+                self._pos += 1
+                self._state = _ITEMS if ch == "[" else _KEY
+            elif self._state == _KEY:
+                if ch == ",":
+                    self._pos += 1
+                    continue
+                if ch == "}":
+                    if self._held is None:
+                        raise MantisError(f"json response has no list{self._wanted()}")
+                    items.extend(self._held)
+                    self._held = None
+                    self._state = _DONE
+                    continue
+                ok, self._key = self._value(final)
+                if not ok:
+                    break
+                self._state = _COLON
+            elif self._state == _COLON:
+                self._pos += 1
+                self._state = _VALUE
+            elif self._state == _VALUE:
+                rank = self._rank.get(self._key, len(self.keys))  # type: ignore[arg-type]
+                if ch == "[" and rank < self._best:
+                    # the first key streams; a later one is held in case a better key follows.
+                    self._pos += 1
+                    self._best = rank
+                    self._held = None if rank == 0 else []
+                    self._state = _ITEMS
+                    continue
+                ok, _ = self._value(final)  # an envelope field we don't want
+                if not ok:
+                    break
+                self._state = _KEY
+            elif self._state == _ITEMS:
+                if ch == ",":
+                    self._pos += 1
+                    continue
+                if ch == "]":
+                    self._pos += 1
+                    self._state = _DONE if self._held is None else _KEY
+                    continue
+                ok, item = self._value(final)
+                if not ok:
+                    break
+                (items if self._held is None else self._held).append(item)
+        return items
+
+    def _wanted(self) -> str:
+        return f" under {' / '.join(map(repr, self.keys))}" if self.keys else ""
+
+
+def iter_json_array(chunks: Iterable[bytes], *keys: str) -> Iterator[Any]:
+    """decode a chunked body with JsonArrayDecoder, yielding list items as they complete."""
+    decoder = JsonArrayDecoder(*keys)
+    for chunk in chunks:
+        if chunk:
+            yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+class EventStreamDecoder:
+    """yield the json data of each event in a text/event-stream body. an event's data lines
+    are joined with newlines; comments (heartbeats), event names and ids are skipped."""
+
+    def __init__(self, codec: JsonCodec | None = None) -> None:
+        self.codec = codec or get_codec("stdlib")  # pass the client's (HttpClient.codec)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buf = ""
+        self._data: list[str] = []
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """consume one body chunk; returns the events it completed (possibly none)."""
+        self._buf += self._utf8.decode(chunk)
+        *lines, self._buf = self._buf.split("\n")
+        return self._lines(lines)
+
+    def close(self) -> list[Any]:
+        """flush at end of body; a final event without its blank line still counts."""
+        lines = [self._buf + self._utf8.decode(b"", final=True), ""]
+        self._buf = ""
+        return self._lines(lines)
+
+    def _lines(self, lines: Iterable[str]) -> list[Any]:
+        events: list[Any] = []
+        for line in lines:
+            line = line[:-1] if line.endswith("\r") else line
+            if not line:
+                if self._data:
+                    data, self._data = "\n".join(self._data), []
+                    try:
+                        events.append(self.codec.loads(data))
+                    except ValueError as exc:  # json.JSONDecodeError / orjson.JSONDecodeError
+                        raise MantisError(f"invalid json in event stream: {exc}") from exc
+            elif line.startswith("data:"):
+                value = line[5:]
+                self._data.append(value[1:] if value.startswith(" ") else value)
+        return events
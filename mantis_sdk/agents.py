@@ -15,10 +15,9 @@ opencode is the safe default. claude_code is opt-in and capability-checked up fr
 raise ProviderUnavailableError instead of letting the backend silently fall back."""
 from __future__ import annotations
 
-import json
 import logging
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 from urllib.parse import quote
@@ -112,7 +111,8 @@ class AgentSession:
     def __init__(self, resource: AgentsResource, *, user_email: str, provider: Provider,
                  space_id: str | None, chat_id: str, timeout: float,
                  all_spaces: bool = False, mode: str | None = None,
-                 space_state_id: str | None = None):
+                 space_state_id: str | None = None,
+                 preflight: Callable[[AgentSession], Awaitable[None]] | None = None):
         self._resource = resource
         self.user_email = user_email
         self.provider = Provider(provider)
@@ -127,6 +127,11 @@ class AgentSession:
         # initialize_all_spaces_agent path) — not possible in the single-space UI.
         self.all_spaces = all_spaces
         self.mode = mode
+        # optional async setup run on __aenter__ before connecting (the async client uses it
+        # for the capability check + space-state mint, which must not block the loop).
+        self._preflight = preflight
+        # every frame is json both ways; use the client's codec (orjson when installed).
+        self._codec = resource.http.codec
         self._ws = None
         self._events: list[AgentEvent] = []
         self.server_chat_id: str | None = None
@@ -145,6 +150,8 @@ class AgentSession:
     async def __aenter__(self) -> AgentSession:
         import websockets
 
+        if self._preflight is not None:
+            await self._preflight(self)
         cookie = self._resource.http.cookie
         headers = {"Cookie": cookie} if cookie else None
         # the header kwarg was renamed extra_headers → additional_headers in websockets 14.
@@ -175,7 +182,7 @@ class AgentSession:
         init: dict[str, Any] = {"type": "agent_initialization", "all_spaces_mode": self.all_spaces}
         if self.mode:
             init["mode"] = self.mode
-        await self._ws.send(json.dumps(init))
+        await self._ws.send(self._codec.dumps(init))
         deadline = time.monotonic() + ack_timeout
         while time.monotonic() < deadline:
             try:
@@ -184,7 +191,7 @@ class AgentSession:
                 logger.debug("agent_initialized ack not received in %.0fs; proceeding", ack_timeout)
                 return
             try:
-                data = json.loads(raw)
+                data = self._codec.loads(raw)
             except (ValueError, TypeError):
                 continue
             if isinstance(data, dict) and data.get("type") == "agent_initialized":
@@ -227,7 +234,7 @@ class AgentSession:
         if cluster_ids:
             payload["clusterIds"] = cluster_ids
 
-        await self._ws.send(json.dumps(payload))
+        await self._ws.send(self._codec.dumps(payload))
 
         # idle timeout: a long claude_code/opencode run can take minutes, but the backend sends
         # heartbeats, so we bound on SILENCE (no event for `self.timeout`s), not total duration.
@@ -251,7 +258,7 @@ class AgentSession:
                 ) from exc
 
             try:
-                data = json.loads(raw)
+                data = self._codec.loads(raw)
             except (ValueError, TypeError):
                 continue
             if not isinstance(data, dict):
@@ -321,6 +328,10 @@ class AgentsResource:
             raise ProviderUnavailableError(
                 f"could not verify provider availability for {user_email!r}: {exc}"
             ) from exc
+        self._check_providers(info, user_email, provider)
+
+    @staticmethod
+    def _check_providers(info: Any, user_email: str, provider: Provider) -> None:
         available = set(info.get("providers", [])) if isinstance(info, dict) else set()
         if provider.value not in available:
             raise ProviderUnavailableError(
@@ -355,12 +366,7 @@ class AgentsResource:
         user_email is required (identity for capability gating); falls back to config.user_email.
         agents key on email, not user_id."""
         provider = Provider(provider)
-        user_email = user_email or getattr(self.http.config, "user_email", None)
-        if not user_email:
-            raise ConfigurationError(
-                "agents.session requires user_email (the agent runtime keys capability + identity "
-                "on email, not user_id)."
-            )
+        user_email = self._resolve_email(user_email)
         if check_capability:
             self._assert_available(user_email, provider)
         if space_id and not space_state_id and not all_spaces and auto_space_state:
@@ -371,6 +377,15 @@ class AgentsResource:
             all_spaces=all_spaces, mode=mode, space_state_id=space_state_id,
         )
 
+    def _resolve_email(self, user_email: str | None) -> str:
+        user_email = user_email or getattr(self.http.config, "user_email", None)
+        if not user_email:
+            raise ConfigurationError(
+                "agents.session requires user_email (the agent runtime keys capability + identity "
+                "on email, not user_id)."
+            )
+        return user_email
+
     def run_sync(self, message: str, space_id: str | None = None, *,
                  provider: Provider | str = DEFAULT_PROVIDER,
                  user_email: str | None = None,
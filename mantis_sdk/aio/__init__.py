@@ -0,0 +1,17 @@
+"""asyncio surface of the sdk: AsyncMantisClient over a pooled httpx transport.
+
+requires the [async] extra: pip install "mantis_sdk[async]"."""
+from __future__ import annotations
+
+from .client import AsyncMantisClient
+from .notebook import AsyncCell, AsyncNotebook
+from .resources import AsyncSpaceHandle
+from .transport import AsyncTransport
+
+__all__ = [
+    "AsyncMantisClient",
+    "AsyncSpaceHandle",
+    "AsyncNotebook",
+    "AsyncCell",
+    "AsyncTransport",
+]
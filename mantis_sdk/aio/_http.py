@@ -0,0 +1,115 @@
+"""internal async http client: the sync HttpClient's url building + auth, over AsyncTransport."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from typing import Any
+
+from .._http import HttpClient
+from ..codec import get_codec
+from ..config import ConfigurationManager
+from .transport import AsyncTransport
+
+
+class _LeaderCancelled(Exception):
+    """set on a flight whose leader was cancelled: its followers make the call themselves."""
+
+
+class _AsyncSingleFlight:
+    """asyncio single-flight: concurrent identical calls await the leader's future."""
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, asyncio.Future] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        while (flight := self._flights.get(key)) is not None:
+            self.shared += 1
+            try:
+                # shield: a cancelled follower must not cancel the leader's shared call.
+                return await asyncio.shield(flight)
+            except _LeaderCancelled:
+                # the leader's cancellation isn't ours: retry, as (or behind) a new leader.
+                self.shared -= 1
+
+        flight = self._flights[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fn()
+        except BaseException as exc:
+            flight.set_exception(_LeaderCancelled() if isinstance(exc, asyncio.CancelledError) else exc)
+            flight.exception()  # mark retrieved: with no followers nobody else will
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            self._flights.pop(key, None)
+
+
+class AsyncHttpClient(HttpClient):
+    """awaitable counterpart of HttpClient. url/auth handling is inherited unchanged;
+    only request() and close() become coroutines."""
+
+    def __init__(
+        self,
+        base_url: str,
+        cookie: str | None,
+        config: ConfigurationManager,
+        transport: AsyncTransport | None = None,
+    ):
+        super().__init__(
+            base_url,
+            cookie,
+            config,
+            transport=transport or AsyncTransport(  # type: ignore[arg-type]
+                default_timeout=config.request_timeout,
+                max_connections=config.pool_maxsize or 100,
+                cache=self._build_cache(config, get_codec(config.json_codec)),
+                codec=get_codec(config.json_codec),
+                limiter=self._build_limiter(config),
+                breakers=self._build_breakers(config),
+            ),
+        )
+        self._flights = _AsyncSingleFlight() if config.coalesce_gets else None  # type: ignore[assignment]
+
+    async def request(  # type: ignore[override]
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        rm_slash: bool = False,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """make an authenticated request to a backend endpoint and return parsed json."""
+        url, merged, kwargs = self._prepare(method, endpoint, rm_slash=rm_slash, headers=headers, **kwargs)
+        if self._flights is not None and method.upper() == "GET":
+            return await self._flights.do(
+                self._flight_key(method, url, kwargs.get("params")),
+                lambda: self.transport.request(method, url, headers=merged, timeout=timeout, **kwargs),
+            )
+        return await self.transport.request(method, url, headers=merged, timeout=timeout, **kwargs)
+
+    async def stream(  # type: ignore[override]
+        self,
+        method: str,
+        endpoint: str,
+        *keys: str,
+        rm_slash: bool = False,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        decoder: Any = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """await the response headers, then `async for` the items of its json list."""
+        url, merged, kwargs = self._prepare(method, endpoint, rm_slash=rm_slash, headers=headers, **kwargs)
+        return await self.transport.stream(
+            method, url, *keys, headers=merged, timeout=timeout, decoder=decoder, **kwargs
+        )
+
+    async def warm_up(self, connections: int = 1) -> int:  # type: ignore[override]
+        return await self.transport.warm_up(self.config.host, connections)
+
+    async def close(self) -> None:  # type: ignore[override]
+        await self.transport.close()
@@ -0,0 +1,88 @@
+"""awaitable agent runtime for AsyncMantisClient.
+
+AgentSession is already async (websockets); what changes here is the rest side — the provider
+capability check and the space-state mint — which run as coroutines on session entry."""
+from __future__ import annotations
+
+from typing import Any
+
+from ..agents import AgentResult, AgentSession, AgentsResource
+from ..enums import Provider
+from ..exceptions import ConfigurationError, ProviderUnavailableError
+
+
+class AsyncAgentsResource(AgentsResource):
+    """run agents and manage per-user provider capabilities. exposed as client.agents."""
+
+    async def providers(self, user_email: str) -> dict:  # type: ignore[override]
+        """list the providers available to a user. shape: {providers, default, current}."""
+        return await self.http.request(
+            "GET", "/api/agent_execution/providers", params={"user_email": user_email}
+        )
+
+    async def set_provider(self, user_email: str, provider: Provider | str) -> dict:  # type: ignore[override]
+        """set the user's default provider (persisted in UserCapabilities)."""
+        return await self.http.request(
+            "POST", "/api/agent_execution/providers/set",
+            json={"user_email": user_email, "provider": str(provider)},
+        )
+
+    async def _assert_available(self, user_email: str, provider: Provider) -> None:  # type: ignore[override]
+        if provider == Provider.OpenCode:
+            return
+        try:
+            info = await self.providers(user_email)
+        except Exception as exc:  # noqa: BLE001 — treat a failed check as a hard stop, with context
+            raise ProviderUnavailableError(
+                f"could not verify provider availability for {user_email!r}: {exc}"
+            ) from exc
+        self._check_providers(info, user_email, provider)
+
+    def session(self, space_id: str | None = None, *,
+                provider: Provider | str = AgentsResource.DEFAULT_PROVIDER,
+                user_email: str | None = None,
+                chat_id: str | None = None,
+                timeout: float = 180.0,
+                check_capability: bool = True,
+                all_spaces: bool = False,
+                mode: str | None = None,
+                space_state_id: str | None = None,
+                auto_space_state: bool = True) -> AgentSession:
+        """open a streaming agent session (same arguments as AgentsResource.session).
+
+        returns the session immediately; the capability check and space-state mint are
+        awaited on `async with`, so nothing here blocks the event loop."""
+        provider = Provider(provider)
+        user_email = self._resolve_email(user_email)
+        mint_state = bool(space_id and not space_state_id and not all_spaces and auto_space_state)
+
+        async def _preflight(run: AgentSession) -> None:
+            if check_capability:
+                await self._assert_available(run.user_email, run.provider)
+            if mint_state:
+                run.space_state_id = await self._client.space_states.create(space_id, name="SDK agent")
+
+        return AgentSession(
+            self, user_email=user_email, provider=provider, space_id=space_id,
+            chat_id=chat_id or "new", timeout=timeout,
+            all_spaces=all_spaces, mode=mode, space_state_id=space_state_id,
+            preflight=_preflight,
+        )
+
+    async def run(self, message: str, space_id: str | None = None, *,
+                  provider: Provider | str = AgentsResource.DEFAULT_PROVIDER,
+                  user_email: str | None = None,
+                  timeout: float = 180.0,
+                  on_event=None, **ask_kwargs: Any) -> AgentResult:
+        """run one message to completion and return the result (the async run_sync)."""
+        async with self.session(space_id, provider=provider, user_email=user_email,
+                                timeout=timeout) as run:
+            async for ev in run.ask(message, **ask_kwargs):
+                if on_event is not None:
+                    on_event(ev)
+            return run.result()
+
+    def run_sync(self, *args: Any, **kwargs: Any) -> AgentResult:
+        raise ConfigurationError(
+            "the async client has no run_sync; use `await client.agents.run(...)` instead."
+        )
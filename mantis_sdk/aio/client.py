@@ -0,0 +1,137 @@
+"""the AsyncMantisClient: the rest surface of MantisClient with awaitable methods.
+
+same resource groups (client.spaces / maps / annotations / space_states / aliases /
+featured_chat / notebooks / agents), backed by one pooled httpx connection pool so a single
+event loop can keep hundreds of calls in flight."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from ..config import ConfigurationManager
+from ..exceptions import ConfigurationError
+from ..resources import SearchResource
+from ._http import AsyncHttpClient
+from .agents import AsyncAgentsResource
+from .notebook import AsyncNotebooksResource
+from .resources import (
+    AsyncAliasesResource,
+    AsyncAnnotationsResource,
+    AsyncFeaturedChatResource,
+    AsyncMapsResource,
+    AsyncSpacesResource,
+    AsyncSpaceStatesResource,
+)
+from .transport import AsyncTransport
+
+logger = logging.getLogger("mantis_sdk")
+
+
+class AsyncMantisClient:
+    """asyncio sdk client for the mantis frontend + backend.
+
+    usage:
+        async with AsyncMantisClient("/api/proxy/", cookie=COOKIE) as client:
+            spaces, maps = await asyncio.gather(client.spaces.get_all(), client.maps.list(sid))
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        cookie: str | None = None,
+        config: ConfigurationManager | None = None,
+        *,
+        transport: AsyncTransport | None = None,
+    ):
+        self.config = config or ConfigurationManager()
+        self.cookie = cookie
+
+        if cookie is None and not self.config.internal_user_id:
+            raise ConfigurationError(
+                "no auth provided: pass a session cookie, or set internal_user_id on the config "
+                "(MANTIS_INTERNAL_USER_ID) for backend-to-backend auth."
+            )
+
+        self.http = AsyncHttpClient(base_url=base_url, cookie=cookie, config=self.config, transport=transport)
+
+        # resource groups.
+        self.spaces = AsyncSpacesResource(self)
+        self.maps = AsyncMapsResource(self)
+        self.space_states = AsyncSpaceStatesResource(self)
+        self.aliases = AsyncAliasesResource(self)
+        self.featured_chat = AsyncFeaturedChatResource(self)
+        self.annotations = AsyncAnnotationsResource(self)
+        self.search = SearchResource(self)  # never touches the network (route disabled)
+        self.notebooks = AsyncNotebooksResource(self)
+        self.agents = AsyncAgentsResource(self)
+
+    # --- constructors ---
+    @classmethod
+    def from_env(cls, base_url: str | None = None) -> AsyncMantisClient:
+        """build a client from MANTIS_* environment variables (see MantisClient.from_env)."""
+        import os
+
+        config = ConfigurationManager()
+        cookie = os.getenv("MANTIS_COOKIE")
+        base = base_url or os.getenv("MANTIS_BASE_URL", "/api/proxy/")
+        return cls(base, cookie=cookie, config=config)
+
+    # --- diagnostics ---
+    async def check_compatibility(self) -> dict:
+        """awaitable MantisClient.check_compatibility."""
+        from .. import __version__
+
+        result: dict[str, Any] = {"sdk_version": __version__, "reachable": False, "getSpaces_shape_ok": False}
+        try:
+            spaces = await self.spaces.get_all()
+            result["reachable"] = True
+            expected = {"public", "private", "shared"}
+            result["getSpaces_shape_ok"] = isinstance(spaces, dict) and expected.issubset(spaces.keys())
+            if not result["getSpaces_shape_ok"]:
+                logger.warning("getSpaces shape looks unexpected; SDK may be out of sync with the backend")
+        except Exception as exc:  # noqa: BLE001 — diagnostic, never fatal
+            result["error"] = str(exc)
+        return result
+
+    def pool_stats(self) -> dict:
+        """live connection-pool statistics for the httpx pool (see AsyncTransport.pool_stats)."""
+        return self.http.transport.pool_stats()
+
+    def stats(self) -> dict:
+        """per-endpoint request metrics, the connection pool, compression savings and the read
+        cache (see MantisClient.stats)."""
+        cache = getattr(self.http.transport, "cache", None)
+        limiter, breakers = self.http.transport.limiter, self.http.transport.breakers
+        return {
+            "endpoints": self.http.metrics.stats() if self.http.metrics is not None else {},
+            "pool": self.pool_stats(),
+            "transfer": self.transfer_stats(),
+            "cache": cache.stats() if cache is not None else None,
+            "rate_limits": limiter.stats() if limiter is not None else {},
+            "circuits": breakers.stats() if breakers is not None else {},
+        }
+
+    def export_metrics(self) -> str:
+        """the per-endpoint metrics in prometheus text format (see MantisClient.export_metrics)."""
+        if self.http.metrics is None:
+            raise ConfigurationError("metrics are off: set config.record_metrics (MANTIS_RECORD_METRICS=1)")
+        return self.http.metrics.to_prometheus()
+
+    @property
+    def hooks(self):
+        """instrumentation hooks on the transport (see MantisClient.hooks)."""
+        return self.http.transport.hooks
+
+    def transfer_stats(self) -> dict:
+        """bytes saved by compression in each direction (see MantisClient.transfer_stats)."""
+        return self.http.transport.transfer_stats()
+
+    # --- lifecycle ---
+    async def close(self) -> None:
+        await self.http.close()
+
+    async def __aenter__(self) -> AsyncMantisClient:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
@@ -0,0 +1,162 @@
+"""awaitable notebook subsystem for AsyncMantisClient (see mantis_sdk.notebook for the flow)."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from ..exceptions import ExecutionError, MantisError
+from ..notebook import Cell, Notebook, NotebooksResource
+
+
+class AsyncCell(Cell):
+    """a notebook cell whose execute() is awaitable; output helpers are inherited."""
+
+    async def execute(self, *, timeout: float = 120.0, poll_interval: float = 1.0) -> list[dict]:  # type: ignore[override]
+        """execute this cell and await its results. returns jupyter-style outputs."""
+        http = self.notebook._http
+        resp = await http.request(
+            "POST", "/api/sessions/execute",
+            json={
+                "session_id": self.notebook.session_id,
+                "project_id": self.notebook.project_id,
+                "cell_index": self.index,
+            },
+        )
+        if not resp.get("success", True):
+            raise ExecutionError(f"execute failed: {resp.get('error')}")
+
+        result = resp.get("result")
+        if result is None:
+            task_id = resp.get("task_id")
+            if not task_id:
+                raise ExecutionError(f"execute returned neither result nor task_id: {resp}")
+            result = await self._poll_result(task_id, timeout=timeout, poll_interval=poll_interval)
+
+        self.outputs = result.get("outputs", []) if isinstance(result, dict) else []
+        self._raise_on_error()
+        return self.outputs
+
+    async def _poll_result(self, task_id: str, *, timeout: float, poll_interval: float) -> dict:  # type: ignore[override]
+        http = self.notebook._http
+        deadline = time.monotonic() + timeout
+        while True:
+            status = await http.request(
+                "GET", "/api/sessions/execute/status", params={"task_id": task_id}
+            )
+            if status.get("status") == "completed":
+                return status.get("result", {})
+            if status.get("status") == "failed" or status.get("error"):
+                raise ExecutionError(f"cell execution failed: {status.get('error')}")
+            if time.monotonic() > deadline:
+                raise ExecutionError(f"cell execution timed out after {timeout}s")
+            await asyncio.sleep(poll_interval)
+
+
+class AsyncNotebook(Notebook):
+    """a notebook bound to a backend session. created via client.notebooks.create()."""
+
+    async def add_cell(self, content: str, cell_type: str = "code") -> AsyncCell:  # type: ignore[override]
+        """append a cell to the notebook and return a handle to it."""
+        resp = await self._http.request(
+            "POST", "/api/notebook/add_cell",
+            json={
+                "session_id": self.session_id,
+                "project_id": self.project_id,
+                "content": content,
+                "cell_type": cell_type,
+                "position": -1,
+            },
+        )
+        if not resp.get("success", True):
+            raise MantisError(f"add_cell failed: {resp.get('error')}")
+        cell = AsyncCell(self, index=len(self.cells), content=content, cell_type=cell_type)
+        self.cells.append(cell)
+        return cell
+
+    async def get_content(self) -> dict:  # type: ignore[override]
+        return await self._http.request(
+            "GET", "/api/notebook/content",
+            params={"session_id": self.session_id, "project_id": self.project_id},
+        )
+
+    async def checkpoint(self, name: str | None = None) -> Any:  # type: ignore[override]
+        return await self._http.request(
+            "POST", "/api/sessions/checkpoint/save",
+            json={"session_id": self.session_id, "name": name or "checkpoint"},
+        )
+
+    async def list_checkpoints(self) -> Any:  # type: ignore[override]
+        return await self._http.request(
+            "GET", "/api/sessions/checkpoint/list", params={"session_id": self.session_id}
+        )
+
+    async def load_checkpoint(self, checkpoint_id: str) -> Any:  # type: ignore[override]
+        return await self._http.request(
+            "POST", "/api/sessions/checkpoint/load",
+            json={"session_id": self.session_id, "checkpoint_id": checkpoint_id},
+        )
+
+    async def delete_checkpoint(self, checkpoint_id: str) -> Any:  # type: ignore[override]
+        return await self._http.request(
+            "POST", "/api/sessions/checkpoint/delete",
+            json={"session_id": self.session_id, "checkpoint_id": checkpoint_id},
+        )
+
+    async def export(self) -> bytes:  # type: ignore[override]
+        return await self._http.request("GET", f"/api/sessions/download/{self.session_id}")
+
+
+class AsyncNotebooksResource(NotebooksResource):
+    """create and resolve notebooks. exposed as AsyncMantisClient.notebooks."""
+
+    async def resolve_map_to_project(self, map_id: str) -> str:  # type: ignore[override]
+        resp = await self.http.request(
+            "POST", "/api/notebook/resolve_map_to_project", json={"map_id": map_id}
+        )
+        if not resp.get("success", True) or "project_id" not in resp:
+            raise MantisError(f"resolve_map_to_project failed: {resp.get('error', resp)}")
+        return resp["project_id"]
+
+    async def create(  # type: ignore[override]
+        self,
+        project_id: str,
+        name: str = "Untitled",
+        user_id: str | None = None,
+        *,
+        nid: str | None = None,
+    ) -> AsyncNotebook:
+        """create a notebook and an attached session ready for add_cell/execute."""
+        user_id = user_id or self.http.config.internal_user_id
+        if not user_id:
+            raise MantisError("user_id is required (or set internal_user_id on the config)")
+
+        created = await self.http.request(
+            "POST", "/api/notebook/create",
+            json={"user_id": user_id, "project_id": project_id, "notebook_name": name, **({"nid": nid} if nid else {})},
+        )
+        if not created.get("success", True) or "nid" not in created:
+            raise MantisError(f"notebook create failed: {created.get('error', created)}")
+        nid = created["nid"]
+
+        session = await self.http.request(
+            "POST", "/api/sessions/create",
+            json={"user_id": user_id, "project_id": project_id, "nid": nid},
+        )
+        if not session.get("success", True) or "session_id" not in session:
+            raise MantisError(f"session create failed: {session.get('error', session)}")
+
+        return AsyncNotebook(
+            self,
+            nid=nid,
+            session_id=session["session_id"],
+            project_id=project_id,
+            user_id=user_id,
+            name=name,
+        )
+
+    async def from_map(  # type: ignore[override]
+        self, map_id: str, name: str = "Untitled", user_id: str | None = None
+    ) -> AsyncNotebook:
+        project_id = await self.resolve_map_to_project(map_id)
+        return await self.create(project_id, name=name, user_id=user_id)
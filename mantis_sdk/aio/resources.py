@@ -0,0 +1,830 @@
+"""awaitable resource groups for AsyncMantisClient.
+
+each class subclasses its sync counterpart so request building, response unwrapping and
+validation stay in one place; only the methods that touch the network become coroutines."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .. import h5ad, sources
+from .. import vectors as vector_codec
+from .._stream import EventStreamDecoder
+from ..create_cache import CreateCache
+from ..delta import Manifest
+from ..enums import AIProvider, DataType, ReducerModels, SpacePrivacy
+from ..exceptions import APIConnectionError, APIStatusError, MantisError, NotFoundError
+from ..jobs import RUNNING, JobStore
+from ..molecules import Canonicalizer
+from ..progress import ProgressEvent
+from ..resources import (
+    _LANDSCAPE_ARGS,
+    _RESUBMIT_BACKOFF,
+    _RESUBMIT_STATUSES,
+    IDEMPOTENCY_HEADER,
+    AliasesResource,
+    AnnotationsResource,
+    CreateResult,
+    FeaturedChatResource,
+    MapsResource,
+    ProgressCallback,
+    SpaceHandle,
+    SpacesResource,
+    SpaceStatesResource,
+    _CreateJob,
+    _ProgressTracker,
+    _unwrap_list,
+)
+from ..upload import UploadProgressCallback
+
+logger = logging.getLogger("mantis_sdk")
+
+
+class AsyncSpaceHandle(SpaceHandle):
+    """SpaceHandle whose rest helpers are awaitable. still a dict, so ["space_id"] works."""
+
+    async def list_maps(self) -> list[dict]:  # type: ignore[override]
+        """list maps belonging to this space via /api/listMaps/."""
+        return await self._client.maps.list(self.space_id)
+
+    async def get_annotations(self) -> list[dict]:  # type: ignore[override]
+        return await self._client.annotations.list(self.map_id or self.space_id)
+
+    async def iter_points(self, page_size: int = 200) -> AsyncIterator[dict]:  # type: ignore[override]
+        """yield the point records (the listIdeas "ideas" entries) of this space's primary map,
+        paging transparently. each page is decoded as it streams in, so memory stays flat
+        however large the map."""
+        map_id = self.map_id or self.space_id
+        offset = 0
+        while True:
+            count = 0
+            async for point in await self._client.http.stream(
+                "GET", "/api/listIdeas", "ideas",
+                params={"map_id": map_id, "limit": page_size, "offset": offset},
+            ):
+                count += 1
+                yield point
+            if count < page_size:
+                break
+            offset += page_size
+
+    @property
+    def points(self) -> AsyncIterator[dict]:  # type: ignore[override]
+        return self.iter_points()
+
+    async def delete(self) -> Any:  # type: ignore[override]
+        return await self._client.http.request("DELETE", f"/api/spaces/delete/{self.space_id}")
+
+
+class AsyncSpacesResource(SpacesResource):
+    """create, open, and manage spaces without blocking the event loop."""
+
+    _handle_type = AsyncSpaceHandle
+
+    async def get_all(self) -> dict:  # type: ignore[override]
+        """raw /api/getSpaces payload: {public, featured, private, shared, projects}."""
+        return await self.http.request("GET", "/api/getSpaces")
+
+    async def ids_by_name(  # type: ignore[override]
+        self, space_name: str, privacy_levels: list[SpacePrivacy | str]
+    ) -> list[str]:
+        return self._match_ids(await self.get_all(), space_name, privacy_levels)
+
+    async def create(  # type: ignore[override]
+        self,
+        space_name: str,
+        data: Any,
+        data_types: dict[str, DataType | str],
+        *,
+        custom_models: list[str | None] | None = None,
+        reducer: ReducerModels | str = ReducerModels.UMAP,
+        privacy_level: SpacePrivacy | str = SpacePrivacy.PRIVATE,
+        ai_provider: AIProvider | str = AIProvider.OpenAI,
+        chat_model: str = "gpt-4o-mini",
+        embedding_model: str = "text-embedding-3-small",
+        on_progress: ProgressCallback | None = None,
+        on_receive_id: Callable[[str, str], None] | None = None,
+        on_upload_progress: UploadProgressCallback | None = None,
+        show_progress: bool = False,
+        wait: bool = True,
+        stall_timeout: float | None = 600.0,
+        space_id: str | None = None,
+        map_id: str | None = None,
+        map_name: str | None = None,
+        upload_format: str | None = None,
+        drop_duplicates: bool = False,
+        delta_key: str | list[str] | None = None,
+        reuse: bool | None = None,
+        vectors: dict[str, Any] | None = None,
+        job_key: str | None = None,
+    ) -> AsyncSpaceHandle:
+        """awaitable SpacesResource.create; same arguments and semantics.
+
+        the csv serialization is cpu-bound, so it runs in a worker thread rather than
+        stalling the event loop (a streamed upload formats each block in a worker thread)."""
+        job = await self._submit_create(
+            space_name,
+            data,
+            data_types,
+            dict(
+                custom_models=custom_models,
+                reducer=reducer,
+                privacy_level=privacy_level,
+                ai_provider=ai_provider,
+                chat_model=chat_model,
+                embedding_model=embedding_model,
+                space_id=space_id,
+                map_id=map_id,
+                map_name=map_name,
+                on_upload_progress=on_upload_progress,
+                drop_duplicates=drop_duplicates,
+                vectors=vectors,
+            ),
+            upload_format=upload_format,
+            delta_key=delta_key,
+            reuse=reuse,
+            job_key=job_key,
+        )
+
+        if on_receive_id is not None:
+            on_receive_id(job.space_id, job.map_id)
+
+        if wait and job.sent:
+            try:
+                await self._poll_until_done(
+                    job.map_id,
+                    on_progress=self._recording(job, on_progress),
+                    show_progress=show_progress,
+                    stall_timeout=stall_timeout,
+                )
+            except BaseException as exc:
+                self._abandon(job, exc)
+                raise
+        self._finish_create(job, completed=wait)
+
+        return AsyncSpaceHandle(job.space_id, job.map_id, self._client)
+
+    async def create_many(  # type: ignore[override]
+        self,
+        specs: Iterable[dict[str, Any]],
+        *,
+        max_concurrent_uploads: int = 4,
+        max_inflight_pipelines: int = 8,
+        wait: bool = True,
+    ) -> list[CreateResult]:
+        """awaitable SpacesResource.create_many: uploads run as tasks on this loop, and one
+        shared poller follows every submitted map."""
+        calls = [self._create_args(spec) for spec in specs]
+        results: list[Any] = [None] * len(calls)
+        queue = deque(range(len(calls)))
+        uploading: dict[asyncio.Task, int] = {}
+        watching: dict[int, tuple[_CreateJob, _ProgressTracker]] = {}
+        schedule = self._poll_schedule(
+            min((args["stall_timeout"] for args in calls if args["stall_timeout"] is not None), default=None)
+        )
+        try:
+            while queue or uploading or watching:
+                while queue and len(uploading) < max(1, max_concurrent_uploads) and (
+                    len(uploading) + len(watching) < max(1, max_inflight_pipelines)
+                ):
+                    index = queue.popleft()
+                    uploading[asyncio.ensure_future(self._submit_spec(calls[index]))] = index
+                for task in [task for task in uploading if task.done()]:
+                    index = uploading.pop(task)
+                    self._uploaded(index, calls[index], task, wait, watching, results)
+                delay = None
+                if watching:
+                    payloads = await self._progress_many(self._map_ids(watching))
+                    changed = self._apply_progress(watching, payloads, results)
+                    delay = schedule.next(max((t.last for _, t in watching.values()), default=0), changed)
+                if uploading:
+                    await asyncio.wait(list(uploading), timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                elif delay:
+                    await asyncio.sleep(delay)
+        finally:
+            for task in uploading:
+                task.cancel()
+            for _, tracker in watching.values():
+                tracker.close()
+        return results
+
+    async def _submit_spec(self, args: dict[str, Any]) -> _CreateJob:  # type: ignore[override]
+        job = await self._submit_create(
+            args["space_name"],
+            args["data"],
+            args["data_types"],
+            {name: args[name] for name in _LANDSCAPE_ARGS},
+            upload_format=args["upload_format"],
+            delta_key=args["delta_key"],
+            reuse=args["reuse"],
+            job_key=args["job_key"],
+        )
+        if args["on_receive_id"] is not None:
+            args["on_receive_id"](job.space_id, job.map_id)
+        return job
+
+    async def _progress_many(self, map_ids: list[str]) -> dict[str, Any]:  # type: ignore[override]
+        if len(map_ids) > 1 and self._batch_progress:
+            try:
+                resp = await self.http.request("POST", "synthesis/progress/batch", json={"map_ids": map_ids})
+            except MantisError as exc:
+                self._no_batch_progress(exc)
+            else:
+                return self._read_progress_batch(resp)
+        payloads: dict[str, Any] = {}
+        for map_id in map_ids:
+            try:
+                payloads[map_id] = await self.http.request("GET", f"synthesis/progress/{map_id}")
+            except MantisError as exc:
+                payloads[map_id] = exc
+        return payloads
+
+    async def resume(  # type: ignore[override]
+        self,
+        *,
+        on_progress: Callable[[str, int, str | None], None] | None = None,
+        stall_timeout: float | None = 600.0,
+    ) -> dict[str, CreateResult]:
+        """awaitable SpacesResource.resume."""
+        store = self.job_store
+        running, watching = self._resumed(store, on_progress, stall_timeout)
+        results: list[Any] = [None] * len(running)
+        schedule = self._poll_schedule(stall_timeout)
+        try:
+            while watching:
+                payloads = await self._progress_many(self._map_ids(watching))
+                changed = self._apply_progress(watching, payloads, results)
+                if watching:
+                    await asyncio.sleep(schedule.next(max(t.last for _, t in watching.values()), changed))
+        finally:
+            for _, tracker in watching.values():
+                tracker.close()
+        return {job.key: result for job, result in zip(running, results)}
+
+    async def _submit_create(  # type: ignore[override]
+        self,
+        space_name: str,
+        data: Any,
+        data_types: dict[str, DataType | str],
+        landscape: dict[str, Any],
+        *,
+        upload_format: str | None,
+        delta_key: str | list[str] | None,
+        reuse: bool | None,
+        job_key: str | None = None,
+    ) -> _CreateJob:
+        """awaitable SpacesResource._submit_create; cpu-bound steps run in worker threads."""
+        data = sources.wrap(data)
+        store, key = self._job_entry(job_key)
+        if store is None:
+            return await self._send_create(space_name, data, data_types, landscape, upload_format, delta_key, reuse)
+        if (resumed := self._resume_job(store, key)) is not None:
+            return resumed
+        await self._claim_slot(store, key, space_name)
+        try:
+            job = await self._send_create(space_name, data, data_types, landscape, upload_format, delta_key, reuse)
+        except BaseException as exc:
+            store.finish(key, str(exc) or type(exc).__name__)
+            raise
+        return self._submitted(store, key, job)
+
+    async def _claim_slot(self, store: JobStore, key: str, space_name: str) -> None:  # type: ignore[override]
+        limit = self.http.config.max_pipelines
+        schedule = self._poll_schedule(None)
+        while not store.submit(key, space_name, limit):
+            running = [job for job in store.jobs(RUNNING) if job.map_id]
+            if not self._record_jobs(store, running, await self._progress_many([job.map_id for job in running])):
+                await asyncio.sleep(schedule.next(0, False))
+
+    async def _send_create(  # type: ignore[override]
+        self,
+        space_name: str,
+        data: Any,
+        data_types: dict[str, DataType | str],
+        landscape: dict[str, Any],
+        upload_format: str | None,
+        delta_key: str | list[str] | None,
+        reuse: bool | None,
+    ) -> _CreateJob:
+        cache = self._create_cache(reuse, data)
+        digest = None
+        if cache is not None:
+            digest = await asyncio.to_thread(self._create_digest, space_name, data, data_types, landscape)
+            if (handle := await self._reuse(cache, digest)) is not None:
+                return _CreateJob(handle.space_id, handle.map_id, sent=False, reused=True)
+        landscape["upload_format"] = await self._upload_format(upload_format, data)
+        landscape["vector_encoding"] = await self._vector_encoding() if landscape["upload_format"] == "csv" else None
+        if delta_key is None:
+            space_id, request_kwargs = await asyncio.to_thread(
+                self._prepare_landscape, space_name, data, data_types, **landscape
+            )
+            key = await asyncio.to_thread(self._landscape_key, space_name, data, data_types, landscape, space_id, digest)
+            rebuild = self._rebuilder(data, lambda: self._prepare_landscape(
+                space_name, data, data_types, **{**landscape, "space_id": space_id}
+            )[1])
+            resp = await self._submit("/synthesis/landscape", key, request_kwargs, rebuild)
+            space_id, map_id = self._read_create_response(resp, space_id)
+            return _CreateJob(space_id, map_id, cache=cache, digest=digest)
+        space_id, map_id, manifest, sent = await self._refresh(space_name, data, data_types, delta_key, landscape)
+        return _CreateJob(space_id, map_id, sent, manifest=manifest, cache=cache, digest=digest)
+
+    async def _reuse(self, cache: CreateCache, digest: str) -> AsyncSpaceHandle | None:  # type: ignore[override]
+        found = cache.get(digest)
+        if found is None:
+            return None
+        space_id, map_id = found
+        try:
+            maps = await self._client.maps.list(space_id)
+        except NotFoundError:
+            maps = []
+        if self._has_map(maps, map_id):
+            logger.info("reusing space %s (map %s): same data and settings as before", space_id, map_id)
+            return AsyncSpaceHandle(space_id, map_id, self._client)
+        cache.discard(digest)
+        return None
+
+    async def _refresh(  # type: ignore[override]
+        self,
+        space_name: str,
+        data: Any,
+        data_types: dict[str, DataType | str],
+        delta_key: str | list[str],
+        landscape: dict[str, Any],
+    ) -> tuple[str, str, Manifest, bool]:
+        shaped, change, manifest, landscape = await asyncio.to_thread(
+            self._plan_refresh, data, data_types, delta_key, landscape
+        )
+        if change is not None and not change.changed:
+            logger.info("map %s is unchanged; nothing to upload", manifest.map_id)
+            return manifest.space_id, manifest.map_id, manifest, False
+        if change is not None:
+            def prepare_delta() -> tuple[str, dict[str, Any]]:
+                return self._prepare_landscape(
+                    space_name, change.upserts, data_types, **landscape, deleted_keys=change.deleted
+                )
+
+            space_id, request_kwargs = await asyncio.to_thread(prepare_delta)
+            key = self._submission_key("delta", space_id, manifest.map_id, manifest.digest())
+            try:
+                resp = await self._submit("/synthesis/landscape/delta", key, request_kwargs, lambda: prepare_delta()[1])
+            except APIStatusError as exc:
+                self._no_delta(exc)
+            else:
+                self._partial_updates = True
+                return (*self._read_create_response(resp, space_id, "delta refresh"), manifest, True)
+        space_id, request_kwargs = await asyncio.to_thread(
+            self._prepare_landscape, space_name, shaped, data_types, **landscape
+        )
+        key = self._submission_key("landscape", space_id, manifest.map_id, manifest.digest())
+        resp = await self._submit("/synthesis/landscape", key, request_kwargs, lambda: self._prepare_landscape(
+            space_name, shaped, data_types, **landscape
+        )[1])
+        return (*self._read_create_response(resp, space_id), manifest, True)
+
+    async def _submit(  # type: ignore[override]
+        self, endpoint: str, key: str, request_kwargs: dict[str, Any], rebuild: Callable[[], dict[str, Any]] | None
+    ) -> Any:
+        """awaitable SpacesResource._submit; a rebuilt upload is prepared in a worker thread."""
+        headers = {IDEMPOTENCY_HEADER: key}
+        retries = max(0, self.http.config.submit_retries)
+        for attempt in range(retries + 1):
+            if attempt:
+                await asyncio.sleep(_RESUBMIT_BACKOFF * 2 ** (attempt - 1))
+                request_kwargs = await asyncio.to_thread(rebuild)
+            try:
+                return await self.http.request("POST", endpoint, headers=headers, **request_kwargs)
+            except (APIConnectionError, APIStatusError) as exc:
+                wait = _RESUBMIT_BACKOFF * 2**attempt
+                if attempt == retries or rebuild is None or not (self._resendable(exc, wait) or await self._replays(exc)):
+                    raise
+                logger.info("re-sending %s (key %s) after: %s", endpoint, key, exc)
+
+    async def _replays(self, exc: MantisError) -> bool:  # type: ignore[override]
+        transient = exc.request_sent if isinstance(exc, APIConnectionError) else (
+            getattr(exc, "status_code", None) in _RESUBMIT_STATUSES
+        )
+        return transient and "idempotency" in await self._advertised_formats()
+
+    async def _upload_format(self, requested: str | None, data: Any) -> str:  # type: ignore[override]
+        wanted = self._wanted_format(requested, data)
+        return wanted if wanted == "csv" else self._pick_format(wanted, await self._advertised_formats())
+
+    async def _vector_encoding(self) -> str | None:  # type: ignore[override]
+        encoding = vector_codec.normalize_encoding(self.http.config.vector_encoding)
+        return encoding and self._pick_vector_encoding(encoding, await self._advertised_formats())
+
+    async def _advertised_formats(self) -> set[str]:  # type: ignore[override]
+        if self._formats is None:
+            try:
+                resp = await self.http.request("GET", "synthesis/upload-formats")
+            except APIStatusError:
+                resp = []
+            self._formats = self._read_formats(resp)
+        return self._formats
+
+    async def from_github(  # type: ignore[override]
+        self,
+        repo_url: str,
+        space_name: str | None = None,
+        *,
+        privacy_level: SpacePrivacy | str = SpacePrivacy.PRIVATE,
+        on_progress: ProgressCallback | None = None,
+        show_progress: bool = False,
+        wait: bool = True,
+        **extra: Any,
+    ) -> AsyncSpaceHandle:
+        """create a space by analyzing a github repository (synthesis/github/)."""
+        space_id, payload = self._github_payload(repo_url, space_name, privacy_level, extra)
+        key = self._submission_key("github", self.http.codec.dumps(payload))
+        resp = await self._submit("/synthesis/github", key, {"json": payload}, lambda: {"json": payload})
+        space_id, map_id = self._read_create_response(resp, space_id, "github create")
+        if wait:
+            await self._poll_until_done(map_id, on_progress=on_progress, show_progress=show_progress)
+        return AsyncSpaceHandle(space_id, map_id, self._client)
+
+    async def embed_only(  # type: ignore[override]
+        self,
+        space_name: str,
+        metadata: pd.DataFrame | str,
+        embeddings: np.ndarray | str | os.PathLike,
+        data_types: dict[str, DataType | str],
+        *,
+        embedding_column: str = "embedding",
+        encoding: str = "float32",
+        reducer: ReducerModels | str = ReducerModels.UMAP,
+        privacy_level: SpacePrivacy | str = SpacePrivacy.PRIVATE,
+        ai_provider: AIProvider | str = AIProvider.OpenAI,
+        chat_model: str = "gpt-4o-mini",
+        on_progress: ProgressCallback | None = None,
+        on_receive_id: Callable[[str, str], None] | None = None,
+        on_upload_progress: UploadProgressCallback | None = None,
+        show_progress: bool = False,
+        wait: bool = True,
+        stall_timeout: float | None = 600.0,
+        space_id: str | None = None,
+        map_id: str | None = None,
+        map_name: str | None = None,
+    ) -> AsyncSpaceHandle:
+        """awaitable SpacesResource.embed_only; the side-car is read and encoded in worker threads."""
+        space_id, request_kwargs = await asyncio.to_thread(
+            self._prepare_embed_only,
+            space_name,
+            metadata,
+            embeddings,
+            data_types,
+            embedding_column=embedding_column,
+            encoding=encoding,
+            reducer=reducer,
+            privacy_level=privacy_level,
+            ai_provider=ai_provider,
+            chat_model=chat_model,
+            space_id=space_id,
+            map_id=map_id,
+            map_name=map_name,
+            on_upload_progress=on_upload_progress,
+        )
+        resp = await self.http.request("POST", "/synthesis/embed-only", **request_kwargs)
+        space_id, map_id = self._read_create_response(resp, space_id, "embed-only create")
+
+        if on_receive_id is not None:
+            on_receive_id(space_id, map_id)
+
+        if wait:
+            await self._poll_until_done(
+                map_id, on_progress=on_progress, show_progress=show_progress, stall_timeout=stall_timeout
+            )
+
+        return AsyncSpaceHandle(space_id, map_id, self._client)
+
+    async def from_molecules(  # type: ignore[override]
+        self,
+        space_name: str,
+        molecules: pd.DataFrame | str | Iterable[str],
+        data_types: dict[str, DataType | str] | None = None,
+        *,
+        smiles_column: str = "smiles",
+        canonicalize: bool | Canonicalizer = False,
+        drop_duplicates: bool = True,
+        workers: int | None = None,
+        batch_rows: int = 100_000,
+        upload_workers: int = 4,
+        reducer: ReducerModels | str = ReducerModels.UMAP,
+        privacy_level: SpacePrivacy | str = SpacePrivacy.PRIVATE,
+        ai_provider: AIProvider | str = AIProvider.OpenAI,
+        chat_model: str = "gpt-4o-mini",
+        on_progress: ProgressCallback | None = None,
+        on_receive_id: Callable[[str, str], None] | None = None,
+        on_batch_progress: Callable[[int, int], None] | None = None,
+        show_progress: bool = False,
+        wait: bool = True,
+        stall_timeout: float | None = 600.0,
+        space_id: str | None = None,
+        map_id: str | None = None,
+        map_name: str | None = None,
+    ) -> AsyncSpaceHandle:
+        """awaitable SpacesResource.from_molecules; preparation runs in a worker thread (and its
+        process pool), batches after the first go up upload_workers at a time."""
+        space_id, form_data, batches = await asyncio.to_thread(
+            self._prepare_molecules,
+            space_name,
+            molecules,
+            data_types,
+            smiles_column=smiles_column,
+            canonicalize=canonicalize,
+            drop_duplicates=drop_duplicates,
+            workers=workers,
+            batch_rows=batch_rows,
+            reducer=reducer,
+            privacy_level=privacy_level,
+            ai_provider=ai_provider,
+            chat_model=chat_model,
+            space_id=space_id,
+            map_id=map_id,
+            map_name=map_name,
+        )
+        total, count = sum(map(len, batches)), len(batches)
+        slots = asyncio.Semaphore(max(1, upload_workers))
+        sent = 0
+
+        async def send(index: int) -> Any:
+            nonlocal sent
+            async with slots:
+                request_kwargs = await asyncio.to_thread(
+                    self._molecule_request, form_data, batches[index], index, count
+                )
+                resp = await self.http.request("POST", "/synthesis/molecules", **request_kwargs)
+            sent += len(batches[index])
+            if on_batch_progress is not None:
+                on_batch_progress(sent, total)
+            return resp
+
+        # the first batch creates the space; the rest are appended to it concurrently.
+        space_id, map_id = self._read_create_response(await send(0), space_id, "molecules create")
+        form_data.update(space_id=space_id, map_id=map_id)
+        tasks = [asyncio.ensure_future(send(index)) for index in range(1, count)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        if on_receive_id is not None:
+            on_receive_id(space_id, map_id)
+
+        if wait:
+            await self._poll_until_done(
+                map_id, on_progress=on_progress, show_progress=show_progress, stall_timeout=stall_timeout
+            )
+
+        return AsyncSpaceHandle(space_id, map_id, self._client)
+
+    async def from_h5ad(  # type: ignore[override]
+        self,
+        path: str | os.PathLike,
+        space_name: str | None = None,
+        *,
+        obsm: str | None = None,
+        layer: str | None = None,
+        obs_columns: list[str] | None = None,
+        data_types: dict[str, DataType | str] | None = None,
+        encoding: str = "float32",
+        reducer: ReducerModels | str = ReducerModels.UMAP,
+        privacy_level: SpacePrivacy | str = SpacePrivacy.PRIVATE,
+        ai_provider: AIProvider | str = AIProvider.OpenAI,
+        chat_model: str = "gpt-4o-mini",
+        on_progress: ProgressCallback | None = None,
+        on_receive_id: Callable[[str, str], None] | None = None,
+        on_upload_progress: UploadProgressCallback | None = None,
+        show_progress: bool = False,
+        wait: bool = True,
+        stall_timeout: float | None = 600.0,
+        space_id: str | None = None,
+        map_id: str | None = None,
+        map_name: str | None = None,
+    ) -> AsyncSpaceHandle:
+        """awaitable SpacesResource.from_h5ad; the file is read in worker threads."""
+        file = await asyncio.to_thread(h5ad.open_file, path)
+        try:
+            space_id, request_kwargs = await asyncio.to_thread(
+                self._prepare_h5ad,
+                file,
+                space_name or Path(path).stem,
+                obsm=obsm,
+                layer=layer,
+                obs_columns=obs_columns,
+                data_types=data_types,
+                encoding=encoding,
+                reducer=reducer,
+                privacy_level=privacy_level,
+                ai_provider=ai_provider,
+                chat_model=chat_model,
+                space_id=space_id,
+                map_id=map_id,
+                map_name=map_name,
+                on_upload_progress=on_upload_progress,
+            )
+            resp = await self.http.request("POST", "/synthesis/h5ad/create", **request_kwargs)
+        finally:
+            file.close()
+        space_id, map_id = self._read_create_response(resp, space_id, "h5ad create")
+
+        if on_receive_id is not None:
+            on_receive_id(space_id, map_id)
+
+        if wait:
+            await self._poll_until_done(
+                map_id, on_progress=on_progress, show_progress=show_progress, stall_timeout=stall_timeout
+            )
+
+        return AsyncSpaceHandle(space_id, map_id, self._client)
+
+    async def _poll_until_done(  # type: ignore[override]
+        self,
+        map_id: str,
+        *,
+        on_progress: ProgressCallback | None = None,
+        show_progress: bool = False,
+        stall_timeout: float | None = 600.0,
+    ) -> None:
+        """follow synthesis/progress/<map_id>/ until completed or errored (see the sync version)."""
+        tracker = _ProgressTracker(
+            map_id, on_progress=on_progress, show_progress=show_progress, stall_timeout=stall_timeout
+        )
+        try:
+            async for _ in self._watch(tracker):
+                pass
+        finally:
+            tracker.close()
+
+    async def watch(  # type: ignore[override]
+        self, map_id: str, *, stall_timeout: float | None = 600.0
+    ) -> AsyncIterator[ProgressEvent]:
+        """`async for` over SpacesResource.watch: pushed progress events when the backend
+        offers a stream, adaptively polled otherwise."""
+        tracker = _ProgressTracker(map_id, stall_timeout=stall_timeout)
+        try:
+            async for event in self._watch(tracker):
+                yield event
+        finally:
+            tracker.close()
+
+    async def _watch(self, tracker: _ProgressTracker) -> AsyncIterator[ProgressEvent]:  # type: ignore[override]
+        schedule = self._poll_schedule(tracker.stall_timeout)
+        while True:
+            payload = await self.http.request("GET", f"synthesis/progress/{tracker.map_id}")
+            for event in self._observe(tracker, payload):
+                yield event
+            if tracker.done:
+                return
+            events_url = self._events_url(payload)
+            if events_url is not None:
+                try:
+                    stream = await self.http.stream(
+                        "GET", events_url, headers={"Accept": "text/event-stream"}, decoder=EventStreamDecoder(self.http.codec)
+                    )
+                    async for payload in stream:
+                        for event in self._observe(tracker, payload):
+                            yield event
+                        if tracker.done:
+                            return
+                except APIStatusError as exc:
+                    self._no_push(exc)
+                except APIConnectionError as exc:
+                    logger.debug("progress stream for %s dropped (%s); polling", tracker.map_id, exc)
+            await asyncio.sleep(schedule.next(tracker.last, tracker.changed))
+
+    async def aopen(self, space_id: str, colab: bool = False):
+        from ..space import Space
+
+        return await Space.create(
+            space_id,
+            _request=self.http.request,
+            cookie=self.http.cookie,
+            config=self.http.config,
+            colab=colab,
+        )
+
+
+class AsyncMapsResource(MapsResource):
+    """read-side access to maps and their ideas/points."""
+
+    async def list(self, space_id: str) -> list[dict]:  # type: ignore[override]
+        resp = await self.http.request("GET", "/api/listMaps", params={"space_id": space_id})
+        return _unwrap_list(resp, "maps", "data")
+
+    async def list_idea_ids(self, map_id: str) -> list[str]:  # type: ignore[override]
+        return [idea_id async for idea_id in self.iter_idea_ids(map_id)]
+
+    async def iter_idea_ids(self, map_id: str) -> AsyncIterator[str]:  # type: ignore[override]
+        """stream a map's idea ids, decoding them as the response arrives."""
+        async for idea_id in await self.http.stream(
+            "GET", "/api/listIdeas", "ideas", "ids", params={"map_id": map_id}
+        ):
+            yield idea_id
+
+    async def get_ideas(self, ids: list[str]) -> Any:  # type: ignore[override]
+        return await self.http.request("GET", "/api/getIdeas", params={"ids": ",".join(ids)})
+
+    async def iter_ideas(self, ids: list[str]) -> AsyncIterator[dict]:  # type: ignore[override]
+        """stream full idea records for `ids`, decoding them as the response arrives."""
+        async for idea in await self.http.stream(
+            "GET", "/api/getIdeas", "ideas", "data", params={"ids": ",".join(ids)}
+        ):
+            yield idea
+
+
+class AsyncSpaceStatesResource(SpaceStatesResource):
+    """create/list space-states (see SpaceStatesResource for the get-or-create semantics)."""
+
+    async def create(self, space_id: str, name: str = "SDK") -> str:  # type: ignore[override]
+        for existing in await self.list(space_id):
+            if isinstance(existing, dict) and existing.get("name") == name and existing.get("id"):
+                return existing["id"]
+        resp = await self.http.request(
+            "POST", "/api/space-state", json={"space_id": space_id, "name": name}
+        )
+        if not isinstance(resp, dict) or "id" not in resp:
+            raise MantisError(f"space-state create returned no id: {resp}")
+        return resp["id"]
+
+    async def list(self, space_id: str) -> list[dict]:  # type: ignore[override]
+        resp = await self.http.request("GET", "/api/space-state", params={"space_id": space_id})
+        return _unwrap_list(resp, "states", "results")
+
+
+class AsyncFeaturedChatResource(FeaturedChatResource):
+    """pin a conversation to a space so it auto-loads for visitors."""
+
+    async def get(self, space_id: str) -> dict:  # type: ignore[override]
+        return await self.http.request("GET", "/api/featured-chat", params={"space_id": space_id})
+
+    async def set(  # type: ignore[override]
+        self, space_id: str, chat_id: str, *, messages: list[dict] | None = None, title: str | None = None
+    ) -> dict:
+        payload: dict = {"space_id": space_id, "chat_id": chat_id}
+        if messages:
+            payload["messages"] = messages
+        if title:
+            payload["title"] = title
+        return await self.http.request("PUT", "/api/featured-chat", json=payload)
+
+    async def clear(self, space_id: str) -> dict:  # type: ignore[override]
+        return await self.http.request("DELETE", "/api/featured-chat", params={"space_id": space_id})
+
+    async def clone(self, space_id: str) -> str:  # type: ignore[override]
+        resp = await self.http.request("POST", "/api/featured-chat/clone", json={"space_id": space_id})
+        if not isinstance(resp, dict) or "chat_session_id" not in resp:
+            raise MantisError(f"featured chat clone failed: {resp}")
+        return resp["chat_session_id"]
+
+
+class AsyncAliasesResource(AliasesResource):
+    """human-friendly URL aliases for spaces (see AliasesResource)."""
+
+    async def resolve(self, alias: str) -> str | None:  # type: ignore[override]
+        try:
+            resp = await self.http.request("GET", "/api/getSpaceFromAlias", params={"alias": alias})
+        except MantisError:
+            return None  # backend returns 400 when not found; treat as "no such alias"
+        return resp.get("project_id") if isinstance(resp, dict) else None
+
+    async def get(self, space_id: str) -> str | None:  # type: ignore[override]
+        try:
+            resp = await self.http.request(
+                "GET", "/api/getAliasFromSpaceId", params={"project_id": space_id}
+            )
+        except MantisError:
+            return None
+        return resp.get("alias") if isinstance(resp, dict) else None
+
+    async def set(self, space_id: str, alias: str) -> Any:  # type: ignore[override]
+        return await self.http.request(
+            "POST", "/api/setSpaceAlias", json={"space_id": space_id, "alias": alias}
+        )
+
+    async def resolve_or_create_space(self, alias: str) -> tuple[str, bool]:  # type: ignore[override]
+        existing = await self.resolve(alias)
+        if existing:
+            return existing, False
+        return self._alias_space_id(alias), True
+
+
+class AsyncAnnotationsResource(AnnotationsResource):
+    """text annotations over rest."""
+
+    async def list(self, map_id: str) -> list[dict]:  # type: ignore[override]
+        resp = await self.http.request("GET", "/api/getAnnotations", params={"map_id": map_id})
+        return _unwrap_list(resp, "annotations")
+
+    async def create(self, map_id: str, payload: dict) -> Any:  # type: ignore[override]
+        body = {"map_id": map_id, **payload}
+        return await self.http.request("POST", "/api/createAnnotation", json=body)
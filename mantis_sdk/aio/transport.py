@@ -0,0 +1,365 @@
+"""async http transport: a pooled httpx.AsyncClient with retry/backoff, per-call timeouts,
+and the same typed-exception mapping as the sync Transport."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from .._stream import JsonArrayDecoder
+from ..cache import ResponseCache
+from ..circuit import CircuitBreaker, CircuitBreakers
+from ..codec import JsonCodec, get_codec
+from ..compression import TransferStats
+from ..exceptions import APIConnectionError
+from ..instrumentation import Hooks, RequestEvent, ResponseEvent, endpoint_template
+from ..ratelimit import RateLimiter, parse_retry_after
+from ..transport import _IDEMPOTENT, _RETRY_STATUSES, _STREAM_CHUNK, Transport, _content_length, _redact
+from ..upload import MultipartStream
+
+logger = logging.getLogger("mantis_sdk")
+
+# httpcore trace events (the documented "trace" request extension) that mark a new connection.
+_CONNECTED = frozenset({"connection.connect_tcp.complete", "connection.connect_unix_socket.complete"})
+
+
+def _connect_failure(exc: httpx.HTTPError) -> bool:
+    """whether exc happened while connecting, before any of the request was sent."""
+    return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout))
+
+
+class AsyncTransport:
+    """owns an httpx.AsyncClient and turns raw responses into parsed json or typed errors.
+
+    one AsyncTransport is one connection pool: every coroutine sharing it multiplexes over
+    up to max_connections sockets, so hundreds of calls can be in flight from one process."""
+
+    def __init__(
+        self,
+        *,
+        default_timeout: float = 60.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        cache: ResponseCache | None = None,
+        codec: JsonCodec | None = None,
+        limiter: RateLimiter | None = None,
+        breakers: CircuitBreakers | None = None,
+        client: httpx.AsyncClient | None = None,
+    ):
+        self.default_timeout = default_timeout
+        self.limiter = limiter
+        self.codec = codec or get_codec()
+        self.cache = cache
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        limits = httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_keepalive_connections
+        )
+        # requests follows redirects by default; match it so both transports see the same urls.
+        self.client = client or httpx.AsyncClient(limits=limits, follow_redirects=True)
+        self.limits = limits if client is None else None
+        # pool counters (see pool_stats): connections opened (warmed ones among them) and requests.
+        self._opened = self._warmed = self._checkouts = 0
+        # httpx already advertises the content-codings it can decode in Accept-Encoding.
+        self.transfer = TransferStats()
+        self.hooks = Hooks()
+        self.breakers = breakers
+        if breakers is not None:
+            breakers.listener = self.hooks.circuit
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """perform a request and return parsed json (or text/None when not json).
+        raises a typed MantisError subclass on failure."""
+        headers = Transport._encode_json(self.codec, headers or {}, kwargs, "content")
+        if isinstance(kwargs.get("data"), MultipartStream):
+            upload = kwargs.pop("data")
+            headers = {**upload.headers, **headers}
+            kwargs["content"] = upload.aiter()
+        timeout = timeout if timeout is not None else self.default_timeout
+        return await self._instrumented(
+            method, url, lambda event: self._request(method, url, headers, timeout, event, kwargs)
+        )
+
+    async def _instrumented(
+        self, method: str, url: str, send: Callable[[ResponseEvent | None], Awaitable[Any]]
+    ) -> Any:
+        """await send(event) between the instrumentation hooks (see Transport._instrumented)."""
+        if not self.hooks:
+            return await send(None)
+        event = ResponseEvent(RequestEvent(method.upper(), url, endpoint_template(url)))
+        self.hooks.before(event.request)
+        started = time.monotonic()
+        try:
+            return await send(event)
+        except BaseException as exc:
+            event.error = exc
+            raise
+        finally:
+            event.elapsed = time.monotonic() - started
+            self.hooks.after(event)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        timeout: float,
+        event: ResponseEvent | None,
+        kwargs: dict[str, Any],
+    ) -> Any:
+        cache_key, entry = None, None
+        if self.cache is not None and method.upper() == "GET":
+            cache_key = self.cache.key(url, kwargs.get("params"))
+            if cache_key is not None:
+                entry, fresh = self.cache.get(cache_key)
+                if fresh:
+                    if event is not None:
+                        event.status, event.cached = 200, True
+                    return Transport._parse(self.cache.response(entry), codec=self.codec)
+                if entry is not None:
+                    headers = {**headers, **entry.conditional_headers()}
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("→ %s %s headers=%s", method, url, _redact(headers))
+
+        # mirror the sync urllib3 Retry: only idempotent methods are retried.
+        retries = self.max_retries if method.upper() in _IDEMPOTENT else 0
+        extensions = {**kwargs.pop("extensions", {}), "trace": self._trace}
+        breaker = self._admit(url)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            await self._throttle(url)
+            self._checkouts += 1
+            try:
+                response = await self.client.request(
+                    method, url, headers=headers, timeout=timeout, extensions=extensions, **kwargs
+                )
+            except httpx.HTTPError as exc:
+                if attempt < retries:
+                    await asyncio.sleep(self._backoff(attempt))
+                    attempt += 1
+                    continue
+                self._invalidate(method, url)
+                if breaker is not None:
+                    breaker.observe(None)
+                raise APIConnectionError(
+                    f"request to {url} failed: {exc}",
+                    request_sent=not _connect_failure(exc),
+                ) from exc
+            if self.limiter is not None:
+                self.limiter.observe(url, response.status_code, response.headers.get("Retry-After"))
+            if response.status_code in _RETRY_STATUSES and attempt < retries:
+                await asyncio.sleep(self._backoff(attempt, response))
+                attempt += 1
+                continue
+            break
+        if breaker is not None:
+            breaker.observe(response.status_code)
+
+        elapsed = (time.monotonic() - started) * 1000
+        logger.debug("← %s %s %d (%.0fms)", method, url, response.status_code, elapsed)
+        if response.headers.get("Content-Encoding"):
+            self.transfer.record_download(response.num_bytes_downloaded, len(response.content))
+        if event is not None:
+            event.status = response.status_code
+            event.retries = attempt
+            event.request_bytes = _content_length(response.request.headers)
+            event.response_bytes = response.num_bytes_downloaded
+
+        if cache_key is not None:
+            if response.status_code == 304 and entry is not None:
+                return Transport._parse(self.cache.response(self.cache.revalidated(entry, response)), codec=self.codec)
+            if 200 <= response.status_code < 300:
+                self.cache.store(cache_key, response)
+        self._invalidate(method, url)
+
+        return Transport._handle(response, url, self.codec)
+
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *keys: str,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        decoder: Any = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """perform a request and return an async iterator over the items of its json list,
+        or of decoder (see Transport.stream). typed errors raise here, before iteration starts."""
+        headers = Transport._encode_json(self.codec, headers or {}, kwargs, "content")
+        timeout = timeout if timeout is not None else self.default_timeout
+        return await self._instrumented(
+            method, url, lambda event: self._stream(
+                method, url, decoder or JsonArrayDecoder(*keys), headers, timeout, event, kwargs
+            )
+        )
+
+    async def _stream(
+        self,
+        method: str,
+        url: str,
+        decoder: Any,
+        headers: dict[str, str],
+        timeout: float,
+        event: ResponseEvent | None,
+        kwargs: dict[str, Any],
+    ) -> AsyncIterator[Any]:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("→ %s %s headers=%s (stream)", method, url, _redact(headers))
+        extensions = {**kwargs.pop("extensions", {}), "trace": self._trace}
+        request = self.client.build_request(
+            method, url, headers=headers, timeout=timeout, extensions=extensions, **kwargs
+        )
+        breaker = self._admit(url)
+        await self._throttle(url)
+        self._checkouts += 1
+        try:
+            response = await self.client.send(request, stream=True)
+        except httpx.HTTPError as exc:
+            if breaker is not None:
+                breaker.observe(None)
+            raise APIConnectionError(
+                f"request to {url} failed: {exc}", request_sent=not _connect_failure(exc)
+            ) from exc
+        if self.limiter is not None:
+            self.limiter.observe(url, response.status_code, response.headers.get("Retry-After"))
+        if breaker is not None:
+            breaker.observe(response.status_code)
+        logger.debug("← %s %s %d (stream)", method, url, response.status_code)
+        if event is not None:
+            event.status = response.status_code
+        if not 200 <= response.status_code < 300:
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            Transport._handle(response, url, self.codec)  # raises
+        return self._iter_items(response, url, decoder)
+
+    async def _iter_items(self, response: httpx.Response, url: str, decoder: Any) -> AsyncIterator[Any]:
+        decoded = 0
+        try:
+            async for chunk in response.aiter_bytes(_STREAM_CHUNK):
+                decoded += len(chunk)
+                for item in decoder.feed(chunk):
+                    yield item
+            for item in decoder.close():
+                yield item
+            if response.headers.get("Content-Encoding"):
+                self.transfer.record_download(response.num_bytes_downloaded, decoded)
+        except httpx.HTTPError as exc:
+            raise APIConnectionError(
+                f"reading {url} failed: {exc}", request_sent=not _connect_failure(exc)
+            ) from exc
+        finally:
+            await response.aclose()
+
+    def _admit(self, url: str) -> CircuitBreaker | None:
+        """url's circuit breaker once it admits the request (see Transport._admit)."""
+        if self.breakers is None:
+            return None
+        breaker = self.breakers.breaker(url)
+        breaker.before(url)
+        return breaker
+
+    async def _throttle(self, url: str) -> None:
+        """await a token from url's endpoint group (the limiter is shared with any threads)."""
+        if self.limiter is not None:
+            wait = self.limiter.reserve(url)
+            if wait:
+                await asyncio.sleep(wait)
+
+    def transfer_stats(self) -> dict[str, int]:
+        """bytes saved by compression in each direction; see Transport.transfer_stats."""
+        return self.transfer.snapshot()
+
+    def _invalidate(self, method: str, url: str) -> None:
+        if self.cache is not None and method.upper() not in _IDEMPOTENT:
+            self.cache.invalidate(url)
+
+    async def warm_up(self, url: str, connections: int = 1, *, timeout: float | None = None) -> int:
+        """pre-open up to `connections` keep-alive connections (tcp + tls) to url's origin.
+
+        httpx has no public way to connect without a request, so unlike Transport.warm_up this
+        sends `connections` concurrent HEAD / requests, each on its own connection, and leaves
+        the connections idle in the pool. failures are logged, never raised — warm-up is an
+        optimization. returns the number of connections that came up."""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}/"
+        timeout = timeout if timeout is not None else self.default_timeout
+        if self.limits is not None and self.limits.max_connections is not None:
+            connections = min(connections, self.limits.max_connections)
+        opened = 0
+
+        async def trace(name: str, info: dict[str, Any]) -> None:
+            nonlocal opened
+            await self._trace(name, info)
+            opened += name in _CONNECTED
+
+        async def _open() -> None:
+            try:
+                await self.client.head(origin, timeout=timeout, extensions={"trace": trace})
+            except httpx.HTTPError as exc:
+                logger.debug("warm-up connection to %s failed: %s", origin, exc)
+
+        await asyncio.gather(*(_open() for _ in range(max(1, connections))))
+        self._warmed += opened
+        logger.debug("warmed %d/%d connections to %s", opened, connections, origin)
+        return opened
+
+    async def _trace(self, name: str, info: dict[str, Any]) -> None:
+        """httpcore trace callback: counts the connections requests open (see pool_stats)."""
+        if name in _CONNECTED:
+            self._opened += 1
+
+    def pool_stats(self) -> dict[str, Any]:
+        """snapshot of the connection pool (see Transport.pool_stats): open/in-use/idle
+        connections, connections opened, and requests that rode an already-open one.
+
+        the opened/reused counts come from httpcore's public trace events. httpx doesn't expose
+        its pool, so the open/in-use/idle counts reach into it and are None when that fails (a
+        caller-supplied client with another transport, or an httpx that moved it)."""
+        total, idle = None, None
+        try:
+            connections = list(self.client._transport._pool.connections)  # type: ignore[attr-defined]
+            total, idle = len(connections), sum(1 for connection in connections if connection.is_idle())
+        except Exception as exc:  # noqa: BLE001 — the pool counts are best-effort
+            logger.debug("connection pool counts unavailable: %s", exc)
+        return {
+            "connections_open": total,
+            "connections_in_use": None if total is None else total - idle,
+            "connections_idle": idle,
+            "connections_opened": self._opened,
+            "connections_reused": max(self._checkouts - (self._opened - self._warmed), 0),
+            "checkouts": self._checkouts,
+            "max_connections": self.limits.max_connections if self.limits is not None else None,
+            "max_keepalive_connections": self.limits.max_keepalive_connections if self.limits is not None else None,
+        }
+
+    def _backoff(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """exponential backoff, deferring to a numeric Retry-After when the server sends one."""
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+        return self.backoff_factor * (2**attempt)
+
+    async def close(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,208 @@
+"""opt-in client-side cache for hot GET reads, with ETag / Last-Modified revalidation.
+
+within ttl a cached read is served from memory without touching the network; after ttl it
+is revalidated with If-None-Match / If-Modified-Since, so an unchanged payload costs a 304
+instead of a full download. writes through the same client drop the reads they make stale.
+entries are evicted least-recently-used by count and by total body bytes."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+from .codec import JsonCodec, get_codec
+
+# reads worth caching: hot dashboard reads whose payloads rarely change between calls.
+# progress polls, execute status etc. are deliberately absent — they must always hit the wire.
+DEFAULT_CACHEABLE = ("/api/getSpaces", "/api/listMaps", "/api/getAnnotations", "/api/space-state")
+
+# writes (matched by path fragment) → the cached reads they make stale.
+DEFAULT_INVALIDATES: dict[str, tuple[str, ...]] = {
+    "/synthesis/": ("/api/getSpaces", "/api/listMaps"),
+    "/api/spaces/delete": ("/api/getSpaces", "/api/listMaps", "/api/space-state", "/api/getAnnotations"),
+    "/api/createAnnotation": ("/api/getAnnotations",),
+    "/api/space-state": ("/api/space-state",),
+    "/api/setSpaceAlias": ("/api/getSpaces",),
+}
+
+# query params that never identify a resource (the legacy GET cache-buster).
+_IGNORED_PARAMS = frozenset({"_ts"})
+
+
+@dataclass
+class CacheEntry:
+    """one cached 2xx body plus the validators needed to revalidate it."""
+
+    content: bytes
+    content_type: str
+    encoding: str | None
+    etag: str | None
+    last_modified: str | None
+    stored_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self, ttl: float) -> bool:
+        return (time.monotonic() - self.stored_at) < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def as_response(self, codec: JsonCodec | None = None) -> _CachedResponse:
+        return _CachedResponse(self, codec)
+
+
+class _CachedResponse:
+    """just enough of a response for Transport._parse to decode a cached body."""
+
+    status_code = 200
+    reason = "OK (cached)"
+
+    def __init__(self, entry: CacheEntry, codec: JsonCodec | None = None):
+        self.codec = codec or get_codec("stdlib")
+        self.content = entry.content
+        self.headers = {"Content-Type": entry.content_type}
+        self._encoding = entry.encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self._encoding, errors="replace")
+
+    def json(self) -> Any:
+        return self.codec.loads(self.content)
+
+
+class ResponseCache:
+    """thread-safe ttl + lru cache of GET bodies keyed by url path and query params."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 30.0,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+        cacheable: tuple[str, ...] = DEFAULT_CACHEABLE,
+        invalidates: dict[str, tuple[str, ...]] | None = None,
+        codec: JsonCodec | None = None,
+    ):
+        self.ttl = ttl
+        self.codec = codec or get_codec("stdlib")  # decodes served bodies (the client's codec)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cacheable = cacheable
+        self.invalidates = DEFAULT_INVALIDATES if invalidates is None else invalidates
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+    # --- keys ---
+    def caches(self, url: str) -> bool:
+        """whether GETs to this url are cached at all."""
+        path = urlsplit(url).path
+        return any(fragment in path for fragment in self.cacheable)
+
+    def key(self, url: str, params: Any = None) -> str | None:
+        """cache key for a GET, or None when the url isn't cacheable."""
+        if not self.caches(url):
+            return None
+        items = sorted((str(k), str(v)) for k, v in dict(params or {}).items() if k not in _IGNORED_PARAMS)
+        return f"{url}?{urlencode(items)}"
+
+    # --- reads / writes ---
+    def get(self, key: str) -> tuple[CacheEntry | None, bool]:
+        """look up a key. returns (entry, fresh); a fresh entry is served without the network."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            self._entries.move_to_end(key)
+            fresh = entry.is_fresh(self.ttl)
+            if fresh:
+                self.hits += 1
+            return entry, fresh
+
+    def store(self, key: str, response: Any) -> None:
+        """cache a 2xx response body. responses without a bytes body are skipped."""
+        content = getattr(response, "content", None)
+        if not isinstance(content, bytes) or len(content) > self.max_bytes:
+            return
+        headers = response.headers
+        entry = CacheEntry(
+            content=content,
+            content_type=headers.get("Content-Type", ""),
+            encoding=getattr(response, "encoding", None),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        with self._lock:
+            self.misses += 1
+            self._pop(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            self._evict()
+
+    def response(self, entry: CacheEntry) -> _CachedResponse:
+        """entry as a response to hand to Transport._parse, decoded with this cache's codec."""
+        return entry.as_response(self.codec)
+
+    def revalidated(self, entry: CacheEntry, response: Any) -> CacheEntry:
+        """a 304 confirmed the entry: restart its ttl and adopt any refreshed validators."""
+        with self._lock:
+            entry.stored_at = time.monotonic()
+            entry.etag = response.headers.get("ETag") or entry.etag
+            entry.last_modified = response.headers.get("Last-Modified") or entry.last_modified
+            self.revalidations += 1
+        return entry
+
+    def invalidate(self, url: str) -> int:
+        """drop every cached read made stale by a write to url. returns entries dropped."""
+        path = urlsplit(url).path
+        stale = tuple(
+            read for fragment, reads in self.invalidates.items() if fragment in path for read in reads
+        )
+        if not stale:
+            return 0
+        with self._lock:
+            keys = [k for k in self._entries if any(read in urlsplit(k).path for read in stale)]
+            for key in keys:
+                self._pop(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+            }
+
+    # --- internals (lock held) ---
+    def _pop(self, key: str) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, old = self._entries.popitem(last=False)
+            self._bytes -= old.size
@@ -0,0 +1,170 @@
+"""client-side circuit breaking, per endpoint group.
+
+when the synthesis or notebook workers are down every poll and rest call would otherwise sit
+out its full timeout and retries. with config.circuit_failures = N, N consecutive connection
+errors or 5xx responses from one endpoint group open that group's circuit: further requests
+fail fast with CircuitOpenError instead of touching the network. after circuit_reset_timeout
+seconds the circuit goes half-open and lets a probe request through — success closes it,
+failure re-opens it for another timeout. groups are the rate limiter's (ratelimit.DEFAULT_GROUPS),
+so a dead synthesis worker does not stop map or annotation reads."""
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .exceptions import CircuitOpenError
+from .ratelimit import DEFAULT_GROUPS, endpoint_group
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# (group, old_state, new_state) — see instrumentation.Hooks.on_circuit.
+StateListener = Callable[[str, str, str], None]
+
+
+class CircuitBreaker:
+    """one endpoint group's breaker. thread-safe and clock-only (never sleeps), so the same
+    breaker guards threads and coroutines sharing a transport."""
+
+    def __init__(
+        self,
+        group: str,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        listener: StateListener | None = None,
+    ):
+        self.group = group
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.listener = listener
+        self.state = CLOSED
+        self._failures = 0
+        # when the circuit opened, or when the current half-open probe went out.
+        self._since = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.rejected = 0
+
+    def before(self, url: str) -> None:
+        """admit a request or raise CircuitOpenError. an open circuit past its timeout turns
+        half-open and admits up to half_open_probes requests; the rest keep failing fast."""
+        changed, error = None, None
+        with self._lock:
+            now = time.monotonic()
+            if self.state == OPEN and now - self._since >= self.reset_timeout:
+                changed = self._set(HALF_OPEN)
+                self._probes = 0
+            stuck = self._probes >= self.half_open_probes and now - self._since >= self.reset_timeout
+            if self.state == HALF_OPEN and stuck:
+                # a probe that never reported back (e.g. its caller was cancelled) must not
+                # wedge the circuit half-open: its slot frees up after reset_timeout.
+                self._probes = 0
+            if self.state == HALF_OPEN and self._probes < self.half_open_probes:
+                self._probes += 1
+                self._since = now
+            elif self.state != CLOSED:
+                self.rejected += 1
+                retry_in = max(0.0, self._since + self.reset_timeout - now)
+                error = CircuitOpenError(
+                    f"circuit for {self.group!r} is {self.state} after {self._failures} consecutive "
+                    f"failures; not sending {url} (next probe in {retry_in:.1f}s)",
+                    group=self.group,
+                    retry_in=retry_in,
+                )
+        self._notify(changed)
+        if error is not None:
+            raise error
+
+    def observe(self, status: int | None) -> None:
+        """feed one outcome back: None (no response) or a 5xx is a failure, anything else a success."""
+        if status is None or status >= 500:
+            self.on_failure()
+        else:
+            self.on_success()
+
+    def on_success(self) -> None:
+        """the backend answered (any non-5xx status): close the circuit."""
+        with self._lock:
+            self._failures = 0
+            changed = self._set(CLOSED) if self.state != CLOSED else None
+        self._notify(changed)
+
+    def on_failure(self) -> None:
+        """a connection error or 5xx: count it, and open at the threshold (or on any failed probe)."""
+        changed = None
+        with self._lock:
+            self._failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self._failures >= self.failure_threshold):
+                changed = self._set(OPEN)
+                self._since = time.monotonic()
+                self.opened += 1
+        self._notify(changed)
+
+    def _set(self, state: str) -> tuple[str, str]:
+        old, self.state = self.state, state
+        return old, state
+
+    def _notify(self, changed: tuple[str, str] | None) -> None:
+        # outside the lock: a listener may read stats() or log.
+        if changed is not None and self.listener is not None:
+            self.listener(self.group, *changed)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self._failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
+
+
+class CircuitBreakers:
+    """a CircuitBreaker per endpoint group, created on first use."""
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        groups: dict[str, tuple[str, ...]] = DEFAULT_GROUPS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.groups = groups
+        # set by the owning transport to forward state changes to its hooks.
+        self.listener: StateListener | None = None
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        group = endpoint_group(url, self.groups)
+        breaker = self.breakers.get(group)
+        if breaker is None:
+            with self._lock:
+                breaker = self.breakers.get(group)
+                if breaker is None:
+                    breaker = self.breakers[group] = CircuitBreaker(
+                        group,
+                        failure_threshold=self.failure_threshold,
+                        reset_timeout=self.reset_timeout,
+                        half_open_probes=self.half_open_probes,
+                        listener=self._forward,
+                    )
+        return breaker
+
+    def _forward(self, group: str, old: str, new: str) -> None:
+        if self.listener is not None:
+            self.listener(group, old, new)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {name: breaker.snapshot() for name, breaker in sorted(self.breakers.items())}
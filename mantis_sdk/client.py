@@ -65,6 +65,8 @@ class MantisClient:
             )
 
         self.http = HttpClient(base_url=base_url, cookie=cookie, config=self.config)
+        if self.config.warm_connections:
+            self.http.warm_up(self.config.warm_connections)
 
         # resource groups.
         self.spaces = SpacesResource(self)
@@ -109,6 +111,47 @@ class MantisClient:
             result["error"] = str(exc)
         return result
 
+    @property
+    def cache(self):
+        """the opt-in ResponseCache (config.cache_ttl), or None when reads aren't cached.
+        call client.cache.clear() to drop everything, client.cache.stats() for hit counts."""
+        return getattr(self.http.transport, "cache", None)
+
+    def pool_stats(self) -> dict:
+        """live connection-pool statistics for the shared transport (see Transport.pool_stats).
+        use them to size pool_maxsize against the worker pool sharing this client."""
+        return self.http.transport.pool_stats()
+
+    def stats(self) -> dict:
+        """one snapshot of everything the client measures: per-endpoint request metrics
+        (config.record_metrics; keyed "METHOD /endpoint/{id}/"), the connection pool,
+        compression savings, the read cache, the adaptive rate limits and circuit breakers."""
+        cache, limiter, breakers = self.cache, self.http.transport.limiter, self.http.transport.breakers
+        return {
+            "endpoints": self.http.metrics.stats() if self.http.metrics is not None else {},
+            "pool": self.pool_stats(),
+            "transfer": self.transfer_stats(),
+            "cache": cache.stats() if cache is not None else None,
+            "rate_limits": limiter.stats() if limiter is not None else {},
+            "circuits": breakers.stats() if breakers is not None else {},
+        }
+
+    def export_metrics(self) -> str:
+        """the per-endpoint metrics in prometheus text format, for a /metrics handler."""
+        if self.http.metrics is None:
+            raise ConfigurationError("metrics are off: set config.record_metrics (MANTIS_RECORD_METRICS=1)")
+        return self.http.metrics.to_prometheus()
+
+    @property
+    def hooks(self):
+        """instrumentation hooks on the transport: client.hooks.add(on_request=..., on_response=...)."""
+        return self.http.transport.hooks
+
+    def transfer_stats(self) -> dict:
+        """bytes on the wire vs decoded, and bytes saved, for compressed uploads and responses
+        (see config.upload_compression)."""
+        return self.http.transport.transfer_stats()
+
     # --- lifecycle ---
     def close(self) -> None:
         self.http.close()
@@ -0,0 +1,89 @@
+"""pluggable json codec for rest bodies, request form fields and agent websocket frames.
+
+config.json_codec picks the backend: "auto" (orjson when installed, else the stdlib),
+"orjson", "stdlib", or any object with loads/dumps. orjson is the optional [speedups] extra."""
+from __future__ import annotations
+
+import json
+from typing import Any, Protocol
+
+from .exceptions import ConfigurationError
+
+
+class JsonCodec(Protocol):
+    """what the sdk needs from a json backend. dumps returns str (form fields, text frames)."""
+
+    name: str
+
+    def loads(self, data: bytes | str) -> Any: ...
+
+    def dumps(self, obj: Any) -> str: ...
+
+
+class StdlibCodec:
+    """the standard library json module."""
+
+    name = "stdlib"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonCodec:
+    """orjson, with a stdlib fallback for the inputs it rejects: NaN/Infinity literals (which
+    python backends emit for missing floats) on decode, and ints beyond 64 bits or other
+    unsupported types on encode. numpy arrays/scalars are encoded natively."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return self._orjson.dumps(obj, option=self._options).decode()
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            return json.dumps(obj)
+
+
+_STDLIB = StdlibCodec()
+_resolved: dict[str, JsonCodec] = {"stdlib": _STDLIB, "json": _STDLIB}
+
+
+def get_codec(spec: str | JsonCodec | None = "auto") -> JsonCodec:
+    """resolve a config.json_codec value to a codec instance (cached per name)."""
+    if spec is None:
+        spec = "auto"
+    if not isinstance(spec, str):
+        return spec
+    name = spec.strip().lower()
+    if name in _resolved:
+        return _resolved[name]
+    if name == "auto":
+        try:
+            codec: JsonCodec = OrjsonCodec()
+        except ImportError:
+            codec = _STDLIB
+    elif name == "orjson":
+        try:
+            codec = OrjsonCodec()
+        except ImportError as exc:
+            raise ConfigurationError(
+                'json_codec="orjson" needs orjson: pip install "mantis_sdk[speedups]"'
+            ) from exc
+    else:
+        raise ConfigurationError(f"unknown json_codec {spec!r}; use auto, orjson or stdlib")
+    _resolved[name] = codec
+    return codec
@@ -0,0 +1,115 @@
+"""columnar upload formats for space creation: parquet and arrow ipc.
+
+csv is slow to format and parse for numeric, date and vector columns and several times larger
+than a columnar encoding. with config.upload_format = "parquet" | "arrow" | "auto" (or
+create(upload_format=...)) a DataFrame, pyarrow Table or streamed source (batch by batch, see
+mantis_sdk.sources) is encoded with pyarrow instead — but only when the backend advertises the
+format at synthesis/upload-formats/; otherwise the sdk falls back to csv. pyarrow is the
+optional [columnar] extra."""
+from __future__ import annotations
+
+import itertools
+import tempfile
+from collections.abc import Iterable
+from typing import IO, Any
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import ConfigurationError, MantisError
+from .vectors import as_matrix
+
+# format → (file extension, mime type) of the multipart part.
+FORMATS: dict[str, tuple[str, str]] = {
+    "parquet": ("parquet", "application/vnd.apache.parquet"),
+    "arrow": ("arrow", "application/vnd.apache.arrow.stream"),
+}
+# what upload_format="auto" picks, best first, among the formats the backend advertises.
+_AUTO_ORDER = ("parquet", "arrow")
+# encoded bodies stay in memory up to this size, then roll over to a temp file.
+_SPOOL_MAX = 8 * 1024 * 1024
+
+
+def is_arrow_table(data: Any) -> bool:
+    """whether data is a pyarrow Table, without importing pyarrow."""
+    return type(data).__module__.startswith("pyarrow") and hasattr(data, "column_names")
+
+
+def has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def normalize_format(spec: str | None) -> str:
+    """validate a config.upload_format / create(upload_format=) value."""
+    name = str(spec or "csv").strip().lower()
+    if name not in {"csv", "auto", *FORMATS}:
+        raise ConfigurationError(f"unknown upload_format {spec!r}; use csv, parquet, arrow or auto")
+    if name in FORMATS and not has_pyarrow():
+        raise ConfigurationError(f'upload_format="{name}" needs pyarrow: pip install "mantis_sdk[columnar]"')
+    return name
+
+
+def pick_format(requested: str, advertised: set[str]) -> str:
+    """the format to send: the requested one if the backend advertises it, the best advertised
+    one for "auto", else csv."""
+    if requested == "auto":
+        if not has_pyarrow():
+            return "csv"
+        return next((fmt for fmt in _AUTO_ORDER if fmt in advertised), "csv")
+    return requested if requested == "csv" or requested in advertised else "csv"
+
+
+def as_dataframe(data: Any) -> Any:
+    """a pyarrow Table as a DataFrame (for the csv path); anything else unchanged."""
+    return data.to_pandas() if is_arrow_table(data) else data
+
+
+def encode(data: pd.DataFrame | Any, fmt: str, vectors: dict[str, Any] | None = None) -> tuple[IO[bytes], int]:
+    """encode a DataFrame or pyarrow Table as parquet (zstd) or an arrow ipc stream into a
+    spooled temp file. vectors ({column: 2-d array}) become fixed-size float32 list columns.
+    returns (file rewound to 0, size in bytes)."""
+    import pyarrow as pa
+
+    table = data if is_arrow_table(data) else pa.Table.from_pandas(data, preserve_index=False)
+    for column, values in (vectors or {}).items():
+        matrix = as_matrix(values, column)
+        array = pa.FixedSizeListArray.from_arrays(pa.array(matrix.reshape(-1).astype(np.float32, copy=False)), matrix.shape[1])
+        if column in table.column_names:
+            table = table.set_column(table.column_names.index(column), column, array)
+        else:
+            table = table.append_column(column, array)
+    return encode_batches(table.to_batches(), fmt, table.schema)
+
+
+def encode_batches(batches: Iterable[Any], fmt: str, schema: Any = None) -> tuple[IO[bytes], int]:
+    """encode pyarrow RecordBatches like encode(), one at a time, so the rows are never all in
+    memory. schema defaults to the first batch's; later batches are cast to it."""
+    import pyarrow as pa
+
+    batches = iter(batches)
+    if schema is None:
+        first = next(batches, None)
+        if first is None:
+            raise MantisError("data has no rows to upload")
+        schema, batches = first.schema, itertools.chain([first], batches)
+    sink = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    elif fmt == "arrow":
+        writer = pa.ipc.new_stream(sink, schema)
+    else:
+        raise ConfigurationError(f"unsupported columnar format {fmt!r}")
+    with writer:
+        for batch in batches:
+            if not batch.schema.equals(schema):  # e.g. a chunk whose ints pandas read as floats
+                batch = pa.Table.from_batches([batch]).cast(schema)
+            writer.write(batch)
+    size = sink.tell()
+    sink.seek(0)
+    return sink, size
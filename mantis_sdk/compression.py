@@ -0,0 +1,146 @@
+"""opt-in compression of upload file parts, and byte accounting for both directions.
+
+config.upload_compression = "gzip" | "zstd" | "auto" compresses the csv sent to synthesis
+endpoints before it goes on the wire ("auto" prefers zstd when the zstandard package is
+installed). responses are already negotiated with Accept-Encoding and decompressed by the
+http library; TransferStats records how many bytes either side saved."""
+from __future__ import annotations
+
+import gzip
+import io
+import shutil
+import threading
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from typing import IO, Any
+
+from .exceptions import ConfigurationError
+
+_CHUNK = 1024 * 1024
+
+# encoding → (file suffix, mime type) for the compressed multipart part.
+_PARTS = {
+    "gzip": (".gz", "application/gzip"),
+    "zstd": (".zst", "application/zstd"),
+}
+
+
+def resolve_encoding(spec: str | None) -> str | None:
+    """normalize a config.upload_compression value to "gzip", "zstd" or None."""
+    if not spec or str(spec).strip().lower() in {"none", "off", "false", "0"}:
+        return None
+    name = str(spec).strip().lower()
+    if name == "auto":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            return "gzip"
+        return "zstd"
+    if name == "zstd":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError as exc:
+            raise ConfigurationError(
+                'upload_compression="zstd" needs zstandard: pip install "mantis_sdk[speedups]"'
+            ) from exc
+        return name
+    if name == "gzip":
+        return name
+    raise ConfigurationError(f"unknown upload_compression {spec!r}; use gzip, zstd or auto")
+
+
+def compress_part(source: IO[bytes], encoding: str) -> tuple[io.BytesIO, int, int]:
+    """compress a binary file object chunk by chunk into memory.
+    returns (compressed buffer rewound to 0, raw bytes read, compressed bytes)."""
+    out = io.BytesIO()
+    if encoding == "gzip":
+        # mtime=0 keeps the output deterministic for identical input.
+        with gzip.GzipFile(fileobj=out, mode="wb", compresslevel=6, mtime=0) as gz:
+            shutil.copyfileobj(source, gz, _CHUNK)
+    elif encoding == "zstd":
+        import zstandard
+
+        with zstandard.ZstdCompressor(level=3).stream_writer(out, closefd=False) as zw:
+            shutil.copyfileobj(source, zw, _CHUNK)
+    else:
+        raise ConfigurationError(f"unsupported upload encoding {encoding!r}")
+    raw = source.tell()
+    source.close()
+    out.seek(0)
+    return out, raw, out.getbuffer().nbytes
+
+
+def compress_chunks(
+    chunks: Iterable[bytes], encoding: str, on_done: Callable[[int, int], None] | None = None
+) -> Iterator[bytes]:
+    """compress a stream of chunks lazily, for streaming uploads. on_done(raw, wire) is
+    called once the input is exhausted (e.g. TransferStats.record_upload)."""
+    if encoding == "gzip":
+        # wbits=31 writes a gzip container; zlib leaves mtime 0, so output is deterministic.
+        compressor: Any = zlib.compressobj(6, zlib.DEFLATED, 31)
+    elif encoding == "zstd":
+        import zstandard
+
+        compressor = zstandard.ZstdCompressor(level=3).compressobj()
+    else:
+        raise ConfigurationError(f"unsupported upload encoding {encoding!r}")
+    raw = wire = 0
+    for chunk in chunks:
+        raw += len(chunk)
+        out = compressor.compress(chunk)
+        if out:
+            wire += len(out)
+            yield out
+    out = compressor.flush()
+    wire += len(out)
+    yield out
+    if on_done is not None:
+        on_done(raw, wire)
+
+
+def part_name(filename: str, encoding: str) -> tuple[str, str]:
+    """(filename, mime type) for a compressed multipart part."""
+    suffix, mime = _PARTS[encoding]
+    return filename + suffix, mime
+
+
+class TransferStats:
+    """byte counters for one transport: uploads compressed by the sdk and responses the
+    server compressed. thread-safe; saved bytes are (decoded - on the wire)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.uploads_compressed = 0
+        self.upload_raw_bytes = 0
+        self.upload_wire_bytes = 0
+        self.responses_compressed = 0
+        self.download_wire_bytes = 0
+        self.download_decoded_bytes = 0
+
+    def record_upload(self, raw: int, wire: int) -> None:
+        with self._lock:
+            self.uploads_compressed += 1
+            self.upload_raw_bytes += raw
+            self.upload_wire_bytes += wire
+
+    def record_download(self, wire: Any, decoded: int) -> None:
+        """count one compressed response. wire is ignored unless it is an int (mocks)."""
+        if not isinstance(wire, int):
+            return
+        with self._lock:
+            self.responses_compressed += 1
+            self.download_wire_bytes += wire
+            self.download_decoded_bytes += decoded
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "uploads_compressed": self.uploads_compressed,
+                "upload_raw_bytes": self.upload_raw_bytes,
+                "upload_wire_bytes": self.upload_wire_bytes,
+                "upload_bytes_saved": self.upload_raw_bytes - self.upload_wire_bytes,
+                "responses_compressed": self.responses_compressed,
+                "download_wire_bytes": self.download_wire_bytes,
+                "download_decoded_bytes": self.download_decoded_bytes,
+                "download_bytes_saved": self.download_decoded_bytes - self.download_wire_bytes,
+            }
@@ -2,10 +2,38 @@
 from __future__ import annotations
 
 import os
+from typing import Any
 
 from .render_args import RenderArgs
 
 
+def _env_flag(name: str, default: bool = False) -> bool:
+    """read a boolean MANTIS_* env var (1/true/yes/on, case-insensitive)."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_int(name: str) -> int | None:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+def _env_float(name: str) -> float | None:
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+def _env_mapping(name: str) -> dict[str, float] | None:
+    """read a MANTIS_* env var of the form "key=number,key=number"."""
+    value = os.getenv(name)
+    if not value:
+        return None
+    pairs = (item.split("=", 1) for item in value.split(",") if "=" in item)
+    return {key.strip(): float(number) for key, number in pairs}
+
+
 class ConfigurationManager:
     """holds connection + rendering settings.
     values fall back to MANTIS_* env vars, then sensible localhost defaults."""
@@ -22,6 +50,94 @@ class ConfigurationManager:
         # default http request timeout in seconds for the rest transport.
         self.request_timeout = float(os.getenv("MANTIS_REQUEST_TIMEOUT", "60"))
 
+        # connection pool for the rest transport. size it to the number of threads (or, for
+        # the async client, concurrent tasks) sharing one client; None keeps the transport
+        # default (10 sync, 100 async). pool_block makes an exhausted pool wait for a free
+        # connection instead of opening a throwaway one.
+        self.pool_maxsize: int | None = _env_int("MANTIS_POOL_MAXSIZE")
+        self.pool_block = _env_flag("MANTIS_POOL_BLOCK")
+        # pre-open this many connections (tcp + tls) to host when the client is built.
+        self.warm_connections = int(os.getenv("MANTIS_WARM_CONNECTIONS", "0"))
+
+        # opt-in read cache for hot GETs (getSpaces, listMaps, getAnnotations, space-state).
+        # None disables it. within cache_ttl seconds a read is served from memory; after that
+        # it is revalidated with etag / last-modified, so unchanged payloads cost a 304.
+        self.cache_ttl: float | None = _env_float("MANTIS_CACHE_TTL")
+        self.cache_max_entries = int(os.getenv("MANTIS_CACHE_MAX_ENTRIES", "256"))
+        self.cache_max_bytes = int(os.getenv("MANTIS_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+        # single-flight: concurrent identical GETs (same url + params) share one request and
+        # its result or error. removes the thundering herd when a worker fleet starts up.
+        self.coalesce_gets = _env_flag("MANTIS_COALESCE_GETS")
+
+        # json backend for response bodies, form fields and agent websocket frames: "auto"
+        # (orjson when installed, else the stdlib), "orjson", "stdlib", or a codec object
+        # with loads/dumps. see mantis_sdk.codec.
+        self.json_codec: Any = os.getenv("MANTIS_JSON_CODEC", "auto")
+
+        # compress the csv part of synthesis uploads: "gzip", "zstd", "auto" (zstd when the
+        # zstandard package is installed, else gzip) or None. the backend must accept a
+        # content_encoding form field. responses are always negotiated via Accept-Encoding.
+        self.upload_compression: str | None = os.getenv("MANTIS_UPLOAD_COMPRESSION") or None
+        # stream synthesis uploads: the csv is produced in blocks of upload_chunk_rows rows
+        # instead of one in-memory copy (see mantis_sdk.upload). the body is spooled to a
+        # temp file for an exact Content-Length, or with chunked_uploads sent straight out
+        # with chunked transfer encoding (the backend and proxies must accept that).
+        self.stream_uploads = _env_flag("MANTIS_STREAM_UPLOADS")
+        # file format of synthesis uploads from DataFrames / arrow tables: "csv", "parquet",
+        # "arrow" (ipc stream) or "auto". columnar formats need pyarrow and are only sent when
+        # the backend advertises them; otherwise create() falls back to csv.
+        self.upload_format = os.getenv("MANTIS_UPLOAD_FORMAT", "csv")
+        # send DataType.Vector columns of csv uploads as packed binary side-car parts: "float32",
+        # "float16" or "int8" (quantized per row). None keeps them as csv text, as does a backend
+        # that doesn't advertise "vectors" uploads. see mantis_sdk.vectors.
+        self.vector_encoding: str | None = os.getenv("MANTIS_VECTOR_ENCODING") or None
+        self.chunked_uploads = _env_flag("MANTIS_CHUNKED_UPLOADS")
+        self.upload_chunk_rows = int(os.getenv("MANTIS_UPLOAD_CHUNK_ROWS", "50000"))
+        # format csv row blocks in parallel: csv_workers > 1 uses a pool of that size,
+        # csv_executor "process" (real parallelism) or "thread". applies to every csv upload;
+        # on the streaming path the formatting overlaps the network transfer.
+        self.csv_workers = int(os.getenv("MANTIS_CSV_WORKERS", "0"))
+        self.csv_executor = os.getenv("MANTIS_CSV_EXECUTOR", "process")
+        # upload only the columns data_types maps (the backend deletes the rest anyway).
+        self.project_columns = _env_flag("MANTIS_PROJECT_COLUMNS", default=True)
+        # local sdk state (delta-refresh manifests, ...). see mantis_sdk.delta.
+        self.state_dir = os.getenv("MANTIS_STATE_DIR", os.path.join("~", ".cache", "mantis_sdk"))
+        # a delta refresh (create(map_id=..., delta_key=...)) re-uploads everything instead
+        # once more than this fraction of the rows were inserted, updated or deleted.
+        self.delta_max_fraction = float(os.getenv("MANTIS_DELTA_MAX_FRACTION", "0.5"))
+        # create() returns the existing space when the same data + settings already built a map
+        # that still exists (see mantis_sdk.create_cache). entries are evicted lru beyond
+        # create_cache_max_entries and after create_cache_ttl seconds (None: never).
+        self.create_cache = _env_flag("MANTIS_CREATE_CACHE")
+        self.create_cache_max_entries = int(os.getenv("MANTIS_CREATE_CACHE_MAX_ENTRIES", "1000"))
+        self.create_cache_ttl: float | None = _env_float("MANTIS_CREATE_CACHE_TTL")
+        # record every create() in the durable job store (see mantis_sdk.jobs), not only those
+        # given a job_key, so spaces.resume() can follow them after a restart.
+        self.job_store = _env_flag("MANTIS_JOB_STORE")
+        # at most this many recorded jobs submitting or running at once, across every process
+        # sharing state_dir; further submissions wait for a slot. None: no limit.
+        self.max_pipelines: int | None = _env_int("MANTIS_MAX_PIPELINES")
+        # re-send a synthesis submission (synthesis/landscape/, .../delta/, synthesis/github/)
+        # up to this many times after a transient failure. each carries an Idempotency-Key; a
+        # submission that may have reached the backend is only re-sent when the backend
+        # advertises idempotency keys (see SpacesResource._submit). 0 disables.
+        self.submit_retries = int(os.getenv("MANTIS_SUBMIT_RETRIES", "3"))
+
+        # built-in metrics recorder: per-endpoint latency histograms, bytes, retries and errors,
+        # read with client.stats() / client.export_metrics(). custom hooks work without it.
+        self.record_metrics = _env_flag("MANTIS_RECORD_METRICS")
+
+        # client-side adaptive rate limits in requests/second per endpoint group: synthesis,
+        # ideas, agent_providers, notebook_execute, or default (everything else), e.g.
+        # MANTIS_RATE_LIMITS="synthesis=2,ideas=20". 429/503 halve a group's rate and honor
+        # Retry-After; sustained success restores it. None disables limiting.
+        self.rate_limits: dict[str, float] | None = _env_mapping("MANTIS_RATE_LIMITS")
+        # circuit breaker per endpoint group: after circuit_failures consecutive connection
+        # errors / 5xx the group fails fast with CircuitOpenError, then lets one probe through
+        # every circuit_reset_timeout seconds until the backend answers. None disables it.
+        self.circuit_failures: int | None = _env_int("MANTIS_CIRCUIT_FAILURES")
+        self.circuit_reset_timeout = float(os.getenv("MANTIS_CIRCUIT_RESET_TIMEOUT", "30"))
+
         # browser-side flag the sdk waits on before a space is considered ready.
         self.wait_for = os.getenv("MANTIS_WAIT_FOR", "isLoaded")
 
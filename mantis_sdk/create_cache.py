@@ -0,0 +1,107 @@
+"""skip re-creating a space from exactly the data and settings of an earlier create().
+
+with config.create_cache (or create(reuse=True)) create() digests the data together with
+every setting that shapes the result — space / map names and ids, data_types, models,
+reducer, privacy, host. a digest recorded by an earlier create() that ran to completion, whose
+map still exists, returns that SpaceHandle at once: no upload, no synthesis.
+
+entries live in one json file under config.state_dir, evicted least-recently-used beyond
+config.create_cache_max_entries and after config.create_cache_ttl seconds (None: never)."""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from . import frames
+from ._state import read_json, state_path, write_json
+from .sources import Source
+from .upload import iter_file
+
+
+def content_digest(data: Any, *, vectors: dict[str, Any] | None = None, **settings: Any) -> str:
+    """digest of a create() input: the data's content (a DataFrame's or arrow Table's columns,
+    dtypes and values, a replayable Source's columns and values, a path's bytes), any vectors=
+    arrays, plus the settings."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(settings, sort_keys=True, default=str).encode())
+    for column, values in sorted((vectors or {}).items()):
+        matrix = np.ascontiguousarray(values)
+        digest.update(f"{column}:{matrix.dtype.str}:{matrix.shape}".encode())
+        digest.update(matrix.tobytes())
+    if isinstance(data, str):
+        for chunk in iter_file(open(data, "rb")):
+            digest.update(chunk)
+    elif isinstance(data, Source):  # replayable: hashed block by block, then read again to upload
+        digest.update(json.dumps([str(c) for c in data.columns]).encode())
+        for frame in data.frames():
+            digest.update(np.ascontiguousarray(frames.hash_rows(frame)).tobytes())
+    else:
+        frame = frames.to_frame(data)
+        digest.update(json.dumps([[str(c), str(t)] for c, t in frame.dtypes.items()]).encode())
+        digest.update(np.ascontiguousarray(frames.hash_rows(frame)).tobytes())
+    return digest.hexdigest()
+
+
+class CreateCache:
+    """digest → (space_id, map_id) of completed creates, persisted as json. safe to share
+    across threads; concurrent processes don't corrupt the file (writes are atomic), the last
+    writer wins."""
+
+    FILENAME = "create-cache.json"
+
+    def __init__(self, directory: str | Path, max_entries: int = 1000, ttl: float | None = None):
+        self.path = state_path(directory, self.FILENAME)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> tuple[str, str] | None:
+        """the (space_id, map_id) recorded for digest, marking it recently used."""
+        with self._lock:
+            entries = self._load()
+            entry = entries.pop(digest, None)
+            if entry is None:
+                return None
+            entry["used"] = time.time()
+            entries[digest] = entry
+            self._save(entries)
+            return entry["space_id"], entry["map_id"]
+
+    def put(self, digest: str, space_id: str, map_id: str) -> None:
+        with self._lock:
+            entries = self._load()
+            entries.pop(digest, None)
+            now = time.time()
+            entries[digest] = {"space_id": space_id, "map_id": map_id, "created": now, "used": now}
+            self._save(entries)
+
+    def discard(self, digest: str) -> None:
+        with self._lock:
+            entries = self._load()
+            if entries.pop(digest, None) is not None:
+                self._save(entries)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    def _load(self) -> dict[str, dict]:
+        """entries oldest-used first, without expired ones."""
+        raw = read_json(self.path)
+        entries = raw.get("entries", {}) if isinstance(raw, dict) else {}
+        if self.ttl is not None:
+            cutoff = time.time() - self.ttl
+            entries = {key: entry for key, entry in entries.items() if entry["created"] >= cutoff}
+        return dict(sorted(entries.items(), key=lambda item: item[1]["used"]))
+
+    def _save(self, entries: dict[str, dict]) -> None:
+        overflow = len(entries) - max(self.max_entries, 0)
+        for key in list(entries)[:max(overflow, 0)]:
+            del entries[key]
+        write_json(self.path, {"entries": entries})
@@ -0,0 +1,119 @@
+"""delta refreshes of a map kept in place by a stable map_id.
+
+create(..., map_id=..., delta_key="url") hashes every uploaded row and keeps a manifest of
+{key: row hash} per map under config.state_dir. on the next refresh the new rows are diffed
+against it and only inserted + updated rows are uploaded, with the deleted keys, to
+synthesis/landscape/delta/. the sdk falls back to a full upload when there is no usable
+manifest (first run, different columns / data_types / models, another host), when more than
+config.delta_max_fraction of the rows changed, or when the backend has no delta route."""
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from . import frames
+from ._state import read_json, state_path, write_json
+from .exceptions import MantisError
+
+# bump when the row hash or manifest layout changes; older manifests then force a full upload.
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class Manifest:
+    """what was last uploaded to a map: its schema digest and {row key: row hash}."""
+
+    map_id: str
+    space_id: str
+    key: list[str]
+    schema: str
+    rows: dict[str, str] = field(default_factory=dict)
+
+    @staticmethod
+    def path(directory: str | Path, map_id: str) -> Path:
+        return state_path(directory, "manifests", f"{map_id}.json")
+
+    @classmethod
+    def load(cls, directory: str | Path, map_id: str) -> Manifest | None:
+        """the stored manifest for map_id, or None (missing, unreadable or an old version)."""
+        raw = read_json(cls.path(directory, map_id))
+        if not isinstance(raw, dict) or raw.get("version") != MANIFEST_VERSION:
+            return None
+        return cls(raw["map_id"], raw["space_id"], raw["key"], raw["schema"], raw["rows"])
+
+    def save(self, directory: str | Path) -> None:
+        """written atomically, so an interrupted run leaves the previous manifest intact."""
+        write_json(self.path(directory, self.map_id), {
+            "version": MANIFEST_VERSION, "map_id": self.map_id, "space_id": self.space_id,
+            "key": self.key, "schema": self.schema, "rows": self.rows,
+        })
+
+    def digest(self) -> str:
+        """digest of the rows the manifest describes (schema, key and every row hash)."""
+        content = json.dumps([self.schema, self.key, sorted(self.rows.items())], separators=(",", ":"))
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+    @classmethod
+    def forget(cls, directory: str | Path, map_id: str) -> None:
+        cls.path(directory, map_id).unlink(missing_ok=True)
+
+
+@dataclass
+class Delta:
+    """the rows to send: upserts (inserted + updated, as a DataFrame) and deleted keys."""
+
+    upserts: pd.DataFrame
+    inserted: int
+    updated: int
+    deleted: list[str]
+    total: int
+
+    @property
+    def changed(self) -> int:
+        return self.inserted + self.updated + len(self.deleted)
+
+    @property
+    def fraction(self) -> float:
+        return self.changed / max(self.total, 1)
+
+
+def key_columns(key: str | list[str]) -> list[str]:
+    return [key] if isinstance(key, str) else list(key)
+
+
+def schema_digest(columns: list[str], **settings: Any) -> str:
+    """digest of everything besides row values that changes what the backend builds."""
+    text = json.dumps({"columns": [str(c) for c in columns], **settings}, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def row_hashes(df: pd.DataFrame) -> list[str]:
+    """each row's content hash as hex (see frames.hash_rows)."""
+    return [format(int(h), "016x") for h in frames.hash_rows(df)]
+
+
+def row_keys(df: pd.DataFrame, key: list[str]) -> list[str]:
+    """each row's identity as a string; raises MantisError on a missing or duplicated key."""
+    missing = [column for column in key if column not in df.columns]
+    if missing:
+        raise MantisError(f"delta_key column(s) {missing} are not in the data")
+    parts = df[key].astype(str)
+    keys = parts.iloc[:, 0].tolist() if len(key) == 1 else parts.agg("\x1f".join, axis=1).tolist()
+    if len(set(keys)) != len(keys):
+        raise MantisError(f"delta_key {key} does not identify rows uniquely")
+    return keys
+
+
+def diff(df: pd.DataFrame, keys: list[str], hashes: list[str], previous: dict[str, str]) -> Delta:
+    """compare the current rows against a manifest's {key: hash}."""
+    current = pd.Series(hashes, dtype=object)
+    old = pd.Series(keys, dtype=object).map(previous)
+    inserted = old.isna().to_numpy()
+    updated = ~inserted & (old != current).to_numpy()
+    deleted = sorted(set(previous).difference(keys))
+    return Delta(df[inserted | updated], int(inserted.sum()), int(updated.sum()), deleted, len(keys))
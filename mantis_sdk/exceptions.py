@@ -37,7 +37,24 @@ class RateLimitError(APIStatusError):
 
 
 class APIConnectionError(MantisError):
-    """raised when the request never reached the server (dns, refused, timeout)."""
+    """raised when the request never reached the server (dns, refused, timeout) or the
+    connection dropped before a response. request_sent is False when it failed while
+    connecting, before any of the request went out — re-sending it can't duplicate work."""
+
+    def __init__(self, message: str, *, request_sent: bool = True):
+        self.request_sent = request_sent
+        super().__init__(message)
+
+
+class CircuitOpenError(APIConnectionError):
+    """raised without touching the network when an endpoint group's circuit breaker is open
+    (too many consecutive connection errors / 5xx). retry_in is the seconds until the next probe.
+    request_sent is always False: nothing went out."""
+
+    def __init__(self, message: str, *, group: str, retry_in: float):
+        self.group = group
+        self.retry_in = retry_in
+        super().__init__(message, request_sent=False)
 
 
 class SpaceCreationError(MantisError):
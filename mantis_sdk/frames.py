@@ -0,0 +1,108 @@
+"""client-side shaping of space-creation data: column projection and exact-duplicate removal.
+
+columns missing from data_types are marked delete=True for the backend, which drops them after
+parsing — so uploading them only costs bytes, parse time and (for text) embedding work. create()
+projects the upload down to the mapped columns first (config.project_columns), and with
+drop_duplicates=True also drops exact-duplicate rows. inputs may be DataFrames, pyarrow Tables or
+csv paths."""
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from . import sources
+from .enums import DataType
+from .exceptions import MantisError
+from .sources import Source
+
+
+def columns_of(data: Any) -> list[str]:
+    """column names of a DataFrame, pyarrow Table, Source or csv path (header only)."""
+    if isinstance(data, (pd.DataFrame, Source)):
+        return list(data.columns)
+    if isinstance(data, str):
+        return list(pd.read_csv(data, nrows=0).columns)
+    if hasattr(data, "column_names"):
+        return list(data.column_names)
+    raise MantisError("data must be a pandas DataFrame, a pyarrow Table or a file path string")
+
+
+def mapped_columns(columns: list[str], data_types: dict[str, Any]) -> list[str]:
+    """the columns data_types maps to a real type, in the data's own order."""
+    delete = str(DataType.Delete)
+    keep = [column for column in columns if column in data_types and str(data_types[column]) != delete]
+    if not keep:
+        raise MantisError(f"none of the data columns {columns} are mapped in data_types")
+    return keep
+
+
+def project(data: Any, keep: list[str]) -> Any:
+    """data restricted to the keep columns (unchanged when it has no others; for a csv path
+    only the header is read to tell). a csv path becomes a Source reading the file in row
+    blocks as text, so it is never loaded whole and the projected values are byte-for-byte
+    what the file held."""
+    if keep == columns_of(data):
+        return data
+    if isinstance(data, pd.DataFrame):
+        return data[keep]
+    if isinstance(data, str):
+        return sources.of_csv(data, keep)
+    return data.select(keep)
+
+
+def drop_duplicate_rows(data: Any) -> tuple[Any, int]:
+    """(data without exact-duplicate rows, keeping first occurrences; number dropped).
+    vector cells (lists / arrays) compare by value. paths and arrow tables become DataFrames."""
+    data = to_frame(data)
+    key = data.apply(lambda column: column.map(_hashable) if column.dtype == object else column)
+    duplicated = key.duplicated()
+    dropped = int(duplicated.sum())
+    return (data[~duplicated.to_numpy()] if dropped else data), dropped
+
+
+def to_frame(data: Any) -> pd.DataFrame:
+    """data as a DataFrame; a csv path is read as text, like project() does. a Source is read
+    whole (and, unless replayable, can't be read again)."""
+    if isinstance(data, pd.DataFrame):
+        return data
+    if isinstance(data, Source):
+        return sources.to_frame(data)
+    if isinstance(data, str):
+        return pd.read_csv(data, dtype=str, keep_default_na=False)
+    return data.to_pandas()
+
+
+def hash_rows(df: pd.DataFrame) -> np.ndarray:
+    """a stable 64-bit content hash per row: equal values hash equal in any process.
+    vector cells (lists / arrays) and dicts are hashed by value."""
+    frame = df.apply(lambda column: column.map(_digest) if column.dtype == object else column)
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+def _digest(value: Any) -> Any:
+    if isinstance(value, (np.ndarray, list, tuple, dict)):
+        return hashlib.blake2b(_canonical(value), digest_size=8).hexdigest()
+    return value
+
+
+def _canonical(value: Any) -> bytes:
+    if isinstance(value, np.ndarray):
+        return b"a" + value.dtype.str.encode() + str(value.shape).encode() + value.tobytes()
+    if isinstance(value, (list, tuple)):
+        return b"l" + b"|".join(_canonical(item) for item in value)
+    if isinstance(value, dict):
+        return b"d" + b"|".join(str(k).encode() + b"=" + _canonical(v) for k, v in sorted(value.items(), key=str))
+    return repr(value).encode()
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    return value
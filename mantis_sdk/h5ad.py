@@ -0,0 +1,164 @@
+"""read an .h5ad (AnnData) file a row block at a time, for from_h5ad.
+
+the file is opened read-only with h5py — nothing is loaded up front. obs, the per-cell
+metadata, becomes csv chunks with its index as an obs_names column; the chosen matrix — an
+obsm entry such as X_pca, or an expression layer (layers/<name>, or X) — is read in row blocks
+and sent as a binary side-car laid out like Vector side-cars (see mantis_sdk.vectors). dense
+and csr matrices are supported; a csc matrix can't be read by rows. peak memory follows the
+block size, not the file size.
+
+h5py is the optional [h5ad] extra; anndata isn't needed. files written by anndata >= 0.7
+(obs as a group of columns) are supported."""
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .enums import DataType
+from .exceptions import ConfigurationError, MantisError
+
+# the csv column holding obs's index (the cell ids).
+INDEX_COLUMN = "obs_names"
+
+
+def open_file(path: str | os.PathLike) -> Any:
+    """the h5ad file at path, opened read-only."""
+    try:
+        import h5py
+    except ImportError as exc:
+        raise ConfigurationError('from_h5ad needs h5py: pip install "mantis_sdk[h5ad]"') from exc
+    return h5py.File(path, "r")
+
+
+def source_path(obsm: str | None, layer: str | None) -> str:
+    """the path inside the file of the matrix named by obsm= or layer= ("X" is the main matrix)."""
+    if (obsm is None) == (layer is None):
+        raise MantisError("from_h5ad needs exactly one of obsm= or layer=")
+    if obsm is not None:
+        return f"obsm/{obsm}"
+    return "X" if layer == "X" else f"layers/{layer}"
+
+
+def _text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def _encoding(node: Any) -> str:
+    return _text(node.attrs.get("encoding-type", ""))
+
+
+def _is_group(node: Any) -> bool:
+    return not hasattr(node, "dtype")
+
+
+def _read(node: Any, rows: slice) -> np.ndarray:
+    """rows of a dataset, with strings decoded."""
+    import h5py
+
+    if h5py.check_string_dtype(node.dtype) is not None:
+        return np.asarray(node.asstr()[rows], dtype=object)
+    return node[rows]
+
+
+class Obs:
+    """the obs table of an open h5ad file: obs_names plus the chosen columns (all by default)."""
+
+    def __init__(self, file: Any, columns: list[str] | None = None):
+        group = file.get("obs")
+        if group is None or not _is_group(group):
+            raise MantisError("obs in this h5ad file uses the pre-0.7 anndata layout; re-save it with a current anndata")
+        order = [_text(column) for column in np.atleast_1d(group.attrs.get("column-order", []))]
+        if columns is not None:
+            missing = [column for column in columns if column not in order]
+            if missing:
+                raise MantisError(f"obs has no column(s) {missing}")
+            order = list(columns)
+        self.columns = [INDEX_COLUMN, *order]
+        index = group[_text(group.attrs.get("_index", "_index"))]
+        self._nodes = {INDEX_COLUMN: index, **{column: group[column] for column in order}}
+        self.rows = len(index)
+        # categories are small; codes are read per block.
+        self._categories = {
+            column: _read(node["categories"], slice(None))
+            for column, node in self._nodes.items() if _is_group(node) and _encoding(node) == "categorical"
+        }
+
+    def data_types(self) -> dict[str, DataType]:
+        """default data_types: obs_names is the title, numbers are numeric, the rest categoric."""
+        types = {INDEX_COLUMN: DataType.Title}
+        for column in self.columns[1:]:
+            node = self._nodes[column]
+            if column in self._categories:
+                numeric = False
+            elif _is_group(node):  # nullable-integer / nullable-boolean
+                numeric = _encoding(node) == "nullable-integer"
+            else:
+                numeric = node.dtype.kind in "iuf"
+            types[column] = DataType.Numeric if numeric else DataType.Categoric
+        return types
+
+    def block(self, start: int, stop: int) -> pd.DataFrame:
+        rows = slice(start, stop)
+        return pd.DataFrame({column: self._column(column, rows) for column in self.columns})
+
+    def iter_csv(self, chunk_rows: int, empty: Iterable[str] = ()) -> Iterator[bytes]:
+        """the table as csv, chunk_rows rows per chunk, with each empty column added blank."""
+        chunk_rows = max(1, chunk_rows)
+        blank = dict.fromkeys(empty, "")
+        for start in range(0, self.rows, chunk_rows):
+            block = self.block(start, start + chunk_rows).assign(**blank)
+            yield block.to_csv(index=False, header=start == 0).encode()
+
+    def _column(self, column: str, rows: slice) -> Any:
+        node = self._nodes[column]
+        if column in self._categories:
+            codes = node["codes"][rows]
+            values = pd.Series(self._categories[column][np.maximum(codes, 0)], dtype=object)
+            return values.where(codes >= 0)  # code -1 is a missing value
+        if _is_group(node):
+            values = pd.Series(node["values"][rows], dtype=object)
+            return values.where(~node["mask"][rows].astype(bool))
+        return _read(node, rows)
+
+
+class CSRRows:
+    """row blocks of a csr matrix as dense float32 arrays; only indptr is held in memory."""
+
+    def __init__(self, group: Any):
+        self._group = group
+        self.shape = tuple(int(n) for n in group.attrs["shape"])
+        self.dtype = np.dtype(np.float32)
+        self._indptr = group["indptr"][:]
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, rows: slice) -> np.ndarray:
+        start, stop, _ = rows.indices(self.shape[0])
+        stop = max(start, stop)
+        lo, hi = self._indptr[start], self._indptr[stop]
+        block = np.zeros((stop - start, self.shape[1]), dtype=np.float32)
+        counts = np.diff(self._indptr[start:stop + 1])
+        block[np.repeat(np.arange(stop - start), counts), self._group["indices"][lo:hi]] = self._group["data"][lo:hi]
+        return block
+
+
+def matrix(file: Any, path: str) -> Any:
+    """the matrix at path as a row-sliceable (rows, dim) object — an h5py dataset or CSRRows."""
+    node = file.get(path)
+    if node is None:
+        raise MantisError(f"{path} isn't in this h5ad file")
+    if not _is_group(node):
+        if node.ndim != 2 or node.dtype.kind not in "iuf":
+            raise MantisError(f"{path} isn't a 2-d numeric matrix")
+        return node
+    encoding = _encoding(node)
+    if encoding == "csr_matrix":
+        return CSRRows(node)
+    if encoding == "csc_matrix":
+        raise MantisError(f"{path} is stored csc, which can't be read by rows; re-save it as csr")
+    raise MantisError(f"{path} has unsupported encoding {encoding!r}")
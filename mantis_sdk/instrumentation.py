@@ -0,0 +1,296 @@
+"""request instrumentation: pre-request / post-response hooks and a built-in metrics recorder.
+
+every Transport owns a Hooks registry. hooks see a RequestEvent before the request is sent
+and a ResponseEvent after it settles (success, typed error, or connection failure). the
+MetricsRecorder (config.record_metrics) is one such hook: it keeps per-endpoint-template
+latency histograms, byte counts, retry counts and error counts by exception type, readable
+via client.stats() and exportable as prometheus text via client.export_metrics(). hooks
+registered with on_circuit hear circuit breaker state changes (see mantis_sdk.circuit)."""
+from __future__ import annotations
+
+import logging
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+logger = logging.getLogger("mantis_sdk")
+
+# path segments that identify a resource rather than a route: uuids, numbers, long hex/ids.
+_ID_SEGMENT = re.compile(
+    r"^(?:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|\d+|[0-9a-f]{16,}|[A-Za-z0-9_-]{24,})$",
+    re.IGNORECASE,
+)
+
+
+def endpoint_template(url: str) -> str:
+    """the route of a url with ids collapsed, so metrics group by endpoint, not resource:
+    http://h/api/proxy/synthesis/progress/5f0c…/ → /api/proxy/synthesis/progress/{id}/"""
+    path = urlsplit(url).path or "/"
+    return "/".join("{id}" if _ID_SEGMENT.match(seg) else seg for seg in path.split("/"))
+
+
+@dataclass
+class RequestEvent:
+    """what is about to be sent."""
+
+    method: str
+    url: str
+    endpoint: str
+
+
+@dataclass
+class ResponseEvent:
+    """how a request settled. status is None when no response arrived; error is the exception
+    the transport is about to raise (None on success); cached means no network round-trip."""
+
+    request: RequestEvent
+    status: int | None = None
+    elapsed: float = 0.0
+    request_bytes: int | None = None
+    response_bytes: int | None = None
+    retries: int = 0
+    error: BaseException | None = None
+    cached: bool = False
+
+
+RequestHook = Callable[[RequestEvent], None]
+ResponseHook = Callable[[ResponseEvent], None]
+# (endpoint group, old state, new state): "closed" / "open" / "half_open".
+CircuitHook = Callable[[str, str, str], None]
+
+
+class Hooks:
+    """registry of instrumentation callbacks. a failing hook is logged, never raised —
+    instrumentation must not break the request it observes."""
+
+    def __init__(self) -> None:
+        self.on_request: list[RequestHook] = []
+        self.on_response: list[ResponseHook] = []
+        self.on_circuit: list[CircuitHook] = []
+
+    def __bool__(self) -> bool:
+        # only the per-request hooks cost anything on the request path.
+        return bool(self.on_request or self.on_response)
+
+    def add(
+        self,
+        *,
+        on_request: RequestHook | None = None,
+        on_response: ResponseHook | None = None,
+        on_circuit: CircuitHook | None = None,
+    ) -> None:
+        if on_request is not None:
+            self.on_request.append(on_request)
+        if on_response is not None:
+            self.on_response.append(on_response)
+        if on_circuit is not None:
+            self.on_circuit.append(on_circuit)
+
+    def remove(self, hook: Callable[..., None]) -> None:
+        for hooks in (self.on_request, self.on_response, self.on_circuit):
+            if hook in hooks:
+                hooks.remove(hook)
+
+    def before(self, event: RequestEvent) -> None:
+        for hook in self.on_request:
+            try:
+                hook(event)
+            except Exception:  # noqa: BLE001
+                logger.exception("request hook %r failed", hook)
+
+    def after(self, event: ResponseEvent) -> None:
+        for hook in self.on_response:
+            try:
+                hook(event)
+            except Exception:  # noqa: BLE001
+                logger.exception("response hook %r failed", hook)
+
+    def circuit(self, group: str, old: str, new: str) -> None:
+        logger.warning("circuit for %r: %s -> %s", group, old, new)
+        for hook in self.on_circuit:
+            try:
+                hook(group, old, new)
+            except Exception:  # noqa: BLE001
+                logger.exception("circuit hook %r failed", hook)
+
+
+# prometheus gauge values for circuit states.
+_CIRCUIT_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+# latency bucket upper bounds in seconds: log-spaced (x1.25) from 1ms to ~2min, then +Inf.
+# quantiles read off these buckets are accurate to within one bucket (25%).
+LATENCY_BUCKETS: tuple[float, ...] = tuple(0.001 * 1.25**i for i in range(53)) + (math.inf,)
+
+
+class _Histogram:
+    def __init__(self) -> None:
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """upper bound of the bucket holding the q-th observation (capped at the max seen)."""
+        if not self.total:
+            return 0.0
+        rank = q * self.total
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+@dataclass
+class _EndpointMetrics:
+    requests: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    latency: _Histogram = field(default_factory=_Histogram)
+    statuses: dict[int, int] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+
+
+class MetricsRecorder:
+    """per-endpoint-template metrics, fed by a Transport's response hook. thread-safe.
+
+    attach with recorder.attach(transport) (config.record_metrics does this for you)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: dict[tuple[str, str], _EndpointMetrics] = {}
+        self._circuits: dict[str, str] = {}
+        self._transitions: dict[tuple[str, str], int] = {}
+
+    def attach(self, transport: Any) -> MetricsRecorder:
+        transport.hooks.add(on_response=self.record, on_circuit=self.record_circuit)
+        return self
+
+    def record_circuit(self, group: str, old: str, new: str) -> None:
+        with self._lock:
+            self._circuits[group] = new
+            self._transitions[(group, new)] = self._transitions.get((group, new), 0) + 1
+
+    def record(self, event: ResponseEvent) -> None:
+        key = (event.request.method.upper(), event.request.endpoint)
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = _EndpointMetrics()
+            metrics.requests += 1
+            if event.cached:
+                metrics.cache_hits += 1
+            else:
+                metrics.latency.observe(event.elapsed)
+            metrics.retries += event.retries
+            metrics.request_bytes += event.request_bytes or 0
+            metrics.response_bytes += event.response_bytes or 0
+            if event.status is not None:
+                metrics.statuses[event.status] = metrics.statuses.get(event.status, 0) + 1
+            if event.error is not None:
+                name = type(event.error).__name__
+                metrics.errors[name] = metrics.errors.get(name, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self._circuits.clear()
+            self._transitions.clear()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """{"GET /api/listMaps/": {requests, latency_ms: {p50, p95, p99, max, mean}, ...}}."""
+        out: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for (method, endpoint), m in sorted(self._endpoints.items()):
+                h = m.latency
+                out[f"{method} {endpoint}"] = {
+                    "requests": m.requests,
+                    "cache_hits": m.cache_hits,
+                    "retries": m.retries,
+                    "request_bytes": m.request_bytes,
+                    "response_bytes": m.response_bytes,
+                    "statuses": dict(m.statuses),
+                    "errors": dict(m.errors),
+                    "latency_ms": {
+                        "p50": h.quantile(0.50) * 1000,
+                        "p95": h.quantile(0.95) * 1000,
+                        "p99": h.quantile(0.99) * 1000,
+                        "max": h.max * 1000,
+                        "mean": (h.sum / h.total * 1000) if h.total else 0.0,
+                    },
+                }
+        return out
+
+    def to_prometheus(self, prefix: str = "mantis_sdk") -> str:
+        """render the metrics in the prometheus text exposition format (version 0.0.4)."""
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            full = f"{prefix}_{name}"
+            lines.append(f"# HELP {full} {help_text}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        with self._lock:
+            items = sorted(self._endpoints.items())
+            name = family("request_duration_seconds", "histogram", "request latency by endpoint template.")
+            for (method, endpoint), m in items:
+                labels = _labels(method=method, endpoint=endpoint)
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, m.latency.counts):
+                    cumulative += count
+                    le = "+Inf" if math.isinf(bound) else f"{bound:.6g}"
+                    lines.append(f"{name}_bucket{_labels(method=method, endpoint=endpoint, le=le)} {cumulative}")
+                lines.append(f"{name}_sum{labels} {m.latency.sum:.6f}")
+                lines.append(f"{name}_count{labels} {m.latency.total}")
+
+            for metric, attr, help_text in (
+                ("requests_total", "requests", "requests settled, including cache hits."),
+                ("cache_hits_total", "cache_hits", "requests served from the read cache."),
+                ("retries_total", "retries", "automatic retries before the final response."),
+                ("request_bytes_total", "request_bytes", "request body bytes sent."),
+                ("response_bytes_total", "response_bytes", "response body bytes received on the wire."),
+            ):
+                name = family(metric, "counter", help_text)
+                for (method, endpoint), m in items:
+                    lines.append(f"{name}{_labels(method=method, endpoint=endpoint)} {getattr(m, attr)}")
+
+            name = family("responses_total", "counter", "responses by http status.")
+            for (method, endpoint), m in items:
+                for status, count in sorted(m.statuses.items()):
+                    lines.append(f"{name}{_labels(method=method, endpoint=endpoint, status=str(status))} {count}")
+
+            name = family("errors_total", "counter", "raised errors by exception type.")
+            for (method, endpoint), m in items:
+                for error, count in sorted(m.errors.items()):
+                    lines.append(f"{name}{_labels(method=method, endpoint=endpoint, error=error)} {count}")
+
+            if self._circuits:
+                name = family("circuit_state", "gauge", "circuit breaker state: 0 closed, 1 half-open, 2 open.")
+                for group, state in sorted(self._circuits.items()):
+                    lines.append(f"{name}{_labels(group=group)} {_CIRCUIT_STATES[state]}")
+                name = family("circuit_transitions_total", "counter", "circuit breaker state changes.")
+                for (group, state), count in sorted(self._transitions.items()):
+                    lines.append(f"{name}{_labels(group=group, state=state)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels.items()) + "}"
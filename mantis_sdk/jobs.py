@@ -0,0 +1,166 @@
+"""a durable record of synthesis submissions, so a restarted process picks up where it left off.
+
+with create(job_key=...) — or config.job_store, which records every create() — each submission
+is kept in a sqlite database under config.state_dir: submitting while it uploads, running with
+its (space_id, map_id) once the backend has accepted it, its last progress, then completed or
+failed. a later create() with the key of a running job follows that map again instead of
+uploading, and one with the key of a completed job returns its handle; spaces.resume()
+follows every job an earlier process left running.
+
+with config.max_pipelines, a submission first waits for a slot: fewer than that many jobs
+submitting or running, counted across every process sharing the state_dir. slots are taken in
+one sqlite transaction, so two processes can't both take the last one.
+
+a job interrupted during its upload has no map_id; the next create() with its key uploads
+again. finished jobs are dropped after FINISHED_TTL."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from ._state import state_path
+
+SUBMITTING = "submitting"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# finished (completed / failed) jobs are kept this many seconds.
+FINISHED_TTL = 7 * 24 * 3600.0
+# a job still submitting after this many seconds is taken to be an upload that died with its
+# process, and no longer holds a slot.
+SUBMIT_GRACE = 3600.0
+
+_SCHEMA = """
+create table if not exists jobs (
+    key text primary key,
+    space_name text not null,
+    status text not null,
+    space_id text,
+    map_id text,
+    progress integer not null default 0,
+    message text,
+    error text,
+    created real not null,
+    updated real not null
+)
+"""
+
+
+@dataclass
+class Job:
+    """one recorded submission."""
+
+    key: str
+    space_name: str
+    status: str
+    space_id: str | None
+    map_id: str | None
+    progress: int
+    message: str | None
+    error: str | None
+    created: float
+    updated: float
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (COMPLETED, FAILED)
+
+
+class JobStore:
+    """job key → Job, in a sqlite file. safe to share across threads and processes."""
+
+    FILENAME = "jobs.sqlite"
+
+    def __init__(self, directory: str | Path):
+        self.path = state_path(directory, self.FILENAME)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connect() as db:
+            db.execute(_SCHEMA)
+            db.execute(
+                "delete from jobs where status in (?, ?) and updated < ?",
+                (COMPLETED, FAILED, time.time() - FINISHED_TTL),
+            )
+
+    def get(self, key: str) -> Job | None:
+        with self._connect() as db:
+            row = db.execute("select * from jobs where key = ?", (key,)).fetchone()
+        return Job(**row) if row is not None else None
+
+    def jobs(self, *statuses: str) -> list[Job]:
+        """recorded jobs (those with one of statuses, if given), oldest first."""
+        query, args = "select * from jobs", ()
+        if statuses:
+            query += f" where status in ({', '.join('?' * len(statuses))})"
+            args = statuses
+        with self._connect() as db:
+            return [Job(**row) for row in db.execute(query + " order by created", args)]
+
+    def submit(self, key: str, space_name: str, max_running: int | None = None) -> bool:
+        """record key as submitting, unless max_running jobs already hold a slot (then
+        returns False and records nothing)."""
+        now = time.time()
+        with self._connect() as db:
+            db.execute("begin immediate")  # the count and the insert are one step across processes
+            if max_running is not None:
+                held = db.execute(
+                    "select count(*) as n from jobs where key != ? and (status = ? or (status = ? and updated >= ?))",
+                    (key, RUNNING, SUBMITTING, now - SUBMIT_GRACE),
+                ).fetchone()
+                if held["n"] >= max_running:
+                    return False
+            db.execute(
+                "insert or replace into jobs (key, space_name, status, created, updated) values (?, ?, ?, ?, ?)",
+                (key, space_name, SUBMITTING, now, now),
+            )
+        return True
+
+    def submitted(self, key: str, space_id: str, map_id: str) -> None:
+        self._update(key, status=RUNNING, space_id=space_id, map_id=map_id)
+
+    def progress(self, key: str, progress: int, message: str | None = None) -> None:
+        self._update(key, progress=progress, message=message)
+
+    def finish(self, key: str, error: str | None = None) -> None:
+        """mark key completed, or failed with error."""
+        if error is None:
+            self._update(key, status=COMPLETED, progress=100)
+        else:
+            self._update(key, status=FAILED, error=error)
+
+    def forget(self, key: str) -> None:
+        with self._connect() as db:
+            db.execute("delete from jobs where key = ?", (key,))
+
+    def __len__(self) -> int:
+        with self._connect() as db:
+            return db.execute("select count(*) as n from jobs").fetchone()["n"]
+
+    def _update(self, key: str, **fields: object) -> None:
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as db:
+            db.execute(f"update jobs set {columns}, updated = ? where key = ?", (*fields.values(), time.time(), key))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """an autocommit connection; a transaction opened on it is committed on exit (rolled
+        back on error)."""
+        with self._lock:
+            db = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            db.row_factory = lambda cursor, row: {col[0]: value for col, value in zip(cursor.description, row)}
+            try:
+                yield db
+                if db.in_transaction:
+                    db.execute("commit")
+            except BaseException:
+                if db.in_transaction:
+                    db.execute("rollback")
+                raise
+            finally:
+                db.close()
@@ -0,0 +1,114 @@
+"""client-side preparation of SMILES for from_molecules: canonicalize, dedupe, batch.
+
+the same structure can be written many ways ("OCC", "C(O)C", "CCO"), so exact-string dedupe
+misses most duplicates. with canonicalize=True each SMILES is rewritten to rdkit's canonical
+form first — spread over a process pool, since parsing millions of structures is cpu-bound —
+and unparseable ones are dropped. duplicates are then removed before anything is uploaded,
+keeping each structure's first row. canonicalize may also be a picklable callable
+(smiles -> canonical smiles, or None when invalid) to use another toolkit.
+
+rdkit is the optional [chem] extra; it's only needed for canonicalize=True."""
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+
+from . import frames
+from .exceptions import ConfigurationError, MantisError
+
+# smiles -> canonical smiles, or None for an invalid structure.
+Canonicalizer = Callable[[str], "str | None"]
+
+# structures per task sent to a canonicalization worker.
+_TASK_ROWS = 10_000
+
+
+@dataclass
+class Prepared:
+    """the rows to upload, and how many of the input's rows were dropped and why."""
+
+    frame: pd.DataFrame
+    total: int
+    invalid: int
+    duplicates: int
+
+    def batches(self, batch_rows: int) -> Iterator[pd.DataFrame]:
+        batch_rows = max(1, batch_rows)
+        for start in range(0, len(self.frame), batch_rows):
+            yield self.frame.iloc[start:start + batch_rows]
+
+
+def as_frame(molecules: Any, column: str) -> pd.DataFrame:
+    """a DataFrame from a DataFrame / arrow Table / csv path with a SMILES column, or from a
+    plain sequence of SMILES strings."""
+    if isinstance(molecules, os.PathLike):
+        molecules = os.fspath(molecules)
+    if isinstance(molecules, (str, pd.DataFrame)) or hasattr(molecules, "to_pandas"):
+        return frames.to_frame(molecules)
+    return pd.DataFrame({column: list(molecules)})
+
+
+def rdkit_canonical(smiles: str) -> str | None:
+    """rdkit's canonical SMILES, or None when it can't be parsed."""
+    from rdkit import Chem
+
+    mol = Chem.MolFromSmiles(smiles)
+    return Chem.MolToSmiles(mol) if mol is not None else None
+
+
+def _canonical_task(canonicalizer: Canonicalizer, smiles: list[str]) -> list[str | None]:
+    if canonicalizer is rdkit_canonical:
+        from rdkit import RDLogger
+
+        RDLogger.DisableLog("rdApp.*")  # one warning per invalid structure otherwise
+    return [canonicalizer(value) if value else None for value in smiles]
+
+
+def canonicalize_all(smiles: list[str], canonicalizer: Canonicalizer, workers: int = 0) -> list[str | None]:
+    """canonicalizer applied to every SMILES, in order; in a pool of workers processes when
+    workers > 1 and there is more than one task's worth."""
+    tasks = [smiles[start:start + _TASK_ROWS] for start in range(0, len(smiles), _TASK_ROWS)]
+    if workers <= 1 or len(tasks) <= 1:
+        results = [_canonical_task(canonicalizer, task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_canonical_task, [canonicalizer] * len(tasks), tasks))
+    return [value for task in results for value in task]
+
+
+def prepare(
+    frame: pd.DataFrame,
+    column: str,
+    *,
+    canonicalize: bool | Canonicalizer = False,
+    drop_duplicates: bool = True,
+    workers: int = 0,
+) -> Prepared:
+    """the rows of frame to upload: SMILES stripped (and canonicalized), rows without a valid
+    structure dropped, then (by default) duplicate structures dropped, first row kept."""
+    if column not in frame.columns:
+        raise MantisError(f"molecules have no {column!r} column; pass smiles_column=")
+    smiles = frame[column].fillna("").astype(str).str.strip()
+    if canonicalize:
+        canonicalizer = rdkit_canonical if canonicalize is True else canonicalize
+        if canonicalizer is rdkit_canonical:
+            try:
+                import rdkit  # noqa: F401
+            except ImportError as exc:
+                raise ConfigurationError('canonicalize=True needs rdkit: pip install "mantis_sdk[chem]"') from exc
+        smiles = pd.Series(canonicalize_all(smiles.tolist(), canonicalizer, workers), index=frame.index, dtype=object)
+    valid = smiles.notna() & (smiles != "")
+    kept = frame.loc[valid].assign(**{column: smiles[valid]})
+    if drop_duplicates:
+        kept = kept.drop_duplicates(subset=[column])
+    return Prepared(
+        kept.reset_index(drop=True),
+        total=len(frame),
+        invalid=int((~valid).sum()),
+        duplicates=int(valid.sum()) - len(kept),
+    )
@@ -0,0 +1,52 @@
+"""synthesis progress events and the adaptive poll schedule behind spaces.watch().
+
+a synthesis pipeline runs for minutes to half an hour. polling synthesis/progress/<map_id>/
+every second for all of it is a steady share of backend load, so watch() prefers a push
+channel: when a progress payload carries an events_url, the sdk switches to that
+text/event-stream and receives each update as it happens. otherwise — or once the stream
+drops — it polls, backing off while progress stands still and tightening again as it moves
+or nears completion."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class ProgressEvent:
+    """one change in a synthesis pipeline's progress, as yielded by spaces.watch()."""
+
+    map_id: str
+    progress: int
+    message: str | None = None
+    progress_tree: Any = None
+    completed: bool = False
+    payload: dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_payload(cls, map_id: str, payload: dict) -> ProgressEvent:
+        progress = int(payload.get("progress", 0))
+        return cls(
+            map_id,
+            progress,
+            payload.get("message"),
+            payload.get("progress_tree"),
+            bool(payload.get("completed")) or progress >= 100,
+            payload,
+        )
+
+
+class PollSchedule:
+    """the wait before each progress poll: base after a change, growing by factor per
+    unchanged poll up to maximum, and back to base from near_completion percent on."""
+
+    def __init__(self, base: float, maximum: float, factor: float = 1.5, near_completion: int = 90):
+        self.base = base
+        self.maximum = max(base, maximum)
+        self.factor = factor
+        self.near_completion = near_completion
+        self.interval = base
+
+    def next(self, progress: int, changed: bool) -> float:
+        self.interval = self.base if changed else min(self.interval * self.factor, self.maximum)
+        return self.base if progress >= self.near_completion else self.interval
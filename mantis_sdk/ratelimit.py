@@ -0,0 +1,163 @@
+"""client-side adaptive rate limiting, per endpoint group.
+
+each configured group (config.rate_limits = {"synthesis": 2, "ideas": 20, ...}) gets a token
+bucket. every request to the group takes a token, waiting when the bucket is empty. a 429 or
+503 halves the group's rate and honors Retry-After; sustained success grows it back toward
+the configured ceiling (aimd). the limiter lives on the transport, so every thread and task
+sharing a client shares the same buckets — a throttled bulk job slows down as a whole instead
+of retry-storming the backend."""
+from __future__ import annotations
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+# endpoint groups: name → url path fragments. also used to key the circuit breaker.
+DEFAULT_GROUPS: dict[str, tuple[str, ...]] = {
+    "synthesis": ("/synthesis/",),
+    "ideas": ("/api/listIdeas", "/api/getIdeas"),
+    "agent_providers": ("/agent_execution/providers",),
+    "notebook_execute": ("/api/sessions/execute",),
+}
+# the group for urls matching none of the above.
+DEFAULT_GROUP = "default"
+
+# statuses that mean "slow down".
+_THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def endpoint_group(url: str, groups: dict[str, tuple[str, ...]] = DEFAULT_GROUPS) -> str:
+    """the name of the first group whose fragment appears in url's path, else "default"."""
+    path = urlsplit(url).path
+    for name, fragments in groups.items():
+        if any(fragment in path for fragment in fragments):
+            return name
+    return DEFAULT_GROUP
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """seconds from a Retry-After header (delta-seconds or http-date), or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveTokenBucket:
+    """a token bucket whose refill rate adapts to backend feedback. thread-safe, and never
+    sleeps itself: reserve() returns how long the caller must wait, so the same bucket serves
+    threads (time.sleep) and coroutines (asyncio.sleep) alike."""
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: float | None = None,
+        min_rate: float | None = None,
+        decrease: float = 0.5,
+        increase: float = 1.25,
+        increase_after: int = 20,
+    ):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.min_rate = min_rate if min_rate is not None else max(self.max_rate / 64, 0.05)
+        self.burst = burst if burst is not None else max(1.0, self.max_rate)
+        self.decrease = decrease
+        self.increase = increase
+        self.increase_after = increase_after
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._successes = 0
+        self._lock = threading.Lock()
+        self.throttled = 0
+        self.waited_seconds = 0.0
+
+    def reserve(self) -> float:
+        """take a token; returns the seconds to wait before sending (0 when one was free)."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.rate, self._blocked_until - now)
+            self.waited_seconds += wait
+            return wait
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        """the backend said slow down: cut the rate (at most once per second, so a burst of
+        429s from in-flight requests counts as one signal) and pause until Retry-After."""
+        with self._lock:
+            now = time.monotonic()
+            self.throttled += 1
+            self._successes = 0
+            if now - self._last_decrease >= 1.0:
+                self._refill(now)
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self._last_decrease = now
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def on_success(self) -> None:
+        """every increase_after consecutive successes grow the rate back toward max_rate."""
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.increase_after and self.rate < self.max_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate * self.increase)
+                self._successes = 0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "max_rate": self.max_rate,
+                "tokens": round(self._tokens, 3),
+                "throttled": self.throttled,
+                "waited_seconds": round(self.waited_seconds, 3),
+            }
+
+
+class RateLimiter:
+    """one AdaptiveTokenBucket per configured endpoint group. groups without a configured
+    rate are not limited; "default" covers urls outside every named group."""
+
+    def __init__(
+        self,
+        rates: dict[str, float],
+        *,
+        groups: dict[str, tuple[str, ...]] = DEFAULT_GROUPS,
+    ):
+        self.groups = groups
+        self.buckets = {name: AdaptiveTokenBucket(rate) for name, rate in rates.items() if rate}
+
+    def bucket(self, url: str) -> AdaptiveTokenBucket | None:
+        return self.buckets.get(endpoint_group(url, self.groups))
+
+    def reserve(self, url: str) -> float:
+        bucket = self.bucket(url)
+        return bucket.reserve() if bucket is not None else 0.0
+
+    def observe(self, url: str, status: int, retry_after: str | None = None) -> None:
+        """feed one response status back into url's bucket."""
+        bucket = self.bucket(url)
+        if bucket is None:
+            return
+        if status in _THROTTLE_STATUSES:
+            bucket.on_throttle(parse_retry_after(retry_after))
+        elif status < 500:
+            bucket.on_success()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {name: bucket.snapshot() for name, bucket in self.buckets.items()}
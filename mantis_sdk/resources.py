@@ -4,19 +4,43 @@ these wrap HttpClient with a domain-oriented api (client.spaces, client.maps, ..
 the heavy synthesis create+poll logic lives in SpacesResource._poll_until_done."""
 from __future__ import annotations
 
+import hashlib
+import inspect
 import io
-import json
 import logging
+import os
 import time
 import uuid
-from collections.abc import Callable, Iterator
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import wait as futures_wait
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from . import columnar, delta, frames, h5ad, jobs, sources
+from . import molecules as molecule_prep
+from . import vectors as vector_codec
 from ._http import HttpClient
+from ._stream import EventStreamDecoder
+from .compression import compress_chunks, compress_part, part_name, resolve_encoding
+from .create_cache import CreateCache, content_digest
 from .enums import AIProvider, DataType, ReducerModels, SpacePrivacy
-from .exceptions import FeatureUnavailableError, MantisError, SpaceCreationError
+from .exceptions import (
+    APIConnectionError,
+    APIStatusError,
+    ConfigurationError,
+    FeatureUnavailableError,
+    MantisError,
+    NotFoundError,
+    SpaceCreationError,
+)
+from .progress import PollSchedule, ProgressEvent
+from .upload import FilePart, MultipartStream, UploadProgressCallback, file_length, iter_csv, iter_file, spool
 
 logger = logging.getLogger("mantis_sdk")
 
@@ -24,6 +48,34 @@ logger = logging.getLogger("mantis_sdk")
 ProgressCallback = Callable[[int, str | None, Any], None]
 # callback to select among legacy umap variations (kept for signature compatibility).
 VariationCallback = Callable[[dict], str]
+# statuses from synthesis/landscape/delta/ meaning the backend can't do partial updates.
+_NO_DELTA_STATUSES = {404, 405, 501}
+# create() arguments that describe the upload itself (see SpacesResource._submit_create).
+_LANDSCAPE_ARGS = (
+    "custom_models", "reducer", "privacy_level", "ai_provider", "chat_model", "embedding_model",
+    "space_id", "map_id", "map_name", "on_upload_progress", "drop_duplicates", "vectors",
+)
+# statuses from a progress events_url (or synthesis/progress/batch/) meaning the backend
+# doesn't have that route after all.
+_NO_PUSH_STATUSES = {404, 405, 406, 501}
+# header naming one synthesis submission, so a re-sent one isn't run twice.
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+# statuses after which a submission may be re-sent under its idempotency key; a 429 was
+# turned away before any work started, so it is re-sent on any backend.
+_RESUBMIT_STATUSES = {429, 500, 502, 503, 504}
+# seconds before the first re-send of a submission, doubling per attempt.
+_RESUBMIT_BACKOFF = 0.5
+
+
+def _unwrap_list(resp: Any, *keys: str) -> list:
+    """pull the list out of a {key: [...]} envelope (first key present wins).
+    tolerates a bare list or an empty body, which older backends return."""
+    if isinstance(resp, dict):
+        for key in keys:
+            if key in resp:
+                return resp[key]
+        return []
+    return resp or []
 
 
 class SpaceHandle(dict):
@@ -45,9 +97,7 @@ class SpaceHandle(dict):
     def list_maps(self) -> list[dict]:
         """list maps belonging to this space via /api/listMaps/."""
         resp = self._client.http.request("GET", "/api/listMaps", params={"space_id": self.space_id})
-        if isinstance(resp, dict):
-            return resp.get("maps", resp.get("data", []))
-        return resp or []
+        return _unwrap_list(resp, "maps", "data")
 
     # --- annotations ---
     def get_annotations(self) -> list[dict]:
@@ -55,19 +105,20 @@ class SpaceHandle(dict):
 
     # --- points (lazy, paginated) ---
     def iter_points(self, page_size: int = 200) -> Iterator[dict]:
-        """yield idea ids for this space's primary map, paging transparently."""
+        """yield the point records (the listIdeas "ideas" entries) of this space's primary map,
+        paging transparently. each page is decoded as it streams in, so memory stays flat
+        however large the map."""
         map_id = self.map_id or self.space_id
         offset = 0
         while True:
-            resp = self._client.http.request(
-                "GET", "/api/listIdeas",
+            count = 0
+            for point in self._client.http.stream(
+                "GET", "/api/listIdeas", "ideas",
                 params={"map_id": map_id, "limit": page_size, "offset": offset},
-            )
-            batch = resp.get("ideas", resp) if isinstance(resp, dict) else resp
-            if not batch:
-                break
-            yield from batch
-            if len(batch) < page_size:
+            ):
+                count += 1
+                yield point
+            if count < page_size:
                 break
             offset += page_size
 
@@ -83,11 +134,101 @@ class SpaceHandle(dict):
         return self._client.http.request("DELETE", f"/api/spaces/delete/{self.space_id}")
 
 
+@dataclass
+class CreateResult:
+    """the outcome of one create_many spec: its handle, or the error that stopped it."""
+
+    index: int
+    handle: SpaceHandle | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _CreateJob:
+    """a create() whose upload is done; sent is False when nothing was uploaded (a reused
+    space, or a refresh with no changed rows), so there is no pipeline to wait for."""
+
+    space_id: str
+    map_id: str
+    sent: bool = True
+    reused: bool = False
+    manifest: delta.Manifest | None = None
+    cache: CreateCache | None = None
+    digest: str | None = None
+    store: jobs.JobStore | None = None
+    key: str | None = None
+
+
+class _ProgressTracker:
+    """bookkeeping for one synthesis progress loop: progress callbacks, the optional tqdm bar,
+    and stall detection. kept free of io so the sync and async loops share it."""
+
+    def __init__(
+        self,
+        map_id: str,
+        *,
+        on_progress: ProgressCallback | None = None,
+        show_progress: bool = False,
+        stall_timeout: float | None = 600.0,
+    ):
+        self.map_id = map_id
+        self.on_progress = on_progress
+        self.stall_timeout = stall_timeout
+        self.bar = None
+        if show_progress:
+            try:
+                from tqdm import tqdm
+
+                self.bar = tqdm(total=100, desc="synthesizing space", unit="%")
+            except ImportError:
+                logger.debug("tqdm not installed; show_progress ignored")
+        self.last = -1
+        self.last_change = time.monotonic()
+        self.changed = False
+        self.done = False
+
+    def update(self, progress: dict) -> bool:
+        """record one progress payload. returns True once the pipeline has completed;
+        raises SpaceCreationError on a pipeline error or a stall."""
+        if progress.get("error"):
+            raise SpaceCreationError(progress["error"])
+
+        pct = int(progress.get("progress", 0))
+        self.changed = pct != self.last
+        if self.changed:
+            if self.on_progress is not None:
+                self.on_progress(pct, progress.get("message"), progress.get("progress_tree"))
+            if self.bar is not None:
+                self.bar.update(pct - max(self.last, 0))
+            self.last = pct
+            self.last_change = time.monotonic()
+
+        if progress.get("completed") or pct >= 100:
+            self.done = True
+            return True
+
+        if self.stall_timeout is not None and (time.monotonic() - self.last_change) > self.stall_timeout:
+            raise SpaceCreationError(
+                f"synthesis stalled at {pct}% for over {self.stall_timeout:.0f}s "
+                f"(map_id={self.map_id}); is a celery worker running?"
+            )
+        return False
+
+    def close(self) -> None:
+        if self.bar is not None:
+            self.bar.close()
+
+
 class MantisClientProtocol:
     """structural type hint for the client passed to resources (avoids a circular import)."""
 
     http: HttpClient
     spaces: SpacesResource
+    maps: MapsResource
     annotations: AnnotationsResource
     space_states: SpaceStatesResource
     aliases: AliasesResource
@@ -103,13 +244,27 @@ class SpacesResource(_BaseResource):
     """create, open, and manage spaces."""
 
     POLL_INTERVAL = 1.0
+    # while progress stands still, polls back off up to this many seconds apart.
+    POLL_MAX_INTERVAL = 15.0
+    # upload formats the backend advertises; fetched on the first columnar create.
+    _formats: set[str] | None = None
+    # whether the backend takes delta refreshes; None until the first one is tried.
+    _partial_updates: bool | None = None
+    # False once the backend's progress event stream turned out to be missing.
+    _progress_push = True
+    # False once synthesis/progress/batch/ turned out to be missing.
+    _batch_progress = True
+    _handle_type: type[SpaceHandle] = SpaceHandle
 
     def get_all(self) -> dict:
         """raw /api/getSpaces payload: {public, featured, private, shared, projects}."""
         return self.http.request("GET", "/api/getSpaces")
 
     def ids_by_name(self, space_name: str, privacy_levels: list[SpacePrivacy | str]) -> list[str]:
-        spaces = self.get_all()
+        return self._match_ids(self.get_all(), space_name, privacy_levels)
+
+    @staticmethod
+    def _match_ids(spaces: dict, space_name: str, privacy_levels: list[SpacePrivacy | str]) -> list[str]:
         ids: list[str] = []
         for level in privacy_levels:
             key = str(level)
@@ -124,7 +279,7 @@ class SpacesResource(_BaseResource):
     def create(
         self,
         space_name: str,
-        data: pd.DataFrame | str,
+        data: Any,
         data_types: dict[str, DataType | str],
         *,
         custom_models: list[str | None] | None = None,
@@ -135,12 +290,19 @@ class SpacesResource(_BaseResource):
         embedding_model: str = "text-embedding-3-small",
         on_progress: ProgressCallback | None = None,
         on_receive_id: Callable[[str, str], None] | None = None,
+        on_upload_progress: UploadProgressCallback | None = None,
         show_progress: bool = False,
         wait: bool = True,
         stall_timeout: float | None = 600.0,
         space_id: str | None = None,
         map_id: str | None = None,
         map_name: str | None = None,
+        upload_format: str | None = None,
+        drop_duplicates: bool = False,
+        delta_key: str | list[str] | None = None,
+        reuse: bool | None = None,
+        vectors: dict[str, Any] | None = None,
+        job_key: str | None = None,
     ) -> SpaceHandle:
         """create a space from a DataFrame or csv path, then (by default) poll to completion.
 
@@ -153,9 +315,1036 @@ class SpacesResource(_BaseResource):
         than creating a new one) — this is how you keep one space with a fixed set of maps.
 
         map_name names the map; without it the backend falls back to "Untitled Map". defaults
-        to space_name so a single-map space gets a sensible label out of the box."""
-        buffer, columns, file_extension = self._load_data(data)
+        to space_name so a single-map space gets a sensible label out of the box.
+
+        with config.stream_uploads (or an on_upload_progress callback) the csv is streamed in
+        row blocks instead of built in memory; on_upload_progress(bytes_sent, total) reports
+        the upload as it goes out (see mantis_sdk.upload).
+
+        data may also be a pyarrow Table. upload_format (default config.upload_format) picks
+        "csv", "parquet", "arrow" or "auto"; a columnar format is only sent when the backend
+        advertises it, else the upload falls back to csv (see mantis_sdk.columnar).
+
+        data may also be streamed: a polars DataFrame, an arrow RecordBatchReader or dataset, an
+        iterator of DataFrames or record batches (e.g. pd.read_csv(chunksize=...)), or Rows(rows,
+        schema) over plain row tuples. these go into the upload a block at a time, without one
+        big pandas copy (see mantis_sdk.sources).
+
+        only the columns data_types maps are uploaded (config.project_columns); custom_models
+        may list one entry per mapped column or per data column. drop_duplicates=True also
+        drops exact-duplicate rows before upload (see mantis_sdk.frames).
+
+        with a map_id, delta_key (a column, or columns, identifying each row) turns a refresh
+        into a delta: only rows inserted, updated or deleted since the last upload from this
+        machine are sent, or nothing at all when no row changed. the sdk falls back to a full
+        upload when it can't send a delta (see mantis_sdk.delta).
+
+        reuse (default config.create_cache) returns the space an earlier create() built from the
+        same data and settings, if its map still exists, without uploading anything (see
+        mantis_sdk.create_cache). only creates that ran to completion (wait=True) are recorded.
+
+        vectors ({column: 2-d NumPy array}, one row per data row) adds Vector columns without
+        building per-row lists. with config.vector_encoding, Vector columns go as packed binary
+        side-car parts instead of csv text (see mantis_sdk.vectors).
+
+        job_key records the create in the durable job store under config.state_dir (see
+        mantis_sdk.jobs). called again with the key of a job that is still running — say
+        after the process restarted mid-poll — create() follows that map instead of uploading
+        again; with the key of a completed job it returns that job's handle."""
+        job = self._submit_create(
+            space_name,
+            data,
+            data_types,
+            dict(
+                custom_models=custom_models,
+                reducer=reducer,
+                privacy_level=privacy_level,
+                ai_provider=ai_provider,
+                chat_model=chat_model,
+                embedding_model=embedding_model,
+                space_id=space_id,
+                map_id=map_id,
+                map_name=map_name,
+                on_upload_progress=on_upload_progress,
+                drop_duplicates=drop_duplicates,
+                vectors=vectors,
+            ),
+            upload_format=upload_format,
+            delta_key=delta_key,
+            reuse=reuse,
+            job_key=job_key,
+        )
+
+        if on_receive_id is not None:
+            on_receive_id(job.space_id, job.map_id)
+
+        if wait and job.sent:
+            try:
+                self._poll_until_done(
+                    job.map_id,
+                    on_progress=self._recording(job, on_progress),
+                    show_progress=show_progress,
+                    stall_timeout=stall_timeout,
+                )
+            except BaseException as exc:
+                self._abandon(job, exc)
+                raise
+        self._finish_create(job, completed=wait)
+
+        return SpaceHandle(job.space_id, job.map_id, self._client)
+
+    def create_many(
+        self,
+        specs: Iterable[dict[str, Any]],
+        *,
+        max_concurrent_uploads: int = 4,
+        max_inflight_pipelines: int = 8,
+        wait: bool = True,
+    ) -> list[CreateResult]:
+        """create several maps at once; roughly as long as the slowest one, not their sum.
+
+        each spec is a dict of create() arguments ({"space_name": ..., "data": ...,
+        "data_types": ..., "map_id": ...}); its on_progress, on_receive_id and stall_timeout
+        apply to its map. up to max_concurrent_uploads uploads run in parallel, and no upload
+        starts while max_inflight_pipelines maps are uploading or synthesizing. one shared
+        poller follows every submitted map, checking them all in one synthesis/progress/batch/
+        request per round when the backend has it.
+
+        returns a CreateResult per spec, in spec order: its handle, or the error that stopped
+        it — one failed map doesn't stop the others. wait=False returns once all are uploaded."""
+        calls = [self._create_args(spec) for spec in specs]  # bad arguments raise before any upload
+        results: list[Any] = [None] * len(calls)
+        queue = deque(range(len(calls)))
+        uploading: dict[Future, int] = {}
+        watching: dict[int, tuple[_CreateJob, _ProgressTracker]] = {}
+        schedule = self._poll_schedule(
+            min((args["stall_timeout"] for args in calls if args["stall_timeout"] is not None), default=None)
+        )
+        pool = ThreadPoolExecutor(max_workers=max(1, max_concurrent_uploads))
+        try:
+            while queue or uploading or watching:
+                while queue and len(uploading) < max(1, max_concurrent_uploads) and (
+                    len(uploading) + len(watching) < max(1, max_inflight_pipelines)
+                ):
+                    index = queue.popleft()
+                    uploading[pool.submit(self._submit_spec, calls[index])] = index
+                for future in [future for future in uploading if future.done()]:
+                    index = uploading.pop(future)
+                    self._uploaded(index, calls[index], future, wait, watching, results)
+                delay = None
+                if watching:
+                    changed = self._apply_progress(watching, self._progress_many(self._map_ids(watching)), results)
+                    delay = schedule.next(max((t.last for _, t in watching.values()), default=0), changed)
+                if uploading:
+                    futures_wait(uploading, timeout=delay, return_when=FIRST_COMPLETED)
+                elif delay:
+                    time.sleep(delay)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            for _, tracker in watching.values():
+                tracker.close()
+        return results
+
+    @property
+    def job_store(self) -> jobs.JobStore:
+        """the durable record of submitted creates under config.state_dir (see mantis_sdk.jobs)."""
+        return jobs.JobStore(self.http.config.state_dir)
+
+    def resume(
+        self,
+        *,
+        on_progress: Callable[[str, int, str | None], None] | None = None,
+        stall_timeout: float | None = 600.0,
+    ) -> dict[str, CreateResult]:
+        """follow every job an earlier process left running in the job store to completion,
+        with one shared poller like create_many. on_progress(job_key, percent, message)
+        reports each change. returns {job_key: CreateResult}."""
+        store = self.job_store
+        running, watching = self._resumed(store, on_progress, stall_timeout)
+        results: list[Any] = [None] * len(running)
+        schedule = self._poll_schedule(stall_timeout)
+        try:
+            while watching:
+                changed = self._apply_progress(watching, self._progress_many(self._map_ids(watching)), results)
+                if watching:
+                    time.sleep(schedule.next(max(t.last for _, t in watching.values()), changed))
+        finally:
+            for _, tracker in watching.values():
+                tracker.close()
+        return {job.key: result for job, result in zip(running, results)}
+
+    def _resumed(
+        self,
+        store: jobs.JobStore,
+        on_progress: Callable[[str, int, str | None], None] | None,
+        stall_timeout: float | None,
+    ) -> tuple[list[jobs.Job], dict[int, tuple[_CreateJob, _ProgressTracker]]]:
+        """the running jobs of store, and a create_many watch list following them."""
+        running = [job for job in store.jobs(jobs.RUNNING) if job.map_id]
+        watching = {}
+        for index, found in enumerate(running):
+            job = _CreateJob(found.space_id, found.map_id, reused=True, store=store, key=found.key)
+            report = None
+            if on_progress is not None:
+                report = lambda pct, message, tree, key=found.key: on_progress(key, pct, message)  # noqa: E731
+            tracker = _ProgressTracker(job.map_id, on_progress=self._recording(job, report), stall_timeout=stall_timeout)
+            watching[index] = (job, tracker)
+        return running, watching
+
+    def _submit_create(
+        self,
+        space_name: str,
+        data: Any,
+        data_types: dict[str, DataType | str],
+        landscape: dict[str, Any],
+        *,
+        upload_format: str | None,
+        delta_key: str | list[str] | None,
+        reuse: bool | None,
+        job_key: str | None = None,
+    ) -> _CreateJob:
+        """everything create() does before waiting: job store and reuse lookups, negotiation
+        and the upload (or delta refresh). shared by create and create_many."""
+        data = sources.wrap(data)
+        store, key = self._job_entry(job_key)
+        if store is None:
+            return self._send_create(space_name, data, data_types, landscape, upload_format, delta_key, reuse)
+        if (resumed := self._resume_job(store, key)) is not None:
+            return resumed
+        self._claim_slot(store, key, space_name)
+        try:
+            job = self._send_create(space_name, data, data_types, landscape, upload_format, delta_key, reuse)
+        except BaseException as exc:
+            store.finish(key, str(exc) or type(exc).__name__)
+            raise
+        return self._submitted(store, key, job)
+
+    def _send_create(
+        self,
+        space_name: str,
+        data: Any,
+        data_types: dict[str, DataType | str],
+        landscape: dict[str, Any],
+        upload_format: str | None,
+        delta_key: str | list[str] | None,
+        reuse: bool | None,
+    ) -> _CreateJob:
+        cache = self._create_cache(reuse, data)
+        digest = None
+        if cache is not None:
+            digest = self._create_digest(space_name, data, data_types, landscape)
+            if (handle := self._reuse(cache, digest)) is not None:
+                return _CreateJob(handle.space_id, handle.map_id, sent=False, reused=True)
+        landscape["upload_format"] = self._upload_format(upload_format, data)
+        landscape["vector_encoding"] = self._vector_encoding() if landscape["upload_format"] == "csv" else None
+        if delta_key is None:
+            space_id, request_kwargs = self._prepare_landscape(space_name, data, data_types, **landscape)
+            key = self._landscape_key(space_name, data, data_types, landscape, space_id, digest)
+            rebuild = self._rebuilder(data, lambda: self._prepare_landscape(
+                space_name, data, data_types, **{**landscape, "space_id": space_id}
+            )[1])
+            resp = self._submit("/synthesis/landscape", key, request_kwargs, rebuild)
+            space_id, map_id = self._read_create_response(resp, space_id)
+            return _CreateJob(space_id, map_id, cache=cache, digest=digest)
+        space_id, map_id, manifest, sent = self._refresh(space_name, data, data_types, delta_key, landscape)
+        return _CreateJob(space_id, map_id, sent, manifest=manifest, cache=cache, digest=digest)
+
+    def _finish_create(self, job: _CreateJob, completed: bool) -> None:
+        """record a create whose pipeline completed (or wasn't waited for): the delta manifest
+        and, once completed, the reuse-cache entry."""
+        if job.manifest is not None:
+            job.manifest.space_id = job.space_id
+            job.manifest.save(self.http.config.state_dir)
+        if job.cache is not None and completed and not job.reused:
+            job.cache.put(job.digest, job.space_id, job.map_id)
+        if job.store is not None and completed:
+            job.store.finish(job.key)
+
+    def _abandon(self, job: _CreateJob, exc: BaseException) -> None:
+        """clean up after waiting on job failed. the job store records the failure only when
+        the pipeline itself failed or its map is gone; a job whose waiting was interrupted is
+        still running, and can be resumed."""
+        self._forget_manifest(job.manifest)
+        if job.store is not None and isinstance(exc, (SpaceCreationError, NotFoundError)):
+            job.store.finish(job.key, str(exc))
+
+    @staticmethod
+    def _recording(job: _CreateJob, on_progress: ProgressCallback | None) -> ProgressCallback | None:
+        """on_progress, also recording each change of job's progress in the job store."""
+        if job.store is None:
+            return on_progress
+        store, key = job.store, job.key
+
+        def record(progress: int, message: str | None, tree: Any) -> None:
+            store.progress(key, progress, message)
+            if on_progress is not None:
+                on_progress(progress, message, tree)
+
+        return record
+
+    def _job_entry(self, job_key: str | None) -> tuple[jobs.JobStore | None, str | None]:
+        """(the job store, the key) a create is recorded under, or (None, None) when it isn't."""
+        if job_key is None and not self.http.config.job_store:
+            return None, None
+        return self.job_store, job_key or uuid.uuid4().hex
+
+    @staticmethod
+    def _resume_job(store: jobs.JobStore, key: str) -> _CreateJob | None:
+        """the recorded job of key when it is running or completed, so nothing is uploaded."""
+        found = store.get(key)
+        if found is None or found.status not in (jobs.RUNNING, jobs.COMPLETED):
+            return None
+        logger.info("job %s is %s (map %s); not submitting it again", key, found.status, found.map_id)
+        return _CreateJob(
+            found.space_id, found.map_id, sent=found.status == jobs.RUNNING, reused=True, store=store, key=key
+        )
+
+    def _claim_slot(self, store: jobs.JobStore, key: str, space_name: str) -> None:
+        """record key as submitting, first waiting while config.max_pipelines jobs run."""
+        limit = self.http.config.max_pipelines
+        schedule = self._poll_schedule(None)
+        while not store.submit(key, space_name, limit):
+            running = [job for job in store.jobs(jobs.RUNNING) if job.map_id]
+            if not self._record_jobs(store, running, self._progress_many([job.map_id for job in running])):
+                time.sleep(schedule.next(0, False))
+
+    @staticmethod
+    def _submitted(store: jobs.JobStore, key: str, job: _CreateJob) -> _CreateJob:
+        store.submitted(key, job.space_id, job.map_id)
+        if not job.sent:  # nothing to wait for
+            store.finish(key)
+        job.store, job.key = store, key
+        return job
+
+    @staticmethod
+    def _record_jobs(store: jobs.JobStore, running: list[jobs.Job], payloads: dict[str, Any]) -> bool:
+        """record one progress poll of running jobs. returns whether any of them finished."""
+        finished = False
+        for job in running:
+            payload = payloads.get(job.map_id)
+            if isinstance(payload, NotFoundError):
+                store.finish(job.key, f"map {job.map_id} no longer exists")
+            elif not isinstance(payload, dict):
+                continue
+            elif payload.get("error"):
+                store.finish(job.key, str(payload["error"]))
+            elif payload.get("completed") or int(payload.get("progress", 0)) >= 100:
+                store.finish(job.key)
+            else:
+                store.progress(job.key, int(payload.get("progress", 0)), payload.get("message"))
+                continue
+            finished = True
+        return finished
+
+    @staticmethod
+    def _create_args(spec: dict[str, Any]) -> dict[str, Any]:
+        """a create_many spec bound to create()'s parameters, with create()'s defaults."""
+        bound = inspect.signature(SpacesResource.create).bind(None, **spec)
+        bound.apply_defaults()
+        args = dict(bound.arguments)
+        del args["self"]
+        return args
+
+    def _submit_spec(self, args: dict[str, Any]) -> _CreateJob:
+        job = self._submit_create(
+            args["space_name"],
+            args["data"],
+            args["data_types"],
+            {name: args[name] for name in _LANDSCAPE_ARGS},
+            upload_format=args["upload_format"],
+            delta_key=args["delta_key"],
+            reuse=args["reuse"],
+            job_key=args["job_key"],
+        )
+        if args["on_receive_id"] is not None:
+            args["on_receive_id"](job.space_id, job.map_id)
+        return job
+
+    def _uploaded(
+        self,
+        index: int,
+        args: dict[str, Any],
+        future: Any,
+        wait: bool,
+        watching: dict[int, tuple[_CreateJob, _ProgressTracker]],
+        results: list[Any],
+    ) -> None:
+        """file a finished create_many upload: failed, done (nothing to wait for), or watched."""
+        try:
+            job = future.result()
+        except Exception as exc:  # noqa: BLE001 — reported per spec
+            results[index] = CreateResult(index, error=exc)
+            return
+        if not (wait and args["wait"] and job.sent):
+            self._finish_create(job, completed=wait and args["wait"])
+            results[index] = CreateResult(index, self._handle_type(job.space_id, job.map_id, self._client))
+            return
+        watching[index] = (job, _ProgressTracker(
+            job.map_id,
+            on_progress=self._recording(job, args["on_progress"]),
+            show_progress=args["show_progress"],
+            stall_timeout=args["stall_timeout"],
+        ))
+
+    def _apply_progress(
+        self, watching: dict[int, tuple[_CreateJob, _ProgressTracker]], payloads: dict[str, Any], results: list[Any]
+    ) -> bool:
+        """feed one poll round to the watched maps, filing those that completed or failed.
+        returns whether any map's progress changed."""
+        changed = False
+        for index, (job, tracker) in list(watching.items()):
+            payload = payloads.get(job.map_id)
+            if payload is None:
+                continue
+            try:
+                if isinstance(payload, BaseException):
+                    raise payload
+                done = tracker.update(payload)
+            except Exception as exc:  # noqa: BLE001 — reported per spec
+                self._abandon(job, exc)
+                results[index] = CreateResult(index, error=exc)
+            else:
+                changed = changed or tracker.changed
+                if not done:
+                    continue
+                self._finish_create(job, completed=True)
+                results[index] = CreateResult(index, self._handle_type(job.space_id, job.map_id, self._client))
+            tracker.close()
+            del watching[index]
+        return changed
+
+    @staticmethod
+    def _map_ids(watching: dict[int, tuple[_CreateJob, _ProgressTracker]]) -> list[str]:
+        return [job.map_id for job, _ in watching.values()]
+
+    def _progress_many(self, map_ids: list[str]) -> dict[str, Any]:
+        """{map_id: progress payload, or the error fetching it}. one synthesis/progress/batch/
+        request when the backend has it, else one synthesis/progress/<map_id>/ per map."""
+        if len(map_ids) > 1 and self._batch_progress:
+            try:
+                resp = self.http.request("POST", "synthesis/progress/batch", json={"map_ids": map_ids})
+            except MantisError as exc:
+                self._no_batch_progress(exc)
+            else:
+                return self._read_progress_batch(resp)
+        payloads: dict[str, Any] = {}
+        for map_id in map_ids:
+            try:
+                payloads[map_id] = self.http.request("GET", f"synthesis/progress/{map_id}")
+            except MantisError as exc:
+                payloads[map_id] = exc
+        return payloads
+
+    @staticmethod
+    def _read_progress_batch(resp: Any) -> dict[str, Any]:
+        # {"progress": {map_id: payload}}, or the mapping itself.
+        batch = resp.get("progress", resp) if isinstance(resp, dict) else {}
+        return batch if isinstance(batch, dict) else {}
+
+    def _no_batch_progress(self, exc: MantisError) -> None:
+        """after a failed batch request: remember a backend without batched progress. any other
+        error (a 5xx, a dropped connection) only sends this round's polls one map at a time."""
+        if isinstance(exc, APIStatusError) and exc.status_code in _NO_PUSH_STATUSES:
+            self._batch_progress = False
+            logger.info("backend has no batched progress endpoint; polling each map")
+        else:
+            logger.warning("batched progress request failed (%s); polling each map this round", exc)
+
+    def _reuse(self, cache: CreateCache, digest: str) -> SpaceHandle | None:
+        """the handle recorded for digest if its map still exists; a stale entry is dropped."""
+        found = cache.get(digest)
+        if found is None:
+            return None
+        space_id, map_id = found
+        try:
+            maps = self._client.maps.list(space_id)
+        except NotFoundError:
+            maps = []
+        if self._has_map(maps, map_id):
+            logger.info("reusing space %s (map %s): same data and settings as before", space_id, map_id)
+            return SpaceHandle(space_id, map_id, self._client)
+        cache.discard(digest)
+        return None
+
+    def _refresh(
+        self,
+        space_name: str,
+        data: Any,
+        data_types: dict[str, DataType | str],
+        delta_key: str | list[str],
+        landscape: dict[str, Any],
+    ) -> tuple[str, str, delta.Manifest, bool]:
+        """send a delta refresh, or a full upload when no delta applies.
+        returns (space_id, map_id, the manifest to keep once it succeeds, whether anything was sent)."""
+        shaped, change, manifest, landscape = self._plan_refresh(data, data_types, delta_key, landscape)
+        if change is not None and not change.changed:
+            logger.info("map %s is unchanged; nothing to upload", manifest.map_id)
+            return manifest.space_id, manifest.map_id, manifest, False
+        if change is not None:
+            def prepare_delta() -> tuple[str, dict[str, Any]]:
+                return self._prepare_landscape(
+                    space_name, change.upserts, data_types, **landscape, deleted_keys=change.deleted
+                )
+
+            space_id, request_kwargs = prepare_delta()
+            key = self._submission_key("delta", space_id, manifest.map_id, manifest.digest())
+            try:
+                resp = self._submit("/synthesis/landscape/delta", key, request_kwargs, lambda: prepare_delta()[1])
+            except APIStatusError as exc:
+                self._no_delta(exc)
+            else:
+                self._partial_updates = True
+                return (*self._read_create_response(resp, space_id, "delta refresh"), manifest, True)
+        space_id, request_kwargs = self._prepare_landscape(space_name, shaped, data_types, **landscape)
+        key = self._submission_key("landscape", space_id, manifest.map_id, manifest.digest())
+        resp = self._submit("/synthesis/landscape", key, request_kwargs, lambda: self._prepare_landscape(
+            space_name, shaped, data_types, **landscape
+        )[1])
+        return (*self._read_create_response(resp, space_id), manifest, True)
+
+    def from_github(
+        self,
+        repo_url: str,
+        space_name: str | None = None,
+        *,
+        privacy_level: SpacePrivacy | str = SpacePrivacy.PRIVATE,
+        on_progress: ProgressCallback | None = None,
+        show_progress: bool = False,
+        wait: bool = True,
+        **extra: Any,
+    ) -> SpaceHandle:
+        """create a space by analyzing a github repository (synthesis/github/)."""
+        space_id, payload = self._github_payload(repo_url, space_name, privacy_level, extra)
+        key = self._submission_key("github", self.http.codec.dumps(payload))
+        resp = self._submit("/synthesis/github", key, {"json": payload}, lambda: {"json": payload})
+        space_id, map_id = self._read_create_response(resp, space_id, "github create")
+        if wait:
+            self._poll_until_done(map_id, on_progress=on_progress, show_progress=show_progress)
+        return SpaceHandle(space_id, map_id, self._client)
+
+    def from_molecules(
+        self,
+        space_name: str,
+        molecules: pd.DataFrame | str | Iterable[str],
+        data_types: dict[str, DataType | str] | None = None,
+        *,
+        smiles_column: str = "smiles",
+        canonicalize: bool | molecule_prep.Canonicalizer = False,
+        drop_duplicates: bool = True,
+        workers: int | None = None,
+        batch_rows: int = 100_000,
+        upload_workers: int = 4,
+        reducer: ReducerModels | str = ReducerModels.UMAP,
+        privacy_level: SpacePrivacy | str = SpacePrivacy.PRIVATE,
+        ai_provider: AIProvider | str = AIProvider.OpenAI,
+        chat_model: str = "gpt-4o-mini",
+        on_progress: ProgressCallback | None = None,
+        on_receive_id: Callable[[str, str], None] | None = None,
+        on_batch_progress: Callable[[int, int], None] | None = None,
+        show_progress: bool = False,
+        wait: bool = True,
+        stall_timeout: float | None = 600.0,
+        space_id: str | None = None,
+        map_id: str | None = None,
+        map_name: str | None = None,
+    ) -> SpaceHandle:
+        """create a chemistry space from SMILES (synthesis/molecules/), then (by default) poll
+        to completion.
+
+        molecules is a DataFrame / arrow Table / csv path with a smiles_column (other columns
+        are metadata, uploaded when data_types maps them; the SMILES column defaults to the
+        title), or a plain sequence of SMILES strings. before upload the SMILES are stripped,
+        optionally canonicalized (canonicalize=True needs rdkit, the [chem] extra; see
+        mantis_sdk.molecules) in a pool of workers processes (default: one per cpu), and
+        duplicate structures are dropped, so they're never sent.
+
+        the rows go up in batches of batch_rows: the first creates the space, the rest follow
+        upload_workers at a time. on_batch_progress(rows_uploaded, total_rows) is called as
+        each batch is accepted."""
+        space_id, form_data, batches = self._prepare_molecules(
+            space_name,
+            molecules,
+            data_types,
+            smiles_column=smiles_column,
+            canonicalize=canonicalize,
+            drop_duplicates=drop_duplicates,
+            workers=workers,
+            batch_rows=batch_rows,
+            reducer=reducer,
+            privacy_level=privacy_level,
+            ai_provider=ai_provider,
+            chat_model=chat_model,
+            space_id=space_id,
+            map_id=map_id,
+            map_name=map_name,
+        )
+        total, count = sum(map(len, batches)), len(batches)
+
+        def send(index: int) -> Any:
+            request_kwargs = self._molecule_request(form_data, batches[index], index, count)
+            return self.http.request("POST", "/synthesis/molecules", **request_kwargs)
+
+        # the first batch creates the space; the rest are appended to it concurrently.
+        space_id, map_id = self._read_create_response(send(0), space_id, "molecules create")
+        form_data.update(space_id=space_id, map_id=map_id)
+        sent = len(batches[0])
+        if on_batch_progress is not None:
+            on_batch_progress(sent, total)
+        if count > 1:
+            with ThreadPoolExecutor(max_workers=max(1, upload_workers)) as pool:
+                futures = {pool.submit(send, index): index for index in range(1, count)}
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                        sent += len(batches[futures[future]])
+                        if on_batch_progress is not None:
+                            on_batch_progress(sent, total)
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        if on_receive_id is not None:
+            on_receive_id(space_id, map_id)
+
+        if wait:
+            self._poll_until_done(
+                map_id, on_progress=on_progress, show_progress=show_progress, stall_timeout=stall_timeout
+            )
 
+        return SpaceHandle(space_id, map_id, self._client)
+
+    def from_h5ad(
+        self,
+        path: str | os.PathLike,
+        space_name: str | None = None,
+        *,
+        obsm: str | None = None,
+        layer: str | None = None,
+        obs_columns: list[str] | None = None,
+        data_types: dict[str, DataType | str] | None = None,
+        encoding: str = "float32",
+        reducer: ReducerModels | str = ReducerModels.UMAP,
+        privacy_level: SpacePrivacy | str = SpacePrivacy.PRIVATE,
+        ai_provider: AIProvider | str = AIProvider.OpenAI,
+        chat_model: str = "gpt-4o-mini",
+        on_progress: ProgressCallback | None = None,
+        on_receive_id: Callable[[str, str], None] | None = None,
+        on_upload_progress: UploadProgressCallback | None = None,
+        show_progress: bool = False,
+        wait: bool = True,
+        stall_timeout: float | None = 600.0,
+        space_id: str | None = None,
+        map_id: str | None = None,
+        map_name: str | None = None,
+    ) -> SpaceHandle:
+        """create a space from an AnnData .h5ad file (synthesis/h5ad/create/), one point per cell.
+
+        the file is read in row blocks, never loaded whole (see mantis_sdk.h5ad): obs is
+        uploaded as metadata — obs_names plus obs_columns (all by default), typed from their
+        dtypes unless data_types says otherwise — and exactly one matrix is streamed as the
+        cells' embedding: obsm= (e.g. "X_pca") or layer= (a layers/ entry, or "X"). space_name
+        defaults to the file's name. needs h5py (the [h5ad] extra)."""
+        with h5ad.open_file(path) as file:
+            space_id, request_kwargs = self._prepare_h5ad(
+                file,
+                space_name or Path(path).stem,
+                obsm=obsm,
+                layer=layer,
+                obs_columns=obs_columns,
+                data_types=data_types,
+                encoding=encoding,
+                reducer=reducer,
+                privacy_level=privacy_level,
+                ai_provider=ai_provider,
+                chat_model=chat_model,
+                space_id=space_id,
+                map_id=map_id,
+                map_name=map_name,
+                on_upload_progress=on_upload_progress,
+            )
+            resp = self.http.request("POST", "/synthesis/h5ad/create", **request_kwargs)
+        space_id, map_id = self._read_create_response(resp, space_id, "h5ad create")
+
+        if on_receive_id is not None:
+            on_receive_id(space_id, map_id)
+
+        if wait:
+            self._poll_until_done(
+                map_id, on_progress=on_progress, show_progress=show_progress, stall_timeout=stall_timeout
+            )
+
+        return SpaceHandle(space_id, map_id, self._client)
+
+    def embed_only(
+        self,
+        space_name: str,
+        metadata: pd.DataFrame | str,
+        embeddings: np.ndarray | str | os.PathLike,
+        data_types: dict[str, DataType | str],
+        *,
+        embedding_column: str = "embedding",
+        encoding: str = "float32",
+        reducer: ReducerModels | str = ReducerModels.UMAP,
+        privacy_level: SpacePrivacy | str = SpacePrivacy.PRIVATE,
+        ai_provider: AIProvider | str = AIProvider.OpenAI,
+        chat_model: str = "gpt-4o-mini",
+        on_progress: ProgressCallback | None = None,
+        on_receive_id: Callable[[str, str], None] | None = None,
+        on_upload_progress: UploadProgressCallback | None = None,
+        show_progress: bool = False,
+        wait: bool = True,
+        stall_timeout: float | None = 600.0,
+        space_id: str | None = None,
+        map_id: str | None = None,
+        map_name: str | None = None,
+    ) -> SpaceHandle:
+        """create a space from precomputed embeddings (synthesis/embed-only/), skipping the
+        server-side embedding stage.
+
+        metadata holds one row per embedding (a DataFrame, arrow Table or csv path) described
+        by data_types. embeddings is a (rows, dim) NumPy array or a path to a .npy file, which
+        is memory-mapped. the matrix is streamed in row blocks as a binary side-car part
+        (encoding float32, float16 or int8; see mantis_sdk.vectors) — a float32 C-contiguous
+        matrix without copies. progress is polled like create()."""
+        space_id, request_kwargs = self._prepare_embed_only(
+            space_name,
+            metadata,
+            embeddings,
+            data_types,
+            embedding_column=embedding_column,
+            encoding=encoding,
+            reducer=reducer,
+            privacy_level=privacy_level,
+            ai_provider=ai_provider,
+            chat_model=chat_model,
+            space_id=space_id,
+            map_id=map_id,
+            map_name=map_name,
+            on_upload_progress=on_upload_progress,
+        )
+        resp = self.http.request("POST", "/synthesis/embed-only", **request_kwargs)
+        space_id, map_id = self._read_create_response(resp, space_id, "embed-only create")
+
+        if on_receive_id is not None:
+            on_receive_id(space_id, map_id)
+
+        if wait:
+            self._poll_until_done(
+                map_id, on_progress=on_progress, show_progress=show_progress, stall_timeout=stall_timeout
+            )
+
+        return SpaceHandle(space_id, map_id, self._client)
+
+    # --- helpers ---
+    def _prepare_embed_only(
+        self,
+        space_name: str,
+        metadata: Any,
+        embeddings: Any,
+        data_types: dict[str, DataType | str],
+        *,
+        embedding_column: str,
+        encoding: str,
+        **landscape: Any,
+    ) -> tuple[str, dict[str, Any]]:
+        """build the synthesis/embed-only/ request: a landscape upload of the metadata whose
+        embedding column comes entirely from a side-car, always streamed."""
+        vector_encoding = vector_codec.normalize_encoding(encoding)
+        if vector_encoding is None:
+            raise ConfigurationError("embed_only sends binary embeddings; use float32, float16 or int8")
+        matrix = vector_codec.load_matrix(embeddings, embedding_column)
+        return self._prepare_landscape(
+            space_name,
+            frames.to_frame(metadata) if isinstance(metadata, str) else metadata,
+            {**data_types, embedding_column: DataType.Vector},
+            custom_models=None,
+            embedding_model="precomputed",
+            upload_format="csv",
+            vectors={embedding_column: matrix},
+            vector_encoding=vector_encoding,
+            streaming=True,
+            **landscape,
+        )
+
+    def _prepare_molecules(
+        self,
+        space_name: str,
+        molecules: Any,
+        data_types: dict[str, DataType | str] | None,
+        *,
+        smiles_column: str,
+        canonicalize: bool | molecule_prep.Canonicalizer,
+        drop_duplicates: bool,
+        workers: int | None,
+        batch_rows: int,
+        **landscape: Any,
+    ) -> tuple[str, dict[str, Any], list[pd.DataFrame]]:
+        """prepare SMILES for synthesis/molecules/: (space_id, the form fields every batch
+        carries, the row batches). shared by the sync and async paths."""
+        types = {smiles_column: DataType.Title, **(data_types or {})}
+        prepared = molecule_prep.prepare(
+            molecule_prep.as_frame(molecules, smiles_column),
+            smiles_column,
+            canonicalize=canonicalize,
+            drop_duplicates=drop_duplicates,
+            workers=(os.cpu_count() or 1) if workers is None else workers,
+        )
+        if not len(prepared.frame):
+            raise MantisError(f"none of the {prepared.total} molecules has a valid structure")
+        logger.info(
+            "uploading %d of %d molecules (%d invalid, %d duplicates dropped)",
+            len(prepared.frame), prepared.total, prepared.invalid, prepared.duplicates,
+        )
+        prepared.frame, _ = self._shape_data(prepared.frame, types, None, False)
+        space_id, form_data = self._landscape_fields(
+            space_name, list(prepared.frame.columns), types, None, "csv", embedding_model=None, **landscape
+        )
+        form_data["smiles_column"] = smiles_column
+        return space_id, form_data, list(prepared.batches(batch_rows))
+
+    def _molecule_request(
+        self, form_data: dict[str, Any], batch: pd.DataFrame, index: int, count: int
+    ) -> dict[str, Any]:
+        """the multipart request for one batch: its rows as csv plus batch_index / batch_count,
+        so the backend starts synthesis once every batch has arrived."""
+        form_data = {**form_data, "batch_index": str(index), "batch_count": str(count)}
+        buffer, _, _ = self._load_data(batch)
+        return {"data": form_data, "files": {"file": self._file_part("data.csv", buffer, "text/csv", form_data)}}
+
+    def _prepare_h5ad(
+        self,
+        file: Any,
+        space_name: str,
+        *,
+        obsm: str | None,
+        layer: str | None,
+        obs_columns: list[str] | None,
+        data_types: dict[str, DataType | str] | None,
+        encoding: str,
+        on_upload_progress: UploadProgressCallback | None,
+        **landscape: Any,
+    ) -> tuple[str, dict[str, Any]]:
+        """build the synthesis/h5ad/create/ request: obs as streamed csv and the chosen matrix
+        as a side-car, both read a block at a time from file, which the caller keeps open
+        until the request has been sent."""
+        vector_encoding = vector_codec.normalize_encoding(encoding)
+        if vector_encoding is None:
+            raise ConfigurationError("from_h5ad sends binary embeddings; use float32, float16 or int8")
+        source = h5ad.source_path(obsm, layer)
+        obs = h5ad.Obs(file, obs_columns)
+        matrix = h5ad.matrix(file, source)
+        if len(matrix) != obs.rows:
+            raise MantisError(f"{source} has {len(matrix)} rows; obs has {obs.rows}")
+        column = obsm or layer
+        types = {**obs.data_types(), **(data_types or {}), column: DataType.Vector}
+        space_id, form_data = self._landscape_fields(
+            space_name, [*obs.columns, column], types, None, "csv", embedding_model="precomputed", **landscape
+        )
+        form_data["h5ad_source"] = source
+        parts = self._vector_parts({column: matrix}, vector_encoding, form_data)
+        chunks = obs.iter_csv(self.http.config.upload_chunk_rows, empty=[column])
+        upload = self._stream_part("data.csv", "text/csv", chunks, None, form_data, on_upload_progress, parts)
+        return space_id, {"data": upload}
+
+    def _plan_refresh(
+        self, data: Any, data_types: dict[str, DataType | str], delta_key: str | list[str], landscape: dict[str, Any]
+    ) -> tuple[Any, delta.Delta | None, delta.Manifest, dict[str, Any]]:
+        """shape and hash the rows and diff them against the map's manifest.
+        returns (shaped data, the delta or None for a full upload, the new manifest, the
+        landscape kwargs to upload with); shared by the sync and async refresh paths."""
+        map_id = landscape["map_id"]
+        if not map_id:
+            raise MantisError("delta_key needs the stable map_id of the map to refresh")
+        if landscape["vectors"]:
+            raise MantisError("delta_key can't be combined with vectors=; put the vectors in a DataFrame column")
+        config = self.http.config
+        key = delta.key_columns(delta_key)
+        data, custom_models = self._shape_data(
+            data, data_types, landscape["custom_models"], landscape["drop_duplicates"], key_columns=key
+        )
+        frame = frames.to_frame(data)
+        if isinstance(data, sources.Source):  # read once: upload the rows that were read
+            data = frame
+        keys, hashes = delta.row_keys(frame, key), delta.row_hashes(frame)
+        schema = delta.schema_digest(
+            list(frame.columns),
+            data_types=self._sanitize_data_types(frame.columns, data_types),
+            custom_models=custom_models,
+            key=key,
+            host=config.host,
+            **{name: str(landscape[name]) for name in ("reducer", "ai_provider", "chat_model", "embedding_model")},
+        )
+        previous = delta.Manifest.load(config.state_dir, map_id)
+        space_id = landscape["space_id"] or (previous.space_id if previous else None) or str(uuid.uuid4())
+        manifest = delta.Manifest(map_id, space_id, key, schema, dict(zip(keys, hashes)))
+        change = None
+        if previous is None or previous.schema != schema:
+            logger.debug("no manifest matching map %s; uploading all rows", map_id)
+        elif self._partial_updates is not False:
+            change = delta.diff(frame, keys, hashes, previous.rows)
+            logger.info(
+                "map %s: %d inserted, %d updated, %d deleted of %d rows",
+                map_id, change.inserted, change.updated, len(change.deleted), change.total,
+            )
+            if change.fraction > config.delta_max_fraction:
+                change = None
+        landscape = {
+            **landscape, "space_id": space_id, "custom_models": custom_models,
+            "drop_duplicates": False, "key_columns": key,
+        }
+        return data, change, manifest, landscape
+
+    def _create_cache(self, reuse: bool | None, data: Any = None) -> CreateCache | None:
+        config = self.http.config
+        if not (config.create_cache if reuse is None else reuse):
+            return None
+        if sources.single_pass(data):  # hashing it would use up the rows before the upload
+            logger.debug("not using the create cache: the data can only be read once")
+            return None
+        return CreateCache(config.state_dir, config.create_cache_max_entries, config.create_cache_ttl)
+
+    def _create_digest(
+        self, space_name: str, data: Any, data_types: dict[str, DataType | str], landscape: dict[str, Any]
+    ) -> str:
+        """content digest of a create(): the data plus every setting that changes the result."""
+        config = self.http.config
+        settings = {name: landscape[name] for name in (
+            "custom_models", "reducer", "privacy_level", "ai_provider", "chat_model", "embedding_model",
+            "space_id", "map_id", "map_name", "drop_duplicates",
+        )}
+        return content_digest(
+            data,
+            vectors=landscape["vectors"],
+            space_name=space_name,
+            data_types={str(column): str(dt) for column, dt in data_types.items()},
+            host=config.host,
+            project_columns=config.project_columns,
+            **settings,
+        )
+
+    @staticmethod
+    def _has_map(maps: list[dict], map_id: str) -> bool:
+        return any(str(m.get("id") or m.get("map_id")) == map_id for m in maps if isinstance(m, dict))
+
+    def _no_delta(self, exc: APIStatusError) -> None:
+        """remember a backend without delta refreshes (re-raising any other error)."""
+        if exc.status_code not in _NO_DELTA_STATUSES:
+            raise exc
+        self._partial_updates = False
+        logger.warning("backend does not support delta refreshes; uploading all rows")
+
+    def _forget_manifest(self, manifest: delta.Manifest | None) -> None:
+        # after a failed refresh the backend's rows are unknown: the next one uploads everything.
+        if manifest is not None:
+            delta.Manifest.forget(self.http.config.state_dir, manifest.map_id)
+
+    def _prepare_landscape(
+        self,
+        space_name: str,
+        data: Any,
+        data_types: dict[str, DataType | str],
+        *,
+        custom_models: list[str | None] | None,
+        reducer: ReducerModels | str,
+        privacy_level: SpacePrivacy | str,
+        ai_provider: AIProvider | str,
+        chat_model: str,
+        embedding_model: str,
+        space_id: str | None,
+        map_id: str | None,
+        map_name: str | None,
+        on_upload_progress: UploadProgressCallback | None = None,
+        upload_format: str = "csv",
+        drop_duplicates: bool = False,
+        key_columns: list[str] | None = None,
+        deleted_keys: list[str] | None = None,
+        vectors: dict[str, Any] | None = None,
+        vector_encoding: str | None = None,
+        streaming: bool | None = None,
+    ) -> tuple[str, dict[str, Any]]:
+        """build the multipart request for synthesis/landscape/. upload_format is the already
+        negotiated format (see _upload_format). key_columns / deleted_keys describe a delta
+        refresh (see _refresh); the key columns are always uploaded. vector_encoding is the
+        negotiated side-car encoding for Vector columns, or None (see _vector_encoding).
+        streaming overrides the streamed-body choice (on_upload_progress / config.stream_uploads).
+        returns (space_id, request kwargs); shared by the sync and async create paths."""
+        if vectors and (isinstance(data, (str, sources.Source)) or drop_duplicates):
+            raise MantisError("vectors= needs DataFrame or arrow Table data, without drop_duplicates")
+        data, custom_models = self._shape_data(data, data_types, custom_models, drop_duplicates, key_columns)
+        if streaming is None:
+            streaming = on_upload_progress is not None or self.http.config.stream_uploads
+        sidecars: dict[str, Any] = {}
+        if upload_format != "csv":
+            # parquet/arrow are compressed internally, so upload_compression doesn't apply.
+            if isinstance(data, sources.Source):
+                batches = data.record_batches(self.http.config.upload_chunk_rows)
+                buffer, length = columnar.encode_batches(batches, upload_format)
+            else:
+                buffer, length = columnar.encode(data, upload_format, vectors)
+            columns = list(data.column_names if columnar.is_arrow_table(data) else data.columns)
+            columns += [column for column in vectors or {} if column not in columns]
+            file_extension, mime = columnar.FORMATS[upload_format]
+        else:
+            if columnar.is_arrow_table(data):
+                # with no vectors to split out, a table is formatted batch by batch, not converted whole.
+                data = columnar.as_dataframe(data) if vectors or vector_encoding else sources.of_table(data)
+            if vector_encoding is not None and isinstance(data, pd.DataFrame):
+                data, sidecars = vector_codec.split(data, data_types, vectors)
+            elif vectors:
+                data = vector_codec.as_text(data, vectors)
+            if streaming:
+                chunks, columns, file_extension, length = self._iter_data(data, **self._csv_options())
+            else:
+                buffer, columns, file_extension = self._load_data(data, **self._csv_options())
+            mime = f"text/{file_extension}"
+
+        space_id, form_data = self._landscape_fields(
+            space_name, columns, data_types, custom_models, file_extension,
+            reducer=reducer, privacy_level=privacy_level, ai_provider=ai_provider, chat_model=chat_model,
+            embedding_model=embedding_model, space_id=space_id, map_id=map_id, map_name=map_name,
+        )
+        if key_columns:  # rows are identified by these columns, so later refreshes can be deltas
+            form_data["key_columns"] = self.http.codec.dumps(key_columns)
+        if deleted_keys is not None:
+            form_data["deleted_keys"] = self.http.codec.dumps(deleted_keys)
+        parts = self._vector_parts(sidecars, vector_encoding, form_data)
+        filename = f"data.{file_extension}"
+        if upload_format != "csv":
+            form_data["file_format"] = upload_format
+            if streaming:
+                upload = MultipartStream(
+                    form_data, "file", filename, mime, iter_file(buffer), length=length, on_progress=on_upload_progress
+                )
+                return space_id, {"data": upload}
+            return space_id, {"data": form_data, "files": {"file": (filename, buffer, mime)}}
+        if streaming:
+            upload = self._stream_part(filename, mime, chunks, length, form_data, on_upload_progress, parts)
+            return space_id, {"data": upload}
+        files = {"file": self._file_part(filename, buffer, mime, form_data)}
+        for part in parts:
+            files[part.name] = (part.filename, spool(part.content)[0], part.mime)
+        return space_id, {"data": form_data, "files": files}
+
+    def _landscape_fields(
+        self,
+        space_name: str,
+        columns: list[str],
+        data_types: dict[str, DataType | str],
+        custom_models: list[str | None] | None,
+        file_extension: str,
+        *,
+        reducer: ReducerModels | str,
+        privacy_level: SpacePrivacy | str,
+        ai_provider: AIProvider | str,
+        chat_model: str,
+        embedding_model: str | None,
+        space_id: str | None,
+        map_id: str | None,
+        map_name: str | None,
+    ) -> tuple[str, dict[str, Any]]:
+        """(space_id, the form fields describing an upload of columns) — shared by every
+        landscape-shaped create (create, embed_only, from_h5ad, from_molecules)."""
         data_types_sanitized = self._sanitize_data_types(columns, data_types)
 
         # custom_models must align with the number of columns we describe, not just the
@@ -177,47 +1366,157 @@ class SpacesResource(_BaseResource):
             "map_name": map_name or space_name,  # backend defaults to "Untitled Map" if omitted
             "is_public": str(str(privacy_level) == str(SpacePrivacy.PUBLIC)).lower(),
             "red_model": str(reducer),
-            "custom_models": json.dumps(custom_models),
-            "data_types": json.dumps(data_types_sanitized),
+            "custom_models": self.http.codec.dumps(custom_models),
+            "data_types": self.http.codec.dumps(data_types_sanitized),
             "ai_provider": str(ai_provider),
             "file_key": file_key,
             "chat_model": chat_model,
-            "embedding_model": embedding_model,
         }
+        if embedding_model is not None:  # None → the endpoint picks its own (e.g. molecules)
+            form_data["embedding_model"] = embedding_model
         if map_id:  # stable map id → backend refreshes that map in place instead of minting one
             form_data["map_id"] = map_id
-        files = {"file": (f"data.{file_extension}", buffer, f"text/{file_extension}")}
-
-        resp = self.http.request("POST", "/synthesis/landscape", data=form_data, files=files)
-
-        # current backend returns {map_id, space_id, status}; there is no layer_id anymore.
-        map_id = resp.get("map_id")
-        space_id = resp.get("space_id", space_id)
-        if not map_id:
-            raise SpaceCreationError(f"create response missing map_id: {resp}")
+        return space_id, form_data
+
+    def _vector_parts(
+        self, sidecars: dict[str, Any], encoding: str | None, form_data: dict[str, Any]
+    ) -> list[FilePart]:
+        """the side-car parts for split-out vector columns, described in form_data."""
+        if not sidecars or encoding is None:
+            return []
+        chunk_rows = self.http.config.upload_chunk_rows
+        parts, described = [], []
+        for index, (column, matrix) in enumerate(sidecars.items()):
+            name = f"vectors_{index}"
+            described.append(vector_codec.describe(column, name, matrix, encoding))
+            parts.append(FilePart(
+                name, f"{name}.bin", vector_codec.MIME, vector_codec.iter_encoded(matrix, encoding, chunk_rows),
+                vector_codec.encoded_length(matrix, encoding),
+            ))
+        form_data["vector_parts"] = self.http.codec.dumps(described)
+        return parts
+
+    def _shape_data(
+        self,
+        data: Any,
+        data_types: dict[str, DataType | str],
+        custom_models: list[str | None] | None,
+        drop_duplicates: bool,
+        key_columns: list[str] | None = None,
+    ) -> tuple[Any, list[str | None] | None]:
+        """project data to its mapped columns (config.project_columns) and optionally drop
+        duplicate rows. a custom_models list given per data column is projected alongside.
+        key_columns are kept even when unmapped."""
+        if self.http.config.project_columns:
+            columns = frames.columns_of(data)
+            keep = frames.mapped_columns(columns, data_types)
+            if key_columns:
+                kept = set(keep) | set(key_columns)
+                keep = [column for column in columns if column in kept]
+            if len(keep) < len(columns):
+                if custom_models is not None and len(custom_models) == len(columns):
+                    kept = set(keep)
+                    custom_models = [model for column, model in zip(columns, custom_models) if column in kept]
+                data = frames.project(data, keep)
+                logger.debug("uploading %d of %d columns (the rest are unmapped)", len(keep), len(columns))
+        if drop_duplicates:
+            data, dropped = frames.drop_duplicate_rows(data)
+            if dropped:
+                logger.info("dropped %d duplicate rows before upload", dropped)
+        return data, custom_models
+
+    def _upload_format(self, requested: str | None, data: Any) -> str:
+        """negotiate the upload format: csv unless a columnar one is wanted and advertised."""
+        wanted = self._wanted_format(requested, data)
+        return wanted if wanted == "csv" else self._pick_format(wanted, self._advertised_formats())
+
+    def _vector_encoding(self) -> str | None:
+        """the side-car encoding for Vector columns: config.vector_encoding if the backend takes it."""
+        encoding = vector_codec.normalize_encoding(self.http.config.vector_encoding)
+        return encoding and self._pick_vector_encoding(encoding, self._advertised_formats())
 
-        if on_receive_id is not None:
-            on_receive_id(space_id, map_id)
+    @staticmethod
+    def _pick_vector_encoding(encoding: str, advertised: set[str]) -> str | None:
+        if "vectors" in advertised:
+            return encoding
+        logger.warning("backend does not advertise binary vector uploads; sending vectors as csv text")
+        return None
+
+    def _advertised_formats(self) -> set[str]:
+        """upload formats the backend accepts (synthesis/upload-formats/), fetched once."""
+        if self._formats is None:
+            try:
+                resp = self.http.request("GET", "synthesis/upload-formats")
+            except APIStatusError:  # older backends don't have the route: csv only
+                resp = []
+            self._formats = self._read_formats(resp)
+        return self._formats
 
-        if wait:
-            self._poll_until_done(
-                map_id, on_progress=on_progress, show_progress=show_progress, stall_timeout=stall_timeout
-            )
+    def _wanted_format(self, requested: str | None, data: Any) -> str:
+        fmt = columnar.normalize_format(requested or self.http.config.upload_format)
+        # file paths are uploaded as they are.
+        return "csv" if isinstance(data, str) else fmt
 
-        return SpaceHandle(space_id, map_id, self._client)
+    @staticmethod
+    def _read_formats(resp: Any) -> set[str]:
+        return {str(fmt).lower() for fmt in _unwrap_list(resp, "formats")} | {"csv"}
 
-    def from_github(
+    @staticmethod
+    def _pick_format(wanted: str, advertised: set[str]) -> str:
+        chosen = columnar.pick_format(wanted, advertised)
+        if wanted != "auto" and chosen != wanted:
+            logger.warning("backend does not advertise %s uploads; falling back to csv", wanted)
+        return chosen
+
+    def _file_part(self, filename: str, buffer: Any, mime: str, form_data: dict[str, Any]) -> tuple:
+        """the multipart file tuple, compressed when config.upload_compression is set.
+        a compressed part carries a content_encoding form field so the backend can decode it;
+        the raw vs compressed sizes are reported in the transport's transfer stats."""
+        encoding = resolve_encoding(self.http.config.upload_compression)
+        if encoding is None:
+            return (filename, buffer, mime)
+        compressed, raw, wire = compress_part(buffer, encoding)
+        stats = getattr(self.http.transport, "transfer", None)
+        if stats is not None:
+            stats.record_upload(raw, wire)
+        logger.debug("compressed upload %s with %s: %d → %d bytes", filename, encoding, raw, wire)
+        form_data["content_encoding"] = encoding
+        name, mime = part_name(filename, encoding)
+        return (name, compressed, mime)
+
+    def _stream_part(
         self,
-        repo_url: str,
-        space_name: str | None = None,
-        *,
-        privacy_level: SpacePrivacy | str = SpacePrivacy.PRIVATE,
-        on_progress: ProgressCallback | None = None,
-        show_progress: bool = False,
-        wait: bool = True,
-        **extra: Any,
-    ) -> SpaceHandle:
-        """create a space by analyzing a github repository (synthesis/github/)."""
+        filename: str,
+        mime: str,
+        chunks: Iterator[bytes],
+        length: int | None,
+        form_data: dict[str, Any],
+        on_progress: UploadProgressCallback | None,
+        parts: list[FilePart] | None = None,
+    ) -> MultipartStream:
+        """the whole multipart body as a MultipartStream over the file's chunks, compressed on
+        the fly when configured. unless config.chunked_uploads, a body of unknown size is
+        spooled to a temp file first so it can be sent with a Content-Length."""
+        config = self.http.config
+        encoding = resolve_encoding(config.upload_compression)
+        if encoding is not None:
+            stats = getattr(self.http.transport, "transfer", None)
+            chunks = compress_chunks(chunks, encoding, stats.record_upload if stats is not None else None)
+            form_data["content_encoding"] = encoding
+            filename, mime = part_name(filename, encoding)
+            length = None
+        if length is None and not config.chunked_uploads:
+            body, length = spool(chunks)
+            chunks = iter_file(body)
+        return MultipartStream(
+            form_data, "file", filename, mime, chunks, length=length, on_progress=on_progress, parts=parts or ()
+        )
+
+    @staticmethod
+    def _github_payload(
+        repo_url: str, space_name: str | None, privacy_level: SpacePrivacy | str, extra: dict
+    ) -> tuple[str, dict]:
+        """build the synthesis/github/ json body; returns (space_id, payload)."""
         space_id = str(uuid.uuid4())
         payload = {
             "space_id": space_id,
@@ -226,39 +1525,123 @@ class SpacesResource(_BaseResource):
             "is_public": str(str(privacy_level) == str(SpacePrivacy.PUBLIC)).lower(),
             **extra,
         }
-        resp = self.http.request("POST", "/synthesis/github", json=payload)
+        return space_id, payload
+
+    def _submit(
+        self, endpoint: str, key: str, request_kwargs: dict[str, Any], rebuild: Callable[[], dict[str, Any]] | None
+    ) -> Any:
+        """POST a synthesis submission under an Idempotency-Key, re-sending it (rebuilt by
+        rebuild(), as upload bodies are single-use) after a transient failure, up to
+        config.submit_retries times; without a rebuild it is sent once. a request that failed
+        while connecting, or was turned away with a 429, is always re-sent. one that may have
+        reached the backend — a dropped connection, a 5xx — is re-sent only when the backend
+        advertises "idempotency" at synthesis/upload-formats/: it then runs each key at most
+        once, answering a repeat with the first response."""
+        headers = {IDEMPOTENCY_HEADER: key}
+        retries = max(0, self.http.config.submit_retries)
+        for attempt in range(retries + 1):
+            if attempt:
+                time.sleep(_RESUBMIT_BACKOFF * 2 ** (attempt - 1))
+                request_kwargs = rebuild()
+            try:
+                return self.http.request("POST", endpoint, headers=headers, **request_kwargs)
+            except (APIConnectionError, APIStatusError) as exc:
+                wait = _RESUBMIT_BACKOFF * 2**attempt
+                if attempt == retries or rebuild is None or not (self._resendable(exc, wait) or self._replays(exc)):
+                    raise
+                logger.info("re-sending %s (key %s) after: %s", endpoint, key, exc)
+
+    def _replays(self, exc: MantisError) -> bool:
+        """whether a submission that may have reached the backend can be re-sent safely."""
+        transient = exc.request_sent if isinstance(exc, APIConnectionError) else (
+            getattr(exc, "status_code", None) in _RESUBMIT_STATUSES
+        )
+        return transient and "idempotency" in self._advertised_formats()
+
+    @staticmethod
+    def _resendable(exc: MantisError, wait: float = 0.0) -> bool:
+        """whether a failed submission certainly did no work on the backend and is worth
+        re-sending after wait seconds — not while its endpoint group's circuit stays open
+        longer than that (see CircuitOpenError.retry_in)."""
+        if isinstance(exc, APIConnectionError):
+            return not exc.request_sent and getattr(exc, "retry_in", 0.0) <= wait
+        return getattr(exc, "status_code", None) == 429
+
+    @staticmethod
+    def _rebuilder(data: Any, rebuild: Callable[[], dict[str, Any]]) -> Callable[[], dict[str, Any]] | None:
+        """rebuild, unless data can only be read once and so can't be uploaded again."""
+        return None if sources.single_pass(data) else rebuild
+
+    @staticmethod
+    def _submission_key(*parts: Any) -> str:
+        """the idempotency key of a submission: the same parts always give the same key."""
+        return hashlib.blake2b("\x1f".join(str(part) for part in parts).encode(), digest_size=16).hexdigest()
+
+    def _landscape_key(
+        self,
+        space_name: str,
+        data: Any,
+        data_types: dict[str, DataType | str],
+        landscape: dict[str, Any],
+        space_id: str,
+        digest: str | None,
+    ) -> str:
+        """the idempotency key of a create's upload. without a caller-given space_id the
+        space id is fresh, which already makes the key unique; with one, the data and
+        settings (the create cache digest) tell submissions apart. data that can only be
+        read once isn't hashed (nor re-sent), so its key is random."""
+        if sources.single_pass(data):
+            digest = digest or uuid.uuid4().hex
+        elif digest is None and landscape["space_id"] is not None:
+            digest = self._create_digest(space_name, data, data_types, landscape)
+        return self._submission_key("landscape", space_id, landscape["map_id"], digest)
+
+    @staticmethod
+    def _read_create_response(resp: Any, space_id: str, what: str = "create") -> tuple[str, str]:
+        """pull (space_id, map_id) out of a synthesis create response.
+        current backend returns {map_id, space_id, status}; there is no layer_id anymore."""
         map_id = resp.get("map_id")
         space_id = resp.get("space_id", space_id)
         if not map_id:
-            raise SpaceCreationError(f"github create response missing map_id: {resp}")
-        if wait:
-            self._poll_until_done(map_id, on_progress=on_progress, show_progress=show_progress)
-        return SpaceHandle(space_id, map_id, self._client)
-
-    # the remaining backend creation pipelines are scaffolded; wire them as needed.
-    def from_molecules(self, *args: Any, **kwargs: Any) -> SpaceHandle:
-        raise FeatureUnavailableError("from_molecules wraps synthesis/molecules/ — not yet wired in the sdk")
+            raise SpaceCreationError(f"{what} response missing map_id: {resp}")
+        return space_id, map_id
 
-    def from_h5ad(self, *args: Any, **kwargs: Any) -> SpaceHandle:
-        raise FeatureUnavailableError("from_h5ad wraps synthesis/h5ad/create/ — not yet wired in the sdk")
+    def _csv_options(self) -> dict[str, Any]:
+        config = self.http.config
+        return {"chunk_rows": config.upload_chunk_rows, "workers": config.csv_workers, "executor": config.csv_executor}
 
-    def embed_only(self, *args: Any, **kwargs: Any) -> SpaceHandle:
-        raise FeatureUnavailableError("embed_only wraps synthesis/embed-only/ — not yet wired in the sdk")
-
-    # --- helpers ---
     @staticmethod
-    def _load_data(data: pd.DataFrame | str):
+    def _load_data(data: Any, *, chunk_rows: int = 50_000, workers: int = 0, executor: str = "process"):
         file_extension = "csv"
         if isinstance(data, pd.DataFrame):
             buffer = io.BytesIO()
-            data.to_csv(buffer, index=False)
+            if workers > 1:
+                for block in iter_csv(data, chunk_rows, workers=workers, executor=executor):
+                    buffer.write(block)
+            else:
+                data.to_csv(buffer, index=False)
             buffer.seek(0)
             return buffer, list(data.columns), file_extension
+        if isinstance(data, sources.Source):  # spooled block by block, to disk past a few MB
+            buffer, _ = spool(sources.iter_csv(data, chunk_rows, workers=workers, executor=executor))
+            return buffer, data.columns, file_extension
         if isinstance(data, str):
             file_extension = data.split(".")[-1] or "csv"
-            columns = list(pd.read_csv(data, nrows=1).columns)
-            return open(data, "rb"), columns, file_extension
-        raise MantisError("data must be a pandas DataFrame or a file path string")
+            return open(data, "rb"), frames.columns_of(data), file_extension
+        raise MantisError("data must be a pandas DataFrame, a Source or a file path string")
+
+    @staticmethod
+    def _iter_data(data: Any, *, chunk_rows: int, workers: int = 0, executor: str = "process"):
+        """streaming counterpart of _load_data: (byte chunks, columns, extension, length or None)."""
+        if isinstance(data, pd.DataFrame):
+            return iter_csv(data, chunk_rows, workers=workers, executor=executor), list(data.columns), "csv", None
+        if isinstance(data, sources.Source):
+            chunks = sources.iter_csv(data, chunk_rows, workers=workers, executor=executor)
+            return chunks, data.columns, "csv", None
+        if isinstance(data, str):
+            source = open(data, "rb")
+            return iter_file(source), frames.columns_of(data), data.split(".")[-1] or "csv", file_length(source)
+        raise MantisError("data must be a pandas DataFrame, a Source or a file path string")
 
     @staticmethod
     def _sanitize_data_types(columns, data_types: dict[str, DataType | str]) -> list[dict]:
@@ -278,49 +1661,80 @@ class SpacesResource(_BaseResource):
         show_progress: bool = False,
         stall_timeout: float | None = 600.0,
     ) -> None:
-        """poll synthesis/progress/<map_id>/ until completed or errored.
+        """follow synthesis/progress/<map_id>/ (see watch) until completed or errored.
 
         stall_timeout guards against a pipeline that never advances (e.g. no celery worker):
         if progress doesn't change for that many seconds, raise instead of hanging forever.
         pass None to wait indefinitely."""
-        bar = None
-        if show_progress:
-            try:
-                from tqdm import tqdm
+        tracker = _ProgressTracker(
+            map_id, on_progress=on_progress, show_progress=show_progress, stall_timeout=stall_timeout
+        )
+        try:
+            for _ in self._watch(tracker):
+                pass
+        finally:
+            tracker.close()
 
-                bar = tqdm(total=100, desc="synthesizing space", unit="%")
-            except ImportError:
-                logger.debug("tqdm not installed; show_progress ignored")
+    def watch(self, map_id: str, *, stall_timeout: float | None = 600.0) -> Iterator[ProgressEvent]:
+        """yield a ProgressEvent each time map_id's synthesis progress changes, ending with the
+        completed one. raises SpaceCreationError on a pipeline error, or when progress doesn't
+        change for stall_timeout seconds (None: wait indefinitely).
 
-        last = -1
-        last_change = time.monotonic()
+        updates are pushed over the backend's event stream when it offers one; otherwise
+        progress is polled, less often while it stands still (see mantis_sdk.progress)."""
+        tracker = _ProgressTracker(map_id, stall_timeout=stall_timeout)
         try:
-            while True:
-                progress = self.http.request("GET", f"synthesis/progress/{map_id}")
-                if progress.get("error"):
-                    raise SpaceCreationError(progress["error"])
-
-                pct = int(progress.get("progress", 0))
-                if pct != last:
-                    if on_progress is not None:
-                        on_progress(pct, progress.get("message"), progress.get("progress_tree"))
-                    if bar is not None:
-                        bar.update(pct - max(last, 0))
-                    last = pct
-                    last_change = time.monotonic()
-
-                if progress.get("completed") or pct >= 100:
-                    return
-
-                if stall_timeout is not None and (time.monotonic() - last_change) > stall_timeout:
-                    raise SpaceCreationError(
-                        f"synthesis stalled at {pct}% for over {stall_timeout:.0f}s "
-                        f"(map_id={map_id}); is a celery worker running?"
-                    )
-                time.sleep(self.POLL_INTERVAL)
+            yield from self._watch(tracker)
         finally:
-            if bar is not None:
-                bar.close()
+            tracker.close()
+
+    def _watch(self, tracker: _ProgressTracker) -> Iterator[ProgressEvent]:
+        schedule = self._poll_schedule(tracker.stall_timeout)
+        while True:
+            payload = self.http.request("GET", f"synthesis/progress/{tracker.map_id}")
+            yield from self._observe(tracker, payload)
+            if tracker.done:
+                return
+            events_url = self._events_url(payload)
+            if events_url is not None:
+                try:
+                    for payload in self.http.stream(
+                        "GET", events_url, headers={"Accept": "text/event-stream"}, decoder=EventStreamDecoder(self.http.codec)
+                    ):
+                        yield from self._observe(tracker, payload)
+                        if tracker.done:
+                            return
+                except APIStatusError as exc:
+                    self._no_push(exc)
+                except APIConnectionError as exc:
+                    logger.debug("progress stream for %s dropped (%s); polling", tracker.map_id, exc)
+            time.sleep(schedule.next(tracker.last, tracker.changed))
+
+    @staticmethod
+    def _observe(tracker: _ProgressTracker, payload: dict) -> list[ProgressEvent]:
+        """feed one progress payload to tracker; the event to yield for it, if any."""
+        done = tracker.update(payload)
+        if not (tracker.changed or done):
+            return []
+        return [ProgressEvent.from_payload(tracker.map_id, payload)]
+
+    def _events_url(self, payload: Any) -> str | None:
+        """the push channel a progress payload advertises, unless it has failed before."""
+        if not self._progress_push or not isinstance(payload, dict):
+            return None
+        return payload.get("events_url") or None
+
+    def _no_push(self, exc: APIStatusError) -> None:
+        """remember a backend without a progress event stream (re-raising any other error)."""
+        if exc.status_code not in _NO_PUSH_STATUSES:
+            raise exc
+        self._progress_push = False
+        logger.info("backend has no progress event stream; polling")
+
+    def _poll_schedule(self, stall_timeout: float | None) -> PollSchedule:
+        # back off no further than a quarter of stall_timeout, so a stall is still caught promptly.
+        maximum = self.POLL_MAX_INTERVAL if stall_timeout is None else min(self.POLL_MAX_INTERVAL, stall_timeout / 4)
+        return PollSchedule(self.POLL_INTERVAL, maximum)
 
     # --- browser open (delegates to the playwright Space) ---
     async def aopen(self, space_id: str, colab: bool = False):
@@ -348,19 +1762,24 @@ class MapsResource(_BaseResource):
 
     def list(self, space_id: str) -> list[dict]:
         resp = self.http.request("GET", "/api/listMaps", params={"space_id": space_id})
-        if isinstance(resp, dict):
-            return resp.get("maps", resp.get("data", []))
-        return resp or []
+        return _unwrap_list(resp, "maps", "data")
 
     def list_idea_ids(self, map_id: str) -> list[str]:
-        resp = self.http.request("GET", "/api/listIdeas", params={"map_id": map_id})
-        if isinstance(resp, dict):
-            return resp.get("ideas", resp.get("ids", []))
-        return resp or []
+        return list(self.iter_idea_ids(map_id))
+
+    def iter_idea_ids(self, map_id: str) -> Iterator[str]:
+        """stream a map's idea ids, decoding them as the response arrives."""
+        return self.http.stream("GET", "/api/listIdeas", "ideas", "ids", params={"map_id": map_id})
 
     def get_ideas(self, ids: list[str]) -> Any:
+        """the /api/getIdeas payload for `ids`, as the backend returns it; iter_ideas streams
+        just the idea records."""
         return self.http.request("GET", "/api/getIdeas", params={"ids": ",".join(ids)})
 
+    def iter_ideas(self, ids: list[str]) -> Iterator[dict]:
+        """stream full idea records for `ids`, decoding them as the response arrives."""
+        return self.http.stream("GET", "/api/getIdeas", "ideas", "data", params={"ids": ",".join(ids)})
+
 
 class SpaceStatesResource(_BaseResource):
     """create/list space-states — a per-user live view of a space (selection, bags, active map).
@@ -388,9 +1807,7 @@ class SpaceStatesResource(_BaseResource):
 
     def list(self, space_id: str) -> list[dict]:
         resp = self.http.request("GET", "/api/space-state", params={"space_id": space_id})
-        if isinstance(resp, dict):
-            return resp.get("states", resp.get("results", []))
-        return resp if isinstance(resp, list) else (resp or [])
+        return _unwrap_list(resp, "states", "results")
 
 
 class FeaturedChatResource(_BaseResource):
@@ -469,8 +1886,12 @@ class AliasesResource(_BaseResource):
         existing = self.resolve(alias)
         if existing:
             return existing, False
-        space_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"mantis-sdk-alias:{alias}"))
-        return space_id, True
+        return self._alias_space_id(alias), True
+
+    @staticmethod
+    def _alias_space_id(alias: str) -> str:
+        """the deterministic space id minted for an unclaimed alias."""
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"mantis-sdk-alias:{alias}"))
 
 
 class AnnotationsResource(_BaseResource):
@@ -478,9 +1899,7 @@ class AnnotationsResource(_BaseResource):
 
     def list(self, map_id: str) -> list[dict]:
         resp = self.http.request("GET", "/api/getAnnotations", params={"map_id": map_id})
-        if isinstance(resp, dict):
-            return resp.get("annotations", [])
-        return resp or []
+        return _unwrap_list(resp, "annotations")
 
     def create(self, map_id: str, payload: dict) -> Any:
         body = {"map_id": map_id, **payload}
@@ -0,0 +1,162 @@
+"""streamed create() inputs: arrow readers and datasets, polars frames, chunked pandas readers
+and row iterators.
+
+converting such data to one pandas DataFrame first doubles peak memory. create() instead wraps
+it in a Source, which hands the rows to the upload encoder a block at a time — pandas blocks
+formatted to csv one after another, or arrow record batches written to a parquet / arrow stream
+(see mantis_sdk.columnar). a polars DataFrame goes in as the arrow Table it converts to without
+copying, and an arrow Table is formatted to csv batch by batch rather than converted whole.
+
+    spaces.create("papers", pq.ParquetFile(path).iter_batches(), data_types)
+    spaces.create("papers", pd.read_csv(path, chunksize=100_000), data_types)
+    spaces.create("papers", Rows(cursor, ["id", "title", "abstract"]), data_types)
+
+an arrow dataset, or a list of blocks, can be read again. readers, iterators and Rows can be
+read once: create() then skips the create cache and doesn't re-send a failed upload, and
+drop_duplicates / delta_key read the rows into one DataFrame first. vectors= needs a DataFrame
+or arrow Table, and Vector columns of a streamed source go as csv text."""
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+import pandas as pd
+
+from .exceptions import MantisError
+from .upload import format_blocks
+
+
+class Rows:
+    """rows with an explicit schema: an iterable of tuples in schema order (or of dicts keyed by
+    column), e.g. a database cursor. schema is a list of column names or {column: dtype}."""
+
+    def __init__(self, rows: Iterable[Any], schema: list[str] | dict[str, Any]):
+        self.rows = rows
+        self.columns = [str(column) for column in schema]
+        self.dtypes = dict(schema) if isinstance(schema, dict) else None
+
+    def blocks(self, chunk_rows: int) -> Iterator[pd.DataFrame]:
+        rows = iter(self.rows)
+        while block := list(itertools.islice(rows, max(1, chunk_rows))):
+            frame = pd.DataFrame.from_records(block, columns=self.columns)
+            yield frame.astype(self.dtypes) if self.dtypes else frame
+
+
+class Source:
+    """data read a block at a time: its columns, and blocks of pandas DataFrames or arrow
+    RecordBatches from blocks(chunk_rows). a source that isn't replayable can be read once."""
+
+    def __init__(self, columns: list[str], blocks: Callable[[int], Iterable[Any]], *, replayable: bool):
+        self.columns = list(columns)
+        self.replayable = replayable
+        self._blocks = blocks
+        self._read = False
+
+    def blocks(self, chunk_rows: int) -> Iterator[Any]:
+        if self._read and not self.replayable:
+            raise MantisError("this data can only be read once; pass a DataFrame, arrow Table or csv path to reuse it")
+        self._read = True
+        return iter(self._blocks(chunk_rows))
+
+    def frames(self, chunk_rows: int = 50_000) -> Iterator[pd.DataFrame]:
+        for block in self.blocks(chunk_rows):
+            yield block if isinstance(block, pd.DataFrame) else block.to_pandas()
+
+    def record_batches(self, chunk_rows: int = 50_000) -> Iterator[Any]:
+        import pyarrow as pa
+
+        for block in self.blocks(chunk_rows):
+            yield pa.RecordBatch.from_pandas(block, preserve_index=False) if isinstance(block, pd.DataFrame) else block
+
+    def select(self, keep: list[str]) -> Source:
+        """the source restricted to the keep columns, projected block by block."""
+        def blocks(chunk_rows: int) -> Iterator[Any]:
+            for block in self.blocks(chunk_rows):
+                yield block[keep] if isinstance(block, pd.DataFrame) else block.select(keep)
+
+        return Source(keep, blocks, replayable=self.replayable)
+
+
+def wrap(data: Any) -> Any:
+    """data as create() uploads it: DataFrames, csv paths and arrow Tables unchanged, a polars
+    DataFrame as an arrow Table, and readers, datasets, iterators of blocks or Rows as a Source."""
+    if isinstance(data, (pd.DataFrame, str, Source)):
+        return data
+    module = type(data).__module__
+    if module.startswith("polars") and hasattr(data, "to_arrow"):
+        return data.to_arrow()
+    if module.startswith("pyarrow"):
+        if hasattr(data, "column_names"):  # a Table or RecordBatch
+            return data
+        if hasattr(data, "to_batches"):  # a dataset
+            return Source(data.schema.names, lambda n: data.to_batches(batch_size=n), replayable=True)
+        if hasattr(data, "read_next_batch"):  # a RecordBatchReader
+            return Source(data.schema.names, lambda n: data, replayable=False)
+    if isinstance(data, Rows):
+        return Source(data.columns, data.blocks, replayable=False)
+    if isinstance(data, Iterable) and not isinstance(data, (bytes, dict)):
+        return _of_blocks(data)
+    raise MantisError(
+        "data must be a DataFrame (pandas or polars), a csv path, an arrow Table, RecordBatchReader or "
+        "dataset, an iterable of DataFrames or record batches, or Rows"
+    )
+
+
+def of_table(table: Any) -> Source:
+    """an arrow Table as a Source of its record batches."""
+    return Source(table.column_names, lambda n: table.to_batches(max_chunksize=n), replayable=True)
+
+
+def of_csv(path: str, keep: list[str]) -> Source:
+    """the keep columns of a csv file, read as text a block of rows at a time."""
+    def blocks(chunk_rows: int) -> Iterator[pd.DataFrame]:
+        with pd.read_csv(path, usecols=keep, dtype=str, keep_default_na=False, chunksize=max(1, chunk_rows)) as reader:
+            for frame in reader:
+                yield frame[keep]
+
+    return Source(keep, blocks, replayable=True)
+
+
+def single_pass(data: Any) -> bool:
+    """whether data (as returned by wrap) can only be read once."""
+    return isinstance(data, Source) and not data.replayable
+
+
+def to_frame(source: Source, chunk_rows: int = 50_000) -> pd.DataFrame:
+    """every row of source in one DataFrame."""
+    blocks = list(source.frames(chunk_rows))
+    return pd.concat(blocks, ignore_index=True) if blocks else pd.DataFrame(columns=source.columns)
+
+
+def iter_csv(source: Source, chunk_rows: int = 50_000, *, workers: int = 0, executor: str = "process") -> Iterator[bytes]:
+    """the csv encoding of source: the header, then its rows in blocks of at most chunk_rows.
+    with workers > 1 the blocks of the whole source share one formatting pool (see
+    upload.format_blocks), so config.csv_workers applies here too."""
+    yield pd.DataFrame(columns=source.columns).to_csv(index=False).encode()
+    chunk_rows = max(1, chunk_rows)
+    blocks = (
+        frame.iloc[start:start + chunk_rows]
+        for frame in source.frames(chunk_rows)
+        for start in range(0, len(frame), chunk_rows)
+    )
+    yield from format_blocks(blocks, workers, executor)
+
+
+def _of_blocks(data: Iterable[Any]) -> Source:
+    """an iterable of DataFrames or record batches (e.g. pd.read_csv(chunksize=...)); the first
+    block gives the columns. a list of blocks can be read again, an iterator once."""
+    replayable = isinstance(data, (list, tuple))
+    blocks = iter(data)
+    first = next(blocks, None)
+    if first is None:
+        raise MantisError("data has no blocks of rows")
+    if isinstance(first, pd.DataFrame):
+        columns = list(first.columns)
+    elif type(first).__module__.startswith("pyarrow") and hasattr(first, "schema"):
+        columns = first.schema.names
+    else:
+        raise MantisError("an iterable of rows needs a schema: pass Rows(rows, columns)")
+    if replayable:
+        return Source(columns, lambda n: data, replayable=True)
+    return Source(columns, lambda n: itertools.chain([first], blocks), replayable=False)
@@ -1,15 +1,28 @@
 """http transport for the sdk: a persistent requests.Session with retry/backoff,
-per-call timeouts, typed-exception mapping, and cookie-redacted debug logging."""
+a sized + instrumented connection pool, per-call timeouts, typed-exception mapping,
+and cookie-redacted debug logging."""
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from urllib.parse import urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
+from ._stream import JsonArrayDecoder
+from .cache import ResponseCache
+from .circuit import CircuitBreaker, CircuitBreakers
+from .codec import JsonCodec, get_codec
+from .compression import TransferStats
 from .exceptions import (
     APIConnectionError,
     APIStatusError,
@@ -17,11 +30,18 @@ from .exceptions import (
     NotFoundError,
     RateLimitError,
 )
+from .instrumentation import Hooks, RequestEvent, ResponseEvent, endpoint_template
+from .ratelimit import RateLimiter
+from .upload import MultipartStream
 
 logger = logging.getLogger("mantis_sdk")
 
 # methods safe to retry automatically (no side effects).
 _IDEMPOTENT = frozenset({"GET", "HEAD", "OPTIONS"})
+# transient server/throttle statuses worth retrying (idempotent methods only).
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+# read size for streamed list responses.
+_STREAM_CHUNK = 64 * 1024
 
 
 def _redact(headers: dict[str, str]) -> dict[str, str]:
@@ -33,8 +53,126 @@ def _redact(headers: dict[str, str]) -> dict[str, str]:
     return redacted
 
 
+def _connect_failure(exc: requests.exceptions.RequestException) -> bool:
+    """whether exc happened while connecting, before any of the request was sent."""
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(exc, requests.exceptions.ConnectionError) and isinstance(reason, NewConnectionError)
+
+
+def _content_length(headers: Any) -> int | None:
+    """the Content-Length of a sent request, when it had one."""
+    value = headers.get("Content-Length") if headers is not None else None
+    return int(value) if isinstance(value, str) and value.isdigit() else None
+
+
+class PoolStats:
+    """live counters for the connection pools behind one Transport. thread-safe.
+
+    a checkout that finds an idle keep-alive connection is "reused"; one that has to build a
+    socket is "opened". with pool_block=False an exhausted pool opens a throwaway connection
+    that is "discarded" on return instead of being pooled — a steady discard count means
+    pool_maxsize is smaller than the number of threads sharing the client."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.checkouts = 0
+        self.in_use = 0
+        self.discarded = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _on_new(self) -> None:
+        with self._lock:
+            self.opened += 1
+
+    def _on_checkout(self, waited: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def _on_checkin(self, discarded: bool) -> None:
+        with self._lock:
+            self.in_use = max(self.in_use - 1, 0)
+            if discarded:
+                self.discarded += 1
+
+    def snapshot(self, idle: int = 0) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "connections_open": self.in_use + idle,
+                "connections_in_use": self.in_use,
+                "connections_idle": idle,
+                "connections_opened": self.opened,
+                "connections_reused": max(self.checkouts - self.opened, 0),
+                "connections_discarded": self.discarded,
+                "checkouts": self.checkouts,
+                "wait_seconds_total": self.wait_seconds,
+                "wait_seconds_max": self.max_wait_seconds,
+            }
+
+
+class _InstrumentedPool:
+    """mixin for urllib3 connection pools that reports into a PoolStats (bound per subclass)."""
+
+    stats: PoolStats
+
+    def _new_conn(self):
+        self.stats._on_new()
+        return super()._new_conn()  # type: ignore[misc]
+
+    def _get_conn(self, timeout: float | None = None):
+        started = time.perf_counter()
+        conn = super()._get_conn(timeout)  # type: ignore[misc]
+        self.stats._on_checkout(time.perf_counter() - started)
+        return conn
+
+    def _put_conn(self, conn) -> None:
+        pool = self.pool  # type: ignore[attr-defined]
+        # urllib3 closes the connection rather than pooling it when the queue is already full.
+        discarded = pool is None or pool.full()
+        self.stats._on_checkin(discarded)
+        super()._put_conn(conn)  # type: ignore[misc]
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools are instrumented. one PoolStats per adapter (i.e. per Transport)."""
+
+    def __init__(self, stats: PoolStats, **kwargs: Any):
+        # init_poolmanager runs inside HTTPAdapter.__init__, so bind the stats first.
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        bound = {"stats": self.stats}
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type("HTTPConnectionPool", (_InstrumentedPool, HTTPConnectionPool), bound),
+            "https": type("HTTPSConnectionPool", (_InstrumentedPool, HTTPSConnectionPool), bound),
+        }
+
+    def idle_connections(self) -> int:
+        """live keep-alive connections parked in the pools (the queues pad with None)."""
+        idle = 0
+        for key in list(self.poolmanager.pools.keys()):
+            pool = self.poolmanager.pools.get(key)
+            if pool is not None and pool.pool is not None:
+                idle += sum(1 for conn in list(pool.pool.queue) if conn is not None)
+        return idle
+
+
 class Transport:
-    """owns a requests.Session and turns raw responses into parsed json or typed errors."""
+    """owns a requests.Session and turns raw responses into parsed json or typed errors.
+
+    thread-safety: one Transport may be shared by any number of threads. it keeps no
+    per-request state; the session's cookie jar is lock-protected and the urllib3 pools hand
+    each thread its own connection. size the pool to the number of threads sharing it
+    (pool_maxsize) — with pool_block=True extra threads wait for a free connection (the wait
+    shows up in pool_stats()), with pool_block=False they open throwaway connections instead."""
 
     def __init__(
         self,
@@ -42,21 +180,102 @@ class Transport:
         default_timeout: float = 60.0,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        cache: ResponseCache | None = None,
+        codec: JsonCodec | None = None,
+        limiter: RateLimiter | None = None,
+        breakers: CircuitBreakers | None = None,
     ):
         self.default_timeout = default_timeout
+        # adaptive per-endpoint-group rate limiting, shared by every thread using this transport.
+        self.limiter = limiter
+        # json backend for response bodies (orjson when installed, see codec.get_codec).
+        self.codec = codec or get_codec()
+        # opt-in read cache with etag revalidation (None = every GET goes to the wire).
+        self.cache = cache
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
         self.session = requests.Session()
 
         # retry idempotent calls on transient server/throttle errors with exponential backoff.
         retry = Retry(
             total=max_retries,
             backoff_factor=backoff_factor,
-            status_forcelist=(429, 500, 502, 503, 504),
+            status_forcelist=_RETRY_STATUSES,
             allowed_methods=_IDEMPOTENT,
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self.adapter = _PooledAdapter(
+            PoolStats(),
+            max_retries=retry,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        # advertise every content-coding urllib3 can decode here (gzip/deflate, plus br/zstd
+        # when brotli/zstandard are installed); bodies are decompressed transparently.
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        self.transfer = TransferStats()
+        # instrumentation callbacks (see instrumentation.Hooks); empty = zero overhead.
+        self.hooks = Hooks()
+        # per-endpoint-group circuit breakers; state changes go to the on_circuit hooks.
+        self.breakers = breakers
+        if breakers is not None:
+            breakers.listener = self.hooks.circuit
+
+    def warm_up(self, url: str, connections: int = 1) -> int:
+        """pre-open up to `connections` keep-alive connections (tcp + tls) to url's origin.
+
+        the sockets are connected in parallel straight on the pool the session will use and
+        parked there idle, so no request reaches the backend. failures are logged, never
+        raised — warm-up is an optimization. returns the number of connections that came up."""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}/"
+        connections = max(1, min(connections, self.pool_maxsize))
+        try:
+            # resolve verify/cert/proxies the way session.request would (env ca bundles
+            # included) so we land on the same pool key as the real calls.
+            env = self.session.merge_environment_settings(origin, {}, None, None, None)
+            if hasattr(self.adapter, "get_connection_with_tls_context"):  # requests>=2.32.2
+                prepared = requests.Request("GET", origin).prepare()
+                pool = self.adapter.get_connection_with_tls_context(
+                    prepared, env["verify"], proxies=env["proxies"], cert=env["cert"]
+                )
+            else:
+                pool = self.adapter.get_connection(origin, env["proxies"])
+            # check out distinct connections first so each one gets its own socket.
+            conns = [pool._get_conn() for _ in range(connections)]
+        except Exception as exc:  # noqa: BLE001 — warm-up is best-effort
+            logger.debug("warm-up of %s skipped: %s", origin, exc)
+            return 0
+
+        def _connect(conn) -> bool:
+            try:
+                if getattr(conn, "sock", None) is None:
+                    conn.connect()
+                return True
+            except Exception as exc:  # noqa: BLE001 — urllib3 wraps socket errors
+                logger.debug("warm-up connection to %s failed: %s", origin, exc)
+                conn.close()
+                return False
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            warmed = sum(executor.map(_connect, conns))
+        for conn in conns:
+            pool._put_conn(conn)
+        logger.debug("warmed %d/%d connections to %s", warmed, connections, origin)
+        return warmed
+
+    def pool_stats(self) -> dict[str, Any]:
+        """snapshot of the connection pool: open/in-use/idle connections, opened vs reused
+        checkouts, discarded overflow connections, and time spent waiting for a connection."""
+        stats = self.adapter.stats.snapshot(idle=self.adapter.idle_connections())
+        stats.update(pool_maxsize=self.pool_maxsize, pool_block=self.pool_block)
+        return stats
 
     def request(
         self,
@@ -68,33 +287,246 @@ class Transport:
         **kwargs: Any,
     ) -> Any:
         """perform a request and return parsed json (or text/None when not json).
-        raises a typed MantisError subclass on failure."""
-        headers = headers or {}
+        a MultipartStream passed as data= is streamed. raises a typed MantisError subclass
+        on failure."""
+        headers = self._encode_json(self.codec, headers or {}, kwargs, "data")
+        upload = kwargs.get("data")
+        if isinstance(upload, MultipartStream):
+            headers = {**upload.headers, **headers}
+            kwargs["data"] = upload.body()
         timeout = timeout if timeout is not None else self.default_timeout
+        return self._instrumented(
+            method, url, lambda event: self._request(method, url, headers, timeout, event, kwargs)
+        )
+
+    def _instrumented(self, method: str, url: str, send: Callable[[ResponseEvent | None], Any]) -> Any:
+        """run send(event) between the on_request and on_response hooks. send fills in the
+        event as the response arrives; with no hooks registered it gets None and costs nothing."""
+        if not self.hooks:
+            return send(None)
+        event = ResponseEvent(RequestEvent(method.upper(), url, endpoint_template(url)))
+        self.hooks.before(event.request)
+        started = time.monotonic()
+        try:
+            return send(event)
+        except BaseException as exc:
+            event.error = exc
+            raise
+        finally:
+            event.elapsed = time.monotonic() - started
+            self.hooks.after(event)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        timeout: float,
+        event: ResponseEvent | None,
+        kwargs: dict[str, Any],
+    ) -> Any:
+        cache_key, entry = None, None
+        if self.cache is not None and method.upper() == "GET":
+            cache_key = self.cache.key(url, kwargs.get("params"))
+            if cache_key is not None:
+                entry, fresh = self.cache.get(cache_key)
+                if fresh:
+                    logger.debug("← %s %s (cached)", method, url)
+                    if event is not None:
+                        event.status, event.cached = 200, True
+                    return self._parse(self.cache.response(entry), codec=self.codec)
+                if entry is not None:
+                    headers = {**headers, **entry.conditional_headers()}
 
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("→ %s %s headers=%s", method, url, _redact(headers))
 
+        breaker = self._admit(url)
+        self._throttle(url)
         started = time.monotonic()
         try:
             response = self.session.request(method, url, headers=headers, timeout=timeout, **kwargs)
         except requests.exceptions.RequestException as exc:
-            raise APIConnectionError(f"request to {url} failed: {exc}") from exc
+            self._invalidate(method, url)
+            if breaker is not None:
+                breaker.observe(None)
+            raise APIConnectionError(
+                f"request to {url} failed: {exc}", request_sent=not _connect_failure(exc)
+            ) from exc
+        self._feed_limiter(url, response)
+        if breaker is not None:
+            breaker.observe(response.status_code)
 
         elapsed = (time.monotonic() - started) * 1000
         logger.debug("← %s %s %d (%.0fms)", method, url, response.status_code, elapsed)
+        if response.headers.get("Content-Encoding"):
+            self.transfer.record_download(self._wire_bytes(response), len(response.content))
+        if event is not None:
+            self._observe(event, response)
+
+        if cache_key is not None:
+            if response.status_code == 304 and entry is not None:
+                return self._parse(self.cache.response(self.cache.revalidated(entry, response)), codec=self.codec)
+            if 200 <= response.status_code < 300:
+                self.cache.store(cache_key, response)
+        self._invalidate(method, url)
+
+        return self._handle(response, url, self.codec)
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *keys: str,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        decoder: Any = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """perform a request and yield the items of its json list as they arrive (see
+        JsonArrayDecoder for `keys`), or whatever decoder (e.g. an EventStreamDecoder) makes
+        of the body. the status is checked before returning, so typed errors raise here
+        rather than on first iteration. never served from the cache. instrumentation hooks
+        fire once the headers are in (elapsed is time to first byte)."""
+        headers = self._encode_json(self.codec, headers or {}, kwargs, "data")
+        timeout = timeout if timeout is not None else self.default_timeout
+        return self._instrumented(
+            method, url, lambda event: self._stream(
+                method, url, decoder or JsonArrayDecoder(*keys), headers, timeout, event, kwargs
+            )
+        )
+
+    def _stream(
+        self,
+        method: str,
+        url: str,
+        decoder: Any,
+        headers: dict[str, str],
+        timeout: float,
+        event: ResponseEvent | None,
+        kwargs: dict[str, Any],
+    ) -> Iterator[Any]:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("→ %s %s headers=%s (stream)", method, url, _redact(headers))
+        breaker = self._admit(url)
+        self._throttle(url)
+        try:
+            response = self.session.request(method, url, headers=headers, timeout=timeout, stream=True, **kwargs)
+        except requests.exceptions.RequestException as exc:
+            if breaker is not None:
+                breaker.observe(None)
+            raise APIConnectionError(
+                f"request to {url} failed: {exc}", request_sent=not _connect_failure(exc)
+            ) from exc
+        self._feed_limiter(url, response)
+        if breaker is not None:
+            breaker.observe(response.status_code)
+        logger.debug("← %s %s %d (stream)", method, url, response.status_code)
+        if event is not None:
+            event.status = response.status_code
+            event.retries = self._retries(response)
+        if not 200 <= response.status_code < 300:
+            with response:
+                self._handle(response, url, self.codec)  # raises
+        return self._iter_items(response, url, decoder)
+
+    def _iter_items(self, response: requests.Response, url: str, decoder: Any) -> Iterator[Any]:
+        decoded = 0
+        with response:
+            try:
+                for chunk in response.iter_content(chunk_size=_STREAM_CHUNK):
+                    decoded += len(chunk)
+                    yield from decoder.feed(chunk)
+            except requests.exceptions.RequestException as exc:
+                raise APIConnectionError(
+                    f"reading {url} failed: {exc}", request_sent=not _connect_failure(exc)
+                ) from exc
+            yield from decoder.close()
+            if response.headers.get("Content-Encoding"):
+                self.transfer.record_download(self._wire_bytes(response), decoded)
+
+    def _admit(self, url: str) -> CircuitBreaker | None:
+        """url's circuit breaker once it has let the request through (None without breakers).
+        raises CircuitOpenError while the group's circuit is open."""
+        if self.breakers is None:
+            return None
+        breaker = self.breakers.breaker(url)
+        breaker.before(url)
+        return breaker
+
+    def _throttle(self, url: str) -> None:
+        """wait for url's endpoint group to have a token (no-op without a limiter)."""
+        if self.limiter is not None:
+            wait = self.limiter.reserve(url)
+            if wait:
+                logger.debug("rate limit: waiting %.2fs before %s", wait, url)
+                time.sleep(wait)
+
+    def _feed_limiter(self, url: str, response: requests.Response) -> None:
+        """report the final status — and any 429/503 urllib3 already retried — to the limiter."""
+        if self.limiter is None:
+            return
+        history = getattr(getattr(response.raw, "retries", None), "history", None)
+        for attempt in history if isinstance(history, tuple) else ():
+            if attempt.status is not None:
+                self.limiter.observe(url, attempt.status)
+        self.limiter.observe(url, response.status_code, response.headers.get("Retry-After"))
+
+    @classmethod
+    def _observe(cls, event: ResponseEvent, response: requests.Response) -> None:
+        """fill an instrumentation event from a fully read response."""
+        event.status = response.status_code
+        event.request_bytes = _content_length(getattr(response.request, "headers", None))
+        wire = cls._wire_bytes(response)
+        event.response_bytes = wire if isinstance(wire, int) else len(response.content)
+        event.retries = cls._retries(response)
+
+    @staticmethod
+    def _retries(response: requests.Response) -> int:
+        """how many times urllib3's Retry re-sent this request before the final response."""
+        history = getattr(getattr(response.raw, "retries", None), "history", None)
+        return len(history) if isinstance(history, tuple) else 0
+
+    @staticmethod
+    def _wire_bytes(response: requests.Response) -> int | None:
+        """compressed bytes read off the socket for a fully consumed response."""
+        tell = getattr(response.raw, "tell", None)
+        return tell() if tell is not None else None
+
+    def transfer_stats(self) -> dict[str, int]:
+        """bytes saved by compression: uploads the sdk compressed (config.upload_compression)
+        and responses the server sent with a Content-Encoding."""
+        return self.transfer.snapshot()
+
+    @staticmethod
+    def _encode_json(
+        codec: JsonCodec, headers: dict[str, str], kwargs: dict[str, Any], field: str
+    ) -> dict[str, str]:
+        """encode a json= body with the codec instead of the http library's stdlib json.
+        moves it to kwargs[field] (requests: data, httpx: content); returns the headers."""
+        body = kwargs.pop("json", None)
+        if body is None:
+            return headers
+        kwargs[field] = codec.dumps(body).encode()
+        return {"Content-Type": "application/json", **headers}
 
-        return self._handle(response, url)
+    def _invalidate(self, method: str, url: str) -> None:
+        """a write (even a failed or dropped one) may have changed server state, so drop the
+        cached reads it could have made stale."""
+        if self.cache is not None and method.upper() not in _IDEMPOTENT:
+            self.cache.invalidate(url)
 
-    def _handle(self, response: requests.Response, url: str) -> Any:
-        """raise typed errors for non-2xx; otherwise parse the body."""
+    @classmethod
+    def _handle(cls, response: requests.Response, url: str, codec: JsonCodec | None = None) -> Any:
+        """raise typed errors for non-2xx; otherwise parse the body.
+        duck-typed on the response so the async (httpx) transport shares the same mapping."""
         status = response.status_code
 
         if 200 <= status < 300:
-            return self._parse(response)
+            return cls._parse(response, codec=codec)
 
-        body = self._parse(response, swallow=True)
-        message = f"{status} from {url}: {self._summarize(body, response)}"
+        body = cls._parse(response, swallow=True, codec=codec)
+        message = f"{status} from {url}: {cls._summarize(body, response)}"
 
         if status in (401, 403):
             raise AuthenticationError(message, status_code=status, body=body, url=url)
@@ -105,17 +537,19 @@ class Transport:
         raise APIStatusError(message, status_code=status, body=body, url=url)
 
     @staticmethod
-    def _parse(response: requests.Response, *, swallow: bool = False) -> Any:
-        """parse json, falling back to text. when swallow, never raise."""
+    def _parse(response: requests.Response, *, swallow: bool = False, codec: JsonCodec | None = None) -> Any:
+        """parse json with `codec` (the response's own .json() when None), falling back to
+        text. when swallow, never raise."""
         content_type = response.headers.get("Content-Type", "")
+        decode = response.json if codec is None else (lambda: codec.loads(response.content))
         try:
             if "application/json" in content_type:
-                return response.json()
+                return decode()
             # some endpoints omit the header but still return json; try anyway.
             text = response.text
             if text and text[:1] in "{[":
                 try:
-                    return response.json()
+                    return decode()
                 except ValueError:
                     return text
             return text
@@ -131,7 +565,8 @@ class Transport:
             return str(body.get("error") or body.get("detail") or body)[:300]
         if isinstance(body, str) and body:
             return body[:300]
-        return response.reason or "<no body>"
+        # requests calls it reason, httpx reason_phrase.
+        return getattr(response, "reason", None) or getattr(response, "reason_phrase", None) or "<no body>"
 
     def close(self) -> None:
         self.session.close()
@@ -0,0 +1,224 @@
+"""streaming multipart uploads for the synthesis endpoints.
+
+the default create path serializes the whole DataFrame into one BytesIO and lets the http
+library build the multipart body on top of it — peak memory is 2-3x the csv. the streaming
+path (config.stream_uploads, or any create() given on_upload_progress) instead produces the
+csv in row blocks and feeds them through a MultipartStream:
+
+- by default the blocks are spooled to a temporary file (in memory up to _SPOOL_MAX, then on
+  disk) so the body is sent with an exact Content-Length, which every wsgi backend accepts;
+- with config.chunked_uploads the blocks go straight onto the socket with chunked transfer
+  encoding — nothing is buffered, but the backend (and any proxy) must accept chunked bodies.
+
+either way on_upload_progress(bytes_sent, total) is called as the body goes out; total is None
+for chunked bodies, whose size isn't known up front.
+
+with config.csv_workers > 1 the row blocks are formatted in a process (or thread) pool a few
+blocks ahead of the consumer, so on the streaming path formatting overlaps the upload."""
+from __future__ import annotations
+
+import asyncio
+import os
+import secrets
+import tempfile
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import IO, Any
+
+import pandas as pd
+
+from .exceptions import ConfigurationError
+
+# callback invoked as an upload body is sent: (bytes_sent, total bytes or None).
+UploadProgressCallback = Callable[[int, "int | None"], None]
+
+# read size when streaming a file or a spooled body.
+_READ_CHUNK = 1024 * 1024
+# spooled bodies stay in memory up to this size, then roll over to a temp file.
+_SPOOL_MAX = 8 * 1024 * 1024
+# csv_executor → pool class for parallel csv formatting.
+_EXECUTORS: dict[str, type[Executor]] = {"process": ProcessPoolExecutor, "thread": ThreadPoolExecutor}
+
+
+def iter_csv(
+    df: pd.DataFrame, chunk_rows: int = 50_000, *, workers: int = 0, executor: str = "process"
+) -> Iterator[bytes]:
+    """the csv encoding of df (header first, no index) in blocks of chunk_rows rows.
+    joined, the blocks are byte-identical to df.to_csv(index=False).
+
+    with workers > 1 the blocks are formatted in a pool ("process" for real parallelism —
+    to_csv holds the gil — or "thread"), at most 2 * workers blocks ahead of the consumer,
+    and yielded in order."""
+    _pool_class(executor)
+    chunk_rows = max(1, chunk_rows)
+    yield df.iloc[:0].to_csv(index=False).encode()
+    blocks = (df.iloc[start:start + chunk_rows] for start in range(0, len(df), chunk_rows))
+    yield from format_blocks(blocks, workers if len(df) > chunk_rows else 0, executor)
+
+
+def format_blocks(blocks: Iterable[pd.DataFrame], workers: int = 0, executor: str = "process") -> Iterator[bytes]:
+    """the csv rows (no header) of each DataFrame block, in order. with workers > 1 every
+    block goes through one pool, as in iter_csv — blocks may come from anywhere (see
+    mantis_sdk.sources), and are only drawn from `blocks` as the pool has room."""
+    pool_class = _pool_class(executor)
+    if workers <= 1:
+        yield from map(_format_block, blocks)
+        return
+    pool = pool_class(max_workers=workers)
+    try:
+        pending: deque = deque()
+        for block in blocks:
+            pending.append(pool.submit(_format_block, block))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # also runs when the consumer stops early (a failed upload): drop queued blocks.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _pool_class(executor: str) -> type[Executor]:
+    pool_class = _EXECUTORS.get(executor)
+    if pool_class is None:
+        raise ConfigurationError(f"unknown csv_executor {executor!r}; use process or thread")
+    return pool_class
+
+
+def _format_block(block: pd.DataFrame) -> bytes:
+    return block.to_csv(index=False, header=False).encode()
+
+
+def iter_file(source: IO[bytes], chunk_size: int = _READ_CHUNK) -> Iterator[bytes]:
+    """read a binary file object in chunks, closing it when done."""
+    with source:
+        while chunk := source.read(chunk_size):
+            yield chunk
+
+
+def spool(chunks: Iterable[bytes]) -> tuple[IO[bytes], int]:
+    """write chunks to a SpooledTemporaryFile; returns (file rewound to 0, size)."""
+    buffer = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX)
+    size = 0
+    for chunk in chunks:
+        buffer.write(chunk)
+        size += len(chunk)
+    buffer.seek(0)
+    return buffer, size
+
+
+def _quote(value: str) -> str:
+    # html5 form encoding of a header parameter, as browsers (and urllib3) do it.
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+@dataclass
+class FilePart:
+    """an extra file part of a MultipartStream; length is the content's size, if known."""
+
+    name: str
+    filename: str
+    mime: str
+    content: Iterable[bytes]
+    length: int | None = None
+
+
+class MultipartStream:
+    """a multipart/form-data body of text fields plus one file part whose content comes from
+    an iterable of byte chunks (and optionally more file parts after it). iterate it
+    (requests) or aiter() it (httpx); each is single-use.
+
+    pass length (the file content's size) when it is known: the body then has an exact
+    len() and Content-Length. without it (or any part's) the body is sent chunked."""
+
+    def __init__(
+        self,
+        fields: dict[str, Any],
+        name: str,
+        filename: str,
+        mime: str,
+        content: Iterable[bytes],
+        *,
+        length: int | None = None,
+        on_progress: UploadProgressCallback | None = None,
+        parts: Iterable[FilePart] = (),
+    ):
+        self.boundary = secrets.token_hex(16)
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.on_progress = on_progress
+        head = b"".join(
+            self._part_header(f'name="{_quote(key)}"') + str(value).encode() + b"\r\n"
+            for key, value in fields.items()
+        )
+        self._head = head + self._part_header(
+            f'name="{_quote(name)}"; filename="{_quote(filename)}"', f"Content-Type: {mime}\r\n"
+        )
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._content = content
+        self._parts = [
+            (b"\r\n" + self._part_header(
+                f'name="{_quote(part.name)}"; filename="{_quote(part.filename)}"', f"Content-Type: {part.mime}\r\n"
+            ), part)
+            for part in parts
+        ]
+        lengths = [length, *(part.length for _, part in self._parts)]
+        self.length = None
+        if None not in lengths:
+            framing = len(self._head) + len(self._tail) + sum(len(header) for header, _ in self._parts)
+            self.length = framing + sum(lengths)
+        self.sent = 0
+
+    def _part_header(self, disposition: str, extra: str = "") -> bytes:
+        return f"--{self.boundary}\r\nContent-Disposition: form-data; {disposition}\r\n{extra}\r\n".encode()
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"Content-Type": self.content_type}
+        if self.length is not None:
+            headers["Content-Length"] = str(self.length)
+        return headers
+
+    def body(self) -> Any:
+        """what to hand requests as data=: the stream itself when its length is known (sent
+        with Content-Length), else a bare generator (requests sends those chunked)."""
+        return self if self.length is not None else iter(self)
+
+    def __len__(self) -> int:
+        if self.length is None:
+            raise TypeError("chunked MultipartStream has no length")
+        return self.length
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._report(self._head)
+        for chunk in self._content:
+            if chunk:
+                yield self._report(chunk)
+        for header, part in self._parts:
+            yield self._report(header)
+            for chunk in part.content:
+                if chunk:
+                    yield self._report(chunk)
+        yield self._report(self._tail)
+
+    async def aiter(self) -> AsyncIterator[bytes]:
+        """the body as an async iterator for httpx. producing each chunk (csv formatting,
+        compression, disk reads) runs in a worker thread, off the event loop."""
+        chunks = iter(self)
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            yield chunk
+
+    def _report(self, chunk: bytes) -> bytes:
+        self.sent += len(chunk)
+        if self.on_progress is not None:
+            self.on_progress(self.sent, self.length)
+        return chunk
+
+
+def file_length(source: IO[bytes]) -> int | None:
+    """bytes left to read in a real file, or None."""
+    try:
+        return os.fstat(source.fileno()).st_size - source.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
@@ -0,0 +1,136 @@
+"""compact binary side-cars for DataType.Vector columns.
+
+to_csv writes a vector as a text list of floats (~10 bytes per dimension), which the backend
+then parses back. with config.vector_encoding = "float32" | "float16" | "int8" a csv upload
+instead sends each vector column as packed little-endian values in its own multipart part
+(vectors_0, vectors_1, ...); the csv keeps the column, empty, so data_types still line up. a
+vector_parts form field describes the parts:
+
+    [{"column": "embedding", "part": "vectors_0", "encoding": "float32", "rows": n, "dim": d}]
+
+rows are in csv row order. int8 values are quantized per row, symmetric: the part holds the
+n * d int8 values followed by n float32 scales, and value = int8 * scale.
+
+vectors can come from DataFrame cells (arrays or lists) or, without building per-row objects,
+as 2-d NumPy arrays via create(vectors={"embedding": matrix}). the side-car is only sent when
+the backend lists "vectors" at synthesis/upload-formats/; otherwise vectors go as csv text."""
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .enums import DataType
+from .exceptions import ConfigurationError, MantisError
+
+# encoding → little-endian numpy dtype of the packed values.
+ENCODINGS: dict[str, str] = {"float32": "<f4", "float16": "<f2", "int8": "i1"}
+# mime type of a side-car part.
+MIME = "application/octet-stream"
+# iter_encoded reads fewer than chunk_rows rows at a time when a block would exceed this, e.g.
+# for a wide expression matrix.
+_MAX_BLOCK_BYTES = 64 * 1024 * 1024
+
+
+def normalize_encoding(spec: str | None) -> str | None:
+    """validate a config.vector_encoding value; None (or "text") keeps vectors in the csv."""
+    name = str(spec or "text").strip().lower()
+    if name in {"text", "csv", "none"}:
+        return None
+    if name not in ENCODINGS:
+        raise ConfigurationError(f"unknown vector_encoding {spec!r}; use float32, float16, int8 or text")
+    return name
+
+
+def as_matrix(values: Any, column: str) -> np.ndarray:
+    """a 2-d matrix from a 2-d numeric array (returned as is, so a memory-mapped one stays on
+    disk) or a float32 one from a sequence of equal-length vectors."""
+    if isinstance(values, np.ndarray) and values.ndim == 2:
+        if not np.issubdtype(values.dtype, np.number):
+            raise MantisError(f"vector column {column!r} must be numeric, not {values.dtype}")
+        return values
+    try:
+        matrix = np.stack([np.asarray(value, dtype=np.float32) for value in values])
+    except ValueError as exc:  # ragged rows or non-numeric cells
+        raise MantisError(f"vector column {column!r} must hold equal-length numeric vectors") from exc
+    if matrix.ndim != 2:
+        raise MantisError(f"vector column {column!r} must hold 1-d vectors")
+    return matrix
+
+
+def load_matrix(source: Any, column: str = "embedding") -> np.ndarray:
+    """as_matrix, also accepting a path to a .npy file, which is memory-mapped, not read."""
+    if isinstance(source, (str, os.PathLike)):
+        source = np.load(source, mmap_mode="r")
+    return as_matrix(source, column)
+
+
+def vector_columns(df: pd.DataFrame, data_types: dict[str, Any]) -> list[str]:
+    """the Vector-typed columns of df whose cells are arrays or lists (not csv text)."""
+    vector = str(DataType.Vector)
+    return [
+        column for column in df.columns
+        if str(data_types.get(column)) == vector and df[column].dtype == object and len(df)
+        and isinstance(df[column].iloc[0], (np.ndarray, list, tuple))
+    ]
+
+
+def split(
+    df: pd.DataFrame, data_types: dict[str, Any], vectors: dict[str, Any] | None
+) -> tuple[pd.DataFrame, dict[str, np.ndarray]]:
+    """(df with every vector column emptied, {column: matrix}). vectors= arrays not already
+    in df become new (empty) columns."""
+    matrices = {column: as_matrix(df[column], column) for column in vector_columns(df, data_types)}
+    for column, values in (vectors or {}).items():
+        matrices[column] = as_matrix(values, column)
+    if not matrices:
+        return df, matrices
+    for column, matrix in matrices.items():
+        if len(matrix) != len(df):
+            raise MantisError(f"vector column {column!r} has {len(matrix)} rows; the data has {len(df)}")
+    return df.assign(**{column: "" for column in matrices}), matrices
+
+
+def as_text(df: pd.DataFrame, vectors: dict[str, Any] | None) -> pd.DataFrame:
+    """df with vectors= arrays added as list columns, for a backend without side-cars."""
+    if not vectors:
+        return df
+    return df.assign(**{column: as_matrix(values, column).tolist() for column, values in vectors.items()})
+
+
+def encoded_length(matrix: np.ndarray, encoding: str) -> int:
+    rows, dim = matrix.shape
+    length = rows * dim * np.dtype(ENCODINGS[encoding]).itemsize
+    return length + rows * 4 if encoding == "int8" else length
+
+
+def iter_encoded(matrix: Any, encoding: str, chunk_rows: int = 50_000) -> Iterator[bytes | memoryview]:
+    """the packed side-car bytes of matrix (an ndarray or anything row-sliceable with a shape
+    and dtype, like an h5py dataset), chunk_rows rows at a time. only one block is read and
+    converted at a time; a C-contiguous matrix already in the target dtype (e.g. a memory-mapped
+    float32 .npy) is sent as views of its own buffer, without copies."""
+    row_bytes = matrix.shape[1] * max(np.dtype(matrix.dtype).itemsize, 4)
+    chunk_rows = max(1, min(chunk_rows, _MAX_BLOCK_BYTES // max(row_bytes, 1)))
+    dtype = np.dtype(ENCODINGS[encoding])
+    scales = []
+    for start in range(0, len(matrix), chunk_rows):
+        block = matrix[start:start + chunk_rows]
+        if encoding != "int8" and block.dtype == dtype and block.flags.c_contiguous:
+            yield memoryview(block).cast("B")
+            continue
+        if encoding == "int8":
+            scale = np.abs(block).max(axis=1) / 127
+            scale[scale == 0] = 1
+            scales.append(scale.astype("<f4"))
+            block = np.rint(block / scale[:, None])
+        yield np.ascontiguousarray(block, dtype=dtype).tobytes()
+    if encoding == "int8" and scales:
+        yield np.concatenate(scales).tobytes()
+
+
+def describe(column: str, part: str, matrix: np.ndarray, encoding: str) -> dict[str, Any]:
+    rows, dim = matrix.shape
+    return {"column": str(column), "part": part, "encoding": encoding, "rows": rows, "dim": dim}
@@ -1,7 +1,9 @@
 """shared test fixtures. all tests are fully mocked — no live server, no browser."""
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 
 import pytest
@@ -28,6 +30,13 @@ class RecordingTransport:
             return self.queue.pop(0)
         return {}
 
+    def stream(self, method: str, url: str, *keys: str, headers=None, timeout=None, **kwargs) -> Any:
+        """scripted responses stream as their unwrapped list (bare list or first key present)."""
+        resp = RecordingTransport.request(self, method, url, headers=headers, timeout=timeout, **kwargs)
+        if isinstance(resp, dict):
+            resp = next((resp[k] for k in keys if k in resp), [])
+        return iter(resp or [])
+
     def close(self) -> None:
         pass
 
@@ -45,3 +54,101 @@ def client(transport: RecordingTransport) -> MantisClient:
     # swap in the recording transport so nothing touches the network.
     c.http.transport = transport
     return c
+
+
+class AsyncRecordingTransport(RecordingTransport):
+    """awaitable RecordingTransport for the AsyncMantisClient."""
+
+    async def request(self, method: str, url: str, *, headers=None, timeout=None, **kwargs) -> Any:  # type: ignore[override]
+        return super().request(method, url, headers=headers, timeout=timeout, **kwargs)
+
+    async def stream(self, method: str, url: str, *keys: str, headers=None, timeout=None, **kwargs) -> Any:  # type: ignore[override]
+        items = RecordingTransport.stream(self, method, url, *keys, headers=headers, timeout=timeout, **kwargs)
+
+        async def _aiter():
+            for item in items:
+                yield item
+
+        return _aiter()
+
+    async def close(self) -> None:  # type: ignore[override]
+        pass
+
+
+@pytest.fixture
+def atransport() -> AsyncRecordingTransport:
+    return AsyncRecordingTransport()
+
+
+@pytest.fixture
+def aclient(atransport: AsyncRecordingTransport):
+    pytest.importorskip("httpx")
+    from mantis_sdk.aio import AsyncMantisClient
+
+    config = ConfigurationManager()
+    config.internal_user_id = "11111111-1111-1111-1111-111111111111"
+    return AsyncMantisClient("/api/proxy/", cookie=None, config=config, transport=atransport)
+
+
+class LoopbackServer:
+    """a real keep-alive http server on 127.0.0.1 for transport-level tests.
+
+    records every request in .requests as (method, path, headers) and its body (content-length
+    or chunked) in .bodies. set .respond to a callable(method, path, headers) ->
+    (status, headers, body bytes) to script replies."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str, dict]] = []
+        self.bodies: list[bytes] = []
+        self.respond: Callable[[str, str, dict], tuple[int, dict, bytes]] = (
+            lambda method, path, headers: (200, {"Content-Type": "application/json"}, b'{"ok": true}')
+        )
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, so connections can be reused
+
+            def _body(self) -> bytes:
+                if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                    body = b""
+                    while size := int(self.rfile.readline().split(b";")[0], 16):
+                        body += self.rfile.read(size)
+                        self.rfile.readline()
+                    self.rfile.readline()
+                    return body
+                length = int(self.headers.get("Content-Length") or 0)
+                return self.rfile.read(length) if length else b""
+
+            def _reply(self) -> None:
+                server.bodies.append(self._body())
+                headers = dict(self.headers.items())
+                server.requests.append((self.command, self.path, headers))
+                status, reply_headers, body = server.respond(self.command, self.path, headers)
+                self.send_response(status)
+                for key, value in reply_headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD" and status not in (204, 304):
+                    self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _reply
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def loopback():
+    server = LoopbackServer()
+    yield server
+    server.close()
@@ -0,0 +1,231 @@
+"""AsyncMantisClient: the async transport's status mapping/retries and the awaitable resources."""
+import asyncio
+
+import pandas as pd
+import pytest
+
+from mantis_sdk import DataType, ExecutionError, SpaceCreationError
+from mantis_sdk.exceptions import (
+    APIConnectionError,
+    APIStatusError,
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+)
+
+httpx = pytest.importorskip("httpx")
+
+from mantis_sdk.aio import AsyncMantisClient, AsyncSpaceHandle, AsyncTransport  # noqa: E402
+
+
+def _transport(handler, **kwargs) -> AsyncTransport:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncTransport(client=client, backoff_factor=0, **kwargs)
+
+
+# --- transport ---
+
+@pytest.mark.parametrize(
+    "status,exc",
+    [(401, AuthenticationError), (403, AuthenticationError),
+     (404, NotFoundError), (429, RateLimitError), (500, APIStatusError)],
+)
+async def test_status_maps_to_typed_exception(status, exc):
+    t = _transport(lambda req: httpx.Response(status, json={"error": "boom"}), max_retries=0)
+    with pytest.raises(exc) as ei:
+        await t.request("GET", "http://x/y")
+    assert ei.value.status_code == status
+    assert ei.value.body == {"error": "boom"}
+
+
+async def test_2xx_parses_json():
+    t = _transport(lambda req: httpx.Response(200, json={"ok": True}))
+    assert await t.request("GET", "http://x/y") == {"ok": True}
+
+
+async def test_idempotent_get_retries_transient_status():
+    seen = []
+
+    def handler(req):
+        seen.append(req.method)
+        return httpx.Response(503 if len(seen) < 3 else 200, json={"n": len(seen)})
+
+    t = _transport(handler)
+    assert await t.request("GET", "http://x/y") == {"n": 3}
+
+
+async def test_post_is_not_retried():
+    seen = []
+
+    def handler(req):
+        seen.append(req.method)
+        return httpx.Response(503, json={"error": "busy"})
+
+    t = _transport(handler)
+    with pytest.raises(APIStatusError):
+        await t.request("POST", "http://x/y", json={})
+    assert seen == ["POST"]
+
+
+async def test_connection_error_wrapped():
+    def handler(req):
+        raise httpx.ConnectError("refused")
+
+    t = _transport(handler, max_retries=0)
+    with pytest.raises(APIConnectionError):
+        await t.request("GET", "http://x/y")
+
+
+# --- client + resources ---
+
+def test_top_level_lazy_export():
+    import mantis_sdk
+
+    assert mantis_sdk.AsyncMantisClient is AsyncMantisClient
+
+
+async def test_get_spaces_sends_auth_and_cache_buster(aclient, atransport):
+    atransport.queue = [{"public": [], "private": [], "shared": []}]
+    spaces = await aclient.spaces.get_all()
+    assert set(spaces) >= {"public", "private", "shared"}
+    call = atransport.calls[0]
+    assert call["url"].endswith("/api/getSpaces/")
+    assert call["headers"]["X-Internal-Service"] == "true"
+    assert "_ts" in call["kwargs"]["params"]
+
+
+async def test_create_polls_to_completion(aclient, atransport):
+    atransport.queue = [
+        {"map_id": "m1", "space_id": "s1"},
+        {"progress": 50, "completed": False, "error": None},
+        {"progress": 100, "completed": True, "error": None},
+    ]
+    aclient.spaces.POLL_INTERVAL = 0
+    df = pd.DataFrame({"A": ["x", "y"], "B": ["p", "q"]})
+    handle = await aclient.spaces.create("t", df, {"A": DataType.Title, "B": DataType.Semantic})
+    assert isinstance(handle, AsyncSpaceHandle)
+    assert (handle.space_id, handle.map_id) == ("s1", "m1")
+    assert atransport.calls[0]["url"].endswith("/synthesis/landscape/")
+    assert atransport.calls[0]["kwargs"]["data"]["map_name"] == "t"
+
+
+async def test_create_raises_on_pipeline_error(aclient, atransport):
+    atransport.queue = [{"map_id": "m1", "space_id": "s1"}, {"progress": 10, "error": "embedding failed"}]
+    df = pd.DataFrame({"A": ["x"]})
+    with pytest.raises(SpaceCreationError, match="embedding failed"):
+        await aclient.spaces.create("t", df, {"A": DataType.Title})
+
+
+async def test_handle_methods_are_awaitable(aclient, atransport):
+    atransport.queue = [{"maps": [{"id": "m1"}]}, {"annotations": [{"id": "a1"}]}]
+    handle = AsyncSpaceHandle("s1", "m1", aclient)
+    assert await handle.list_maps() == [{"id": "m1"}]
+    assert await handle.get_annotations() == [{"id": "a1"}]
+
+
+async def test_alias_resolve_missing_returns_none(aclient, atransport):
+    def notfound(method, url, kwargs):
+        raise APIStatusError("nf", status_code=400, body={})
+
+    atransport.responder = notfound
+    space_id, created = await aclient.aliases.resolve_or_create_space("m4m")
+    assert created is True
+    assert space_id == aclient.aliases._alias_space_id("m4m")
+
+
+async def test_concurrent_calls_share_one_client(aclient, atransport):
+    atransport.responder = lambda method, url, kwargs: {"maps": [kwargs["params"]["space_id"]]}
+    results = await asyncio.gather(*(aclient.maps.list(f"s{i}") for i in range(50)))
+    assert results == [[f"s{i}"] for i in range(50)]
+
+
+async def test_notebook_cell_execute(aclient, atransport):
+    atransport.queue = [
+        {"success": True, "nid": "nb1"},
+        {"success": True, "session_id": "ses1"},
+        {"success": True},
+        {"success": True, "task_id": "t1"},
+        {"status": "completed", "result": {"outputs": [
+            {"output_type": "error", "ename": "ValueError", "evalue": "bad", "traceback": []},
+        ]}},
+    ]
+    nb = await aclient.notebooks.create("proj1", user_id="u1")
+    cell = await nb.add_cell("raise ValueError('bad')")
+    with pytest.raises(ExecutionError, match="ValueError"):
+        await cell.execute(poll_interval=0)
+
+
+async def test_agent_capability_check_is_async(aclient, atransport):
+    from mantis_sdk import Provider, ProviderUnavailableError
+
+    atransport.queue = [{"providers": ["opencode"]}]
+    with pytest.raises(ProviderUnavailableError, match="claude_code"):
+        await aclient.agents._assert_available("u@e.com", Provider.ClaudeCode)
+
+
+async def test_async_single_flight_coalesces_identical_gets(atransport):
+    from mantis_sdk import ConfigurationManager
+
+    calls = []
+
+    class Slow(type(atransport)):
+        async def request(self, method, url, **kwargs):
+            calls.append(url)
+            await asyncio.sleep(0.05)
+            return {"project_id": "sp-1"}
+
+    cfg = ConfigurationManager()
+    cfg.internal_user_id = "u"
+    cfg.coalesce_gets = True
+    client = AsyncMantisClient("/api/proxy/", config=cfg, transport=Slow())
+    results = await asyncio.gather(*(client.aliases.resolve("m4m") for _ in range(20)))
+    assert results == ["sp-1"] * 20
+    assert len(calls) == 1
+
+
+async def test_cancelled_single_flight_leader_leaves_followers_running():
+    from mantis_sdk.aio._http import _AsyncSingleFlight
+
+    flights, calls = _AsyncSingleFlight(), []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    leader = asyncio.ensure_future(flights.do("k", fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flights.do("k", fetch))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    assert await follower == 2  # the follower made the call itself instead of being cancelled
+    assert leader.cancelled() and flights.shared == 0
+
+
+async def test_async_warm_up_opens_connections_with_head_requests(loopback):
+    t = AsyncTransport(max_connections=4)
+    try:
+        assert await t.warm_up(f"{loopback.url}/api/proxy/", connections=3) == 3
+        stats = t.pool_stats()
+        assert (stats["connections_opened"], stats["connections_idle"]) == (3, 3)
+        assert [(method, path) for method, path, _ in loopback.requests] == [("HEAD", "/")] * 3
+        # the next requests ride warm connections instead of opening new ones.
+        for _ in range(2):
+            assert await t.request("GET", f"{loopback.url}/x") == {"ok": True}
+        stats = t.pool_stats()
+        assert (stats["connections_opened"], stats["connections_reused"], stats["checkouts"]) == (3, 2, 2)
+        assert await t.warm_up("http://127.0.0.1:9/", connections=2) == 0
+    finally:
+        await t.close()
+
+
+async def test_async_pool_stats_without_an_httpx_pool():
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})))
+    t = AsyncTransport(client=client)
+    try:
+        await t.request("GET", "http://api.test/x")
+        stats = t.pool_stats()
+        assert stats["connections_open"] is None and stats["max_connections"] is None
+        assert stats["checkouts"] == 1
+    finally:
+        await t.close()
@@ -0,0 +1,116 @@
+"""opt-in read cache: ttl hits, etag revalidation, write invalidation, and lru/byte eviction."""
+import json
+
+from mantis_sdk import ConfigurationManager, MantisClient
+from mantis_sdk.cache import ResponseCache
+
+
+def _client(loopback, ttl):
+    cfg = ConfigurationManager()
+    cfg.host = loopback.url
+    cfg.internal_user_id = "u"
+    cfg.cache_ttl = ttl
+    return MantisClient("", config=cfg)
+
+
+def _etag_server(loopback, payload):
+    """serve `payload` with a stable etag and answer matching If-None-Match with a 304."""
+    body = json.dumps(payload).encode()
+
+    def respond(method, path, headers):
+        if method != "GET":
+            return 200, {"Content-Type": "application/json"}, b"{}"
+        if headers.get("If-None-Match") == '"v1"':
+            return 304, {"ETag": '"v1"'}, b""
+        return 200, {"Content-Type": "application/json", "ETag": '"v1"'}, body
+
+    loopback.respond = respond
+
+
+def test_fresh_entry_served_without_network(loopback):
+    _etag_server(loopback, {"public": [], "private": [{"id": "s1"}], "shared": []})
+    client = _client(loopback, ttl=60)
+    first = client.spaces.get_all()
+    second = client.spaces.get_all()
+    assert first == second
+    assert len(loopback.requests) == 1
+    assert client.cache.stats()["hits"] == 1
+
+
+def test_cached_reads_skip_the_cache_buster(loopback):
+    _etag_server(loopback, {"maps": []})
+    client = _client(loopback, ttl=60)
+    client.maps.list("s1")
+    method, path, headers = loopback.requests[0]
+    assert "_ts=" not in path
+    assert "Cache-Control" not in headers
+
+
+def test_stale_entry_revalidates_with_etag(loopback):
+    _etag_server(loopback, {"maps": [{"id": "m1"}]})
+    client = _client(loopback, ttl=0)  # always revalidate
+    assert client.maps.list("s1") == [{"id": "m1"}]
+    assert client.maps.list("s1") == [{"id": "m1"}]
+    assert len(loopback.requests) == 2
+    assert loopback.requests[1][2]["If-None-Match"] == '"v1"'
+    assert client.cache.stats()["revalidations"] == 1
+
+
+def test_write_invalidates_related_reads(loopback):
+    _etag_server(loopback, {"annotations": [{"id": "a1"}]})
+    client = _client(loopback, ttl=60)
+    client.annotations.list("m1")
+    client.annotations.create("m1", {"text": "hi"})
+    client.annotations.list("m1")
+    gets = [r for r in loopback.requests if r[0] == "GET"]
+    assert len(gets) == 2
+    assert "If-None-Match" not in gets[1][2]  # the entry was dropped, not revalidated
+
+
+def test_uncacheable_reads_always_hit_the_wire(loopback):
+    loopback.respond = lambda m, p, h: (200, {"Content-Type": "application/json"}, b'{"progress": 5}')
+    client = _client(loopback, ttl=60)
+    client.http.request("GET", "synthesis/progress/m1")
+    client.http.request("GET", "synthesis/progress/m1")
+    assert len(loopback.requests) == 2
+    assert "_ts=" in loopback.requests[0][1]
+
+
+class _Resp:
+    def __init__(self, body: bytes, etag=None):
+        self.content = body
+        self.encoding = "utf-8"
+        self.headers = {"Content-Type": "application/json", **({"ETag": etag} if etag else {})}
+
+
+def test_key_ignores_cache_buster_and_param_order():
+    cache = ResponseCache()
+    a = cache.key("http://h/api/listMaps/", {"space_id": "s", "x": 1, "_ts": "1"})
+    b = cache.key("http://h/api/listMaps/", {"x": 1, "space_id": "s", "_ts": "2"})
+    assert a == b
+    assert cache.key("http://h/synthesis/progress/m/", {}) is None
+
+
+def test_cached_bodies_are_decoded_with_the_cache_codec():
+    class Tagging:
+        name = "tagging"
+
+        def loads(self, data):
+            return {"decoded": data}
+
+    cache = ResponseCache(codec=Tagging())
+    cache.store("http://h/api/listMaps/?a", _Resp(b"[1]"))
+    entry, _ = cache.get("http://h/api/listMaps/?a")
+    assert cache.response(entry).json() == {"decoded": b"[1]"}
+
+
+def test_lru_and_byte_eviction():
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+    cache.store("http://h/api/listMaps/?a", _Resp(b"1234"))
+    cache.store("http://h/api/listMaps/?b", _Resp(b"1234"))
+    cache.get("http://h/api/listMaps/?a")  # touch a → b is now least recent
+    cache.store("http://h/api/listMaps/?c", _Resp(b"1234"))
+    assert cache.get("http://h/api/listMaps/?b")[0] is None
+    assert cache.get("http://h/api/listMaps/?a")[0] is not None
+    cache.store("http://h/api/listMaps/?d", _Resp(b"123456789"))  # pushes total over 10 bytes
+    assert cache.stats()["bytes"] <= 10
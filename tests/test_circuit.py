@@ -0,0 +1,135 @@
+"""per-group circuit breaking: opening, fast failure, half-open probes, and reporting."""
+import time
+
+import pytest
+
+from mantis_sdk import (
+    APIConnectionError,
+    APIStatusError,
+    CircuitOpenError,
+    ConfigurationManager,
+    MantisClient,
+    NotFoundError,
+)
+from mantis_sdk.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakers
+from mantis_sdk.transport import Transport
+
+_JSON = {"Content-Type": "application/json"}
+
+
+def test_opens_after_consecutive_failures_only():
+    breaker = CircuitBreaker("synthesis", failure_threshold=3)
+    for status in (500, 502, 404, 503, 504):  # the 404 proves the backend is up: counter resets
+        breaker.before("u")
+        breaker.observe(status)
+    assert breaker.state == CLOSED
+    breaker.observe(None)
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError) as info:
+        breaker.before("http://h/synthesis/progress/m1/")
+    assert info.value.group == "synthesis" and 0 < info.value.retry_in <= 30
+    assert isinstance(info.value, APIConnectionError)
+    assert breaker.snapshot() == {"state": OPEN, "consecutive_failures": 3, "opened": 1, "rejected": 1}
+
+
+def test_half_open_admits_one_probe_then_closes_or_reopens():
+    changes = []
+    breaker = CircuitBreaker(
+        "ideas", failure_threshold=1, reset_timeout=0.05, listener=lambda *c: changes.append(c)
+    )
+    breaker.observe(None)
+    time.sleep(0.06)
+    breaker.before("u")  # the probe
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before("u")  # everyone else still fails fast while the probe is out
+    breaker.observe(503)
+    assert breaker.state == OPEN
+    time.sleep(0.06)
+    breaker.before("u")
+    breaker.observe(200)
+    assert breaker.state == CLOSED
+    assert changes == [
+        ("ideas", CLOSED, OPEN), ("ideas", OPEN, HALF_OPEN), ("ideas", HALF_OPEN, OPEN),
+        ("ideas", OPEN, HALF_OPEN), ("ideas", HALF_OPEN, CLOSED),
+    ]
+
+
+def test_lost_probe_does_not_wedge_the_circuit():
+    breaker = CircuitBreaker("default", failure_threshold=1, reset_timeout=0.05)
+    breaker.observe(None)
+    time.sleep(0.06)
+    breaker.before("u")  # a probe that never reports back
+    time.sleep(0.06)
+    breaker.before("u")  # a fresh probe is admitted
+    assert breaker.state == HALF_OPEN
+
+
+def test_dead_group_fails_fast_while_others_keep_working(loopback):
+    def respond(method, path, headers):
+        return (503, _JSON, b"{}") if "/synthesis/" in path else (404, _JSON, b'{"error": "nope"}')
+
+    loopback.respond = respond
+    t = Transport(max_retries=0, breakers=CircuitBreakers(failure_threshold=2))
+    changes = []
+    t.hooks.add(on_circuit=lambda *c: changes.append(c))
+    progress = f"{loopback.url}/api/proxy/synthesis/progress/m1/"
+    for _ in range(2):
+        with pytest.raises(APIStatusError):
+            t.request("GET", progress)
+    sent = len(loopback.requests)
+    with pytest.raises(CircuitOpenError):
+        t.request("GET", progress)
+    assert len(loopback.requests) == sent  # never hit the wire
+    with pytest.raises(NotFoundError):
+        t.request("GET", f"{loopback.url}/api/proxy/api/getSpaces/")
+    assert changes == [("synthesis", CLOSED, OPEN)]
+    assert t.breakers.stats()["synthesis"]["rejected"] == 1
+    assert t.breakers.stats()["default"]["state"] == CLOSED
+
+
+def test_connection_errors_open_the_circuit():
+    t = Transport(max_retries=0, breakers=CircuitBreakers(failure_threshold=1, reset_timeout=60))
+    with pytest.raises(APIConnectionError):
+        t.request("GET", "http://127.0.0.1:9/api/listMaps/")
+    with pytest.raises(CircuitOpenError, match="next probe in"):
+        t.request("GET", "http://127.0.0.1:9/api/listMaps/")
+
+
+def test_client_reports_circuits(loopback, monkeypatch):
+    loopback.respond = lambda m, p, h: (500, _JSON, b"{}")
+    monkeypatch.setenv("MANTIS_CIRCUIT_FAILURES", "1")
+    cfg = ConfigurationManager()
+    cfg.host, cfg.internal_user_id, cfg.record_metrics = loopback.url, "u", True
+    client = MantisClient("/api/proxy/", config=cfg)
+    client.http.transport.adapter.max_retries.total = 0  # fail on the first 500
+    with pytest.raises(APIStatusError):
+        client.http.request("GET", "api/getSpaces")
+    with pytest.raises(CircuitOpenError):
+        client.http.request("GET", "api/getSpaces")
+    assert client.stats()["circuits"]["default"]["state"] == OPEN
+    text = client.export_metrics()
+    assert 'mantis_sdk_circuit_state{group="default"} 2' in text
+    assert 'mantis_sdk_errors_total{method="GET",endpoint="/api/proxy/api/getSpaces/",error="CircuitOpenError"} 1' in text
+
+
+async def test_async_transport_fails_fast():
+    httpx = pytest.importorskip("httpx")
+    from mantis_sdk.aio import AsyncTransport
+
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(502, json={})
+
+    t = AsyncTransport(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        backoff_factor=0,
+        breakers=CircuitBreakers(failure_threshold=1),
+    )
+    with pytest.raises(APIStatusError):
+        await t.request("GET", "http://x/api/sessions/execute/status/")
+    with pytest.raises(CircuitOpenError):
+        await t.request("GET", "http://x/api/sessions/execute/status/")
+    assert len(calls) == 4  # the first call's own retries, then nothing
@@ -0,0 +1,84 @@
+"""json codec selection and use across rest bodies, form fields and agent frames."""
+import json
+import math
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from mantis_sdk import ConfigurationError, ConfigurationManager, DataType, MantisClient, Provider
+from mantis_sdk.codec import OrjsonCodec, StdlibCodec, get_codec
+from mantis_sdk.transport import Transport
+
+
+class _CountingCodec(StdlibCodec):
+    name = "counting"
+
+    def __init__(self):
+        self.loads_calls = 0
+        self.dumps_calls = 0
+
+    def loads(self, data):
+        self.loads_calls += 1
+        return super().loads(data)
+
+    def dumps(self, obj):
+        self.dumps_calls += 1
+        return super().dumps(obj)
+
+
+def test_get_codec_resolution():
+    assert get_codec("stdlib").name == "stdlib"
+    custom = _CountingCodec()
+    assert get_codec(custom) is custom
+    with pytest.raises(ConfigurationError, match="unknown json_codec"):
+        get_codec("simdjson")
+
+
+def test_auto_prefers_orjson_when_installed():
+    pytest.importorskip("orjson")
+    assert get_codec("auto").name == "orjson"
+
+
+def test_orjson_falls_back_for_what_it_rejects():
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("orjson")
+    codec = OrjsonCodec()
+    assert math.isnan(codec.loads(b'{"x": NaN}')["x"])  # orjson rejects NaN; stdlib takes over
+    assert json.loads(codec.dumps({"big": 2**70})) == {"big": 2**70}
+    assert json.loads(codec.dumps({"v": np.array([1.5, 2.5], dtype=np.float32)})) == {"v": [1.5, 2.5]}
+
+
+def test_env_selects_codec(monkeypatch):
+    monkeypatch.setenv("MANTIS_JSON_CODEC", "stdlib")
+    monkeypatch.setenv("MANTIS_INTERNAL_USER_ID", "u")
+    client = MantisClient("/api/proxy/", config=ConfigurationManager())
+    assert client.http.codec.name == "stdlib"
+    assert client.http.transport.codec is client.http.codec
+
+
+def test_transport_decodes_and_encodes_with_codec():
+    codec = _CountingCodec()
+    t = Transport(codec=codec)
+    response = MagicMock(status_code=200, headers={"Content-Type": "application/json"}, content=b'{"ok": 1}')
+    t.session.request = MagicMock(return_value=response)
+    assert t.request("POST", "http://x/y", json={"a": 1}) == {"ok": 1}
+    kwargs = t.session.request.call_args.kwargs
+    assert "json" not in kwargs
+    assert json.loads(kwargs["data"]) == {"a": 1}
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert (codec.loads_calls, codec.dumps_calls) == (1, 1)
+
+
+def test_create_form_fields_and_agent_frames_use_client_codec(client, transport):
+    codec = client.http.codec = _CountingCodec()
+    transport.queue = [{"map_id": "m1", "space_id": "s1"}]
+    df = pd.DataFrame({"A": ["x"], "B": ["p"]})
+    client.spaces.create("t", df, {"A": DataType.Title, "B": DataType.Semantic}, wait=False)
+    assert codec.dumps_calls == 2  # custom_models + data_types
+
+    session = client.agents.session(
+        "space1", provider=Provider.OpenCode, user_email="u@e.com",
+        check_capability=False, auto_space_state=False,
+    )
+    assert session._codec is codec
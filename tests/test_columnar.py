@@ -0,0 +1,78 @@
+"""parquet / arrow ipc uploads: format negotiation, csv fallback, and the encoded payload."""
+import io
+
+import pandas as pd
+import pytest
+
+from mantis_sdk import ConfigurationError, DataType, NotFoundError
+from mantis_sdk.columnar import normalize_format, pick_format
+from mantis_sdk.upload import MultipartStream
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+_DF = pd.DataFrame({"A": ["x", "y", "z"], "N": [1.5, 2.5, 3.5], "V": [[0.1, 0.2]] * 3})
+_TYPES = {"A": DataType.Title, "N": DataType.Numeric, "V": DataType.Vector}
+
+
+def _backend(transport, formats):
+    def responder(method, url, kwargs):
+        if url.endswith("/synthesis/upload-formats/"):
+            if formats is None:
+                raise NotFoundError("404", status_code=404)
+            return {"formats": formats}
+        return {"map_id": "m1", "space_id": "s1"}
+
+    transport.responder = responder
+
+
+def test_parquet_upload_when_advertised(client, transport):
+    _backend(transport, ["csv", "parquet"])
+    client.spaces.create("t", _DF, _TYPES, wait=False, upload_format="parquet")
+    kwargs = transport.calls[-1]["kwargs"]
+    name, part, mime = kwargs["files"]["file"]
+    assert (name, mime) == ("data.parquet", "application/vnd.apache.parquet")
+    assert kwargs["data"]["file_format"] == "parquet"
+    assert kwargs["data"]["file_key"].endswith(".parquet")
+    assert pq.read_table(io.BytesIO(part.read())).to_pylist() == _DF.to_dict("records")
+
+
+def test_falls_back_to_csv_and_probes_once(client, transport):
+    _backend(transport, None)  # older backend: no upload-formats route
+    client.config.upload_format = "parquet"
+    for _ in range(2):
+        client.spaces.create("t", _DF, _TYPES, wait=False)
+    assert [c["url"].endswith("/upload-formats/") for c in transport.calls] == [True, False, False]
+    name, _, mime = transport.calls[-1]["kwargs"]["files"]["file"]
+    assert (name, mime) == ("data.csv", "text/csv")
+    assert "file_format" not in transport.calls[-1]["kwargs"]["data"]
+
+
+def test_auto_streams_an_arrow_table(client, transport):
+    _backend(transport, ["arrow"])
+    client.config.stream_uploads = True
+    table = pa.Table.from_pandas(_DF, preserve_index=False)
+    client.spaces.create("t", table, _TYPES, wait=False, upload_format="auto")
+    upload = transport.calls[-1]["kwargs"]["data"]
+    assert isinstance(upload, MultipartStream) and upload.length == len(b"".join(upload))
+    assert b"application/vnd.apache.arrow.stream" in upload._head
+
+
+def test_arrow_table_uploads_as_csv_by_default(client, transport):
+    transport.queue = [{"map_id": "m1", "space_id": "s1"}]
+    client.spaces.create("t", pa.Table.from_pandas(_DF, preserve_index=False), _TYPES, wait=False)
+    _, part, _ = transport.calls[0]["kwargs"]["files"]["file"]
+    assert part.read().startswith(b"A,N,V\n")
+
+
+def test_format_negotiation():
+    assert pick_format("auto", {"csv", "arrow", "parquet"}) == "parquet"
+    assert pick_format("arrow", {"csv"}) == "csv"
+    with pytest.raises(ConfigurationError, match="unknown upload_format"):
+        normalize_format("feather")
+
+
+async def test_async_create_negotiates(aclient, atransport):
+    _backend(atransport, ["parquet"])
+    await aclient.spaces.create("t", _DF, _TYPES, wait=False, upload_format="auto")
+    assert atransport.calls[-1]["kwargs"]["files"]["file"][0] == "data.parquet"
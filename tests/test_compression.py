@@ -0,0 +1,99 @@
+"""compressed uploads, Accept-Encoding negotiation, and transfer byte accounting."""
+import gzip
+import json
+
+import pandas as pd
+import pytest
+
+from mantis_sdk import ConfigurationError, ConfigurationManager, DataType, MantisClient
+from mantis_sdk.compression import compress_part, resolve_encoding
+from mantis_sdk.transport import Transport
+
+_DF = pd.DataFrame({"A": [f"a fairly repetitive title {i % 7}" for i in range(2000)], "B": ["p"] * 2000})
+_TYPES = {"A": DataType.Title, "B": DataType.Semantic}
+
+
+def test_gzip_upload_part(client, transport):
+    client.config.upload_compression = "gzip"
+    transport.queue = [{"map_id": "m1", "space_id": "s1"}]
+    client.spaces.create("t", _DF, _TYPES, wait=False)
+    kwargs = transport.calls[0]["kwargs"]
+    name, part, mime = kwargs["files"]["file"]
+    assert (name, mime) == ("data.csv.gz", "application/gzip")
+    assert kwargs["data"]["content_encoding"] == "gzip"
+    assert gzip.decompress(part.read()).decode() == _DF.to_csv(index=False)
+
+
+def test_uploads_stay_raw_by_default(client, transport):
+    transport.queue = [{"map_id": "m1", "space_id": "s1"}]
+    client.spaces.create("t", _DF, _TYPES, wait=False)
+    name, _, mime = transport.calls[0]["kwargs"]["files"]["file"]
+    assert (name, mime) == ("data.csv", "text/csv")
+    assert "content_encoding" not in transport.calls[0]["kwargs"]["data"]
+
+
+def test_upload_bytes_saved_reported(loopback):
+    loopback.respond = lambda m, p, h: (200, {"Content-Type": "application/json"}, b'{"map_id": "m1"}')
+    cfg = ConfigurationManager()
+    cfg.host, cfg.internal_user_id, cfg.upload_compression = loopback.url, "u", "gzip"
+    client = MantisClient("", config=cfg)
+    client.spaces.create("t", _DF, _TYPES, wait=False)
+    stats = client.transfer_stats()
+    assert stats["uploads_compressed"] == 1
+    assert stats["upload_raw_bytes"] == len(_DF.to_csv(index=False).encode())
+    assert stats["upload_bytes_saved"] > stats["upload_wire_bytes"]  # > 2x on repetitive text
+
+
+def test_compressed_responses_are_negotiated_and_counted(loopback):
+    body = json.dumps({"ideas": ["idea"] * 5000}).encode()
+    loopback.respond = lambda m, p, h: (
+        200, {"Content-Type": "application/json", "Content-Encoding": "gzip"}, gzip.compress(body)
+    )
+    t = Transport()
+    assert t.request("GET", f"{loopback.url}/api/getIdeas/") == {"ideas": ["idea"] * 5000}
+    assert list(t.stream("GET", f"{loopback.url}/api/listIdeas/", "ideas")) == ["idea"] * 5000
+    assert "gzip" in loopback.requests[0][2]["Accept-Encoding"]
+    stats = t.transfer_stats()
+    assert stats["responses_compressed"] == 2
+    assert stats["download_decoded_bytes"] == 2 * len(body)
+    assert stats["download_wire_bytes"] == 2 * len(gzip.compress(body))
+    t.close()
+
+
+async def test_async_transport_counts_compressed_responses():
+    httpx = pytest.importorskip("httpx")
+    from mantis_sdk.aio import AsyncTransport
+
+    body = json.dumps({"ok": "x" * 10_000}).encode()
+
+    def handler(request):
+        return httpx.Response(200, content=gzip.compress(body),
+                              headers={"Content-Type": "application/json", "Content-Encoding": "gzip"})
+
+    t = AsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    assert await t.request("GET", "http://x/y") == {"ok": "x" * 10_000}
+    assert t.transfer_stats()["download_bytes_saved"] > 9000
+
+
+def test_resolve_encoding():
+    assert resolve_encoding(None) is None
+    assert resolve_encoding("gzip") == "gzip"
+    with pytest.raises(ConfigurationError, match="unknown upload_compression"):
+        resolve_encoding("lz4")
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        assert resolve_encoding("auto") == "gzip"
+        with pytest.raises(ConfigurationError, match="zstandard"):
+            resolve_encoding("zstd")
+    else:
+        assert resolve_encoding("auto") == "zstd"
+
+
+def test_gzip_output_is_deterministic():
+    import io
+
+    a, raw, wire = compress_part(io.BytesIO(b"x" * 10_000), "gzip")
+    b, _, _ = compress_part(io.BytesIO(b"x" * 10_000), "gzip")
+    assert a.getvalue() == b.getvalue()
+    assert (raw, wire) == (10_000, len(a.getvalue()))
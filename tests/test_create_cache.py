@@ -0,0 +1,108 @@
+"""create() reuse of identical earlier creates: digests, existence checks, eviction."""
+import pandas as pd
+import pytest
+
+from mantis_sdk import DataType, NotFoundError
+from mantis_sdk.create_cache import CreateCache, content_digest
+
+_TYPES = {"A": DataType.Title}
+
+
+def _df(value="x"):
+    return pd.DataFrame({"A": [value, "y"]})
+
+
+def _backend(transport, existing=("m1",)):
+    def responder(method, url, kwargs):
+        if "/api/listMaps/" in url:
+            return {"maps": [{"id": map_id} for map_id in existing]}
+        if "/synthesis/progress/" in url:
+            return {"progress": 100, "completed": True}
+        return {"map_id": "m1", "space_id": "s1"}
+
+    transport.responder = responder
+
+
+@pytest.fixture
+def reusing(client, transport, tmp_path):
+    client.config.state_dir = str(tmp_path)
+    client.config.create_cache = True
+    _backend(transport)
+    return client
+
+
+def _creates(transport):
+    return sum(c["url"].endswith("/synthesis/landscape/") for c in transport.calls)
+
+
+def test_identical_create_returns_the_existing_space(reusing, transport):
+    first = reusing.spaces.create("t", _df(), _TYPES)
+    seen = []
+    second = reusing.spaces.create("t", _df(), _TYPES, on_receive_id=lambda s, m: seen.append((s, m)))
+    assert _creates(transport) == 1
+    assert (second.space_id, second.map_id) == (first.space_id, first.map_id) == ("s1", "m1")
+    assert seen == [("s1", "m1")]
+
+
+def test_changed_data_or_settings_create_again(reusing, transport):
+    reusing.spaces.create("t", _df(), _TYPES)
+    reusing.spaces.create("t", _df("z"), _TYPES)
+    reusing.spaces.create("t", _df(), _TYPES, embedding_model="other")
+    reusing.spaces.create("t", _df(), {"A": DataType.Semantic})
+    assert _creates(transport) == 4
+
+
+def test_deleted_map_is_recreated(reusing, transport):
+    reusing.spaces.create("t", _df(), _TYPES)
+    _backend(transport, existing=())
+    reusing.spaces.create("t", _df(), _TYPES)
+    assert _creates(transport) == 2
+
+
+def test_missing_space_is_recreated(reusing, transport):
+    reusing.spaces.create("t", _df(), _TYPES)
+    answer = transport.responder
+
+    def gone(method, url, kwargs):
+        if "/api/listMaps/" in url:
+            raise NotFoundError("404", status_code=404)
+        return answer(method, url, kwargs)
+
+    transport.responder = gone
+    reusing.spaces.create("t", _df(), _TYPES)
+    assert _creates(transport) == 2
+
+
+def test_only_completed_creates_are_recorded(reusing, transport, tmp_path):
+    reusing.spaces.create("t", _df(), _TYPES, wait=False)
+    assert len(CreateCache(tmp_path)) == 0
+    reusing.spaces.create("t", _df(), _TYPES, reuse=False)
+    assert len(CreateCache(tmp_path)) == 0
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = CreateCache(tmp_path, max_entries=2)
+    cache.put("a", "s", "ma")
+    cache.put("b", "s", "mb")
+    assert cache.get("a") == ("s", "ma")  # "b" is now least recently used
+    cache.put("c", "s", "mc")
+    assert cache.get("b") is None and cache.get("a") and cache.get("c")
+    expired = CreateCache(tmp_path, ttl=-1)
+    assert expired.get("a") is None
+
+
+def test_digest_covers_content_and_settings(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text("A\nx\n")
+    assert content_digest(_df(), n=1) == content_digest(_df(), n=1)
+    assert content_digest(_df(), n=1) != content_digest(_df(), n=2)
+    assert content_digest(_df(), n=1) != content_digest(_df().astype("category"), n=1)
+    assert content_digest(str(path)) != content_digest(_df())
+
+
+async def test_async_create_reuses(aclient, atransport, tmp_path):
+    aclient.config.state_dir = str(tmp_path)
+    _backend(atransport)
+    for _ in range(2):
+        handle = await aclient.spaces.create("t", _df(), _TYPES, reuse=True)
+    assert _creates(atransport) == 1 and handle.map_id == "m1"
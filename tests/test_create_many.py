@@ -0,0 +1,133 @@
+"""spaces.create_many: parallel uploads, one shared progress poller, per-spec results."""
+import itertools
+import threading
+
+import pandas as pd
+import pytest
+
+from mantis_sdk import (
+    APIConnectionError,
+    APIStatusError,
+    CreateResult,
+    MantisError,
+    NotFoundError,
+    SpaceCreationError,
+)
+
+_DATA = pd.DataFrame({"title": ["a", "b"]})
+
+
+def _spec(name, **extra):
+    return {"space_name": name, "data": _DATA, "data_types": {"title": "title"}, **extra}
+
+
+def _backend(transport, progress=lambda map_id: {"progress": 100, "completed": True}, batch=True):
+    """landscape POSTs get map ids m0, m1, ... in arrival order; progress comes from progress()."""
+    ids = itertools.count()
+    lock = threading.Lock()
+
+    def responder(method, url, kwargs):
+        if url.endswith("/synthesis/progress/batch/"):
+            if not batch:
+                raise NotFoundError("no batch", status_code=404)
+            return {"progress": {map_id: progress(map_id) for map_id in kwargs["json"]["map_ids"]}}
+        if "/synthesis/progress/" in url:
+            return progress(url.rstrip("/").rsplit("/", 1)[1])
+        with lock:
+            n = next(ids)
+        return {"map_id": f"m{n}", "space_id": f"s{n}"}
+
+    transport.responder = responder
+
+
+@pytest.fixture
+def spaces(client):
+    client.spaces.POLL_INTERVAL = 0
+    return client.spaces
+
+
+def test_results_come_back_in_spec_order(spaces, transport):
+    _backend(transport, lambda map_id: {"error": "worker died"} if map_id == "m1" else {"progress": 100})
+    specs = [_spec("one"), _spec("bad", data_types={"nope": "title"}), _spec("two"), _spec("three")]
+    results = spaces.create_many(specs, max_concurrent_uploads=1)
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert all(isinstance(r, CreateResult) for r in results)
+    assert isinstance(results[1].error, MantisError) and not results[1].ok
+    assert isinstance(results[2].error, SpaceCreationError)  # m1: the second map uploaded
+    assert (results[0].handle.map_id, results[3].handle.map_id) == ("m0", "m2")
+
+
+def test_inflight_pipelines_are_bounded(spaces, transport):
+    _backend(transport)
+    spaces.create_many([_spec("a"), _spec("b"), _spec("c")], max_inflight_pipelines=1)
+    # with one map in flight, each upload waits for the previous map to finish.
+    assert [c["method"] for c in transport.calls] == ["POST", "GET"] * 3
+
+
+def test_one_batched_progress_request_per_round(spaces, transport):
+    # maps stay at 50% until all three are followed together.
+    _backend(transport, lambda map_id: {"progress": 50})
+    done = []
+
+    def responder(method, url, kwargs, inner=transport.responder):
+        if url.endswith("/synthesis/progress/batch/") and len(kwargs["json"]["map_ids"]) == 3:
+            done.append(kwargs["json"]["map_ids"])
+            return {"progress": {map_id: {"progress": 100} for map_id in kwargs["json"]["map_ids"]}}
+        return inner(method, url, kwargs)
+
+    transport.responder = responder
+    seen = []
+    results = spaces.create_many(
+        [_spec(name, on_progress=lambda p, m, t: seen.append(p)) for name in "abc"], max_concurrent_uploads=3
+    )
+    assert all(r.ok for r in results) and len(done) == 1
+    assert sorted(done[0]) == ["m0", "m1", "m2"] and seen.count(100) == 3
+
+
+def test_without_a_batch_endpoint_each_map_is_polled(spaces, transport):
+    def batch_tried():
+        return [c for c in transport.calls if c["url"].endswith("/batch/")]
+
+    # maps stay at 50% until both are followed together, so a batch request is tried.
+    _backend(transport, lambda map_id: {"progress": 100 if batch_tried() else 50}, batch=False)
+    results = spaces.create_many([_spec("a"), _spec("b")], max_concurrent_uploads=2, max_inflight_pipelines=2)
+    assert all(r.ok for r in results)
+    assert spaces._batch_progress is False and len(batch_tried()) == 1
+
+
+@pytest.mark.parametrize("failure", [
+    APIStatusError("unavailable", status_code=503), APIConnectionError("connection reset"),
+])
+def test_failed_batch_request_polls_each_map_that_round(spaces, transport, failure):
+    _backend(transport, lambda map_id: {"progress": 50})
+    failed = []
+
+    def responder(method, url, kwargs, inner=transport.responder):
+        if url.endswith("/synthesis/progress/batch/"):
+            if not failed:
+                failed.append(url)
+                raise failure
+            return {"progress": {map_id: {"progress": 100} for map_id in kwargs["json"]["map_ids"]}}
+        return inner(method, url, kwargs)
+
+    transport.responder = responder
+    results = spaces.create_many([_spec("a"), _spec("b")], max_concurrent_uploads=2, max_inflight_pipelines=2)
+    assert all(r.ok for r in results) and failed
+    assert spaces._batch_progress is not False  # a transient failure doesn't turn batching off
+
+
+def test_wait_false_returns_after_uploading(spaces, transport):
+    _backend(transport)
+    results = spaces.create_many([_spec("a"), _spec("b")], wait=False)
+    assert all(r.ok for r in results)
+    assert all(c["method"] == "POST" and "/progress/" not in c["url"] for c in transport.calls)
+    with pytest.raises(TypeError):
+        spaces.create_many([{"space_name": "a", "colour": "red"}])
+
+
+async def test_async_create_many(aclient, atransport):
+    aclient.spaces.POLL_INTERVAL = 0
+    _backend(atransport, lambda map_id: {"error": "boom"} if map_id == "m0" else {"progress": 100})
+    results = await aclient.spaces.create_many([_spec("a"), _spec("b")], max_concurrent_uploads=1)
+    assert isinstance(results[0].error, SpaceCreationError)
+    assert results[1].ok and results[1].handle.map_id == "m1"
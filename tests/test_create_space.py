@@ -1,9 +1,13 @@
 """create_space: data_types sanitization, the progress poll loop, and error handling."""
+import json
+
+import numpy as np
 import pandas as pd
 import pytest
 
-from mantis_sdk import DataType, SpaceCreationError
+from mantis_sdk import DataType, MantisError, SpaceCreationError, frames
 from mantis_sdk.resources import SpacesResource
+from mantis_sdk.sources import Source
 
 
 def test_sanitize_data_types_marks_unlisted_as_delete():
@@ -87,3 +91,72 @@ def test_create_space_no_wait_skips_polling(client, transport):
     )
     assert handle.map_id == "m1"
     assert len(transport.calls) == 1  # only the POST, no progress polls.
+
+
+def _uploaded(transport):
+    kwargs = transport.calls[0]["kwargs"]
+    _, part, _ = kwargs["files"]["file"]
+    return pd.read_csv(part), json.loads(kwargs["data"]["data_types"]), json.loads(kwargs["data"]["custom_models"])
+
+
+def test_create_uploads_only_mapped_columns(client, transport):
+    transport.queue = [{"map_id": "m1", "space_id": "s1"}]
+    df = pd.DataFrame({"A": ["x"], "junk": [1], "B": ["p"], "gone": [2]})
+    client.spaces.create(
+        "t", df, {"A": DataType.Title, "B": DataType.Semantic, "gone": DataType.Delete},
+        custom_models=["m-a", None, "m-b", None],  # one per data column: projected along
+        wait=False,
+    )
+    uploaded, types, models = _uploaded(transport)
+    assert list(uploaded.columns) == ["A", "B"]
+    assert [t["title"] for t in types] == [True, False] and [t["semantic"] for t in types] == [False, True]
+    assert models == ["m-a", "m-b"]
+
+
+def test_projection_can_be_turned_off(client, transport):
+    transport.queue = [{"map_id": "m1", "space_id": "s1"}]
+    client.config.project_columns = False
+    df = pd.DataFrame({"A": ["x"], "junk": [1]})
+    client.spaces.create("t", df, {"A": DataType.Title}, wait=False)
+    uploaded, types, _ = _uploaded(transport)
+    assert list(uploaded.columns) == ["A", "junk"] and types[1]["delete"] is True
+
+
+def test_csv_path_projection_keeps_values_verbatim(client, transport, tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text("A,junk,B\n007,1,1.50\n,2,x\n")
+    transport.queue = [{"map_id": "m1", "space_id": "s1"}]
+    client.spaces.create("t", str(path), {"A": DataType.Title, "B": DataType.Semantic}, wait=False)
+    _, part, _ = transport.calls[0]["kwargs"]["files"]["file"]
+    assert part.read() == b"A,B\n007,1.50\n,x\n"
+
+
+def test_csv_path_projection_reads_the_file_in_blocks(client, transport, tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text("A,junk,B\n" + "".join(f"{i:03},{i},b{i}\n" for i in range(5)))
+    projected = frames.project(str(path), ["A", "B"])
+    assert isinstance(projected, Source) and projected.replayable
+    assert [len(frame) for frame in projected.frames(2)] == [2, 2, 1]
+    transport.queue = [{"map_id": "m1", "space_id": "s1"}]
+    client.config.upload_chunk_rows = 2
+    client.config.stream_uploads = True
+    client.spaces.create("t", str(path), {"A": DataType.Title, "B": DataType.Semantic}, wait=False)
+    body = b"".join(transport.calls[0]["kwargs"]["data"])
+    assert b"\nA,B\n000,b0\n001,b1\n002,b2\n003,b3\n004,b4\n" in body
+
+
+def test_drop_duplicates_compares_vectors_by_value(client, transport):
+    transport.queue = [{"map_id": "m1", "space_id": "s1"}]
+    df = pd.DataFrame({
+        "A": ["x", "x", "x", "y"],
+        "V": [np.array([1.0, 2.0]), np.array([1.0, 2.0]), np.array([1.0, 3.0]), np.array([1.0, 2.0])],
+        "junk": [1, 2, 3, 4],  # differs per row, but isn't uploaded
+    })
+    client.spaces.create("t", df, {"A": DataType.Title, "V": DataType.Vector}, drop_duplicates=True, wait=False)
+    uploaded, _, _ = _uploaded(transport)
+    assert list(uploaded["A"]) == ["x", "x", "y"]
+
+
+def test_unmapped_data_is_rejected(client, transport):
+    with pytest.raises(MantisError, match="none of the data columns"):
+        client.spaces.create("t", _df(), {"Z": DataType.Title}, wait=False)
@@ -0,0 +1,146 @@
+"""delta refreshes: row-hash manifests, partial uploads, and the full-upload fallbacks."""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mantis_sdk import DataType, MantisError, NotFoundError, SpaceCreationError
+from mantis_sdk.delta import Manifest, row_hashes
+
+_TYPES = {"title": DataType.Title, "body": DataType.Semantic}
+
+
+def _df(n=10):
+    return pd.DataFrame({
+        "url": [f"u{i}" for i in range(n)],
+        "title": [f"t{i}" for i in range(n)],
+        "body": [f"b{i}" for i in range(n)],
+        "junk": range(n),
+    })
+
+
+def _backend(transport, delta=True):
+    def responder(method, url, kwargs):
+        if url.endswith("/synthesis/landscape/delta/") and not delta:
+            raise NotFoundError("404", status_code=404)
+        if "/synthesis/progress/" in url:
+            return {"progress": 100, "completed": True}
+        return {"map_id": "m1", "space_id": "s1"}
+
+    transport.responder = responder
+
+
+def _refresh(client, df, **kwargs):
+    return client.spaces.create("t", df, _TYPES, map_id="m1", delta_key="url", **kwargs)
+
+
+def _posts(transport):
+    return [c for c in transport.calls if c["method"] == "POST"]
+
+
+def _uploaded(call):
+    _, part, _ = call["kwargs"]["files"]["file"]
+    return pd.read_csv(part)
+
+
+@pytest.fixture
+def refreshing(client, transport, tmp_path):
+    client.config.state_dir = str(tmp_path)
+    _backend(transport)
+    return client
+
+
+def test_first_refresh_uploads_everything_with_the_key(refreshing, transport, tmp_path):
+    _refresh(refreshing, _df())
+    (post,) = _posts(transport)
+    assert post["url"].endswith("/synthesis/landscape/")
+    uploaded = _uploaded(post)
+    assert list(uploaded.columns) == ["url", "title", "body"] and len(uploaded) == 10  # key kept, junk dropped
+    assert json.loads(post["kwargs"]["data"]["key_columns"]) == ["url"]
+    assert len(Manifest.load(tmp_path, "m1").rows) == 10
+
+
+def test_second_refresh_sends_only_changed_rows(refreshing, transport):
+    _refresh(refreshing, _df())
+    df = _df()
+    df.loc[3, "body"] = "edited"
+    df.loc[5, "junk"] = 99  # unmapped: not a change
+    df = pd.concat([df.drop(index=7), pd.DataFrame([{"url": "new", "title": "n", "body": "n", "junk": 0}])])
+    _refresh(refreshing, df)
+    post = _posts(transport)[-1]
+    assert post["url"].endswith("/synthesis/landscape/delta/")
+    assert list(_uploaded(post)["url"]) == ["u3", "new"]
+    assert json.loads(post["kwargs"]["data"]["deleted_keys"]) == ["u7"]
+
+
+def test_unchanged_refresh_sends_nothing(refreshing, transport):
+    _refresh(refreshing, _df())
+    calls = len(transport.calls)
+    handle = _refresh(refreshing, _df().sample(frac=1, random_state=0))  # row order doesn't matter
+    assert len(transport.calls) == calls
+    assert (handle.space_id, handle.map_id) == ("s1", "m1")
+
+
+def test_falls_back_to_a_full_upload(refreshing, transport):
+    _refresh(refreshing, _df())
+    changed = _df()
+    changed.loc[0, "body"] = "edited"
+    _backend(transport, delta=False)
+    _refresh(refreshing, changed)
+    _refresh(refreshing, _df())  # the missing route is remembered
+    urls = [c["url"].split("/synthesis/")[1] for c in _posts(transport)]
+    assert urls == ["landscape/", "landscape/delta/", "landscape/", "landscape/"]
+    assert len(_uploaded(_posts(transport)[-1])) == 10
+
+
+def test_large_or_incompatible_changes_upload_everything(refreshing, transport):
+    _refresh(refreshing, _df())
+    most = _df()
+    most["body"] = "rewritten"  # every row changed: over delta_max_fraction
+    _refresh(refreshing, most)
+    refreshing.spaces.create("t", most, {**_TYPES, "junk": DataType.Numeric}, map_id="m1", delta_key="url")
+    assert [c["url"].endswith("/landscape/") for c in _posts(transport)] == [True, True, True]
+
+
+def test_failed_refresh_forgets_the_manifest(refreshing, transport, tmp_path):
+    _refresh(refreshing, _df())
+
+    def failing(method, url, kwargs):
+        if "/synthesis/progress/" in url:
+            return {"error": "worker crashed"}
+        return {"map_id": "m1", "space_id": "s1"}
+
+    transport.responder = failing
+    changed = _df()
+    changed.loc[0, "body"] = "edited"
+    with pytest.raises(SpaceCreationError):
+        _refresh(refreshing, changed)
+    assert Manifest.load(tmp_path, "m1") is None
+
+
+def test_refresh_needs_a_map_id_and_a_unique_key(refreshing):
+    with pytest.raises(MantisError, match="map_id"):
+        refreshing.spaces.create("t", _df(), _TYPES, delta_key="url")
+    with pytest.raises(MantisError, match="uniquely"):
+        _refresh(refreshing, pd.concat([_df(), _df()]))
+
+
+def test_row_hashes_are_stable_and_compare_vectors_by_value():
+    df = pd.DataFrame({"a": ["x", "x"], "v": [np.array([1.0, 2.0]), np.array([1.0, 2.0])], "n": [1, 1]})
+    first, second = row_hashes(df)
+    assert first == second == row_hashes(df.copy())[0]
+    df.at[1, "v"] = np.array([1.0, 2.5])
+    assert row_hashes(df)[1] != first
+
+
+async def test_async_delta_refresh(aclient, atransport, tmp_path):
+    aclient.config.state_dir = str(tmp_path)
+    _backend(atransport)
+    for body in ("b", "edited"):
+        df = _df(3)
+        df.loc[1, "body"] = body
+        await aclient.spaces.create("t", df, _TYPES, map_id="m1", delta_key="url", wait=False)
+    post = _posts(atransport)[-1]
+    assert post["url"].endswith("/synthesis/landscape/delta/")
+    assert list(_uploaded(post)["url"]) == ["u1"]
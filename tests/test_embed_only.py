@@ -0,0 +1,77 @@
+"""embed_only: precomputed embeddings streamed as a binary side-car, then polled."""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mantis_sdk import ConfigurationError, DataType, MantisError
+from mantis_sdk.upload import MultipartStream
+from mantis_sdk.vectors import iter_encoded
+
+_EMB = np.random.default_rng(0).normal(size=(5, 8)).astype(np.float32)
+_META = pd.DataFrame({"title": list("abcde")})
+
+
+def _field(upload, name):
+    return upload._head.split(f'name="{name}"\r\n\r\n'.encode())[1].split(b"\r\n")[0]
+
+
+def _backend(transport):
+    def responder(method, url, kwargs):
+        if "/synthesis/progress/" in url:
+            return {"progress": 100, "completed": True}
+        return {"map_id": "m1", "space_id": "s1"}
+
+    transport.responder = responder
+
+
+def test_embed_only_streams_a_memory_mapped_npy(client, transport, tmp_path):
+    path = tmp_path / "emb.npy"
+    np.save(path, _EMB)
+    _backend(transport)
+    seen = []
+    handle = client.spaces.embed_only(
+        "t", _META, str(path), {"title": DataType.Title}, on_progress=lambda p, m, t: seen.append(p)
+    )
+    post = next(c for c in transport.calls if c["method"] == "POST")
+    assert post["url"].endswith("/synthesis/embed-only/")
+    upload = post["kwargs"]["data"]
+    assert isinstance(upload, MultipartStream)
+    body = b"".join(upload)
+    assert len(body) == upload.length and _EMB.tobytes() in body
+    assert json.loads(_field(upload, "vector_parts")) == [
+        {"column": "embedding", "part": "vectors_0", "encoding": "float32", "rows": 5, "dim": 8}
+    ]
+    assert b"title,embedding\na,\n" in body  # the csv column is filled from the side-car
+    assert (handle.map_id, seen) == ("m1", [100])
+
+
+def test_float32_blocks_are_views_of_the_mapped_file(tmp_path):
+    np.save(tmp_path / "emb.npy", _EMB)
+    mapped = np.load(tmp_path / "emb.npy", mmap_mode="r")
+    chunks = list(iter_encoded(mapped, "float32", chunk_rows=2))
+    assert len(chunks) == 3
+    assert all(np.shares_memory(np.frombuffer(chunk, np.float32), mapped) for chunk in chunks)
+
+
+def test_quantized_embed_only(client, transport):
+    _backend(transport)
+    client.spaces.embed_only("t", _META, _EMB.astype(np.float64), {"title": "title"}, encoding="int8", wait=False)
+    upload = transport.calls[-1]["kwargs"]["data"]
+    parts = json.loads(_field(upload, "vector_parts"))
+    assert parts[0]["encoding"] == "int8" and upload.length == len(b"".join(upload))
+
+
+def test_embed_only_validates_input(client):
+    with pytest.raises(MantisError, match="has 4 rows"):
+        client.spaces.embed_only("t", _META, _EMB[:4], {"title": DataType.Title}, wait=False)
+    with pytest.raises(ConfigurationError):
+        client.spaces.embed_only("t", _META, _EMB, {"title": DataType.Title}, encoding="text", wait=False)
+
+
+async def test_async_embed_only(aclient, atransport):
+    _backend(atransport)
+    handle = await aclient.spaces.embed_only("t", _META, _EMB, {"title": DataType.Title})
+    post = next(c for c in atransport.calls if c["method"] == "POST")
+    assert post["url"].endswith("/synthesis/embed-only/") and handle.map_id == "m1"
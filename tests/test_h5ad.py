@@ -0,0 +1,149 @@
+"""from_h5ad: obs csv plus an obsm / layer side-car, read from the file a block at a time."""
+import json
+
+import numpy as np
+import pytest
+
+from mantis_sdk import APIConnectionError, DataType, MantisError, h5ad
+from mantis_sdk.h5ad import CSRRows, Obs, open_file
+from mantis_sdk.upload import MultipartStream
+
+h5py = pytest.importorskip("h5py")
+
+_PCA = np.arange(10, dtype=np.float32).reshape(5, 2)
+_COUNTS = np.array([[0, 1, 0], [2, 0, 0], [0, 0, 0], [0, 3, 4], [5, 0, 6]], dtype=np.float32)
+
+
+def _write_h5ad(path, csc=False):
+    """a minimal anndata >= 0.7 file: categorical, numeric and string obs columns, an obsm
+    entry and a sparse layer."""
+    strings = h5py.string_dtype()
+    with h5py.File(path, "w") as f:
+        obs = f.create_group("obs")
+        obs.attrs.update({"encoding-type": "dataframe", "_index": "_index", "column-order": ["cell_type", "n_genes", "batch"]})
+        obs.create_dataset("_index", data=[f"cell{i}" for i in range(5)], dtype=strings)
+        cell_type = obs.create_group("cell_type")
+        cell_type.attrs["encoding-type"] = "categorical"
+        cell_type.create_dataset("categories", data=["B", "T"], dtype=strings)
+        cell_type.create_dataset("codes", data=np.array([0, 1, 1, -1, 0], dtype=np.int8))
+        obs.create_dataset("n_genes", data=np.array([10, 20, 30, 40, 50]))
+        obs.create_dataset("batch", data=["a", "b", "a", "b", "a"], dtype=strings)
+        f.create_group("obsm").create_dataset("X_pca", data=_PCA)
+        layer = f.create_group("layers").create_group("counts")
+        matrix = _COUNTS.T if csc else _COUNTS
+        rows = [np.flatnonzero(row) for row in matrix]
+        layer.attrs.update({"encoding-type": "csc_matrix" if csc else "csr_matrix", "shape": _COUNTS.shape})
+        layer.create_dataset("indptr", data=np.cumsum([0] + [len(r) for r in rows]))
+        layer.create_dataset("indices", data=np.concatenate(rows))
+        layer.create_dataset("data", data=np.concatenate([m[r] for m, r in zip(matrix, rows)]))
+    return str(path)
+
+
+def _field(upload, name):
+    return upload._head.split(f'name="{name}"\r\n\r\n'.encode())[1].split(b"\r\n")[0]
+
+
+def _chosen(flags):
+    return next(name for name, on in flags.items() if on)
+
+
+def _backend(transport):
+    def responder(method, url, kwargs):
+        if "/synthesis/progress/" in url:
+            return {"progress": 100, "completed": True}
+        kwargs["body"] = b"".join(kwargs["data"])  # sent while the file is open, as a transport would
+        return {"map_id": "m1", "space_id": "s1"}
+
+    transport.responder = responder
+
+
+def test_obs_and_obsm_are_streamed(client, transport, tmp_path):
+    path = _write_h5ad(tmp_path / "pbmc.h5ad")
+    _backend(transport)
+    client.config.upload_chunk_rows = 2
+    handle = client.spaces.from_h5ad(path, obsm="X_pca")
+    post = next(c for c in transport.calls if c["method"] == "POST")
+    assert post["url"].endswith("/synthesis/h5ad/create/")
+    upload = post["kwargs"]["data"]
+    assert isinstance(upload, MultipartStream)
+    body = post["kwargs"]["body"]
+    assert len(body) == upload.length and _PCA.tobytes() in body
+    assert b"obs_names,cell_type,n_genes,batch,X_pca\ncell0,B,10,a,\n" in body
+    assert b"cell3,,40,b,\n" in body  # code -1 is missing
+    assert _field(upload, "h5ad_source") == b"obsm/X_pca"
+    assert [_chosen(t) for t in json.loads(_field(upload, "data_types"))] == [
+        "title", "categoric", "numeric", "categoric", "vector",
+    ]
+    assert json.loads(_field(upload, "vector_parts"))[0]["dim"] == 2
+    assert _field(upload, "space_name") == b"pbmc" and handle.map_id == "m1"
+
+
+def test_csr_layer_is_densified_per_block(tmp_path):
+    with open_file(_write_h5ad(tmp_path / "a.h5ad")) as f:
+        rows = CSRRows(f["layers/counts"])
+        assert rows.shape == (5, 3)
+        np.testing.assert_array_equal(np.concatenate([rows[0:2], rows[2:4], rows[4:6]]), _COUNTS)
+
+
+def test_layer_upload_and_column_choice(client, transport, tmp_path):
+    path = _write_h5ad(tmp_path / "a.h5ad")
+    _backend(transport)
+    client.spaces.from_h5ad(
+        path, "cells", layer="counts", obs_columns=["batch"], data_types={"batch": DataType.Semantic}, wait=False,
+    )
+    upload = transport.calls[-1]["kwargs"]["data"]
+    body = transport.calls[-1]["kwargs"]["body"]
+    assert _COUNTS.tobytes() in body and b"obs_names,batch,counts\n" in body
+    assert _chosen(json.loads(_field(upload, "data_types"))[1]) == "semantic"
+
+
+def test_obs_reads_only_the_requested_rows(tmp_path):
+    with open_file(_write_h5ad(tmp_path / "a.h5ad")) as f:
+        block = Obs(f).block(3, 5)
+    assert block["obs_names"].tolist() == ["cell3", "cell4"]
+    assert block["n_genes"].tolist() == [40, 50]
+
+
+def test_bad_sources_are_rejected(client, tmp_path):
+    path = _write_h5ad(tmp_path / "a.h5ad", csc=True)
+    with pytest.raises(MantisError, match="exactly one"):
+        client.spaces.from_h5ad(path, wait=False)
+    with pytest.raises(MantisError, match="csc"):
+        client.spaces.from_h5ad(path, layer="counts", wait=False)
+    with pytest.raises(MantisError, match="isn't in this h5ad"):
+        client.spaces.from_h5ad(path, obsm="X_umap", wait=False)
+    with pytest.raises(MantisError, match="no column"):
+        client.spaces.from_h5ad(path, obsm="X_pca", obs_columns=["tissue"], wait=False)
+
+
+def _failing_backend(transport, monkeypatch):
+    opened = []
+    monkeypatch.setattr(h5ad, "open_file", lambda path: opened.append(h5py.File(path, "r")) or opened[-1])
+
+    def responder(method, url, kwargs):
+        raise APIConnectionError("refused", request_sent=False)
+
+    transport.responder = responder
+    return opened
+
+
+def test_file_is_closed_when_the_submission_fails(client, transport, tmp_path, monkeypatch):
+    opened = _failing_backend(transport, monkeypatch)
+    with pytest.raises(APIConnectionError):
+        client.spaces.from_h5ad(_write_h5ad(tmp_path / "a.h5ad"), obsm="X_pca", wait=False)
+    assert len(opened) == 1 and not opened[0].id.valid
+
+
+async def test_async_file_is_closed_when_the_submission_fails(aclient, atransport, tmp_path, monkeypatch):
+    opened = _failing_backend(atransport, monkeypatch)
+    with pytest.raises(APIConnectionError):
+        await aclient.spaces.from_h5ad(_write_h5ad(tmp_path / "a.h5ad"), obsm="X_pca", wait=False)
+    assert len(opened) == 1 and not opened[0].id.valid
+
+
+async def test_async_from_h5ad(aclient, atransport, tmp_path):
+    path = _write_h5ad(tmp_path / "a.h5ad")
+    _backend(atransport)
+    handle = await aclient.spaces.from_h5ad(path, obsm="X_pca")
+    post = next(c for c in atransport.calls if c["method"] == "POST")
+    assert post["url"].endswith("/synthesis/h5ad/create/") and handle.map_id == "m1"
@@ -35,3 +35,91 @@ def test_internal_service_auth_header():
     headers = h.auth_headers()
     assert headers["X-Internal-Service"] == "true"
     assert headers["X-Internal-User-Id"] == "user-123"
+
+
+def test_get_does_not_mutate_caller_params():
+    # the same params dict may be shared by several threads; _ts must go on a copy.
+    h = _http("/api/proxy/", internal="u")
+    params = {"space_id": "s1"}
+    _, _, kwargs = h._prepare("GET", "/api/listMaps", params=params)
+    assert params == {"space_id": "s1"}
+    assert "_ts" in kwargs["params"]
+
+
+# --- single-flight GET coalescing ---
+
+def _coalescing_client(transport):
+    from mantis_sdk import MantisClient
+
+    cfg = ConfigurationManager()
+    cfg.internal_user_id = "u"
+    cfg.coalesce_gets = True
+    client = MantisClient("/api/proxy/", config=cfg)
+    client.http.transport = transport
+    return client
+
+
+def _slow(result, calls):
+    import time
+
+    def responder(method, url, kwargs):
+        calls.append(url)
+        time.sleep(0.2)  # hold the leader in flight while the followers arrive
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return responder
+
+
+def test_concurrent_identical_gets_share_one_call(transport):
+    from concurrent.futures import ThreadPoolExecutor
+
+    calls: list = []
+    transport.responder = _slow({"project_id": "sp-1"}, calls)
+    client = _coalescing_client(transport)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: client.aliases.resolve("m4m"), range(8)))
+    assert results == ["sp-1"] * 8
+    assert len(calls) == 1
+    assert client.http._flights.shared == 7
+
+
+def test_coalesced_followers_get_the_same_exception(transport):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from mantis_sdk import RateLimitError
+
+    calls: list = []
+    transport.responder = _slow(RateLimitError("slow down", status_code=429), calls)
+    client = _coalescing_client(transport)
+
+    def call(_):
+        try:
+            client.spaces.get_all()
+        except RateLimitError as exc:
+            return exc
+        return None
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        errors = list(pool.map(call, range(4)))
+    assert len(calls) == 1
+    assert all(isinstance(e, RateLimitError) for e in errors)
+
+
+def test_different_params_and_writes_are_not_coalesced(transport):
+    from concurrent.futures import ThreadPoolExecutor
+
+    calls: list = []
+    transport.responder = _slow({"maps": []}, calls)
+    client = _coalescing_client(transport)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(client.maps.list, ["s1", "s2", "s1", "s2"]))
+        list(pool.map(lambda _: client.aliases.set("s1", "a"), range(2)))
+    assert len(calls) == 2 + 2
+
+
+def test_flight_key_ignores_cache_buster():
+    a = HttpClient._flight_key("get", "http://h/x/", {"a": 1, "_ts": "1"})
+    b = HttpClient._flight_key("GET", "http://h/x/", {"_ts": "2", "a": 1})
+    assert a == b
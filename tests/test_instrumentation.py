@@ -0,0 +1,127 @@
+"""instrumentation hooks and the metrics recorder: latency, bytes, retries, errors, export."""
+import json
+
+import pytest
+
+from mantis_sdk import (
+    APIConnectionError,
+    ConfigurationError,
+    ConfigurationManager,
+    MantisClient,
+    RateLimitError,
+)
+from mantis_sdk.instrumentation import MetricsRecorder, _Histogram, endpoint_template
+from mantis_sdk.transport import Transport
+
+_JSON = {"Content-Type": "application/json"}
+
+
+def _client(loopback, record=True):
+    cfg = ConfigurationManager()
+    cfg.host, cfg.internal_user_id, cfg.record_metrics = loopback.url, "u", record
+    return MantisClient("/api/proxy/", config=cfg)
+
+
+def test_endpoint_template_collapses_ids():
+    assert endpoint_template(
+        "http://h/api/proxy/synthesis/progress/5f0c2a1e-8b7d-4c3a-9e21-0a1b2c3d4e5f/"
+    ) == "/api/proxy/synthesis/progress/{id}/"
+    assert endpoint_template("http://h/api/spaces/delete/1234/") == "/api/spaces/delete/{id}/"
+    assert endpoint_template("http://h/api/listMaps/") == "/api/listMaps/"
+
+
+def test_recorder_tracks_latency_bytes_statuses_and_errors(loopback):
+    def respond(method, path, headers):
+        if method == "POST":
+            return 429, _JSON, b'{"error": "slow down"}'
+        return 200, _JSON, json.dumps({"maps": [{"id": "m"}] * 10}).encode()
+
+    loopback.respond = respond
+    client = _client(loopback)
+    for _ in range(5):
+        client.maps.list("s1")
+    with pytest.raises(RateLimitError):
+        client.annotations.create("m1", {"text": "x"})
+
+    stats = client.stats()["endpoints"]
+    reads = stats["GET /api/proxy/api/listMaps/"]
+    assert reads["requests"] == 5
+    assert reads["statuses"] == {200: 5}
+    assert reads["response_bytes"] > 5 * 100
+    assert 0 < reads["latency_ms"]["p50"] <= reads["latency_ms"]["p99"] <= reads["latency_ms"]["max"] * 1.25
+    writes = stats["POST /api/proxy/api/createAnnotation/"]
+    assert writes["errors"] == {"RateLimitError": 1}
+    assert writes["request_bytes"] > 0
+
+
+def test_recorder_counts_urllib3_retries(loopback):
+    seen = []
+
+    def respond(method, path, headers):
+        seen.append(path)
+        return (503, _JSON, b"{}") if len(seen) == 1 else (200, _JSON, b'{"maps": []}')
+
+    loopback.respond = respond
+    client = _client(loopback)
+    client.maps.list("s1")
+    assert client.stats()["endpoints"]["GET /api/proxy/api/listMaps/"]["retries"] == 1
+
+
+def test_connection_errors_are_recorded():
+    t = Transport(max_retries=0)
+    recorder = MetricsRecorder().attach(t)
+    with pytest.raises(APIConnectionError):
+        t.request("GET", "http://127.0.0.1:9/api/listMaps/")
+    assert recorder.stats()["GET /api/listMaps/"]["errors"] == {"APIConnectionError": 1}
+
+
+def test_hooks_see_events_and_cannot_break_requests(loopback):
+    client = _client(loopback, record=False)
+    seen = []
+
+    def explode(event):
+        raise RuntimeError("bad hook")
+
+    client.hooks.add(on_request=lambda e: seen.append(("req", e.endpoint)), on_response=explode)
+    client.hooks.add(on_response=lambda e: seen.append(("resp", e.status)))
+    assert client.http.request("GET", "api/getSpaces") == {"ok": True}
+    assert seen == [("req", "/api/proxy/api/getSpaces/"), ("resp", 200)]
+    with pytest.raises(ConfigurationError, match="record_metrics"):
+        client.export_metrics()
+
+
+def test_prometheus_export(loopback):
+    client = _client(loopback)
+    client.http.request("GET", "api/getSpaces")
+    text = client.export_metrics()
+    assert "# TYPE mantis_sdk_request_duration_seconds histogram" in text
+    labels = 'method="GET",endpoint="/api/proxy/api/getSpaces/"'
+    assert f'mantis_sdk_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f"mantis_sdk_requests_total{{{labels}}} 1" in text
+    assert f'mantis_sdk_responses_total{{{labels},status="200"}} 1' in text
+
+
+def test_histogram_quantiles():
+    h = _Histogram()
+    for ms in range(1, 101):
+        h.observe(ms / 1000)
+    assert 0.040 <= h.quantile(0.5) <= 0.0625  # within one 25% bucket of 50ms
+    assert 0.095 <= h.quantile(0.99) <= 0.100
+    assert h.quantile(1.0) == pytest.approx(0.100)
+
+
+async def test_async_transport_fires_hooks():
+    httpx = pytest.importorskip("httpx")
+    from mantis_sdk.aio import AsyncTransport
+
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503 if len(calls) == 1 else 200, json={"ok": True})
+
+    t = AsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), backoff_factor=0)
+    recorder = MetricsRecorder().attach(t)
+    await t.request("GET", "http://x/api/listMaps/")
+    stats = recorder.stats()["GET /api/listMaps/"]
+    assert (stats["requests"], stats["retries"], stats["statuses"]) == (1, 1, {200: 1})
@@ -0,0 +1,125 @@
+"""the durable job store: resumed creates, spaces.resume, and the max_pipelines limit."""
+import itertools
+
+import pandas as pd
+import pytest
+
+from mantis_sdk import SpaceCreationError
+from mantis_sdk.jobs import COMPLETED, FAILED, RUNNING, SUBMITTING, JobStore
+
+_DF = pd.DataFrame({"A": ["x", "y"]})
+_TYPES = {"A": "title"}
+
+
+def _backend(transport, progress=lambda map_id: {"progress": 100, "completed": True}):
+    ids = itertools.count(1)
+
+    def responder(method, url, kwargs):
+        if url.endswith("/synthesis/progress/batch/"):
+            return {"progress": {map_id: progress(map_id) for map_id in kwargs["json"]["map_ids"]}}
+        if "/synthesis/progress/" in url:
+            return progress(url.rstrip("/").rsplit("/", 1)[1])
+        n = next(ids)
+        return {"map_id": f"m{n}", "space_id": f"s{n}"}
+
+    transport.responder = responder
+
+
+@pytest.fixture
+def spaces(client, tmp_path):
+    client.config.state_dir = str(tmp_path)
+    client.spaces.POLL_INTERVAL = 0
+    return client.spaces
+
+
+def _creates(transport):
+    return sum(c["url"].endswith("/synthesis/landscape/") for c in transport.calls)
+
+
+def test_job_is_recorded_through_completion(spaces, transport):
+    _backend(transport, lambda map_id: {"progress": 40, "message": "embedding"})
+    spaces.create("t", _DF, _TYPES, job_key="weekly", wait=False)
+    job = spaces.job_store.get("weekly")
+    assert (job.status, job.space_id, job.map_id) == (RUNNING, "s1", "m1")
+    _backend(transport)
+    handle = spaces.create("t", _DF, _TYPES, job_key="weekly")
+    job = spaces.job_store.get("weekly")
+    assert (job.status, job.progress) == (COMPLETED, 100) and handle.map_id == "m1"
+    assert _creates(transport) == 1
+
+
+def test_restarted_create_resumes_the_running_job(spaces, transport):
+    _backend(transport, lambda map_id: {"progress": 30, "message": "embedding"})
+
+    def crash(progress, message, tree):
+        raise KeyboardInterrupt  # the worker is stopped mid-poll
+
+    with pytest.raises(KeyboardInterrupt):
+        spaces.create("t", _DF, _TYPES, job_key="k", on_progress=crash)
+    job = spaces.job_store.get("k")
+    assert (job.status, job.progress, job.message) == (RUNNING, 30, "embedding")
+
+    _backend(transport)
+    seen = []
+    handle = spaces.create("t", _DF, _TYPES, job_key="k", on_receive_id=lambda s, m: seen.append(m))
+    assert _creates(transport) == 1  # not uploaded again
+    assert handle.map_id == "m1" and seen == ["m1"]
+    assert spaces.job_store.get("k").status == COMPLETED
+
+
+def test_failed_pipeline_is_recorded_and_resubmitted(spaces, transport):
+    _backend(transport, lambda map_id: {"error": "no worker"})
+    with pytest.raises(SpaceCreationError):
+        spaces.create("t", _DF, _TYPES, job_key="k")
+    job = spaces.job_store.get("k")
+    assert (job.status, job.error) == (FAILED, "no worker")
+    _backend(transport)
+    assert spaces.create("t", _DF, _TYPES, job_key="k").map_id == "m1"
+    assert _creates(transport) == 2
+
+
+def test_resume_follows_jobs_left_running(spaces, transport, client):
+    _backend(transport, lambda map_id: {"progress": 10})
+    client.config.job_store = True  # record creates without a job_key too
+    spaces.create("a", _DF, _TYPES, wait=False)
+    spaces.create("b", _DF, _TYPES, job_key="b", wait=False)
+    _backend(transport, lambda map_id: {"error": "boom"} if map_id == "m2" else {"progress": 100})
+    seen = []
+    results = spaces.resume(on_progress=lambda key, pct, message: seen.append((key, pct)))
+    assert len(results) == 2 and isinstance(results["b"].error, SpaceCreationError)
+    (key,) = [key for key in results if key != "b"]
+    assert results[key].handle.map_id == "m1" and seen == [(key, 100)]
+    assert [job.status for job in spaces.job_store.jobs()] == [COMPLETED, FAILED]
+    assert spaces.resume() == {}
+
+
+def test_max_pipelines_waits_for_a_slot(spaces, transport, client):
+    store = spaces.job_store
+    assert store.submit("other", "x", max_running=1)
+    store.submitted("other", "s0", "m0")
+    assert not store.submit("mine", "y", max_running=1) and store.get("mine") is None
+    client.config.max_pipelines = 1
+    _backend(transport)
+    spaces.create("t", _DF, _TYPES, job_key="mine", wait=False)
+    # the running job is checked first; once it's completed, the slot is free.
+    assert [c["url"].rsplit("/", 2)[-2] for c in transport.calls] == ["m0", "landscape"]
+    assert store.get("other").status == COMPLETED and store.get("mine").status == RUNNING
+
+
+def test_failed_upload_is_recorded(spaces):
+    with pytest.raises(Exception, match="none of the data columns"):
+        spaces.create("t", _DF, {"B": "title"}, job_key="k")
+    job = spaces.job_store.get("k")
+    assert job.status == FAILED and "none of the data columns" in job.error
+    assert JobStore(spaces.http.config.state_dir).jobs(SUBMITTING) == []
+
+
+async def test_async_resume(aclient, atransport, tmp_path):
+    aclient.config.state_dir = str(tmp_path)
+    aclient.spaces.POLL_INTERVAL = 0
+    _backend(atransport, lambda map_id: {"progress": 10})
+    await aclient.spaces.create("t", _DF, _TYPES, job_key="k", wait=False)
+    _backend(atransport)
+    results = await aclient.spaces.resume()
+    assert results["k"].ok and results["k"].handle.map_id == "m1"
+    assert aclient.spaces.job_store.get("k").status == COMPLETED
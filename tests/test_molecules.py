@@ -0,0 +1,93 @@
+"""from_molecules: SMILES preparation (strip, canonicalize, dedupe) and batched uploads."""
+import threading
+
+import pandas as pd
+import pytest
+
+from mantis_sdk import ConfigurationError, DataType, MantisError
+from mantis_sdk.molecules import prepare
+
+
+def _backend(transport):
+    lock = threading.Lock()
+
+    def responder(method, url, kwargs):
+        if "/synthesis/progress/" in url:
+            return {"progress": 100, "completed": True}
+        return {"map_id": "m1", "space_id": "s1"}
+
+    def locked(method, url, kwargs):  # batches arrive from several threads
+        with lock:
+            return responder(method, url, kwargs)
+
+    transport.responder = locked
+
+
+def _batches(transport):
+    posts = [c["kwargs"] for c in transport.calls if c["url"].endswith("/synthesis/molecules/")]
+    return [(kwargs["data"], pd.read_csv(kwargs["files"]["file"][1])) for kwargs in posts]
+
+
+def test_duplicates_and_blanks_are_never_sent(client, transport):
+    _backend(transport)
+    handle = client.spaces.from_molecules("mols", [" CCO", "CCO", "", "c1ccccc1", None])
+    [(form, rows)] = _batches(transport)
+    assert rows["smiles"].tolist() == ["CCO", "c1ccccc1"]
+    assert (form["smiles_column"], form["batch_index"], form["batch_count"]) == ("smiles", "0", "1")
+    assert "embedding_model" not in form and handle.map_id == "m1"
+
+
+def test_batches_upload_concurrently_with_progress(client, transport):
+    _backend(transport)
+    df = pd.DataFrame({"smiles": [f"C{'C' * i}O" for i in range(7)], "name": list("abcdefg"), "junk": 1})
+    seen = []
+    client.spaces.from_molecules(
+        "mols", df, {"name": DataType.Semantic}, batch_rows=2, upload_workers=3,
+        on_batch_progress=lambda sent, total: seen.append((sent, total)), wait=False,
+    )
+    batches = _batches(transport)
+    assert sorted(int(form["batch_index"]) for form, _ in batches) == [0, 1, 2, 3]
+    assert batches[0][0]["batch_index"] == "0" and "map_id" not in batches[0][0]
+    assert all(form["map_id"] == "m1" and form["space_id"] == "s1" for form, _ in batches[1:])
+    assert list(batches[0][1].columns) == ["smiles", "name"]  # unmapped columns aren't uploaded
+    assert [sent for sent, _ in seen] == sorted(sent for sent, _ in seen) and seen[-1] == (7, 7)
+
+
+def test_canonical_duplicates_are_dropped(client, transport):
+    _backend(transport)
+    client.spaces.from_molecules("mols", ["cco", "CCO", "bad"], canonicalize=_toy_canonical, wait=False)
+    [(_, rows)] = _batches(transport)
+    assert rows["smiles"].tolist() == ["CCO"]
+
+
+def _toy_canonical(smiles):
+    return None if smiles == "bad" else smiles.upper()
+
+
+def test_canonicalization_runs_in_a_process_pool():
+    smiles = [f"c{i % 5000}" for i in range(20_001)]
+    prepared = prepare(pd.DataFrame({"smiles": smiles}), "smiles", canonicalize=str.upper, workers=2)
+    assert prepared.frame["smiles"].iloc[1] == "C1"
+    assert (prepared.total, prepared.invalid, prepared.duplicates) == (20_001, 0, 15_001)
+
+
+def test_rdkit_is_required_for_canonicalize_true(client):
+    try:
+        import rdkit  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        pytest.skip("rdkit is installed")
+    with pytest.raises(ConfigurationError, match="rdkit"):
+        client.spaces.from_molecules("mols", ["CCO"], canonicalize=True, wait=False)
+    with pytest.raises(MantisError, match="valid structure"):
+        client.spaces.from_molecules("mols", ["", " "], wait=False)
+
+
+async def test_async_from_molecules(aclient, atransport):
+    _backend(atransport)
+    seen = []
+    handle = await aclient.spaces.from_molecules(
+        "mols", ["C", "CC", "CCC", "CC"], batch_rows=1, on_batch_progress=lambda s, t: seen.append(s),
+    )
+    assert len(_batches(atransport)) == 3 and seen == [1, 2, 3] and handle.map_id == "m1"
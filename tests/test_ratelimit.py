@@ -0,0 +1,106 @@
+"""adaptive per-group rate limiting: token accounting, aimd feedback, and transport wiring."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+
+import pytest
+
+from mantis_sdk import ConfigurationManager, MantisClient, RateLimitError
+from mantis_sdk.ratelimit import AdaptiveTokenBucket, RateLimiter, endpoint_group, parse_retry_after
+
+_JSON = {"Content-Type": "application/json"}
+
+
+def test_endpoint_groups():
+    assert endpoint_group("http://h/api/proxy/synthesis/landscape/") == "synthesis"
+    assert endpoint_group("http://h/api/proxy/api/listIdeas/") == "ideas"
+    assert endpoint_group("http://h/api/proxy/agent_execution/providers/") == "agent_providers"
+    assert endpoint_group("http://h/api/proxy/api/sessions/execute/status/") == "notebook_execute"
+    assert endpoint_group("http://h/api/proxy/api/getSpaces/") == "default"
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert 8 <= parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_bucket_spends_burst_then_paces():
+    bucket = AdaptiveTokenBucket(10, burst=2)
+    assert bucket.reserve() == 0 and bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_throttle_halves_once_per_second_and_success_restores():
+    bucket = AdaptiveTokenBucket(8, increase_after=3)
+    bucket.on_throttle()
+    bucket.on_throttle()  # same burst of 429s: one signal
+    assert bucket.rate == 4
+    assert bucket.throttled == 2
+    for _ in range(3):
+        bucket.on_success()
+    assert bucket.rate == 5
+    for _ in range(30):
+        bucket.on_success()
+    assert bucket.rate == 8  # capped at the configured ceiling
+
+
+def test_retry_after_blocks_the_group():
+    bucket = AdaptiveTokenBucket(100)
+    bucket.on_throttle(retry_after=2.0)
+    assert bucket.reserve() == pytest.approx(2.0, abs=0.05)
+
+
+def test_threads_share_one_schedule():
+    limiter = RateLimiter({"ideas": 20})
+    limiter.buckets["ideas"].burst = limiter.buckets["ideas"]._tokens = 1
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        waits = sorted(pool.map(lambda _: limiter.reserve("http://h/api/listIdeas/"), range(10)))
+    assert waits[0] == 0
+    assert waits[-1] == pytest.approx(9 / 20, abs=0.02)  # one token every 50ms, across threads
+    assert limiter.reserve("http://h/api/getSpaces/") == 0  # ungrouped urls are unlimited
+
+
+def test_transport_feeds_throttles_back(loopback):
+    attempts = []
+
+    def respond(method, path, headers):
+        attempts.append(path)
+        if method == "POST":
+            return 429, {**_JSON, "Retry-After": "0"}, b'{"error": "slow down"}'
+        return (503, _JSON, b"{}") if len(attempts) == 1 else (200, _JSON, b'{"ideas": []}')
+
+    loopback.respond = respond
+    cfg = ConfigurationManager()
+    cfg.host, cfg.internal_user_id = loopback.url, "u"
+    cfg.rate_limits = {"ideas": 40, "synthesis": 10}
+    client = MantisClient("/api/proxy/", config=cfg)
+
+    client.maps.list_idea_ids("m1")  # 503 retried by urllib3, then 200
+    with pytest.raises(RateLimitError):
+        client.http.request("POST", "/synthesis/github", json={})
+    limits = client.stats()["rate_limits"]
+    assert limits["ideas"]["throttled"] == 1 and limits["ideas"]["rate"] == 20
+    assert limits["synthesis"]["throttled"] == 1 and limits["synthesis"]["rate"] == 5
+
+
+def test_env_rate_limits(monkeypatch):
+    monkeypatch.setenv("MANTIS_RATE_LIMITS", "synthesis=2, ideas=20")
+    assert ConfigurationManager().rate_limits == {"synthesis": 2.0, "ideas": 20.0}
+
+
+async def test_async_tasks_wait_for_tokens():
+    import asyncio
+
+    httpx = pytest.importorskip("httpx")
+    from mantis_sdk.aio import AsyncTransport
+
+    limiter = RateLimiter({"default": 50})
+    limiter.buckets["default"].burst = limiter.buckets["default"]._tokens = 1
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda req: httpx.Response(200, json={})))
+    t = AsyncTransport(client=client, limiter=limiter)
+    started = time.monotonic()
+    await asyncio.gather(*(t.request("GET", "http://x/api/getSpaces/") for _ in range(6)))
+    assert time.monotonic() - started >= 5 / 50 - 0.01
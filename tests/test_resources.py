@@ -1,7 +1,8 @@
 """annotations, getSpaces, maps, and feature-unavailable guards."""
+import pandas as pd
 import pytest
 
-from mantis_sdk import FeatureUnavailableError
+from mantis_sdk import FeatureUnavailableError, MantisError
 
 
 def test_get_spaces_passthrough(client, transport):
@@ -23,9 +24,9 @@ def test_cluster_questions_disabled(client):
         client.search.cluster_questions("space1")
 
 
-def test_from_molecules_scaffold_raises(client):
-    with pytest.raises(FeatureUnavailableError):
-        client.spaces.from_molecules()
+def test_from_molecules_needs_a_smiles_column(client):
+    with pytest.raises(MantisError, match="smiles_column"):
+        client.spaces.from_molecules("mols", pd.DataFrame({"structure": ["CCO"]}), wait=False)
 
 
 def test_check_compatibility_reports_shape(client, transport):
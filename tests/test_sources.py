@@ -0,0 +1,126 @@
+"""streamed create() inputs: chunked readers, arrow readers and datasets, polars frames and Rows."""
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from mantis_sdk import APIConnectionError, MantisError, Rows, upload
+from mantis_sdk.upload import MultipartStream
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+_DF = pd.DataFrame({"A": list("abcde"), "N": [1, 2, 3, 4, 5], "X": list("vwxyz")})
+_TYPES = {"A": "title", "N": "numeric"}
+_CSV = _DF[["A", "N"]].to_csv(index=False).encode()
+
+
+def _backend(transport, formats=("csv",), failures=()):
+    failures = list(failures)
+
+    def responder(method, url, kwargs):
+        if url.endswith("/synthesis/upload-formats/"):
+            return {"formats": list(formats)}
+        if failures:
+            raise failures.pop(0)
+        return {"map_id": "m1", "space_id": "s1"}
+
+    transport.responder = responder
+
+
+def _uploaded(transport) -> bytes:
+    kwargs = transport.calls[-1]["kwargs"]
+    if isinstance(kwargs["data"], MultipartStream):
+        body = b"".join(kwargs["data"])
+        return body[body.index(b"\r\n\r\n", body.index(b'name="file"')) + 4:].rsplit(b"\r\n--", 1)[0]
+    return kwargs["files"]["file"][1].read()
+
+
+@pytest.fixture
+def spaces(client, transport):
+    _backend(transport)
+    client.config.upload_chunk_rows = 2
+    return client.spaces
+
+
+def test_chunked_csv_reader_is_uploaded_block_by_block(spaces, transport, tmp_path):
+    path = tmp_path / "data.csv"
+    _DF.to_csv(path, index=False)
+    spaces.create("t", pd.read_csv(path, chunksize=2), _TYPES, wait=False)
+    assert _uploaded(transport) == _CSV  # projected to the mapped columns, one header
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_arrow_table_csv_matches_the_pandas_encoding(spaces, transport, client, stream):
+    client.config.stream_uploads = stream
+    spaces.create("t", pa.Table.from_pandas(_DF, preserve_index=False), _TYPES, wait=False)
+    assert _uploaded(transport) == _CSV
+
+
+def test_row_blocks_of_a_source_share_one_formatting_pool(spaces, transport, client, monkeypatch):
+    pools = []
+
+    class Pool(ThreadPoolExecutor):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            pools.append(self)
+
+    monkeypatch.setitem(upload._EXECUTORS, "thread", Pool)
+    client.config.update({"csv_workers": 2, "csv_executor": "thread", "upload_chunk_rows": 1})
+    spaces.create("t", iter([_DF.iloc[:2], _DF.iloc[2:]]), _TYPES, wait=False)
+    assert _uploaded(transport) == _CSV and len(pools) == 1
+
+
+def test_record_batch_reader_is_written_to_parquet_in_batches(spaces, transport):
+    _backend(transport, formats=("csv", "parquet"))
+    table = pa.Table.from_pandas(_DF, preserve_index=False)
+    reader = pa.RecordBatchReader.from_batches(table.schema, table.to_batches(max_chunksize=2))
+    spaces.create("t", reader, _TYPES, wait=False, upload_format="parquet")
+    uploaded = pq.ParquetFile(io.BytesIO(_uploaded(transport)))
+    assert uploaded.read().to_pandas().equals(_DF[["A", "N"]]) and uploaded.num_row_groups == 3
+
+
+def test_rows_with_a_schema(spaces, transport, client):
+    client.config.stream_uploads = True
+    rows = ({"N": n, "A": a} for a, n in zip(_DF.A, _DF.N))  # dicts in any key order
+    spaces.create("t", Rows(rows, {"A": str, "N": "int64"}), _TYPES, wait=False)
+    assert _uploaded(transport) == _CSV
+    with pytest.raises(MantisError, match="Rows"):
+        spaces.create("t", iter([("a", 1)]), _TYPES, wait=False)
+
+
+def test_single_pass_data_is_not_hashed_or_resent(spaces, transport):
+    _backend(transport, failures=[APIConnectionError("refused", request_sent=False)])
+    rows = Rows(iter(_DF[["A", "N"]].itertuples(index=False)), ["A", "N"])
+    with pytest.raises(APIConnectionError):
+        spaces.create("t", rows, _TYPES, space_id="s1", reuse=True, wait=False)
+    assert len(transport.calls) == 1
+
+
+def test_single_pass_data_can_drop_duplicates(spaces, transport):
+    blocks = iter([_DF.iloc[:3], _DF.iloc[:3], _DF.iloc[3:]])
+    spaces.create("t", blocks, _TYPES, wait=False, drop_duplicates=True)
+    assert _uploaded(transport) == _CSV
+
+
+def test_dataset_is_read_again_for_the_create_cache(spaces, transport, client, tmp_path):
+    ds = pytest.importorskip("pyarrow.dataset")
+    client.config.state_dir = str(tmp_path)
+    dataset = ds.dataset(pa.Table.from_pandas(_DF, preserve_index=False))
+    spaces.create("t", dataset, _TYPES, reuse=True, wait=False)
+    assert _uploaded(transport) == _CSV
+
+
+def test_polars_frame_goes_in_as_arrow(spaces, transport):
+    pl = pytest.importorskip("polars")
+    spaces.create("t", pl.from_pandas(_DF), _TYPES, wait=False)
+    assert _uploaded(transport) == _CSV
+
+
+async def test_async_create_from_rows(aclient, atransport):
+    _backend(atransport)
+    rows = Rows(_DF[["A", "N"]].itertuples(index=False), ["A", "N"])
+    handle = await aclient.spaces.create("t", rows, _TYPES, wait=False)
+    assert handle.map_id == "m1"
+    assert atransport.calls[-1]["kwargs"]["files"]["file"][1].read() == _CSV
@@ -0,0 +1,130 @@
+"""streaming list decoding: chunk-boundary safety, envelope handling, and the stream() paths."""
+import json
+
+import pytest
+
+from mantis_sdk import APIConnectionError, MantisError, NotFoundError
+from mantis_sdk._stream import JsonArrayDecoder, iter_json_array
+from mantis_sdk.resources import SpaceHandle
+from mantis_sdk.transport import Transport
+
+
+def _bytewise(body: bytes):
+    return (body[i:i + 1] for i in range(len(body)))
+
+
+@pytest.mark.parametrize(
+    "payload,keys,expected",
+    [
+        ([1, 22, 333, -4.5e2, "x", None, True], (), [1, 22, 333, -450.0, "x", None, True]),
+        ({"total": 3, "meta": {"a": [1, 2]}, "ideas": [{"id": "i1"}, {"id": "i2"}]}, ("ideas",),
+         [{"id": "i1"}, {"id": "i2"}]),
+        ({"ids": ["a", "b"]}, ("ideas", "ids"), ["a", "b"]),
+        ({"ids": ["x"], "ideas": ["y"]}, ("ideas", "ids"), ["y"]),  # key priority, not body order
+        ({"ids": ["x"], "ideas": None}, ("ideas", "ids"), ["x"]),
+        ({"data": [1], "ids": [2], "z": 0}, ("ideas", "ids", "data"), [2]),
+        ([], (), []),
+    ],
+)
+def test_decodes_across_every_chunk_boundary(payload, keys, expected):
+    body = json.dumps(payload, indent=1).encode()
+    assert list(iter_json_array(_bytewise(body), *keys)) == expected
+    assert list(iter_json_array([body], *keys)) == expected
+
+
+@pytest.mark.parametrize(
+    "payload", [{"results": [1]}, {"ideas": None}, {"detail": "not found"}, None, "ideas"],
+)
+def test_a_body_without_the_list_raises(payload):
+    body = json.dumps(payload).encode()
+    with pytest.raises(MantisError, match="json"):
+        list(iter_json_array(_bytewise(body), "ideas"))
+    assert list(iter_json_array([b""], "ideas")) == []  # an empty body is no items
+
+
+def test_multibyte_utf8_split_between_chunks():
+    body = json.dumps(["café", "名前"], ensure_ascii=False).encode()
+    assert list(iter_json_array(_bytewise(body))) == ["café", "名前"]
+
+
+def test_items_are_yielded_before_the_body_ends():
+    decoder = JsonArrayDecoder("ideas")
+    assert decoder.feed(b'{"ideas": ["a", "b", "c') == ["a", "b"]
+    assert decoder.feed(b'"]}') == ["c"]
+    assert decoder.close() == []
+
+
+def test_truncated_list_raises():
+    with pytest.raises(MantisError, match="middle of a json list"):
+        list(iter_json_array([b'{"ideas": ["a", "b"'], "ideas"))
+
+
+def test_transport_stream_over_the_wire(loopback):
+    ideas = [f"idea-{i}" for i in range(20_000)]
+    body = json.dumps({"total": len(ideas), "ideas": ideas}).encode()
+    loopback.respond = lambda m, p, h: (200, {"Content-Type": "application/json"}, body)
+    t = Transport()
+    assert list(t.stream("GET", f"{loopback.url}/api/listIdeas/", "ideas")) == ideas
+    t.close()
+
+
+def test_transport_stream_raises_typed_error_before_iteration(loopback):
+    loopback.respond = lambda m, p, h: (404, {"Content-Type": "application/json"}, b'{"error": "no map"}')
+    t = Transport(max_retries=0)
+    with pytest.raises(NotFoundError, match="no map"):
+        t.stream("GET", f"{loopback.url}/api/listIdeas/", "ideas")
+    t.close()
+
+
+def test_transport_stream_connect_failure_is_not_sent():
+    t = Transport(max_retries=0)
+    with pytest.raises(APIConnectionError) as info:
+        t.stream("GET", "http://127.0.0.1:9/api/listIdeas/", "ideas")
+    assert info.value.request_sent is False
+    t.close()
+
+
+def test_list_idea_ids_and_iter_ideas_stream(client, transport):
+    transport.queue = [{"ideas": ["a", "b"]}, {"ideas": [{"id": "a"}]}, {"ideas": [{"id": "a"}], "total": 1}]
+    assert client.maps.list_idea_ids("m1") == ["a", "b"]
+    assert list(client.maps.iter_ideas(["a"])) == [{"id": "a"}]
+    assert transport.calls[1]["kwargs"]["params"]["ids"] == "a"
+    assert client.maps.get_ideas(["a"]) == {"ideas": [{"id": "a"}], "total": 1}  # the raw payload
+
+
+def test_iter_points_pages_until_short_page(client, transport):
+    transport.queue = [{"ideas": ["a", "b"]}, {"ideas": ["c"]}]
+    handle = SpaceHandle("s1", "m1", client)
+    assert list(handle.iter_points(page_size=2)) == ["a", "b", "c"]
+    assert [c["kwargs"]["params"]["offset"] for c in transport.calls] == [0, 2]
+
+
+async def test_async_transport_stream():
+    httpx = pytest.importorskip("httpx")
+    from mantis_sdk.aio import AsyncTransport
+
+    body = json.dumps({"ideas": list(range(5000))}).encode()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda req: httpx.Response(200, content=body)))
+    t = AsyncTransport(client=client)
+    items = [item async for item in await t.stream("GET", "http://x/api/listIdeas/", "ideas")]
+    assert items == list(range(5000))
+
+
+async def test_async_iter_points(aclient, atransport):
+    from mantis_sdk.aio import AsyncSpaceHandle
+
+    atransport.queue = [{"ideas": ["a", "b"]}, {"ideas": []}]
+    handle = AsyncSpaceHandle("s1", "m1", aclient)
+    assert [p async for p in handle.iter_points(page_size=2)] == ["a", "b"]
+    assert await aclient.maps.list_idea_ids("m1") == []
+
+
+async def test_async_transport_stream_connect_failure_is_not_sent():
+    pytest.importorskip("httpx")
+    from mantis_sdk.aio import AsyncTransport
+
+    t = AsyncTransport()
+    with pytest.raises(APIConnectionError) as info:
+        await t.stream("GET", "http://127.0.0.1:9/api/listIdeas/", "ideas")
+    assert info.value.request_sent is False
+    await t.close()
@@ -0,0 +1,108 @@
+"""idempotency keys on synthesis submissions, and when a failed one is re-sent."""
+import pandas as pd
+import pytest
+
+from mantis_sdk import APIConnectionError, APIStatusError, CircuitOpenError, RateLimitError
+from mantis_sdk.resources import IDEMPOTENCY_HEADER
+
+_DF = pd.DataFrame({"A": ["x", "y"]})
+_TYPES = {"A": "title"}
+
+
+def _backend(transport, failures=(), formats=("csv",)):
+    """submissions fail with each of failures in turn, then succeed."""
+    failures = list(failures)
+
+    def responder(method, url, kwargs):
+        if url.endswith("/synthesis/upload-formats/"):
+            return {"formats": list(formats)}
+        if method == "POST" and failures:
+            raise failures.pop(0)
+        return {"map_id": "m1", "space_id": "s1"}
+
+    transport.responder = responder
+
+
+@pytest.fixture(autouse=True)
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr("mantis_sdk.resources.time.sleep", slept.append)
+    return slept
+
+
+def _keys(transport):
+    return [c["headers"].get(IDEMPOTENCY_HEADER) for c in transport.calls if c["method"] == "POST"]
+
+
+def test_keys_follow_space_map_and_content(client, transport):
+    _backend(transport)
+    for df in (_DF, _DF, _DF.assign(A=["x", "z"])):
+        client.spaces.create("t", df, _TYPES, space_id="s1", map_id="m1", wait=False)
+    client.spaces.create("t", _DF, _TYPES, wait=False)  # a fresh space id
+    first, same, changed, fresh = _keys(transport)
+    assert first and first == same and len({first, changed, fresh}) == 3
+
+
+def test_unsent_request_is_resent_with_the_same_key(client, transport, sleeps):
+    _backend(transport, [APIConnectionError("refused", request_sent=False)])
+    assert client.spaces.create("t", _DF, _TYPES, wait=False).map_id == "m1"
+    first, second = _keys(transport)
+    assert first == second and sleeps == [0.5]
+    assert not any("upload-formats" in c["url"] for c in transport.calls)  # no capability check needed
+
+
+@pytest.mark.parametrize("retry_in,posts", [(0.2, 2), (30.0, 1)])
+def test_open_circuit_is_resent_only_once_it_would_admit_the_retry(client, transport, retry_in, posts):
+    error = CircuitOpenError("circuit open", group="synthesis", retry_in=retry_in)
+    assert not error.request_sent  # the breaker never touches the network
+    _backend(transport, [error], formats=("csv", "idempotency"))
+    if posts == 1:
+        with pytest.raises(CircuitOpenError):
+            client.spaces.create("t", _DF, _TYPES, wait=False)
+    else:
+        client.spaces.create("t", _DF, _TYPES, wait=False)
+    assert len(_keys(transport)) == posts
+
+
+def test_possibly_received_request_needs_idempotency_support(client, transport):
+    _backend(transport, [APIConnectionError("connection reset")])
+    with pytest.raises(APIConnectionError):
+        client.spaces.create("t", _DF, _TYPES, wait=False)
+    assert len(_keys(transport)) == 1
+
+
+def test_backend_with_idempotency_keys_gets_resent_submissions(client, transport, sleeps):
+    _backend(
+        transport,
+        [APIConnectionError("connection reset"), APIStatusError("bad gateway", status_code=502)],
+        formats=("csv", "idempotency"),
+    )
+    handle = client.spaces.create("t", _DF, _TYPES, wait=False)
+    keys = _keys(transport)
+    assert len(keys) == 3 and len(set(keys)) == 1 and handle.map_id == "m1"
+    assert sleeps == [0.5, 1.0]
+    posts = [c for c in transport.calls if c["method"] == "POST"]
+    assert posts[0]["kwargs"] is not posts[2]["kwargs"]  # each attempt gets a fresh body
+
+
+def test_github_submission_is_resent_after_429(client, transport):
+    _backend(transport, [RateLimitError("slow down", status_code=429)] * 2)
+    client.config.submit_retries = 1
+    with pytest.raises(RateLimitError):
+        client.spaces.from_github("https://github.com/org/repo", wait=False)
+    _backend(transport, [RateLimitError("slow down", status_code=429)])
+    client.spaces.from_github("https://github.com/org/repo", wait=False)
+    posts = [c for c in transport.calls if c["method"] == "POST"]
+    assert posts[-1]["kwargs"]["json"] == posts[-2]["kwargs"]["json"]
+    assert posts[-1]["headers"][IDEMPOTENCY_HEADER] == posts[-2]["headers"][IDEMPOTENCY_HEADER]
+
+
+async def test_async_submission_is_resent(aclient, atransport, monkeypatch):
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr("mantis_sdk.aio.resources.asyncio.sleep", no_sleep)
+    _backend(atransport, [APIStatusError("unavailable", status_code=503)], formats=("idempotency",))
+    handle = await aclient.spaces.create("t", _DF, _TYPES, wait=False)
+    first, second = _keys(atransport)
+    assert first == second and handle.map_id == "m1"
@@ -1,4 +1,5 @@
 """transport maps http status codes to typed exceptions and retries idempotent calls."""
+import json
 from unittest.mock import MagicMock
 
 import pytest
@@ -18,7 +19,8 @@ def _response(status: int, json_body=None, text="", content_type="application/js
     r = MagicMock(spec=requests.Response)
     r.status_code = status
     r.headers = {"Content-Type": content_type}
-    r.text = text or ("" if json_body is None else "{}")
+    r.text = text or ("" if json_body is None else json.dumps(json_body))
+    r.content = r.text.encode()
     r.reason = "reason"
     r.json.return_value = json_body
     return r
@@ -56,3 +58,53 @@ def test_redact_masks_cookie():
     assert redacted["cookie"] == "<redacted>"
     assert redacted["X-Internal-User-Id"] == "<redacted>"
     assert redacted["Accept"] == "json"
+
+
+# --- connection pool sizing, warm-up and stats (against a real loopback server) ---
+
+def test_pool_size_and_block_are_configurable():
+    t = Transport(pool_maxsize=32, pool_block=True)
+    adapter = t.session.get_adapter("https://x")
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+    assert t.pool_stats()["pool_maxsize"] == 32
+
+
+def test_pool_stats_count_reused_connections(loopback):
+    t = Transport()
+    for _ in range(5):
+        assert t.request("GET", f"{loopback.url}/x") == {"ok": True}
+    stats = t.pool_stats()
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 4
+    assert stats["connections_in_use"] == 0
+    assert stats["connections_idle"] == 1
+
+
+def test_warm_up_preopens_connections(loopback):
+    t = Transport(pool_maxsize=4)
+    assert t.warm_up(f"{loopback.url}/api/proxy/", connections=3) == 3
+    stats = t.pool_stats()
+    assert stats["connections_opened"] == 3
+    assert stats["connections_idle"] == 3
+    # the next request rides a warm connection instead of opening a new one.
+    t.request("GET", f"{loopback.url}/x")
+    assert t.pool_stats()["connections_opened"] == 3
+
+
+def test_warm_up_never_raises():
+    t = Transport(max_retries=0)
+    assert t.warm_up("http://127.0.0.1:9/", connections=2) == 0
+
+
+def test_shared_transport_across_threads(loopback):
+    from concurrent.futures import ThreadPoolExecutor
+
+    t = Transport(pool_maxsize=8, pool_block=True)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: t.request("GET", f"{loopback.url}/x"), range(64)))
+    assert results == [{"ok": True}] * 64
+    stats = t.pool_stats()
+    assert stats["connections_opened"] <= 8
+    assert stats["connections_discarded"] == 0
+    assert stats["checkouts"] == 64
@@ -0,0 +1,114 @@
+"""streaming multipart uploads: row-block csv, spooled vs chunked bodies, progress reporting."""
+import gzip
+from email.parser import BytesParser
+
+import pandas as pd
+import pytest
+
+from mantis_sdk import ConfigurationError, ConfigurationManager, DataType, MantisClient
+from mantis_sdk.upload import iter_csv
+
+_DF = pd.DataFrame({"A": [f"title, {i}" for i in range(1000)], "B": [f"p {i}" for i in range(1000)]})
+_TYPES = {"A": DataType.Title, "B": DataType.Semantic}
+_CREATED = (200, {"Content-Type": "application/json"}, b'{"map_id": "m1", "space_id": "s1"}')
+
+
+def _client(loopback, **settings):
+    loopback.respond = lambda m, p, h: _CREATED
+    cfg = ConfigurationManager()
+    cfg.host, cfg.internal_user_id, cfg.upload_chunk_rows = loopback.url, "u", 64
+    for key, value in settings.items():
+        setattr(cfg, key, value)
+    return MantisClient("", config=cfg)
+
+
+def _parts(headers, body):
+    """{field name: (filename, bytes)} of a multipart body, via the stdlib mime parser."""
+    message = BytesParser().parsebytes(f"Content-Type: {headers['Content-Type']}\r\n\r\n".encode() + body)
+    return {
+        part.get_param("name", header="content-disposition"): (part.get_filename(), part.get_payload(decode=True))
+        for part in message.get_payload()
+    }
+
+
+def test_iter_csv_matches_to_csv():
+    assert b"".join(iter_csv(_DF, 7)) == _DF.to_csv(index=False).encode()
+    assert b"".join(iter_csv(_DF.iloc[:0], 7)) == b"A,B\n"
+
+
+def test_streamed_create_is_spooled_with_content_length(loopback):
+    client = _client(loopback)
+    progress = []
+    client.spaces.create("t", _DF, _TYPES, wait=False, on_upload_progress=lambda *p: progress.append(p))
+    headers, body = loopback.requests[0][2], loopback.bodies[0]
+    assert int(headers["Content-Length"]) == len(body)
+    parts = _parts(headers, body)
+    assert parts["file"] == ("data.csv", _DF.to_csv(index=False).encode())
+    assert parts["space_name"][1] == b"t"
+    assert progress[-1] == (len(body), len(body))
+    assert [sent for sent, _ in progress] == sorted(sent for sent, _ in progress)
+
+
+def test_chunked_upload_reports_unknown_total(loopback):
+    client = _client(loopback, stream_uploads=True, chunked_uploads=True)
+    client.spaces.create("t", _DF, _TYPES, wait=False)
+    headers, body = loopback.requests[0][2], loopback.bodies[0]
+    assert headers["Transfer-Encoding"] == "chunked" and "Content-Length" not in headers
+    assert _parts(headers, body)["file"][1] == _DF.to_csv(index=False).encode()
+
+
+def test_streamed_upload_compresses_on_the_fly(loopback):
+    client = _client(loopback, stream_uploads=True, upload_compression="gzip")
+    client.spaces.create("t", _DF, _TYPES, wait=False)
+    parts = _parts(loopback.requests[0][2], loopback.bodies[0])
+    name, payload = parts["file"]
+    assert name == "data.csv.gz" and parts["content_encoding"][1] == b"gzip"
+    assert gzip.decompress(payload) == _DF.to_csv(index=False).encode()
+    assert client.transfer_stats()["upload_wire_bytes"] == len(payload)
+
+
+def test_csv_path_streams_without_spooling(loopback, tmp_path, monkeypatch):
+    path = tmp_path / "data.csv"
+    _DF.to_csv(path, index=False)
+    monkeypatch.setattr("mantis_sdk.resources.spool", lambda chunks: pytest.fail("file was spooled"))
+    client = _client(loopback, stream_uploads=True)
+    client.spaces.create("t", str(path), _TYPES, wait=False)
+    assert _parts(loopback.requests[0][2], loopback.bodies[0])["file"][1] == path.read_bytes()
+
+
+async def test_async_create_streams(loopback):
+    pytest.importorskip("httpx")
+    from mantis_sdk.aio import AsyncMantisClient
+
+    loopback.respond = lambda m, p, h: _CREATED
+    cfg = ConfigurationManager()
+    cfg.host, cfg.internal_user_id, cfg.upload_chunk_rows, cfg.chunked_uploads = loopback.url, "u", 64, True
+    progress = []
+    async with AsyncMantisClient("", config=cfg) as client:
+        await client.spaces.create("t", _DF, _TYPES, wait=False, on_upload_progress=lambda s, t: progress.append(t))
+    assert _parts(loopback.requests[0][2], loopback.bodies[0])["file"][1] == _DF.to_csv(index=False).encode()
+    assert set(progress) == {None}
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_csv_blocks_stay_in_order(executor):
+    blocks = list(iter_csv(_DF, 10, workers=3, executor=executor))
+    assert len(blocks) == 101
+    assert b"".join(blocks) == _DF.to_csv(index=False).encode()
+
+
+def test_parallel_csv_stops_cleanly_when_the_upload_does():
+    blocks = iter_csv(_DF, 10, workers=2, executor="thread")
+    assert next(blocks) == b"A,B\n"
+    next(blocks)
+    blocks.close()  # e.g. the connection dropped mid-upload
+    with pytest.raises(ConfigurationError, match="csv_executor"):
+        next(iter_csv(_DF, 10, workers=2, executor="fibers"))
+
+
+def test_csv_workers_apply_to_both_upload_paths(loopback):
+    client = _client(loopback, csv_workers=2, csv_executor="thread")
+    client.spaces.create("t", _DF, _TYPES, wait=False)
+    client.spaces.create("t", _DF, _TYPES, wait=False, on_upload_progress=lambda *p: None)
+    for headers, body in zip((r[2] for r in loopback.requests), loopback.bodies):
+        assert _parts(headers, body)["file"][1] == _DF.to_csv(index=False).encode()
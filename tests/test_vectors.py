@@ -0,0 +1,119 @@
+"""binary side-car parts for Vector columns: encodings, negotiation, and both upload paths."""
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mantis_sdk import ConfigurationError, DataType, MantisError, NotFoundError
+from mantis_sdk.upload import MultipartStream
+from mantis_sdk.vectors import encoded_length, iter_encoded, normalize_encoding
+
+_MATRIX = np.arange(12, dtype=np.float64).reshape(3, 4) / 7
+_TYPES = {"A": DataType.Title, "emb": DataType.Vector}
+
+
+def _df():
+    return pd.DataFrame({"A": ["x", "y", "z"]})
+
+
+def _backend(transport, formats=("csv", "vectors")):
+    def responder(method, url, kwargs):
+        if url.endswith("/synthesis/upload-formats/"):
+            if formats is None:
+                raise NotFoundError("404", status_code=404)
+            return {"formats": list(formats)}
+        return {"map_id": "m1", "space_id": "s1"}
+
+    transport.responder = responder
+
+
+@pytest.fixture
+def binary(client, transport):
+    client.config.vector_encoding = "float32"
+    _backend(transport)
+    return client
+
+
+def _upload(transport):
+    kwargs = transport.calls[-1]["kwargs"]
+    return kwargs["data"], kwargs["files"]
+
+
+def test_vectors_from_numpy_go_as_a_float32_side_car(binary, transport):
+    binary.spaces.create("t", _df(), _TYPES, vectors={"emb": _MATRIX}, wait=False)
+    data, files = _upload(transport)
+    _, csv, _ = files["file"]
+    assert csv.read() == b"A,emb\nx,\ny,\nz,\n"  # emptied, so data_types still line up
+    name, part, mime = files["vectors_0"]
+    assert (name, mime) == ("vectors_0.bin", "application/octet-stream")
+    assert part.read() == _MATRIX.astype("<f4").tobytes()
+    assert json.loads(data["vector_parts"]) == [
+        {"column": "emb", "part": "vectors_0", "encoding": "float32", "rows": 3, "dim": 4}
+    ]
+    assert len(json.loads(data["data_types"])) == 2
+
+
+def test_dataframe_array_cells_are_split_out(binary, transport):
+    df = _df().assign(emb=list(_MATRIX))
+    binary.spaces.create("t", df, _TYPES, wait=False)
+    _, files = _upload(transport)
+    assert np.frombuffer(files["vectors_0"][1].read(), "<f4").reshape(3, 4).tolist() == _MATRIX.astype("<f4").tolist()
+
+
+def test_int8_and_float16_encodings():
+    int8 = b"".join(iter_encoded(_MATRIX, "int8", chunk_rows=2))
+    assert len(int8) == encoded_length(_MATRIX, "int8") == 12 + 3 * 4
+    values = np.frombuffer(int8[:12], "i1").reshape(3, 4)
+    scales = np.frombuffer(int8[12:], "<f4")
+    np.testing.assert_allclose(values * scales[:, None], _MATRIX, atol=np.abs(_MATRIX).max() / 127)
+    half = b"".join(iter_encoded(_MATRIX, "float16"))
+    assert np.frombuffer(half, "<f2").reshape(3, 4).tolist() == _MATRIX.astype("<f2").tolist()
+    with pytest.raises(ConfigurationError, match="unknown vector_encoding"):
+        normalize_encoding("bfloat16")
+
+
+def test_streamed_body_carries_the_side_car(binary, transport):
+    binary.config.stream_uploads = True
+    binary.spaces.create("t", _df(), _TYPES, vectors={"emb": _MATRIX}, wait=False)
+    upload = transport.calls[-1]["kwargs"]["data"]
+    assert isinstance(upload, MultipartStream)
+    body = b"".join(upload)
+    assert len(body) == upload.length
+    assert b'name="vectors_0"; filename="vectors_0.bin"' in body
+    assert _MATRIX.astype("<f4").tobytes() in body
+
+
+def test_falls_back_to_text_without_backend_support(binary, transport):
+    _backend(transport, formats=None)
+    binary.spaces.create("t", _df(), _TYPES, vectors={"emb": _MATRIX[:, :2]}, wait=False)
+    data, files = _upload(transport)
+    assert set(files) == {"file"} and "vector_parts" not in data
+    uploaded = pd.read_csv(files["file"][1])
+    assert json.loads(uploaded["emb"][1]) == pytest.approx(_MATRIX[1, :2].tolist())
+
+
+def test_vectors_must_match_the_rows(binary):
+    with pytest.raises(MantisError, match="has 2 rows"):
+        binary.spaces.create("t", _df(), _TYPES, vectors={"emb": _MATRIX[:2]}, wait=False)
+    with pytest.raises(MantisError, match="vectors="):
+        binary.spaces.create("t", _df(), _TYPES, vectors={"emb": _MATRIX}, drop_duplicates=True, wait=False)
+
+
+def test_columnar_upload_gets_fixed_size_lists(client, transport):
+    pq = pytest.importorskip("pyarrow.parquet")
+    _backend(transport, formats=("csv", "parquet"))
+    client.spaces.create("t", _df(), _TYPES, vectors={"emb": _MATRIX}, upload_format="parquet", wait=False)
+    _, files = _upload(transport)
+    table = pq.read_table(io.BytesIO(files["file"][1].read()))
+    assert table.schema.field("emb").type.list_size == 4
+    assert table.column("emb").to_pylist()[2] == pytest.approx(_MATRIX[2].tolist())
+
+
+async def test_async_side_car(aclient, atransport):
+    aclient.config.vector_encoding = "float16"
+    _backend(atransport)
+    await aclient.spaces.create("t", _df(), _TYPES, vectors={"emb": _MATRIX}, wait=False)
+    _, files = _upload(atransport)
+    assert files["vectors_0"][1].read() == _MATRIX.astype("<f2").tobytes()
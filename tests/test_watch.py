@@ -0,0 +1,94 @@
+"""spaces.watch: pushed progress events, adaptive polling, and the stall guard."""
+import pytest
+
+from mantis_sdk import NotFoundError, ProgressEvent, SpaceCreationError
+from mantis_sdk._stream import EventStreamDecoder
+
+_EVENTS_URL = "synthesis/progress/m1/events"
+
+
+def _polled(transport, *percents, events_url=None):
+    payloads = [{"progress": pct, "completed": pct >= 100} for pct in percents]
+    if events_url:
+        payloads[0]["events_url"] = events_url
+    transport.queue = payloads
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr("mantis_sdk.resources.time.sleep", slept.append)
+    return slept
+
+
+def test_polling_backs_off_while_progress_stands_still(client, transport, sleeps):
+    _polled(transport, 10, 10, 10, 50, 95, 95, 100)
+    events = list(client.spaces.watch("m1"))
+    assert [e.progress for e in events] == [10, 50, 95, 100]
+    assert events[-1].completed and isinstance(events[0], ProgressEvent)
+    # 1s after a change, growing 1.5x while unchanged, back to 1s near completion.
+    assert sleeps == [1.0, 1.5, 2.25, 1.0, 1.0, 1.0]
+
+
+def test_pushed_events_replace_polling(client, transport, sleeps):
+    def responder(method, url, kwargs):
+        if url.endswith("/events/"):
+            return [{"progress": 5}, {"progress": 60, "message": "embedding"}, {"progress": 100, "completed": True}]
+        return {"progress": 5, "events_url": _EVENTS_URL}
+
+    transport.responder = responder
+    events = list(client.spaces.watch("m1"))
+    assert [(e.progress, e.message) for e in events] == [(5, None), (60, "embedding"), (100, None)]
+    assert [c["url"].split("/synthesis/")[1] for c in transport.calls] == ["progress/m1/", "progress/m1/events/"]
+    assert transport.calls[1]["headers"]["Accept"] == "text/event-stream"
+    assert isinstance(transport.calls[1]["kwargs"]["decoder"], EventStreamDecoder) and sleeps == []
+
+
+def test_missing_event_stream_falls_back_to_polling(client, transport, sleeps):
+    progress = iter([10, 40, 100])
+
+    def responder(method, url, kwargs):
+        if url.endswith("/events/"):
+            raise NotFoundError("404", status_code=404)
+        return {"progress": next(progress), "events_url": _EVENTS_URL}
+
+    transport.responder = responder
+    assert [e.progress for e in client.spaces.watch("m1")] == [10, 40, 100]
+    assert sum(c["url"].endswith("/events/") for c in transport.calls) == 1  # not retried
+
+
+def test_stall_timeout_still_applies(client, transport, sleeps):
+    _polled(transport, 10, 10, 10)
+    with pytest.raises(SpaceCreationError, match="stalled at 10%"):
+        list(client.spaces.watch("m1", stall_timeout=0))
+
+
+def test_event_stream_decoder_handles_split_events():
+    decoder = EventStreamDecoder()
+    assert decoder.feed(b': keep-alive\r\ndata: {"progress"') == []
+    assert decoder.feed(b': 7}\r\n\r\nevent: tick\ndata: [1,\ndata: 2]\n') == [{"progress": 7}]
+    assert decoder.close() == [[1, 2]]
+
+
+def test_event_stream_decoder_uses_the_clients_codec():
+    class Tagging:
+        name = "tagging"
+
+        def loads(self, data):
+            return {"decoded": data}
+
+    decoder = EventStreamDecoder(Tagging())
+    assert decoder.feed(b'data: {"progress": 7}\n\n') == [{"decoded": '{"progress": 7}'}]
+
+
+async def test_async_watch(aclient, atransport, monkeypatch):
+    monkeypatch.setattr(aclient.spaces, "POLL_INTERVAL", 0)
+
+    def responder(method, url, kwargs):
+        if url.endswith("/events/"):
+            return [{"progress": 100, "completed": True}]
+        return {"progress": 30, "events_url": _EVENTS_URL}
+
+    atransport.responder = responder
+    events = [event async for event in aclient.spaces.watch("m1")]
+    assert [e.progress for e in events] == [30, 100]